@@ -0,0 +1,41 @@
+# Copyright (c) 2025 Bivex
+#
+# Author: Bivex
+# Available for contact via email: support@b-b.top
+# For up-to-date contact information:
+# https://github.com/bivex
+#
+# Created: 2026-10-16T09:12:04
+# Last Updated: 2026-10-16T09:12:04
+#
+# Licensed under the MIT License.
+# Commercial licensing available upon request.
+
+"""Collapse short keys that store identical tracking parameters into one content-addressed key.
+
+Old keys stay as aliases, so links that were already issued keep decoding.
+
+Usage:
+    python scripts/database/collapse_short_key_duplicates.py [url_shortener_storage.json]
+"""
+
+import os
+import sys
+
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..', '..')))
+
+from shared_url_shortener import URLShortener  # noqa: E402
+
+
+def main() -> int:
+    if len(sys.argv) > 2:
+        print(__doc__)
+        return 1
+    storage_file = sys.argv[1] if len(sys.argv) == 2 else "url_shortener_storage.json"
+    stats = URLShortener(storage_file).collapse_duplicates()
+    print(f"✅ Collapsed {storage_file}: {stats}")
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
@@ -0,0 +1,38 @@
+# Copyright (c) 2025 Bivex
+#
+# Author: Bivex
+# Available for contact via email: support@b-b.top
+# For up-to-date contact information:
+# https://github.com/bivex
+#
+# Created: 2026-10-16T09:12:04
+# Last Updated: 2026-10-16T09:12:04
+#
+# Licensed under the MIT License.
+# Commercial licensing available upon request.
+
+"""Compile a geo-IP CSV into the memory-mapped range database used by GEOIP_DATABASE_PATH.
+
+Usage:
+    python scripts/database/compile_geo_database.py ranges.csv geoip.bin
+"""
+
+import os
+import sys
+
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..', '..')))
+
+from src.infrastructure.external.mmap_geolocation_service import compile_geo_database  # noqa: E402
+
+
+def main() -> int:
+    if len(sys.argv) != 3:
+        print(__doc__)
+        return 1
+    stats = compile_geo_database(sys.argv[1], sys.argv[2])
+    print(f"✅ Compiled {sys.argv[2]}: {stats}")
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
@@ -0,0 +1,131 @@
+# Copyright (c) 2025 Bivex
+#
+# Author: Bivex
+# Available for contact via email: support@b-b.top
+# For up-to-date contact information:
+# https://github.com/bivex
+#
+# Created: 2026-10-16T09:12:04
+# Last Updated: 2026-10-16T09:12:04
+#
+# Licensed under the MIT License.
+# Commercial licensing available upon request.
+
+"""Compare response encode times: legacy patched json.dumps vs src.utils.serialization.
+
+Payloads mirror the campaign list and campaign analytics responses, with the
+Money / Decimal / datetime / CampaignId values the handlers hand to the encoder.
+
+Usage:
+    python scripts/performance/benchmark_json_serialization.py [--campaigns 100] [--days 90] [--repeat 200]
+"""
+
+import argparse
+import json
+import os
+import sys
+import timeit
+from datetime import date, datetime, timedelta, timezone
+from decimal import Decimal
+
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..', '..')))
+
+from src.domain.value_objects.financial.money import Money  # noqa: E402
+from src.domain.value_objects.identifiers.campaign_id import CampaignId  # noqa: E402
+from src.utils import serialization  # noqa: E402
+
+
+class LegacyJSONEncoder(json.JSONEncoder):
+    """The encoder main.py used to install over json.dumps."""
+
+    def default(self, obj):
+        if isinstance(obj, Decimal):
+            return float(obj)
+        try:
+            from src.domain.value_objects.financial.money import Money as _Money
+            if isinstance(obj, _Money):
+                return {"amount": float(obj.amount), "currency": obj.currency}
+        except ImportError:
+            pass
+        if isinstance(obj, datetime):
+            return obj.isoformat()
+        if isinstance(obj, CampaignId):
+            return obj.value
+        return super().default(obj)
+
+
+def legacy_dumps(obj) -> bytes:
+    return json.dumps(obj, cls=LegacyJSONEncoder).encode('utf-8')
+
+
+def campaign_list_payload(count: int) -> dict:
+    now = datetime(2026, 1, 1, tzinfo=timezone.utc)
+    campaigns = []
+    for i in range(count):
+        campaign_id = CampaignId.generate()
+        campaigns.append({
+            "id": campaign_id,
+            "name": f"Campaign {i}",
+            "description": "Spring promotion for returning players",
+            "status": "active",
+            "schedule": {"startDate": now, "endDate": now + timedelta(days=30)},
+            "financial": {
+                "costModel": "CPA",
+                "payout": Money(Decimal("12.50"), "USD"),
+                "dailyBudget": Money(Decimal("500.00"), "USD"),
+                "totalBudget": Money(Decimal("15000.00"), "USD"),
+                "spent": Money(Decimal(i * 37) / 10, "USD"),
+            },
+            "performance": {
+                "impressions": 10000 + i, "clicks": 800 + i, "conversions": 40 + i % 7,
+                "ctr": Decimal("0.080"), "cr": Decimal("0.050"),
+                "epc": Money(Decimal("0.62"), "USD"), "roi": Decimal("1.35"),
+            },
+            "createdAt": now, "updatedAt": now,
+            "_links": {"self": f"/v1/campaigns/{campaign_id.value}"},
+        })
+    return {"campaigns": campaigns, "pagination": {"page": 1, "pageSize": count, "totalItems": count}}
+
+
+def analytics_payload(days: int) -> dict:
+    start = date(2026, 1, 1)
+    breakdown = []
+    for i in range(days):
+        breakdown.append({
+            "date": (start + timedelta(days=i)).isoformat(),
+            "clicks": 1000 + i, "uniqueClicks": 900 + i, "conversions": 50 + i % 11,
+            "revenue": Decimal(f"{250 + i}.75"), "cost": Decimal(f"{120 + i}.10"),
+            "ctr": Decimal("0.0812"), "cr": Decimal("0.0533"),
+        })
+    return {
+        "campaignId": CampaignId.generate(),
+        "timeRange": {"startDate": datetime(2026, 1, 1), "endDate": datetime(2026, 1, 1) + timedelta(days=days)},
+        "metrics": {"clicks": 120000, "conversions": 6100, "revenue": Money(Decimal("48211.55"), "USD"),
+                    "ctr": Decimal("0.0812"), "cr": Decimal("0.0508"), "roi": Decimal("2.14")},
+        "breakdowns": {"byDate": breakdown},
+    }
+
+
+def measure(label: str, payload, repeat: int) -> None:
+    assert json.loads(legacy_dumps(payload)) == json.loads(serialization.dumps_bytes(payload)), label
+    size = len(serialization.dumps_bytes(payload))
+    legacy = min(timeit.repeat(lambda: legacy_dumps(payload), number=repeat, repeat=5)) / repeat
+    fast = min(timeit.repeat(lambda: serialization.dumps_bytes(payload), number=repeat, repeat=5)) / repeat
+    print(f"{label:<16} {size:>9,d} B   legacy {legacy * 1e6:>9.1f} µs   "
+          f"{serialization.backend():<6} {fast * 1e6:>9.1f} µs   x{legacy / fast:.1f}")
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument('--campaigns', type=int, default=100)
+    parser.add_argument('--days', type=int, default=90)
+    parser.add_argument('--repeat', type=int, default=200)
+    args = parser.parse_args()
+
+    measure('campaign list', campaign_list_payload(args.campaigns), args.repeat)
+    measure('analytics', analytics_payload(args.days), args.repeat)
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
@@ -11,13 +11,26 @@
 # Licensed under the MIT License.
 # Commercial licensing available upon request.
 import base64
+import hashlib
 import json
+import mmap
 import os
 import secrets
+import threading
+import time
+import weakref
 import zlib
-from dataclasses import dataclass
+from collections import OrderedDict
+from contextlib import contextmanager
+from dataclasses import dataclass, fields
 from enum import Enum
-from typing import Dict, Optional
+from typing import Dict, Iterable, Iterator, List, Optional, Tuple
+
+try:
+    import fcntl
+    FCNTL_AVAILABLE = True
+except ImportError:
+    FCNTL_AVAILABLE = False
 
 
 class EncodingStrategy(Enum):
@@ -53,6 +66,295 @@ class URLParams:
         return result
 
 
+_URL_PARAMS_FIELDS = frozenset(f.name for f in fields(URLParams)) - {"extra"}
+
+
+def _canonical_params(params: URLParams) -> str:
+    """Каноническая форма параметров: одинаковые наборы дают одну строку"""
+    return json.dumps(params.to_dict(), sort_keys=True, ensure_ascii=False, separators=(',', ':'))
+
+
+def _format_record(key: str, params: URLParams) -> str:
+    return f"{key}\t{json.dumps(params.to_dict(), ensure_ascii=False, separators=(',', ':'))}\n"
+
+
+def _params_from_dict(data: Dict[str, str]) -> URLParams:
+    """Восстановить URLParams из to_dict(): неизвестные ключи возвращаются в extra"""
+    known = {k: v for k, v in data.items() if k in _URL_PARAMS_FIELDS}
+    extra = {k: v for k, v in data.items() if k not in _URL_PARAMS_FIELDS}
+    return URLParams(**known, extra=extra or None)
+
+
+class ShortKeyStore:
+    """
+    Append-only лог short key -> параметры с индексом смещений поверх mmap.
+
+    Каждая запись - одна строка ``key\t{json}\n`` или алиас ``key\t=target\n``
+    (старый ключ, указывающий на запись с теми же параметрами). При открытии лог
+    отображается в память и индексируется по смещениям без разбора JSON;
+    параметры декодируются при первом обращении и кэшируются. Новые ключи
+    дописываются одним write() (пачка из encode_many - тоже одним), а когда
+    устаревших записей становится больше живых, лог переписывается (компакция).
+
+    Несколько процессов могут делить один лог: запись идёт через O_APPEND,
+    компакция - под эксклюзивным flock, а промах по ключу дочитывает хвост,
+    дописанный другими воркерами. Хранилище, открытое до fork(), наследуется
+    воркерами вместе с mmap (страницы лога общие), а lock-файл в каждом
+    потомке открывается заново. При path=None хранилище живёт только в памяти.
+    """
+
+    COMPACT_MIN_RECORDS = 1024
+
+    def __init__(self, path: Optional[str] = None, legacy_json_path: Optional[str] = None):
+        self.path = path
+        self._index: Dict[str, Tuple[int, int]] = {}  # key -> (offset, length) JSON в логе
+        self._cache: Dict[str, URLParams] = {}
+        self._records = 0  # Записей в логе, включая устаревшие
+        self._scanned = 0  # До какого смещения лог проиндексирован
+        self._fd: Optional[int] = None
+        self._map: Optional[mmap.mmap] = None
+        self._lock_fd: Optional[int] = None
+        self._lock = threading.Lock()
+
+        if path is None:
+            return
+        _OPEN_STORES.add(self)
+        migrate = legacy_json_path is not None and not os.path.exists(path) and os.path.exists(legacy_json_path)
+        self._open()
+        if migrate:
+            self._migrate_legacy_json(legacy_json_path)
+
+    # ---------- Mapping API ----------
+
+    def __len__(self) -> int:
+        return len(self._index.keys() | self._cache.keys())
+
+    def __contains__(self, key: str) -> bool:
+        return self.get(key) is not None
+
+    def __getitem__(self, key: str) -> URLParams:
+        params = self.get(key)
+        if params is None:
+            raise KeyError(key)
+        return params
+
+    def __setitem__(self, key: str, params: URLParams):
+        self.put_many([(key, params)])
+
+    def __iter__(self) -> Iterator[str]:
+        return iter(self._index.keys() | self._cache.keys())
+
+    def keys(self):
+        return self._index.keys() | self._cache.keys()
+
+    def items(self) -> Iterator[Tuple[str, URLParams]]:
+        for key in self.keys():
+            params = self.get(key)
+            if params is not None:
+                yield key, params
+
+    def get(self, key: str, default=None) -> Optional[URLParams]:
+        """Найти параметры; при промахе дочитать записи других процессов"""
+        params = self._cache.get(key)
+        if params is not None:
+            return params
+        # Индекс и mmap подменяются при сканировании и компакции: запись копируется
+        # под блокировкой, а JSON разбирается уже без неё
+        with self._lock:
+            if self._fd is None:
+                return default
+            if key not in self._index:
+                self._reopen_if_replaced()
+                self._scan()
+            location = self._index.get(key)
+            if location is None:
+                return default
+            offset, length = location
+            record = self._map[offset:offset + length]
+        params = self._decode(record)
+        if params is not None:
+            self._cache[key] = params
+        return params if params is not None else default
+
+    def put_many(self, items: Iterable[Tuple[str, URLParams]]):
+        """Сохранить пачку ключей одной записью в лог"""
+        items = list(items)
+        if not items:
+            return
+        for key, params in items:
+            self._cache[key] = params
+        if self._fd is None:
+            return
+
+        data = "".join(_format_record(key, params) for key, params in items).encode("utf-8")
+        with self._lock:
+            with self._file_lock(exclusive=False):
+                self._reopen_if_replaced()
+                os.write(self._fd, data)
+            self._scan()
+
+        self._maybe_compact()
+
+    def put_aliases(self, aliases: Iterable[Tuple[str, str]]):
+        """Перенаправить ключи на другие (уже сохранённые) ключи одной записью в лог"""
+        aliases = list(aliases)
+        if not aliases:
+            return
+        for key, target in aliases:
+            self._cache[key] = self[target]
+        if self._fd is None:
+            return
+
+        data = "".join(f"{key}\t={target}\n" for key, target in aliases).encode("utf-8")
+        with self._lock:
+            with self._file_lock(exclusive=False):
+                self._reopen_if_replaced()
+                os.write(self._fd, data)
+            self._scan()
+        self._maybe_compact()
+
+    def _maybe_compact(self):
+        if self._records > self.COMPACT_MIN_RECORDS and self._records > 2 * len(self._index):
+            self.compact()
+
+    # ---------- Лог ----------
+
+    def refresh(self):
+        """Проиндексировать записи, дописанные после последнего сканирования"""
+        with self._lock:
+            self._reopen_if_replaced()
+            self._scan()
+
+    def compact(self):
+        """Переписать лог, оставив по одной записи на живой ключ"""
+        if self._fd is None:
+            return
+        with self._lock, self._file_lock(exclusive=True):
+            self._reopen_if_replaced()
+            self._scan()
+            # Записи копируются как есть, без разбора JSON; алиасы остаются алиасами
+            live = [b"%s\t%s\n" % (key.encode("ascii"), self._map[offset:offset + length])
+                    for key, (offset, length) in self._index.items()]
+            tmp_path = f"{self.path}.compact"
+            with open(tmp_path, "wb") as f:
+                f.writelines(live)
+                f.flush()
+                os.fsync(f.fileno())
+            os.replace(tmp_path, self.path)
+            self._close_files()
+            self._open_files()
+            self._scan()
+        print(f"Short key log compacted: {len(live)} keys")
+
+    def close(self):
+        with self._lock:
+            self._close_files()
+            if self._lock_fd is not None:
+                os.close(self._lock_fd)
+                self._lock_fd = None
+
+    def _open(self):
+        # Отдельный lock-файл: сам лог при компакции подменяется через os.replace
+        if FCNTL_AVAILABLE:
+            self._lock_fd = os.open(f"{self.path}.lock", os.O_RDWR | os.O_CREAT, 0o644)
+        with self._lock:
+            self._open_files()
+            self._scan()
+
+    def _after_fork(self):
+        # flock принадлежит открытому файлу, а не процессу: после fork() родитель
+        # и потомок делили бы одну блокировку, поэтому потомок берёт свой дескриптор
+        self._lock = threading.Lock()
+        if self._lock_fd is not None:
+            os.close(self._lock_fd)
+            self._lock_fd = os.open(f"{self.path}.lock", os.O_RDWR | os.O_CREAT, 0o644)
+
+    def _open_files(self):
+        self._fd = os.open(self.path, os.O_RDWR | os.O_APPEND | os.O_CREAT, 0o644)
+        self._index.clear()
+        self._map = None
+        self._records = 0
+        self._scanned = 0
+
+    def _close_files(self):
+        if self._map is not None:
+            self._map.close()
+            self._map = None
+        if self._fd is not None:
+            os.close(self._fd)
+            self._fd = None
+
+    def _reopen_if_replaced(self):
+        # Другой процесс сделал компакцию: наш fd указывает на старый файл
+        try:
+            replaced = os.stat(self.path).st_ino != os.fstat(self._fd).st_ino
+        except FileNotFoundError:
+            replaced = True
+        if replaced:
+            self._close_files()
+            self._open_files()
+            self._scan()
+
+    def _scan(self):
+        size = os.fstat(self._fd).st_size
+        if size <= self._scanned:
+            return
+        if self._map is not None:
+            self._map.close()
+        self._map = mmap.mmap(self._fd, size, access=mmap.ACCESS_READ)
+        mm, pos = self._map, self._scanned
+        while pos < size:
+            end = mm.find(b"\n", pos, size)
+            if end < 0:
+                break  # Недописанный хвост: дочитаем при следующем сканировании
+            tab = mm.find(b"\t", pos, end)
+            if tab > pos:
+                self._index[mm[pos:tab].decode("ascii")] = (tab + 1, end - tab - 1)
+                self._records += 1
+            pos = end + 1
+        self._scanned = pos
+
+    def _decode(self, record: bytes) -> Optional[URLParams]:
+        if record[:1] == b"=":
+            return self.get(record[1:].decode("ascii"))
+        return _params_from_dict(json.loads(record))
+
+    @contextmanager
+    def _file_lock(self, exclusive: bool):
+        """flock на время блока: shared для дозаписи, exclusive для компакции"""
+        if self._lock_fd is None:
+            yield
+            return
+        fcntl.flock(self._lock_fd, fcntl.LOCK_EX if exclusive else fcntl.LOCK_SH)
+        try:
+            yield
+        finally:
+            fcntl.flock(self._lock_fd, fcntl.LOCK_UN)
+
+    def _migrate_legacy_json(self, legacy_json_path: str):
+        """Одноразовый перенос старого JSON-хранилища в лог"""
+        try:
+            with open(legacy_json_path, "r", encoding="utf-8") as f:
+                data = json.load(f)
+        except (OSError, ValueError) as e:
+            print(f"Error migrating {legacy_json_path}: {e}")
+            return
+        self.put_many((key, _params_from_dict(params)) for key, params in data.get("key_to_params", {}).items())
+        print(f"Migrated {len(self)} keys from {legacy_json_path} to {self.path}")
+
+
+_OPEN_STORES: "weakref.WeakSet[ShortKeyStore]" = weakref.WeakSet()
+
+
+def _reopen_store_locks_after_fork():
+    for store in list(_OPEN_STORES):
+        store._after_fork()
+
+
+if hasattr(os, "register_at_fork"):
+    os.register_at_fork(after_in_child=_reopen_store_locks_after_fork)
+
+
 class URLShortener:
     """
     URL shortener с short-key подходом для надежного кодирования/декодирования
@@ -63,8 +365,15 @@ class URLShortener:
     BASE62_LEN = len(BASE62)
 
     def __init__(self, storage_file: str = "url_shortener_storage.json", autosave: bool = True):
-        # Short-key storage: key -> URLParams
-        self.key_to_params: Dict[str, URLParams] = {}
+        # Storage settings
+        self.storage_file = storage_file
+        self.autosave = autosave
+
+        # Short-key storage: key -> URLParams (append-only лог рядом с JSON, старый JSON мигрируется один раз)
+        self.key_to_params = ShortKeyStore(
+            self._log_path(storage_file) if autosave else None,
+            legacy_json_path=storage_file,
+        )
 
         # Кэш для быстрого доступа
         self.decode_cache: Dict[str, URLParams] = {}
@@ -81,13 +390,13 @@ class URLShortener:
         self.sub_value_map: Dict[int, str] = {}
         self.reverse_sub_value_map: Dict[str, int] = {}
         self.next_sub_id: int = 1
-        # Storage settings
-        self.storage_file = storage_file
-        self.autosave = autosave
 
-        # Load existing storage
         if self.autosave:
-            self.load_storage_from_file(self.storage_file)
+            print(f"Storage loaded from {self.key_to_params.path} ({len(self.key_to_params)} keys)")
+
+    @staticmethod
+    def _log_path(storage_file: str) -> str:
+        return f"{os.path.splitext(storage_file)[0]}.log"
 
     # ==================== SHORT-KEY METHODS ====================
 
@@ -97,10 +406,56 @@ class URLShortener:
         return base64.urlsafe_b64encode(secrets.token_bytes(6)).decode().rstrip('=')
 
     def _store_params(self, key: str, params: URLParams):
-        """Сохранить параметры под ключом"""
+        """Сохранить параметры под ключом (одна дозапись в лог)"""
         self.key_to_params[key] = params
-        if self.autosave:
-            self.save_storage_to_file(self.storage_file)
+
+    def _new_short_key(self, taken: set = frozenset()) -> str:
+        key = self._generate_short_key()
+        while key in taken or key in self.key_to_params:
+            key = self._generate_short_key()
+        return key
+
+    def _content_key(self, params: URLParams, canonical: Optional[str] = None) -> Tuple[str, bool]:
+        """
+        Ключ, адресуемый содержимым: хэш канонической формы параметров.
+        Возвращает (ключ, нужно_ли_сохранить). При коллизии хэша с другими
+        параметрами к данным добавляется номер попытки.
+        """
+        if canonical is None:
+            canonical = _canonical_params(params)
+        data = canonical.encode("utf-8")
+        attempt = 0
+        while True:
+            digest = hashlib.blake2b(data if attempt == 0 else data + b"#%d" % attempt, digest_size=6).digest()
+            key = base64.urlsafe_b64encode(digest).decode("ascii")  # 6 байт -> 8 символов
+            stored = self.key_to_params.get(key)
+            if stored is None:
+                return key, True
+            if _canonical_params(stored) == canonical:
+                return key, False
+            attempt += 1
+
+    def collapse_duplicates(self) -> Dict[str, int]:
+        """
+        Миграция: свести ключи с одинаковыми параметрами к одному ключу по содержимому.
+        Старые ключи остаются алиасами, поэтому выданные ссылки продолжают работать.
+        """
+        groups: Dict[str, List[str]] = {}
+        for key, params in self.key_to_params.items():
+            groups.setdefault(_canonical_params(params), []).append(key)
+
+        new_records, aliases = [], []
+        for canonical, keys in groups.items():
+            params = self.key_to_params[keys[0]]
+            target, is_new = self._content_key(params, canonical)
+            if is_new:
+                new_records.append((target, params))
+            aliases.extend((key, target) for key in keys if key != target)
+
+        self.key_to_params.put_many(new_records)
+        self.key_to_params.put_aliases(aliases)
+        self.key_to_params.compact()
+        return {"keys": sum(len(keys) for keys in groups.values()), "distinct": len(groups), "aliased": len(aliases)}
 
     def _retrieve_params(self, key: str) -> Optional[URLParams]:
         """Получить параметры по ключу"""
@@ -108,25 +463,54 @@ class URLShortener:
 
     # ==================== SHORT-KEY ENCODING ====================
 
-    def encode_short_key(self, params: URLParams) -> str:
+    def encode_short_key(self, params: URLParams, unique: bool = False) -> str:
         """
         Кодирование с использованием short-key подхода
         Формат: s[key_8_chars]
         Длина: 9 символов (s + 8)
+        Одинаковые параметры дают один и тот же код; unique=True выдаёт новый случайный ключ
         """
-        # Генерируем уникальный ключ
-        key = self._generate_short_key()
-
-        # Гарантируем уникальность
-        while key in self.key_to_params:
-            key = self._generate_short_key()
+        if unique:
+            key, is_new = self._new_short_key(), True
+        else:
+            key, is_new = self._content_key(params)
 
-        # Сохраняем параметры
-        self._store_params(key, params)
+        # Сохраняем параметры только для нового набора
+        if is_new:
+            self._store_params(key, params)
 
         # Возвращаем код
         return f"s{key}"
 
+    def encode_many(self, params_list: Iterable[URLParams], unique: bool = False) -> List[str]:
+        """
+        Пакетное short-key кодирование: все новые ключи пишутся в лог одной записью
+        """
+        new_items = []
+        batch_keys: Dict[str, str] = {}  # каноническая форма -> ключ внутри пачки
+        taken = set()
+        codes = []
+        for params in params_list:
+            if unique:
+                key = self._new_short_key(taken)
+                taken.add(key)
+                new_items.append((key, params))
+            else:
+                canonical = _canonical_params(params)
+                key = batch_keys.get(canonical)
+                if key is None:
+                    key, is_new = self._content_key(params, canonical)
+                    batch_keys[canonical] = key
+                    if is_new:
+                        new_items.append((key, params))
+
+            code = f"s{key}"
+            self.decode_cache[code] = params
+            codes.append(code)
+
+        self.key_to_params.put_many(new_items)
+        return codes
+
     # ==================== LEGACY STRATEGIES (FOR COMPATIBILITY) ====================
 
     def encode_sequential(self, params: URLParams) -> str:
@@ -357,10 +741,12 @@ class URLShortener:
 
     # ==================== UNIFIED API ====================
 
-    def encode(self, params: URLParams, strategy: EncodingStrategy = EncodingStrategy.SMART) -> str:
+    def encode(self, params: URLParams, strategy: EncodingStrategy = EncodingStrategy.SMART,
+               unique: bool = False) -> str:
         """
         Унифицированный метод кодирования
         По умолчанию использует short-key подход для надежности
+        unique=True (только для SMART) выдаёт отдельный код даже для повторных параметров
         """
         if strategy == EncodingStrategy.SEQUENTIAL:
             code = self.encode_sequential(params)
@@ -370,7 +756,7 @@ class URLShortener:
             code = self.encode_hybrid(params)
         elif strategy == EncodingStrategy.SMART:
             # По умолчанию используем short-key для надежности
-            code = self.encode_short_key(params)
+            code = self.encode_short_key(params, unique=unique)
         else:
             raise ValueError(f"Unknown strategy: {strategy}")
 
@@ -387,9 +773,14 @@ class URLShortener:
         if code in self.decode_cache:
             return self.decode_cache[code]
 
-        # Определяем стратегию по префиксу
-        result = None
+        result = self.decode_uncached(code)
+        if result:
+            self.decode_cache[code] = result
+
+        return result
 
+    def decode_uncached(self, code: str) -> Optional[URLParams]:
+        """Декодирование по префиксу стратегии без обращения к decode_cache"""
         if code.startswith('s') and len(code) == 9:  # Short-key: s + 8 chars
             result = self.decode_short_key(code)
         elif code.startswith('s'):  # Legacy sequential
@@ -405,9 +796,6 @@ class URLShortener:
                       self.decode_compressed(code) or
                       self.decode_hybrid(code))
 
-        if result:
-            self.decode_cache[code] = result
-
         return result
 
     def decode_short_key(self, code: str) -> Optional[URLParams]:
@@ -561,10 +949,10 @@ class URLShortener:
 
     def import_storage(self, data: Dict):
         """Импорт хранилища для восстановления состояния"""
-        # Восстановление key_to_params
-        for key, params_dict in data.get("key_to_params", {}).items():
-            params = URLParams(**params_dict)
-            self.key_to_params[key] = params
+        # Восстановление key_to_params (одной записью в лог)
+        self.key_to_params.put_many(
+            (key, _params_from_dict(params_dict)) for key, params_dict in data.get("key_to_params", {}).items()
+        )
 
         # Legacy mappings (пустые для новой версии)
         print(f"Loaded {len(self.key_to_params)} stored keys")
@@ -842,74 +1230,127 @@ def expand_url(short_url: str) -> tuple[str | None, dict | None]:
 
 # ==================== RECOVERY FUNCTIONS ====================
 
-def recover_unknown_code(code: str) -> Optional[URLParams]:
+class ShortCodeDecoder:
     """
-    Try to recover parameters from unknown/damaged short codes.
-    Attempts various fallback decoding strategies.
+    Общий для процесса декодер коротких кодов.
+
+    Работает поверх одного URLShortener (его ShortKeyStore отображён в память,
+    и воркеры, форкнутые после импорта, делят страницы лога), поэтому
+    неизвестный код больше не приводит к загрузке хранилища с диска.
+    Успешно декодированные коды держатся в LRU, нераспознанные - в негативном
+    кэше с TTL: ключ могут дописать позже другим воркером.
     """
-    from shared_url_shortener import URLShortener
 
-    shortener = URLShortener()
+    LRU_SIZE = 10000
+    NEGATIVE_SIZE = 10000
+    NEGATIVE_TTL_SECONDS = 60.0
+
+    def __init__(self, shortener: URLShortener, lru_size: int = LRU_SIZE,
+                 negative_size: int = NEGATIVE_SIZE, negative_ttl: float = NEGATIVE_TTL_SECONDS):
+        self.shortener = shortener
+        self.lru_size = lru_size
+        self.negative_size = negative_size
+        self.negative_ttl = negative_ttl
+        self._decoded: "OrderedDict[str, URLParams]" = OrderedDict()
+        self._unknown: "OrderedDict[str, float]" = OrderedDict()  # code -> когда забыть
+        self._lock = threading.Lock()
+        self.hits = 0
+        self.negative_hits = 0
+        self.misses = 0
 
-    # First try normal decoding
-    result = shortener.decode(code)
-    if result:
-        return result
+    def decode(self, code: str) -> Optional[URLParams]:
+        """Декодировать код; при неудаче - попытаться восстановить повреждённый"""
+        with self._lock:
+            params = self._decoded.get(code)
+            if params is not None:
+                self._decoded.move_to_end(code)
+                self.hits += 1
+                return params
+            expires_at = self._unknown.get(code)
+            if expires_at is not None:
+                if expires_at > time.monotonic():
+                    self.negative_hits += 1
+                    return None
+                del self._unknown[code]
+            self.misses += 1
+
+        params = self.shortener.decode_uncached(code) or self._recover(code)
+
+        with self._lock:
+            if params is not None:
+                self._decoded[code] = params
+                if len(self._decoded) > self.lru_size:
+                    self._decoded.popitem(last=False)
+            else:
+                self._unknown[code] = time.monotonic() + self.negative_ttl
+                if len(self._unknown) > self.negative_size:
+                    self._unknown.popitem(last=False)
+        return params
 
-    # Try alternative approaches for compressed codes
-    if code.startswith('c') and len(code) >= 3:
-        try:
-            # Try different campaign_id lengths and parameter interpretations
-            for campaign_len in [1, 2, 3]:
-                if len(code) <= campaign_len + 1:
-                    continue
+    def _recover(self, code: str) -> Optional[URLParams]:
+        """Запасные варианты для compressed кодов: разная длина campaign_id, сырые параметры"""
+        if not code.startswith('c') or len(code) < 3:
+            return None
 
-                campaign_part = code[1:1 + campaign_len]
-                params_part = code[1 + campaign_len:]
+        shortener = self.shortener
+        for campaign_len in [1, 2, 3]:
+            if len(code) <= campaign_len + 1:
+                continue
 
-                if not all(c in shortener.BASE62 for c in campaign_part):
-                    continue
+            campaign_part = code[1:1 + campaign_len]
+            params_part = code[1 + campaign_len:]
+            if not all(c in shortener.BASE62 for c in campaign_part):
+                continue
+            cid = str(shortener._decode_base62(campaign_part))
 
-                try:
-                    campaign_id_num = shortener._decode_base62(campaign_part)
+            # Параметры прямым текстом: "1:value1|2:value2|k:click_id"
+            if '|' in params_part:
+                return shortener._deserialize_params(params_part, cid)
 
-                    # Try interpreting params_part as direct parameter string
-                    if '|' in params_part:
-                        # Direct parameter format like "1:value1|2:value2|k:click_id"
-                        result = shortener._parse_params_string(params_part, str(campaign_id_num))
-                        if result:
-                            return result
+            # Параметры в base64 без zlib
+            try:
+                padding = (4 - len(params_part) % 4) % 4
+                text = base64.urlsafe_b64decode(params_part + '=' * padding).decode('utf-8')
+            except ValueError:
+                continue
+            if '|' in text:
+                return shortener._deserialize_params(text, cid)
 
-                    # Try as raw base64 without zlib
-                    try:
-                        padding = (4 - len(params_part) % 4) % 4
-                        padded = params_part + '=' * padding
-                        decoded = base64.urlsafe_b64decode(padded)
+        return None
 
-                        # Try as direct UTF-8
-                        try:
-                            text = decoded.decode('utf-8')
-                            if '|' in text:
-                                result = shortener._parse_params_string(text, str(campaign_id_num))
-                                if result:
-                                    return result
-                        except:
-                            pass
-                    except:
-                        pass
+    def clear(self):
+        with self._lock:
+            self._decoded.clear()
+            self._unknown.clear()
 
-                except:
-                    continue
-        except:
-            pass
+    def get_stats(self) -> Dict:
+        """Статистика кэшей декодера"""
+        return {
+            "decoded_cached": len(self._decoded),
+            "unknown_cached": len(self._unknown),
+            "hits": self.hits,
+            "negative_hits": self.negative_hits,
+            "misses": self.misses,
+        }
 
-    return None
+
+# Общий декодер процесса; создаётся при импорте, до fork() воркеров
+_code_decoder = ShortCodeDecoder(_url_shortener)
+
+
+def recover_unknown_code(code: str) -> Optional[URLParams]:
+    """
+    Try to recover parameters from unknown/damaged short codes.
+    Goes through the process-wide ShortCodeDecoder, so repeated bad codes are answered from its negative cache.
+    """
+    return _code_decoder.decode(code)
 
 
 # ==================== PUBLIC API ====================
 
 # Main public instance for import
 url_shortener = _url_shortener
+code_decoder = _code_decoder
 
 
 # ==================== COMPATIBILITY BINDINGS ====================
@@ -958,6 +1399,11 @@ class DecodedTrackingParams:
             result["click_id"] = self.click_id
         return result
 
+    @classmethod
+    def from_url_params(cls, params: URLParams) -> "DecodedTrackingParams":
+        return cls(campaign_id=params.cid, sub1=params.sub1, sub2=params.sub2, sub3=params.sub3,
+                   sub4=params.sub4, sub5=params.sub5, click_id=params.click_id)
+
 
 class TrackingURLDecoder:
     """
@@ -1488,8 +1934,9 @@ class TrackingURLHandler:
     Обработчик для интеграции с вашим ботом
     """
 
-    def __init__(self):
-        self.decoder = TrackingURLDecoder()
+    def __init__(self, decoder: Optional[ShortCodeDecoder] = None):
+        # Общий декодер процесса: кэши и mmap-хранилище не создаются на каждый обработчик
+        self.decoder = decoder or _code_decoder
 
     def handle_tracking_redirect(self, short_code: str) -> Optional[Dict]:
         """
@@ -1511,7 +1958,7 @@ class TrackingURLHandler:
                 print(f"Failed to decode tracking code: {short_code}")
                 return None
 
-            params = result.to_dict()
+            params = DecodedTrackingParams.from_url_params(result).to_dict()
 
             print(f"Decoded tracking params: {params}")
 
@@ -1633,9 +2080,9 @@ def demo():
     code4 = shortener.encode(params4, EncodingStrategy.SMART)
     print(f"First encoding: {code4} (длина: {len(code4)})")
 
-    # Повторное кодирование - должно использовать sequential
+    # Повторное кодирование - тот же ключ по содержимому
     code4_repeat = shortener.encode(params4, EncodingStrategy.SMART)
-    print(f"Second encoding: {code4_repeat} (должно быть короче)")
+    print(f"Second encoding: {code4_repeat} (тот же код: {code4_repeat == code4})")
 
     # Статистика
     print("\n5. STATISTICS")
@@ -16,6 +16,7 @@
 from .analytics_handler import AnalyticsHandler
 from .analyze_journey_handler import AnalyzeJourneyHandler
 from .bulk_click_handler import BulkClickHandler
+from .bulk_click_ingestion_handler import BulkClickIngestionHandler
 from .click_validation_handler import ClickValidationHandler
 from .cohort_analysis_handler import CohortAnalysisHandler
 from .create_campaign_handler import CreateCampaignHandler
@@ -56,6 +57,7 @@ __all__ = [
     'ManageGoalHandler',
     'AnalyzeJourneyHandler',
     'BulkClickHandler',
+    'BulkClickIngestionHandler',
     'ClickValidationHandler',
     'FraudHandler',
     'SystemHandler',
@@ -0,0 +1,148 @@
+# Copyright (c) 2025 Bivex
+#
+# Author: Bivex
+# Available for contact via email: support@b-b.top
+# For up-to-date contact information:
+# https://github.com/bivex
+#
+# Created: 2026-10-16T09:12:04
+# Last Updated: 2026-10-16T09:12:04
+#
+# Licensed under the MIT License.
+# Commercial licensing available upon request.
+
+"""Bulk click ingestion handler."""
+
+import asyncio
+import inspect
+from collections import Counter
+from datetime import datetime, timezone
+from typing import Any, Dict, List, Sequence, Tuple
+
+from loguru import logger
+
+from ...domain.entities.click import Click
+from ...domain.value_objects import CampaignId, ClickId
+
+_TEXT_FIELDS = (
+    'ip_address', 'user_agent', 'referrer',
+    'sub1', 'sub2', 'sub3', 'sub4', 'sub5',
+    'click_id_param', 'affiliate_sub', 'affiliate_sub2', 'affiliate_sub3', 'affiliate_sub4', 'affiliate_sub5',
+)
+_INT_FIELDS = ('landing_page_id', 'campaign_offer_id', 'traffic_source_id')
+
+# Rejected rows reported per batch; the counts always cover every row
+MAX_REPORTED_ERRORS = 20
+
+
+class BulkClickIngestionHandler:
+    """Handler that validates, scores and persists batches of streamed click records.
+
+    Each batch is screened with vectorized checks (required ids, timestamp and
+    referrer format, duplicate click ids), scored for fraud in one pass of the
+    compiled rule set and written with a single ``upsert_many`` (COPY on
+    PostgreSQL). Clicks scored as fraud are stored marked invalid, as on the
+    tracking path, and only valid clicks that were not stored before are added
+    to the campaign click counters.
+    """
+
+    def __init__(self, click_repository, click_validation_service, click_screener, batch_size: int = 1000,
+                 campaign_counters=None):
+        self._click_repository = click_repository
+        self._click_validation_service = click_validation_service
+        self._click_screener = click_screener
+        self._campaign_counters = campaign_counters
+        self.batch_size = batch_size
+
+    async def handle_batch(self, batch: int, records: Sequence[Tuple[int, Dict[str, Any]]],
+                           malformed: Sequence[Tuple[int, str]] = ()) -> Dict[str, Any]:
+        """Ingest one batch of ``(line, record)`` pairs.
+
+        Args:
+            batch: Batch number, echoed in the result
+            records: Parsed records with the body line they came from
+            malformed: ``(line, reason)`` for body lines that could not be parsed
+
+        Returns:
+            Dict with the batch's received/accepted/rejected/fraudulent counts
+            and the first rejected rows
+        """
+        rejected: List[Tuple[int, str]] = list(malformed)
+        clicks: List[Click] = []
+
+        if records:
+            invalid, duplicate = self._click_screener.screen_clicks([record for _, record in records])
+            for (line, record), is_invalid, is_duplicate in zip(records, invalid, duplicate):
+                if is_invalid:
+                    rejected.append((line, "missing click_id/campaign_id or malformed timestamp/referrer"))
+                elif is_duplicate:
+                    rejected.append((line, "duplicate click_id in batch"))
+                else:
+                    try:
+                        clicks.append(self._build_click(record))
+                    except (TypeError, ValueError) as e:
+                        rejected.append((line, str(e)))
+
+        fraudulent = 0
+        if clicks:
+            verdicts = self._click_validation_service.evaluate_batch(clicks)
+            for click, verdict in zip(clicks, verdicts):
+                if not verdict.is_valid:
+                    click.mark_as_fraudulent(verdict.reason, verdict.score)
+                    fraudulent += 1
+
+            try:
+                inserted = set(await self._upsert(clicks))
+            except Exception as e:
+                logger.error(f"Bulk click ingestion batch {batch} failed to persist: {e}", exc_info=True)
+                return self._result(batch, len(records) + len(malformed), [], rejected, 0,
+                                    error="Failed to persist batch")
+
+            if self._campaign_counters is not None:
+                # A resubmitted batch upserts the same rows again; count each click once
+                valid_per_campaign = Counter(click.campaign_id.value for click in clicks
+                                             if click.is_valid and click.id.value in inserted)
+                for campaign_id, count in valid_per_campaign.items():
+                    self._campaign_counters.increment(campaign_id, clicks=count)
+
+        return self._result(batch, len(records) + len(malformed), clicks, rejected, fraudulent)
+
+    async def _upsert(self, clicks: List[Click]) -> List[str]:
+        """Write a batch; blocking (psycopg2) repositories run in the default executor, off the loop."""
+        upsert_many = self._click_repository.upsert_many
+        if inspect.iscoroutinefunction(upsert_many):
+            return await upsert_many(clicks)
+        return await asyncio.get_running_loop().run_in_executor(None, upsert_many, clicks)
+
+    @staticmethod
+    def _result(batch: int, received: int, clicks: List[Click], rejected: List[Tuple[int, str]],
+                fraudulent: int, error: str = None) -> Dict[str, Any]:
+        result = {
+            "batch": batch,
+            "received": received,
+            "accepted": len(clicks),
+            "rejected": received - len(clicks),
+            "fraudulent": fraudulent,
+            "errors": [{"line": line, "reason": reason}
+                       for line, reason in sorted(rejected)[:MAX_REPORTED_ERRORS]],
+        }
+        if error:
+            result["error"] = error
+        return result
+
+    @staticmethod
+    def _build_click(record: Dict[str, Any]) -> Click:
+        """Build a Click from a record; the entity rejects bad IPs and tracking parameters."""
+        click_data = {name: str(record[name]) for name in _TEXT_FIELDS if record.get(name) is not None}
+        click_data.update({name: int(record[name]) for name in _INT_FIELDS if record.get(name) is not None})
+
+        timestamp = record.get('timestamp')
+        if timestamp is not None:
+            created_at = datetime.fromisoformat(str(timestamp))
+            click_data['created_at'] = created_at if created_at.tzinfo else created_at.replace(tzinfo=timezone.utc)
+
+        return Click(
+            id=ClickId.from_string(str(record['click_id'])),
+            campaign_id=CampaignId.from_string(str(record['campaign_id'])),
+            **click_data
+        )
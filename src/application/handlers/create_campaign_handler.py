@@ -22,8 +22,9 @@ from ...domain.value_objects import CampaignId, Url
 class CreateCampaignHandler:
     """Handler for creating campaigns."""
 
-    def __init__(self, campaign_repository: CampaignRepository):
+    def __init__(self, campaign_repository: CampaignRepository, routing_cache=None):
         self._campaign_repository = campaign_repository
+        self._routing_cache = routing_cache
 
     def handle(self, command: CreateCampaignCommand) -> Campaign:
         """Handle create campaign command."""
@@ -52,4 +53,8 @@ class CreateCampaignHandler:
         # Save to repository
         self._campaign_repository.save(campaign)
 
+        # Drop any snapshot cached under this id (e.g. a miss from an early click) so it is routable
+        if self._routing_cache is not None:
+            self._routing_cache.invalidate_campaign(campaign_id)
+
         return campaign
@@ -23,8 +23,9 @@ from ...domain.repositories.landing_page_repository import LandingPageRepository
 class CreateLandingPageHandler:
     """Handler for creating landing pages."""
 
-    def __init__(self, landing_page_repository: LandingPageRepository):
+    def __init__(self, landing_page_repository: LandingPageRepository, routing_cache=None):
         self._landing_page_repository = landing_page_repository
+        self._routing_cache = routing_cache
 
     def handle(self, command: CreateLandingPageCommand) -> LandingPage:
         """
@@ -53,4 +54,8 @@ class CreateLandingPageHandler:
         # Save to repository
         self._landing_page_repository.save(landing_page)
 
+        # Recompile the campaign's redirect table so the new landing page is routable
+        if self._routing_cache is not None:
+            self._routing_cache.invalidate_campaign(command.campaign_id)
+
         return landing_page
@@ -23,8 +23,9 @@ from ...domain.repositories.offer_repository import OfferRepository
 class CreateOfferHandler:
     """Handler for creating offers."""
 
-    def __init__(self, offer_repository: OfferRepository):
+    def __init__(self, offer_repository: OfferRepository, routing_cache=None):
         self._offer_repository = offer_repository
+        self._routing_cache = routing_cache
 
     def handle(self, command: CreateOfferCommand) -> Offer:
         """
@@ -56,4 +57,8 @@ class CreateOfferHandler:
         # Save to repository
         self._offer_repository.save(offer)
 
+        # Recompile the campaign's redirect table so the new offer is routable
+        if self._routing_cache is not None:
+            self._routing_cache.invalidate_campaign(command.campaign_id)
+
         return offer
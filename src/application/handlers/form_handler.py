@@ -20,14 +20,16 @@ from loguru import logger
 
 from ...domain.repositories.form_repository import FormRepository
 from ...domain.services.form.form_service import FormService
+from ...domain.services.traffic.user_agent_classifier import UserAgentClassifier
 
 
 class FormHandler:
     """Handler for form processing operations."""
 
-    def __init__(self, form_repository: FormRepository):
+    def __init__(self, form_repository: FormRepository,
+                 user_agent_classifier: Optional[UserAgentClassifier] = None):
         self._form_repository = form_repository
-        self._form_service = FormService()
+        self._form_service = FormService(user_agent_classifier=user_agent_classifier)
 
     def submit_form(self, form_data: Dict[str, Any], campaign_id: Optional[str] = None,
                     click_id: Optional[str] = None, ip_address: str = "",
@@ -13,19 +13,95 @@
 
 """Fraud detection handler."""
 
-from typing import Dict, Any, Optional
+import asyncio
+import re
+import threading
+import uuid
+from typing import Dict, Any, List, Optional
 
 from loguru import logger
 
+from ...domain.services.click import FraudRule, FraudRuleEngine
+
+# Invalidation namespace on which rule changes are announced to the other workers
+FRAUD_RULES_NAMESPACE = 'fraud_rules'
+
 
 class FraudHandler:
     """Handler for fraud detection operations."""
 
-    def __init__(self, fraud_repository=None):
-        """Initialize fraud handler."""
-        # TODO: Implement FraudRepository for persistent fraud rule storage
+    def __init__(self, fraud_repository=None, rule_engine: Optional[FraudRuleEngine] = None, invalidator=None):
+        """Initialize fraud handler.
+
+        Args:
+            fraud_repository: Optional persistent rule store (``find_all()``/``save(rule)``)
+            rule_engine: Engine used by click validation; rules are hot-reloaded into it on every change
+            invalidator: Optional PostgresCacheInvalidator; rule changes are published on it and the
+                other workers reload their rules from the store
+        """
         self._fraud_repository = fraud_repository
-        self._rules = []  # Empty until repository is implemented
+        self._rule_engine = rule_engine
+        self._invalidator = invalidator
+        self._lock = threading.Lock()
+        self._rules: List[FraudRule] = list(fraud_repository.find_all()) if fraud_repository else []
+        self._reload_engine()
+        if invalidator is not None and fraud_repository is not None:
+            invalidator.subscribe(FRAUD_RULES_NAMESPACE, self._on_rules_changed)
+
+    def _on_rules_changed(self, _rule_id) -> None:
+        """Rules changed in another worker; reload them without blocking the event loop."""
+        asyncio.get_running_loop().run_in_executor(None, self.reload_rules)
+
+    def reload_rules(self) -> None:
+        """Replace the rule list with the store's and recompile the engine."""
+        try:
+            rules = list(self._fraud_repository.find_all())
+            with self._lock:
+                if self._rule_engine is not None:
+                    self._rule_engine.load_rules(rules)
+                self._rules = rules
+            logger.info(f"Fraud rules reloaded from the store: {len(rules)} rules")
+        except Exception as e:
+            logger.error(f"Failed to reload fraud rules: {e}", exc_info=True)
+
+    def _reload_engine(self) -> None:
+        """Recompile the click validation rules from the current rule list."""
+        if self._rule_engine is not None:
+            self._rule_engine.load_rules(self._rules)
+            logger.info(f"Fraud rule engine reloaded with {len(self._rules)} rules")
+
+    @staticmethod
+    def _rule_to_dict(rule: FraudRule) -> Dict[str, Any]:
+        return {
+            "id": rule.id,
+            "name": rule.name,
+            "type": rule.type,
+            "action": rule.action,
+            "patterns": list(rule.patterns),
+            "score": rule.score,
+            "campaignId": rule.campaign_id,
+            "isActive": rule.is_active,
+            "priority": rule.priority,
+        }
+
+    @staticmethod
+    def _rule_from_dict(rule_data: Dict[str, Any]) -> FraudRule:
+        patterns = rule_data.get('patterns')
+        if patterns is None and rule_data.get('pattern'):
+            patterns = [rule_data['pattern']]
+        if not isinstance(patterns, list) or not all(isinstance(p, str) and p for p in patterns):
+            raise ValueError("patterns must be a non-empty list of strings")
+        return FraudRule(
+            id=f"rule_{uuid.uuid4().hex[:8]}",
+            name=str(rule_data['name']),
+            type=rule_data['type'],
+            action=rule_data['action'],
+            patterns=tuple(patterns),
+            score=float(rule_data.get('score', 1.0)),
+            campaign_id=str(rule_data['campaignId']) if rule_data.get('campaignId') else None,
+            is_active=bool(rule_data.get('isActive', True)),
+            priority=int(rule_data.get('priority', 0)),
+        )
 
     def list_rules(self, page: int = 1, page_size: int = 20,
                    rule_type: Optional[str] = None, active_only: bool = False) -> Dict[str, Any]:
@@ -44,18 +120,7 @@ class FraudHandler:
             logger.info(
                 f"Listing fraud rules: page={page}, size={page_size}, type={rule_type}, active_only={active_only}")
 
-            # TODO: Implement real fraud rule repository
-            # For now, return empty results
-            return {
-                "rules": [],
-                "pagination": {
-                    "page": page,
-                    "pageSize": page_size,
-                    "total": 0,
-                    "totalPages": 0
-                },
-                "message": "Fraud rule repository not yet implemented"
-            }
+            filtered_rules = [self._rule_to_dict(rule) for rule in self._rules]
 
             if rule_type:
                 filtered_rules = [r for r in filtered_rules if r['type'] == rule_type]
@@ -115,13 +180,25 @@ class FraudHandler:
         try:
             logger.info("Creating new fraud rule")
 
-            # TODO: Implement FraudRepository for persistent fraud rule storage
-            return {
-                "error": {
-                    "code": "NOT_IMPLEMENTED",
-                    "message": "Fraud rule repository not yet implemented. Use database-backed fraud detection instead."
-                }
-            }
+            try:
+                rule = self._rule_from_dict(rule_data)
+                with self._lock:
+                    rules = self._rules + [rule]
+                    # Compile first: a rule the engine rejects is never stored
+                    if self._rule_engine is not None:
+                        self._rule_engine.load_rules(rules)
+                    if self._fraud_repository is not None:
+                        self._fraud_repository.save(rule)
+                    self._rules = rules
+            except (ValueError, TypeError, KeyError, re.error) as e:
+                return {"error": {"code": "VALIDATION_ERROR", "message": f"Invalid fraud rule: {e}"}}
+
+            if self._invalidator is not None:
+                self._invalidator.publish(FRAUD_RULES_NAMESPACE, rule.id)
+
+            logger.info(f"Fraud rule {rule.id} ({rule.type}/{rule.action}) active, engine hot-reloaded")
+
+            return {"status": "success", "rule": self._rule_to_dict(rule)}
 
         except Exception as e:
             logger.error(f"Error creating fraud rule: {e}", exc_info=True)
@@ -34,13 +34,16 @@ class GamingWebhookHandler:
             click_repository: ClickRepository,
             customer_ltv_repository: CustomerLtvRepository,
             conversion_service: ConversionService,
-            gaming_webhook_service: GamingWebhookService
+            gaming_webhook_service: GamingWebhookService,
+            unit_of_work
     ):
         self.conversion_repository = conversion_repository
         self.click_repository = click_repository
         self.customer_ltv_repository = customer_ltv_repository
         self.conversion_service = conversion_service
         self.gaming_webhook_service = gaming_webhook_service
+        # Factory of per-request units of work, shared with the other conversion handlers
+        self.unit_of_work = unit_of_work
 
     def handle_deposit(self, deposit_data: Dict[str, Any]) -> Dict[str, Any]:
         """Handle deposit webhook from gaming platform."""
@@ -142,7 +145,7 @@ class GamingWebhookHandler:
             # Step 5: Save conversion
             logger.info(f"💾 Step 5: Saving conversion to database | TX:{transaction_id} | Conv:{conversion.id}")
             try:
-                self.conversion_repository.save(conversion)
+                self._save(self.conversion_repository, conversion)
                 logger.info(f"✅ Saved conversion to database | TX:{transaction_id} | Conv:{conversion.id}")
             except Exception as e:
                 logger.error(f"❌ ERROR in database save step | TX:{transaction_id} | Conv:{conversion.id} | {e}",
@@ -248,7 +251,7 @@ class GamingWebhookHandler:
             conversion = self._create_registration_conversion(registration_data, click)
 
             # Save conversion
-            self.conversion_repository.save(conversion)
+            self._save(self.conversion_repository, conversion)
             logger.info(f"Registration conversion saved: {conversion.id}")
 
             return {
@@ -265,6 +268,11 @@ class GamingWebhookHandler:
                 "message": str(e)
             }
 
+    def _save(self, repository, entity) -> None:
+        """Write ``entity`` through ``repository`` in one unit of work."""
+        with self.unit_of_work() as uow:
+            uow.add(repository.save, entity)
+
     def _create_deposit_conversion(self, deposit_data: Dict[str, Any], click) -> Conversion:
         """Create a deposit conversion entity."""
         transaction_id = deposit_data.get('transaction_id', 'unknown')
@@ -422,7 +430,7 @@ class GamingWebhookHandler:
                 else:
                     ltv_record.segment = 'casual'
 
-            self.customer_ltv_repository.save(ltv_record)
+            self._save(self.customer_ltv_repository, ltv_record)
             logger.info(f"LTV updated for customer {user_id}: total_revenue={ltv_record.total_revenue}")
 
         except Exception as e:
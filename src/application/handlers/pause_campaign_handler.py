@@ -22,8 +22,9 @@ from ...domain.value_objects import CampaignStatus
 class PauseCampaignHandler:
     """Handler for pausing campaigns."""
 
-    def __init__(self, campaign_repository: CampaignRepository):
+    def __init__(self, campaign_repository: CampaignRepository, routing_cache=None):
         self._campaign_repository = campaign_repository
+        self._routing_cache = routing_cache
 
     def handle(self, command: PauseCampaignCommand) -> Campaign:
         """
@@ -63,4 +64,8 @@ class PauseCampaignHandler:
         # Save updated campaign
         self._campaign_repository.save(campaign)
 
+        # Drop the cached routing snapshot here and in the other workers
+        if self._routing_cache is not None:
+            self._routing_cache.invalidate_campaign(campaign.id)
+
         return campaign
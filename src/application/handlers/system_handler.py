@@ -13,25 +13,64 @@
 
 """System administration handler."""
 
+import asyncio
 import time
 from typing import Dict, Any, List
 
 from loguru import logger
 
+# Invalidation namespace on which IP reputation reloads are announced to the other workers
+IP_REPUTATION_NAMESPACE = 'ip_reputation'
+
 
 class SystemHandler:
     """Handler for system administration operations."""
 
-    def __init__(self):
-        """Initialize system handler."""
-        # TODO: Implement real cache monitoring when caching is added
-        pass
+    CACHE_TYPES = ('campaigns', 'landing_pages', 'offers', 'analytics', 'user_agents', 'auth_tokens')
+
+    def __init__(self, click_write_buffer=None, campaign_counters=None, routing_cache=None,
+                 user_agent_classifier=None, ip_reputation=None, token_cache=None, invalidator=None):
+        """Initialize system handler.
+
+        Args:
+            click_write_buffer: Optional write-behind click buffer whose metrics are exposed
+            campaign_counters: Optional campaign counter aggregator whose metrics are exposed
+            routing_cache: Optional campaign/landing page/offer routing cache to monitor and flush
+            user_agent_classifier: Optional user-agent verdict cache to monitor and flush
+            ip_reputation: Optional IP reputation service to reload from its files
+            token_cache: Optional verified JWT claims cache to monitor and flush
+            invalidator: Optional PostgresCacheInvalidator; IP reputation reloads are published on it
+                and the other workers rebuild their index from the same files
+        """
+        self._click_write_buffer = click_write_buffer
+        self._campaign_counters = campaign_counters
+        self._routing_cache = routing_cache
+        self._user_agent_classifier = user_agent_classifier
+        self._ip_reputation = ip_reputation
+        self._token_cache = token_cache
+        self._invalidator = invalidator
+        if invalidator is not None and ip_reputation is not None:
+            invalidator.subscribe(IP_REPUTATION_NAMESPACE, self._on_ip_reputation_reloaded)
+
+    def _on_ip_reputation_reloaded(self, _key) -> None:
+        """IP reputation was reloaded in another worker; rebuild the index off the event loop."""
+        asyncio.get_running_loop().run_in_executor(None, self._reload_ip_reputation_quietly)
+
+    def _reload_ip_reputation_quietly(self) -> None:
+        try:
+            stats = self._ip_reputation.reload()
+            logger.info(f"IP reputation index reloaded on another worker's request: {stats}")
+        except RuntimeError:
+            pass  # No loader configured in this worker
+        except Exception as e:
+            logger.error(f"Failed to reload IP reputation data: {e}", exc_info=True)
 
     def flush_cache(self, cache_types: List[str]) -> Dict[str, Any]:
         """Flush cache with specified types.
 
         Args:
-            cache_types: List of cache types to flush ('campaigns', 'landing_pages', 'offers', 'analytics', 'all')
+            cache_types: List of cache types to flush
+                ('campaigns', 'landing_pages', 'offers', 'analytics', 'user_agents', 'auth_tokens', 'all')
 
         Returns:
             Dict containing flush results and statistics
@@ -40,33 +79,33 @@ class SystemHandler:
             logger.info(f"Flushing cache for types: {cache_types}")
 
             start_time = time.time()
-            flushed_keys = 0
 
             # Determine what to flush
             if 'all' in cache_types:
-                # Flush everything
-                flushed_keys = self._cache_stats['total']['keys']
-                flushed_types = ['campaigns', 'landing_pages', 'offers', 'analytics']
+                flushed_types = list(self.CACHE_TYPES)
             else:
-                # Flush specific types
-                flushed_types = cache_types
-                for cache_type in flushed_types:
-                    if cache_type in self._cache_stats:
-                        flushed_keys += self._cache_stats[cache_type]['keys']
+                flushed_types = [t for t in cache_types if t in self.CACHE_TYPES]
+
+            # Routing snapshots are flushed here and, via NOTIFY, in every other worker.
+            # Analytics results are not cached in-process, so there is nothing to drop for them.
+            flushed_by_type = {}
+            if self._routing_cache is not None:
+                flushed_by_type = self._routing_cache.flush(
+                    [t for t in flushed_types if t in self._routing_cache.NAMESPACES])
+            # User-agent verdicts are per-process and deterministic, so no broadcast is needed.
+            if self._user_agent_classifier is not None and 'user_agents' in flushed_types:
+                flushed_by_type['user_agents'] = self._user_agent_classifier.clear()
+            if self._token_cache is not None and 'auth_tokens' in flushed_types:
+                flushed_by_type['auth_tokens'] = self._token_cache.clear()
+            flushed_keys = sum(flushed_by_type.values())
 
-            # Simulate cache flush operation
             flush_time = time.time() - start_time
 
-            # In a real implementation, this would:
-            # 1. Clear Redis cache keys matching patterns
-            # 2. Clear in-memory caches
-            # 3. Invalidate CDN caches if applicable
-            # 4. Update cache statistics
-
             result = {
                 "status": "success",
                 "message": f"Cache flushed successfully for types: {', '.join(flushed_types)}",
                 "flushed_keys": flushed_keys,
+                "flushed_keys_by_type": flushed_by_type,
                 "flush_time_ms": round(flush_time * 1000, 2),
                 "flushed_types": flushed_types,
                 "timestamp": time.strftime('%Y-%m-%dT%H:%M:%SZ', time.gmtime())
@@ -94,17 +133,21 @@ class SystemHandler:
         try:
             logger.info("Getting cache statistics")
 
-            # TODO: Implement real cache monitoring when caching is added
+            cache_types = {cache_type: {"enabled": False, "keys": 0} for cache_type in self.CACHE_TYPES}
+            routing = self._routing_cache.get_stats() if self._routing_cache is not None else None
+            if routing is not None:
+                cache_types.update(routing['namespaces'])
+            if self._user_agent_classifier is not None:
+                cache_types['user_agents'] = self._user_agent_classifier.get_stats()
+            if self._token_cache is not None:
+                cache_types['auth_tokens'] = self._token_cache.get_stats()
+
             return {
                 "status": "success",
-                "message": "Cache monitoring not yet implemented",
-                "cache_types": {
-                    "campaigns": {"enabled": False, "keys": 0, "size_mb": 0.0},
-                    "landing_pages": {"enabled": False, "keys": 0, "size_mb": 0.0},
-                    "offers": {"enabled": False, "keys": 0, "size_mb": 0.0},
-                    "analytics": {"enabled": False, "keys": 0, "size_mb": 0.0}
-                },
-                "total": {"keys": 0, "size_mb": 0.0},
+                "cache_types": cache_types,
+                "total": {"keys": sum(stats['keys'] for stats in cache_types.values())},
+                "ttl_seconds": routing['ttl_seconds'] if routing else None,
+                "invalidation": routing['invalidator'] if routing else {"enabled": False},
                 "timestamp": time.strftime('%Y-%m-%dT%H:%M:%SZ', time.gmtime())
             }
 
@@ -116,3 +159,44 @@ class SystemHandler:
                 "error": str(e),
                 "timestamp": time.strftime('%Y-%m-%dT%H:%M:%SZ', time.gmtime())
             }
+
+    def get_ingestion_stats(self) -> Dict[str, Any]:
+        """Get write-behind ingestion statistics.
+
+        Returns:
+            Dict containing click buffer and campaign counter statistics
+        """
+        click_buffer = self._click_write_buffer.get_stats() if self._click_write_buffer else {"enabled": False}
+        campaign_counters = self._campaign_counters.get_stats() if self._campaign_counters else {"enabled": False}
+        return {
+            "status": "success",
+            "click_buffer": click_buffer,
+            "campaign_counters": campaign_counters,
+            "timestamp": time.strftime('%Y-%m-%dT%H:%M:%SZ', time.gmtime())
+        }
+
+    async def reload_ip_reputation(self) -> Dict[str, Any]:
+        """Rebuild the IP reputation index from its files and swap it in atomically.
+
+        The files are parsed in the default executor, and the other workers are
+        told to reload as well.
+
+        Returns:
+            Dict containing the new index statistics
+        """
+        timestamp = time.strftime('%Y-%m-%dT%H:%M:%SZ', time.gmtime())
+        if self._ip_reputation is None:
+            return {"status": "disabled", "message": "IP reputation is not configured", "timestamp": timestamp}
+        try:
+            stats = await asyncio.get_running_loop().run_in_executor(None, self._ip_reputation.reload)
+            logger.info(f"IP reputation index reloaded: {stats}")
+            if self._invalidator is not None:
+                self._invalidator.publish(IP_REPUTATION_NAMESPACE, None)
+            return {"status": "success", "ip_reputation": stats, "broadcast": self._invalidator is not None,
+                    "timestamp": timestamp}
+        except RuntimeError as e:
+            return {"status": "disabled", "message": str(e), "timestamp": timestamp}
+        except Exception as e:
+            logger.error(f"Error reloading IP reputation data: {e}", exc_info=True)
+            return {"status": "error", "message": "IP reputation reload failed", "error": str(e),
+                    "timestamp": timestamp}
@@ -24,8 +24,13 @@ from ...domain.repositories.click_repository import ClickRepository
 from ...domain.repositories.landing_page_repository import LandingPageRepository
 from ...domain.repositories.offer_repository import OfferRepository
 from ...domain.repositories.pre_click_data_repository import PreClickDataRepository
-from ...domain.services.click import ClickValidationService
-from ...domain.value_objects import ClickId, CampaignId, Url
+from ...domain.services.click import ClickValidationService, RedirectDecisionTable, RedirectTarget, \
+    FALLBACK_REDIRECT_URL
+from ...domain.value_objects import ClickId, CampaignId
+from ...utils.awaitables import maybe_await
+from ...utils.structured_logging import log_gate
+
+_DEBUG = log_gate(__name__, "DEBUG", sampled=True)
 
 
 class TrackClickHandler:
@@ -37,55 +42,89 @@ class TrackClickHandler:
                  landing_page_repository: LandingPageRepository,
                  offer_repository: OfferRepository,
                  pre_click_data_repository: PreClickDataRepository,
-                 click_validation_service: ClickValidationService):
+                 click_validation_service: ClickValidationService,
+                 unit_of_work,
+                 click_write_buffer=None,
+                 campaign_counters=None,
+                 routing_cache=None):
         self._click_repository = click_repository
         self._campaign_repository = campaign_repository
         self._landing_page_repository = landing_page_repository
         self._offer_repository = offer_repository
         self._pre_click_data_repository = pre_click_data_repository
         self._click_validation_service = click_validation_service
+        self._click_write_buffer = click_write_buffer
+        self._campaign_counters = campaign_counters
+        self._routing_cache = routing_cache
+        # Factory of per-request units of work: one connection and one commit per click
+        self._unit_of_work = unit_of_work
 
-    async def handle(self, command: TrackClickCommand) -> Tuple[Click, Url, bool]:
+    async def handle(self, command: TrackClickCommand) -> Tuple[Click, str, bool]:
         """
         Handle track click command.
 
         Returns:
-            Tuple of (click, redirect_url, is_valid_click)
+            Tuple of (click, redirect_location, is_valid_click)
         """
-        campaign = self._find_campaign(command.campaign_id)
+        campaign = await self._find_campaign(command.campaign_id)
 
         if not campaign:
             return await self._handle_unknown_campaign(command)
 
-        click = await self._create_click_from_command(command)  # Await the async call
-        is_valid = self._validate_click_and_mark_fraud(click)
+        # Pre-click take, click insert and campaign update commit together; the writes go out on exit
+        async with self._unit_of_work() as uow:
+            click = await self._create_click_from_command(command, uow)
+            is_valid = self._validate_click_and_mark_fraud(click, campaign.id.value)
 
-        redirect_url = self._determine_redirect_url(campaign, is_valid, command.test_mode, click.id.value, command)
+            await self._save_click(click, uow)
 
-        # Save click
-        self._click_repository.save(click)
+            # Update campaign performance if valid click
+            if is_valid:
+                await self._update_campaign_performance(campaign, uow)
 
-        # Update campaign performance if valid click
-        if is_valid:
-            self._update_campaign_performance(campaign)
+        # Resolved after the unit has released its connection: lookups may need one of their own
+        redirect_url = await self._determine_redirect_url(campaign, is_valid, command.test_mode, click.id.value,
+                                                          command)
 
         return click, redirect_url, is_valid
 
-    def _find_campaign(self, campaign_id_str: str):
+    async def _save_click(self, click: Click, uow) -> None:
+        """Queue the click for write-behind persistence, or write it with the unit of work if the buffer has no room."""
+        if self._click_write_buffer is not None:
+            if await self._click_write_buffer.add(click):
+                return
+            logger.warning(f"Click write buffer rejected click {click.id.value}; saving directly")
+        uow.add(self._click_repository.save, click)
+
+    async def _find_campaign(self, campaign_id_str: str):
         """Find campaign by ID."""
         campaign_id = CampaignId.from_string(campaign_id_str)
-        return self._campaign_repository.find_by_id(campaign_id)
-
-    async def _handle_unknown_campaign(self, command: TrackClickCommand) -> Tuple[Click, Url, bool]:
+        if self._routing_cache is not None:
+            return await self._routing_cache.get_campaign(campaign_id)
+        return await maybe_await(self._campaign_repository.find_by_id(campaign_id))
+
+    async def _find_landing_page(self, landing_page_id):
+        """Find landing page by ID."""
+        if self._routing_cache is not None:
+            return await self._routing_cache.get_landing_page(landing_page_id)
+        return await maybe_await(self._landing_page_repository.find_by_id(str(landing_page_id)))
+
+    async def _find_offer(self, offer_id):
+        """Find offer by ID."""
+        if self._routing_cache is not None:
+            return await self._routing_cache.get_offer(offer_id)
+        return await maybe_await(self._offer_repository.find_by_id(str(offer_id)))
+
+    async def _handle_unknown_campaign(self, command: TrackClickCommand) -> Tuple[Click, str, bool]:
         """Handle clicks for unknown campaigns."""
-        safe_url = Url("http://localhost:5000/mock-safe-page")
-        click = await self._create_click_from_command(command)
-        return click, safe_url, False
+        async with self._unit_of_work() as uow:
+            click = await self._create_click_from_command(command, uow)
+        return click, FALLBACK_REDIRECT_URL, False
 
-    def _validate_click_and_mark_fraud(self, click: Click) -> bool:
-        """Validate click for fraud and mark if fraudulent."""
+    def _validate_click_and_mark_fraud(self, click: Click, campaign_id: str) -> bool:
+        """Validate click for fraud (global and per-campaign rules) and mark if fraudulent."""
         is_valid, fraud_reason, fraud_score = self._click_validation_service.validate_click(
-            click, campaign_filters={}
+            click, campaign_id=campaign_id
         )
 
         if not is_valid:
@@ -93,71 +132,59 @@ class TrackClickHandler:
 
         return is_valid
 
-    def _determine_redirect_url(self, campaign, is_valid: bool, test_mode: bool, click_id: str,
-                                command: TrackClickCommand) -> Url:
-        """Determine redirect URL based on validation, campaign settings, and specific parameters."""
-        redirect_url = None
-
-        # Priority 1: Use specific landing page if provided (overrides everything)
-        if command.landing_page_id:
-            try:
-                landing_page = self._landing_page_repository.find_by_id(str(command.landing_page_id))
-                if landing_page and landing_page.is_active:
-                    redirect_url = landing_page.url
-                    logger.info(
-                        f"Using specific landing page URL for lp_id {command.landing_page_id}: {landing_page.url.value}")
-                    # For direct landing page links, skip fraud checks
-                    is_valid = True
-                else:
-                    logger.warning(f"Landing page {command.landing_page_id} not found or inactive")
-            except Exception as e:
-                logger.warning(f"Failed to find landing page {command.landing_page_id}: {e}")
-
-        # Priority 2: Use specific offer if provided (overrides campaign settings)
-        if not redirect_url and command.campaign_offer_id:
-            try:
-                offer = self._offer_repository.find_by_id(str(command.campaign_offer_id))
-                if offer and offer.is_active:
-                    redirect_url = offer.url
-                    logger.info(f"Using specific offer URL for offer_id {command.campaign_offer_id}: {offer.url.value}")
-                    # For direct offer links, skip fraud checks
-                    is_valid = True
-                else:
-                    logger.warning(f"Offer {command.campaign_offer_id} not found or inactive")
-            except Exception as e:
-                logger.warning(f"Failed to find offer {command.campaign_offer_id}: {e}")
-
-        # Priority 3: Use campaign's offer page for valid clicks
-        if not redirect_url and is_valid:
-            if campaign.offer_page_url:
-                redirect_url = campaign.offer_page_url
-                logger.info("Using campaign offer page URL (valid click)")
-            elif campaign.safe_page_url:
-                redirect_url = campaign.safe_page_url
-                logger.info("Using campaign safe page URL (valid click, no offer URL)")
-
-        # Priority 4: Use campaign's safe page for invalid clicks
-        if not redirect_url and not is_valid and campaign.safe_page_url:
-            redirect_url = campaign.safe_page_url
-            logger.info("Using campaign safe page URL (invalid click)")
-
-        # Fallback
-        if not redirect_url:
-            redirect_url = Url("http://localhost:5000/mock-safe-page")
-            logger.warning("Using fallback safe page URL")
-
-        # Add click ID to redirect URL if in test mode
-        if test_mode:
-            redirect_url = redirect_url.with_query_params({'click_id': click_id})
-
-        return redirect_url
-
-    def _update_campaign_performance(self, campaign):
+    async def _determine_redirect_url(self, campaign, is_valid: bool, test_mode: bool, click_id: str,
+                                      command: TrackClickCommand) -> str:
+        """Determine the redirect location from the campaign's precompiled decision table.
+
+        Cached campaign snapshots carry a compiled RedirectDecisionTable, so this is a
+        dict lookup plus a string concat; no Url objects are built and nothing is parsed.
+        """
+        table = getattr(campaign, 'redirects', None)
+        if table is None:
+            # Plain entity (routing cache disabled): compile for this click
+            table = RedirectDecisionTable.compile(campaign)
+
+        landing_page_id = str(command.landing_page_id) if command.landing_page_id else None
+        offer_id = str(command.campaign_offer_id) if command.campaign_offer_id else None
+        target = table.decide(is_valid, landing_page_id, offer_id)
+        if landing_page_id not in table.landing_pages and offer_id not in table.offers:
+            # Table miss: the landing page/offer may belong to another campaign, look it up before the default
+            resolved = None
+            if landing_page_id:
+                resolved = await self._resolve_target(self._find_landing_page, landing_page_id, "Landing page")
+            if resolved is None and offer_id:
+                resolved = await self._resolve_target(self._find_offer, offer_id, "Offer")
+            target = resolved or target
+
+        return target.build(click_id, test_mode)
+
+    async def _resolve_target(self, find, entity_id: str, label: str):
+        """Compile a target for a landing page/offer outside the campaign's table (e.g. another campaign's)."""
+        try:
+            entity = await find(entity_id)
+        except Exception as e:
+            logger.warning(f"Failed to find {label.lower()} {entity_id}: {e}")
+            return None
+        if not entity or not entity.is_active:
+            logger.warning(f"{label} {entity_id} not found or inactive")
+            return None
+        return getattr(entity, 'target', None) or RedirectTarget.compile(entity.url)
+
+    async def _update_campaign_performance(self, campaign, uow):
         """Update campaign performance metrics."""
+        if self._campaign_counters is not None:
+            # Aggregated in memory and applied as an atomic increment; no read-modify-write of the row
+            self._campaign_counters.increment(campaign.id.value, clicks=1)
+            return
+        if not hasattr(campaign, 'update_performance'):
+            # Cached routing snapshots are read-only; load the entity for the read-modify-write
+            campaign = await maybe_await(uow.run(self._campaign_repository.find_by_id, campaign.id))
+            if campaign is None:
+                return
         campaign.update_performance(clicks_increment=1)
-        self._campaign_repository.save(campaign)
+        uow.add(self._campaign_repository.save, campaign)
 
-    async def _create_click_from_command(self, command: TrackClickCommand) -> Click:
+    async def _create_click_from_command(self, command: TrackClickCommand, uow) -> Click:
         """Create Click entity from command, enriched with PreClickData."""
         if command.click_id_param:
             click_id = ClickId.from_string(command.click_id_param)
@@ -165,8 +192,9 @@ class TrackClickHandler:
             logger.warning("Click ID parameter is missing, generating a new one.")
             click_id = ClickId.generate()
 
-        # Retrieve all stored tracking parameters using the click_id
-        pre_click_data = await self._pre_click_data_repository.find_by_click_id(click_id)
+        # Retrieve and consume the stored tracking parameters in one round-trip; a concurrent
+        # click with the same click_id gets None instead of re-reading the same row.
+        pre_click_data = await maybe_await(uow.run(self._pre_click_data_repository.take_by_click_id, click_id))
 
         if not pre_click_data:
             logger.warning(f"No PreClickData found for click_id: {click_id.value}. Creating click with limited data.")
@@ -196,8 +224,9 @@ class TrackClickHandler:
                 'fraud_reason': None,
             }
         else:
-            logger.info(
-                f"DEBUG: PreClickData found for click_id {click_id.value}. Tracking parameters: {pre_click_data.tracking_params}")
+            if _DEBUG:
+                logger.debug(f"PreClickData found for click_id {click_id.value}. "
+                             f"Tracking parameters: {pre_click_data.tracking_params}")
             # Populate click_data with parameters from pre_click_data, falling back to command if not present
             tracking_params = pre_click_data.tracking_params
             click_data = {
@@ -228,8 +257,4 @@ class TrackClickHandler:
                 'fraud_reason': None,
             }
 
-            # After successfully retrieving and using pre-click data, delete it
-            await self._pre_click_data_repository.delete_by_click_id(click_id)
-            logger.info(f"PreClickData deleted for click_id: {click_id.value}")
-
         return Click(**click_data)
@@ -23,8 +23,9 @@ from ...domain.repositories.campaign_repository import CampaignRepository
 class UpdateCampaignHandler:
     """Handler for updating campaigns."""
 
-    def __init__(self, campaign_repository: CampaignRepository):
+    def __init__(self, campaign_repository: CampaignRepository, routing_cache=None):
         self._campaign_repository = campaign_repository
+        self._routing_cache = routing_cache
 
     async def handle(self, command: UpdateCampaignCommand) -> Campaign:
         """
@@ -79,4 +80,8 @@ class UpdateCampaignHandler:
         # Save updated campaign
         self._campaign_repository.save(campaign)
 
+        # Drop the cached routing snapshot here and in the other workers
+        if self._routing_cache is not None:
+            self._routing_cache.invalidate_campaign(campaign.id)
+
         return campaign
@@ -28,6 +28,7 @@ class DatabaseSettings:
     password: str = "app_password"
     connection_string: Optional[str] = None
     sqlite_path: str = "stress_test.db"  # For stress testing with SQLite
+    connection_budget: int = 150  # Server-wide PostgreSQL connections, split between workers
 
     def get_connection_string(self) -> str:
         """Get database connection string."""
@@ -48,6 +49,8 @@ class APISettings:
     debug: bool = False
     workers: int = 1
     cors_origins: list[str] = None
+    drain_timeout_seconds: float = 30.0  # How long SIGTERM waits for in-flight requests
+    leader_lock_path: Optional[str] = None  # Lock file electing the worker that runs singleton jobs
 
     def __post_init__(self):
         if self.cors_origins is None:
@@ -62,6 +65,16 @@ class SecuritySettings:
     jwt_expiration_hours: int = 24
     rate_limit_requests: int = 1000000
     rate_limit_window_seconds: int = 60
+    # Per route group limits, e.g. "/v1/click=600/60,/v1/auth=20/60"
+    rate_limit_groups: str = ""
+    rate_limit_backend: str = "local"  # 'local' or 'shared_memory' (one budget across forked workers)
+    rate_limit_slots: int = 65536
+    # Self-revocations per client IP; each one holds a revocation slot until the token expires
+    revoke_rate_limit_requests: int = 10
+    revoke_rate_limit_window_seconds: int = 3600
+    jwt_cache_enabled: bool = True
+    jwt_cache_max_entries: int = 10000
+    jwt_revocation_slots: int = 16384
     allowed_hosts: list[str] = None
 
     def __post_init__(self):
@@ -74,6 +87,10 @@ class ExternalServicesSettings:
     """External services configuration."""
     ip_geolocation_api_key: Optional[str] = None
     ip_geolocation_timeout: int = 5
+    ip_reputation_dir: Optional[str] = None
+    ip_index_backend: str = "radix"
+    geoip_database_path: Optional[str] = None
+    geoip_cache_size: int = 65536
     redis_url: Optional[str] = None
 
 
@@ -84,6 +101,30 @@ class LoggingSettings:
     format: str = "%(asctime)s - %(name)s - %(levelname)s - %(message)s"
     file_path: Optional[str] = None
     show_traceback: bool = True
+    profile: str = "development"  # 'development' (boxed, colourised) or 'production' (JSON lines, enqueued)
+    module_levels: str = ""  # e.g. "src.presentation.routes=WARNING"
+    sample_rate: float = 1.0  # Share of requests whose per-request info logs are emitted
+
+
+@dataclass
+class IngestionSettings:
+    """Write-behind click ingestion configuration."""
+    click_buffer_enabled: bool = True
+    click_buffer_max_batch_size: int = 500
+    click_buffer_flush_interval_ms: int = 250
+    click_buffer_max_pending: int = 20000
+    click_buffer_enqueue_timeout_ms: int = 50
+    click_buffer_max_row_attempts: int = 3  # Failed writes of a bad row before it is dead-lettered
+
+
+@dataclass
+class CacheSettings:
+    """In-process routing cache configuration."""
+    routing_cache_enabled: bool = True
+    routing_cache_ttl_seconds: float = 30.0
+    routing_cache_negative_ttl_seconds: float = 5.0
+    routing_cache_max_entries: int = 10000
+    routing_cache_notify_channel: str = "routing_cache_invalidation"
 
 
 @dataclass
@@ -95,6 +136,8 @@ class Settings:
     security: SecuritySettings = None
     external_services: ExternalServicesSettings = None
     logging: LoggingSettings = None
+    ingestion: IngestionSettings = None
+    cache: CacheSettings = None
 
     def __post_init__(self):
         # Comment out database initialization for mock server testing
@@ -108,6 +151,10 @@ class Settings:
             self.external_services = ExternalServicesSettings()
         if self.logging is None:
             self.logging = LoggingSettings()
+        if self.ingestion is None:
+            self.ingestion = IngestionSettings()
+        if self.cache is None:
+            self.cache = CacheSettings()
 
 
 def _load_external_settings() -> ExternalServicesSettings:
@@ -115,10 +162,50 @@ def _load_external_settings() -> ExternalServicesSettings:
     return ExternalServicesSettings(
         ip_geolocation_api_key=os.getenv("IP_GEOLOCATION_API_KEY"),
         ip_geolocation_timeout=int(os.getenv("IP_GEOLOCATION_TIMEOUT", "5")),
+        ip_reputation_dir=os.getenv("IP_REPUTATION_DIR"),
+        ip_index_backend=os.getenv("IP_INDEX_BACKEND", "radix"),
+        geoip_database_path=os.getenv("GEOIP_DATABASE_PATH"),
+        geoip_cache_size=int(os.getenv("GEOIP_CACHE_SIZE", "65536")),
         redis_url=os.getenv("REDIS_URL"),
     )
 
 
+def _load_logging_settings() -> LoggingSettings:
+    """Load logging settings from environment."""
+    profile = os.getenv("LOG_PROFILE", "development").lower()
+    return LoggingSettings(
+        level=os.getenv("LOG_LEVEL", "INFO" if profile == "production" else "DEBUG"),
+        format=os.getenv("LOG_FORMAT", "%(asctime)s - %(name)s - %(levelname)s - %(message)s"),
+        file_path=os.getenv("LOG_FILE"),
+        profile=profile,
+        module_levels=os.getenv("LOG_MODULE_LEVELS", ""),
+        sample_rate=float(os.getenv("LOG_SAMPLE_RATE", "1.0")),
+    )
+
+
+def _load_ingestion_settings() -> IngestionSettings:
+    """Load click ingestion settings from environment."""
+    return IngestionSettings(
+        click_buffer_enabled=os.getenv("CLICK_BUFFER_ENABLED", "true").lower() == "true",
+        click_buffer_max_batch_size=int(os.getenv("CLICK_BUFFER_MAX_BATCH_SIZE", "500")),
+        click_buffer_flush_interval_ms=int(os.getenv("CLICK_BUFFER_FLUSH_INTERVAL_MS", "250")),
+        click_buffer_max_pending=int(os.getenv("CLICK_BUFFER_MAX_PENDING", "20000")),
+        click_buffer_enqueue_timeout_ms=int(os.getenv("CLICK_BUFFER_ENQUEUE_TIMEOUT_MS", "50")),
+        click_buffer_max_row_attempts=int(os.getenv("CLICK_BUFFER_MAX_ROW_ATTEMPTS", "3")),
+    )
+
+
+def _load_cache_settings() -> CacheSettings:
+    """Load routing cache settings from environment."""
+    return CacheSettings(
+        routing_cache_enabled=os.getenv("ROUTING_CACHE_ENABLED", "true").lower() == "true",
+        routing_cache_ttl_seconds=float(os.getenv("ROUTING_CACHE_TTL_SECONDS", "30")),
+        routing_cache_negative_ttl_seconds=float(os.getenv("ROUTING_CACHE_NEGATIVE_TTL_SECONDS", "5")),
+        routing_cache_max_entries=int(os.getenv("ROUTING_CACHE_MAX_ENTRIES", "10000")),
+        routing_cache_notify_channel=os.getenv("ROUTING_CACHE_NOTIFY_CHANNEL", "routing_cache_invalidation"),
+    )
+
+
 def load_settings() -> Settings:
     """Load settings from environment variables."""
     return Settings(
@@ -132,6 +219,7 @@ def load_settings() -> Settings:
             password=os.getenv("DB_PASSWORD", ""),
             connection_string=os.getenv("DATABASE_URL"),
             sqlite_path=os.getenv("SQLITE_PATH", ":memory:"),
+            connection_budget=int(os.getenv("DB_CONNECTION_BUDGET", "150")),
         ),
         api=APISettings(
             host=os.getenv("API_HOST", "localhost"),
@@ -139,6 +227,8 @@ def load_settings() -> Settings:
             debug=os.getenv("DEBUG", "false").lower() == "true",
             workers=int(os.getenv("WORKERS", "1")),
             cors_origins=os.getenv("CORS_ORIGINS", "*").split(","),
+            drain_timeout_seconds=float(os.getenv("DRAIN_TIMEOUT_SECONDS", "30")),
+            leader_lock_path=os.getenv("LEADER_LOCK_PATH"),
         ),
         security=SecuritySettings(
             secret_key=os.getenv("SECRET_KEY", "your-secret-key-change-in-production"),
@@ -146,14 +236,20 @@ def load_settings() -> Settings:
             jwt_expiration_hours=int(os.getenv("JWT_EXPIRATION_HOURS", "24")),
             rate_limit_requests=int(os.getenv("RATE_LIMIT_REQUESTS", "100")),
             rate_limit_window_seconds=int(os.getenv("RATE_LIMIT_WINDOW", "60")),
+            rate_limit_groups=os.getenv("RATE_LIMIT_GROUPS", ""),
+            rate_limit_backend=os.getenv("RATE_LIMIT_BACKEND", "local"),
+            rate_limit_slots=int(os.getenv("RATE_LIMIT_SLOTS", "65536")),
+            revoke_rate_limit_requests=int(os.getenv("REVOKE_RATE_LIMIT_REQUESTS", "10")),
+            revoke_rate_limit_window_seconds=int(os.getenv("REVOKE_RATE_LIMIT_WINDOW", "3600")),
+            jwt_cache_enabled=os.getenv("JWT_CACHE_ENABLED", "true").lower() == "true",
+            jwt_cache_max_entries=int(os.getenv("JWT_CACHE_MAX_ENTRIES", "10000")),
+            jwt_revocation_slots=int(os.getenv("JWT_REVOCATION_SLOTS", "16384")),
             allowed_hosts=os.getenv("ALLOWED_HOSTS", "localhost,127.0.0.1").split(","),
         ),
         external_services=_load_external_settings(),
-        logging=LoggingSettings(
-            level=os.getenv("LOG_LEVEL", "DEBUG"),
-            format=os.getenv("LOG_FORMAT", "%(asctime)s - %(name)s - %(levelname)s - %(message)s"),
-            file_path=os.getenv("LOG_FILE"),
-        ),
+        logging=_load_logging_settings(),
+        ingestion=_load_ingestion_settings(),
+        cache=_load_cache_settings(),
     )
 
 
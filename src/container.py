@@ -16,6 +16,7 @@
 import asyncio
 import threading
 import time
+from functools import partial
 
 from loguru import logger
 
@@ -25,7 +26,7 @@ from .application.handlers import (
     CreateLandingPageHandler, CreateOfferHandler,
     TrackClickHandler, ProcessWebhookHandler, TrackEventHandler, TrackConversionHandler, GamingWebhookHandler,
     SendPostbackHandler, GenerateClickHandler, ManageGoalHandler, AnalyzeJourneyHandler,
-    BulkClickHandler, ClickValidationHandler, FraudHandler, SystemHandler, AnalyticsHandler,
+    BulkClickHandler, BulkClickIngestionHandler, ClickValidationHandler, FraudHandler, SystemHandler, AnalyticsHandler,
     LTVHandler, RetentionHandler, FormHandler, CohortAnalysisHandler, SegmentationHandler
 )
 # Application queries
@@ -42,7 +43,8 @@ from .domain.services import (
     CampaignPerformanceService,
     CampaignLifecycleService
 )
-from .domain.services.click import ClickGenerationService
+from .domain.services.click import ClickGenerationService, FraudRuleEngine
+from .domain.services.traffic import UserAgentClassifier, IpReputationService
 from .domain.services.conversion import ConversionService
 from .domain.services.event import EventService
 from .domain.services.gaming import GamingWebhookService
@@ -50,9 +52,15 @@ from .domain.services.goal import GoalService
 from .domain.services.journey import JourneyService
 from .domain.services.postback import PostbackService
 from .domain.services.webhook import WebhookService
+from .config.settings import IngestionSettings, CacheSettings, ExternalServicesSettings
 from .infrastructure.async_io_processor import AsyncIOProcessor
 from .infrastructure.database.advanced_connection_pool import AdvancedConnectionPool
-from .infrastructure.external import MockIpGeolocationService
+from .infrastructure.database.async_connection_pool import AsyncConnectionPool, ASYNCPG_AVAILABLE
+from .infrastructure.database.pool_budget import PoolSizes
+from .infrastructure.database.unit_of_work import UnitOfWork, AsyncUnitOfWork, DirectUnitOfWork
+from .infrastructure.cache import RoutingCache, PostgresCacheInvalidator
+from .infrastructure.external import MockIpGeolocationService, MmapIpGeolocationService, load_ip_reputation_index
+from .infrastructure.ingestion import ClickWriteBuffer, CampaignCounterAggregator
 from .infrastructure.monitoring.vectorized_cache_monitor import VectorizedCacheMonitor
 # Infrastructure
 from .infrastructure.repositories import (
@@ -67,6 +75,7 @@ from .infrastructure.repositories import (
     SQLiteLTVRepository,
     SQLiteRetentionRepository,
     SQLiteFormRepository,
+    SQLiteFraudRuleRepository,
     PostgresCampaignRepository,
     PostgresClickRepository,
     PostgresImpressionRepository,
@@ -83,6 +92,11 @@ from .infrastructure.repositories import (
     PostgresCustomerLtvRepository,
     PostgresRetentionRepository,
     PostgresFormRepository,
+    PostgresFraudRuleRepository,
+    AsyncPostgresCampaignRepository,
+    AsyncPostgresClickRepository,
+    AsyncPostgresConversionRepository,
+    AsyncPostgresPreClickDataRepository,
 )
 from .infrastructure.repositories.optimized_analytics_repository import OptimizedAnalyticsRepository
 from .infrastructure.upholder.postgres_bulk_optimizer import PostgresBulkOptimizer
@@ -90,6 +104,7 @@ from .infrastructure.upholder.postgres_bulk_optimizer import PostgresBulkOptimiz
 from .presentation.routes import CampaignRoutes, ClickRoutes, WebhookRoutes, EventRoutes, ConversionRoutes, \
     PostbackRoutes, ClickGenerationRoutes, GoalRoutes, JourneyRoutes, LtvRoutes, FormRoutes, RetentionRoutes, \
     BulkOperationsRoutes, FraudRoutes, SystemRoutes, AnalyticsRoutes, GamingWebhookRoutes
+from .presentation.middleware.security_middleware import get_token_cache
 
 
 class Container:
@@ -99,6 +114,14 @@ class Container:
         self._singletons = {}
         self._settings = settings
         self._lock = threading.RLock()  # Reentrant lock for thread safety
+        self._pool_sizes = PoolSizes()
+
+    def configure_pool_sizes(self, sizes: PoolSizes) -> None:
+        """Set this process's share of the connection budget (before any pool is created)."""
+        with self._lock:
+            if 'db_connection_pool' in self._singletons or 'async_db_connection_pool' in self._singletons:
+                logger.warning("🔌 Pool sizes changed after the pools were created; applies to new pools only")
+            self._pool_sizes = sizes
 
     async def get_db_connection_pool(self):
         """Get optimized PostgreSQL connection pool with advanced monitoring and thread-safe creation."""
@@ -106,14 +129,14 @@ class Container:
         with self._lock:
             if 'db_connection_pool' not in self._singletons:
                 start = time.time()
-                logger.info("🔌 DB pool: creating AdvancedConnectionPool (localhost:5432)...")
+                sizes = self._pool_sizes
+                logger.info(f"🔌 DB pool: creating AdvancedConnectionPool (localhost:5432, "
+                            f"{sizes.sync_min}-{sizes.sync_max} connections)...")
                 try:
                     self._singletons['db_connection_pool'] = await loop.run_in_executor(None,
                                                                                         lambda: AdvancedConnectionPool(
-                                                                                            minconn=5,
-                                                                                            # Увеличено для лучшей производительности
-                                                                                            maxconn=100,
-                                                                                            # Temporarily increased to debug connection leaks
+                                                                                            minconn=sizes.sync_min,
+                                                                                            maxconn=sizes.sync_max,
                                                                                             host="localhost",
                                                                                             port=5432,
                                                                                             database="supreme_octosuccotash_db",
@@ -151,6 +174,36 @@ class Container:
         with self._lock:
             return self._singletons.get('db_connection_pool')
 
+    async def get_async_db_connection_pool(self):
+        """Get asyncio-native (asyncpg) PostgreSQL connection pool for hot-path repositories."""
+        with self._lock:
+            if 'async_db_connection_pool' not in self._singletons:
+                sizes = self._pool_sizes
+                logger.info(f"🔌 Async DB pool: creating AsyncConnectionPool (localhost:5432, "
+                            f"{sizes.async_min}-{sizes.async_max} connections)...")
+                self._singletons['async_db_connection_pool'] = AsyncConnectionPool(
+                    minconn=sizes.async_min,
+                    maxconn=sizes.async_max,
+                    host="localhost",
+                    port=5432,
+                    database="supreme_octosuccotash_db",
+                    user="app_user",
+                    password="app_password",
+                )
+            pool = self._singletons['async_db_connection_pool']
+
+        # open() is idempotent, serialised on its own asyncio lock, and re-creates the
+        # asyncpg pool when called from a different event loop than the one it was opened on
+        if not pool._is_current():
+            start = time.time()
+            try:
+                await pool.open()
+                logger.info(f"✅ Async DB pool ready in {time.time() - start:.3f}s")
+            except Exception:
+                logger.exception(f"❌ Async DB pool creation failed after {time.time() - start:.3f}s")
+                raise
+        return pool
+
     def get_pool_stats(self):
         """Get database connection pool statistics."""
         pool = self.get_db_connection_pool_sync()
@@ -164,27 +217,16 @@ class Container:
                 'total_connections': 0,
             }
 
-        def _safe_count(collection):
-            if collection is None:
-                return 0
-            if hasattr(collection, '__len__'):
-                try:
-                    return len(collection)
-                except TypeError:
-                    pass
-            if hasattr(collection, 'qsize'):
-                try:
-                    return collection.qsize()
-                except TypeError:
-                    return 0
-            return 0
-
+        stats = pool.get_stats()
         return {
-            'minconn': getattr(pool, '_minconn', 'unknown'),
-            'maxconn': getattr(pool, '_maxconn', 'unknown'),
-            'used': _safe_count(getattr(pool, '_used', None)),
-            'available': _safe_count(getattr(pool, '_pool', None)),
-            'total_connections': _safe_count(getattr(pool, '_used', None)) + _safe_count(getattr(pool, '_pool', None))
+            'minconn': stats.get('minconn', 'unknown'),
+            'maxconn': stats.get('maxconn', 'unknown'),
+            'used': stats.get('used', 0),
+            'available': stats.get('available', 0),
+            'total_connections': stats.get('used', 0) + stats.get('available', 0),
+            'waiting': stats.get('waiting', 0),
+            'checkout_timeouts': stats.get('checkout_timeouts', 0),
+            'checkout_wait': stats.get('checkout_wait'),
         }
 
     def get_db_connection(self):
@@ -288,14 +330,14 @@ class Container:
     async def get_bulk_optimizer(self):
         """Get PostgreSQL bulk optimizer."""
         if 'bulk_optimizer' not in self._singletons:
-            connection_pool = self.get_db_connection_pool()
+            connection_pool = await self.get_db_connection_pool()
             self._singletons['bulk_optimizer'] = PostgresBulkOptimizer(connection_pool)
         return self._singletons['bulk_optimizer']
 
     async def get_vectorized_cache_monitor(self):
         """Get vectorized cache monitor."""
         if 'vectorized_cache_monitor' not in self._singletons:
-            connection_pool = self.get_db_connection_pool()
+            connection_pool = await self.get_db_connection_pool()
             self._singletons['vectorized_cache_monitor'] = VectorizedCacheMonitor(connection_pool)
         return self._singletons['vectorized_cache_monitor']
 
@@ -308,15 +350,65 @@ class Container:
     async def get_ip_geolocation_service(self):
         """Get IP geolocation service."""
         if 'ip_geolocation_service' not in self._singletons:
-            self._singletons['ip_geolocation_service'] = MockIpGeolocationService()
+            external = self._settings.external_services if self._settings else ExternalServicesSettings()
+            service = None
+            if external.geoip_database_path:
+                try:
+                    service = MmapIpGeolocationService(external.geoip_database_path,
+                                                       cache_size=external.geoip_cache_size)
+                except (OSError, ValueError, RuntimeError) as e:
+                    logger.warning(f"Geolocation database {external.geoip_database_path} not loaded: {e}")
+            if service is None:
+                service = MockIpGeolocationService(ip_reputation=await self.get_ip_reputation_service())
+            self._singletons['ip_geolocation_service'] = service
         return self._singletons['ip_geolocation_service']
 
+    async def get_ip_reputation_service(self):
+        """Get CIDR blocklist/location index shared by click validation and geolocation."""
+        if 'ip_reputation_service' not in self._singletons:
+            external = self._settings.external_services if self._settings else ExternalServicesSettings()
+            loader = None
+            if external.ip_reputation_dir:
+                directory, backend = external.ip_reputation_dir, external.ip_index_backend
+                loader = lambda: load_ip_reputation_index(directory, backend)  # noqa: E731
+            service = IpReputationService(loader=loader)
+            if loader is not None:
+                try:
+                    service.reload()
+                except OSError as e:
+                    logger.warning(f"IP reputation data not loaded from {external.ip_reputation_dir}: {e}")
+            self._singletons['ip_reputation_service'] = service
+        return self._singletons['ip_reputation_service']
+
     async def get_click_validation_service(self):
         """Get click validation service."""
         if 'click_validation_service' not in self._singletons:
-            self._singletons['click_validation_service'] = ClickValidationService()
+            self._singletons['click_validation_service'] = ClickValidationService(
+                rule_engine=await self.get_fraud_rule_engine()
+            )
         return self._singletons['click_validation_service']
 
+    async def get_fraud_rule_engine(self):
+        """Get compiled fraud rule engine shared by click validation and fraud rule management."""
+        if 'fraud_rule_engine' not in self._singletons:
+            self._singletons['fraud_rule_engine'] = FraudRuleEngine(
+                user_agent_classifier=await self.get_user_agent_classifier(),
+                ip_reputation=await self.get_ip_reputation_service(),
+                geolocation=await self._get_click_geolocation(),
+            )
+        return self._singletons['fraud_rule_engine']
+
+    async def _get_click_geolocation(self):
+        """Offline geolocation for inline geo checks; the mock service is never used on the click path."""
+        service = await self.get_ip_geolocation_service()
+        return service if isinstance(service, MmapIpGeolocationService) else None
+
+    async def get_user_agent_classifier(self):
+        """Get user-agent verdict cache shared by click, event and form fraud checks."""
+        if 'user_agent_classifier' not in self._singletons:
+            self._singletons['user_agent_classifier'] = UserAgentClassifier()
+        return self._singletons['user_agent_classifier']
+
     async def get_campaign_validator(self):
         """Get campaign validation service."""
         if 'campaign_validation_service' not in self._singletons:
@@ -339,7 +431,8 @@ class Container:
         """Get create campaign handler."""
         if 'create_campaign_handler' not in self._singletons:
             self._singletons['create_campaign_handler'] = CreateCampaignHandler(
-                campaign_repository=await self.get_campaign_repository()
+                campaign_repository=await self.get_campaign_repository(),
+                routing_cache=await self.get_routing_cache()
             )
         return self._singletons['create_campaign_handler']
 
@@ -347,7 +440,8 @@ class Container:
         """Get update campaign handler."""
         if 'update_campaign_handler' not in self._singletons:
             self._singletons['update_campaign_handler'] = UpdateCampaignHandler(
-                campaign_repository=await self.get_campaign_repository()
+                campaign_repository=await self.get_campaign_repository(),
+                routing_cache=await self.get_routing_cache()
             )
         return self._singletons['update_campaign_handler']
 
@@ -355,7 +449,8 @@ class Container:
         """Get pause campaign handler."""
         if 'pause_campaign_handler' not in self._singletons:
             self._singletons['pause_campaign_handler'] = PauseCampaignHandler(
-                campaign_repository=await self.get_campaign_repository()
+                campaign_repository=await self.get_campaign_repository(),
+                routing_cache=await self.get_routing_cache()
             )
         return self._singletons['pause_campaign_handler']
 
@@ -363,7 +458,8 @@ class Container:
         """Get resume campaign handler."""
         if 'resume_campaign_handler' not in self._singletons:
             self._singletons['resume_campaign_handler'] = ResumeCampaignHandler(
-                campaign_repository=await self.get_campaign_repository()
+                campaign_repository=await self.get_campaign_repository(),
+                routing_cache=await self.get_routing_cache()
             )
         return self._singletons['resume_campaign_handler']
 
@@ -371,7 +467,8 @@ class Container:
         """Get create landing page handler."""
         if 'create_landing_page_handler' not in self._singletons:
             self._singletons['create_landing_page_handler'] = CreateLandingPageHandler(
-                landing_page_repository=await self.get_postgres_landing_page_repository()
+                landing_page_repository=await self.get_postgres_landing_page_repository(),
+                routing_cache=await self.get_routing_cache()
             )
         return self._singletons['create_landing_page_handler']
 
@@ -379,21 +476,174 @@ class Container:
         """Get create offer handler."""
         if 'create_offer_handler' not in self._singletons:
             self._singletons['create_offer_handler'] = CreateOfferHandler(
-                offer_repository=await self.get_postgres_offer_repository()
+                offer_repository=await self.get_postgres_offer_repository(),
+                routing_cache=await self.get_routing_cache()
             )
         return self._singletons['create_offer_handler']
 
+    async def get_click_path_repositories(self):
+        """Get (click, campaign, pre-click data) repositories for the redirect hot path.
+
+        Prefers asyncpg repositories: one awaited round-trip per query instead of an
+        executor hop around a blocking psycopg2 call.
+        """
+        if 'click_path_repositories' not in self._singletons:
+            try:
+                if not ASYNCPG_AVAILABLE:
+                    raise RuntimeError("asyncpg is not installed")
+                repositories = (
+                    await self.get_async_click_repository(),
+                    await self.get_async_campaign_repository(),
+                    await self.get_async_pre_click_data_repository(),
+                )
+                logger.info("🖱️ Click path using asyncpg repositories")
+            except Exception as e:
+                logger.warning(f"⚠️ Async repositories unavailable ({e}); using psycopg2 repositories")
+                repositories = (
+                    await self.get_click_repository(),
+                    await self.get_campaign_repository(),
+                    await self.get_postgres_pre_click_data_repository(),
+                )
+            # Counter deltas are applied through the repository the click path reads from
+            campaign_repo = repositories[1]
+            if hasattr(campaign_repo, 'apply_counter_deltas'):
+                (await self.get_campaign_counters()).set_sink(campaign_repo.apply_counter_deltas)
+            self._singletons['click_path_repositories'] = repositories
+        return self._singletons['click_path_repositories']
+
+    async def get_click_unit_of_work(self):
+        """Get the per-click unit of work factory for the click path repositories.
+
+        asyncpg repositories join an AsyncUnitOfWork and the psycopg2 fallback
+        repositories a UnitOfWork (one connection, one transaction either way).
+        The PostgreSQL campaign repositories are updated through the counter
+        aggregator, not the unit; other fallbacks commit on their own.
+        """
+        if 'click_unit_of_work' not in self._singletons:
+            click_repo, campaign_repo, pre_click_data_repo = await self.get_click_path_repositories()
+            if isinstance(pre_click_data_repo, AsyncPostgresPreClickDataRepository):
+                self._singletons['click_unit_of_work'] = partial(AsyncUnitOfWork,
+                                                                 await self.get_async_db_connection_pool())
+            elif (isinstance(pre_click_data_repo, PostgresPreClickDataRepository)
+                  and isinstance(click_repo, PostgresClickRepository)
+                  and isinstance(campaign_repo, PostgresCampaignRepository)):
+                self._singletons['click_unit_of_work'] = partial(UnitOfWork, await self.get_db_connection_pool())
+            else:
+                self._singletons['click_unit_of_work'] = DirectUnitOfWork
+        return self._singletons['click_unit_of_work']
+
+    async def get_unit_of_work(self):
+        """Get the per-request unit of work factory for the conversion/click repositories.
+
+        PostgreSQL repositories join a UnitOfWork (one connection and transaction, writes
+        sent as one batch); the SQLite fallback commits on its own.
+        """
+        if 'unit_of_work' not in self._singletons:
+            conversion_repo = await self.get_conversion_repository()
+            click_repo = await self.get_click_repository()
+            if (isinstance(conversion_repo, PostgresConversionRepository)
+                    and isinstance(click_repo, PostgresClickRepository)):
+                self._singletons['unit_of_work'] = partial(UnitOfWork, await self.get_db_connection_pool())
+            else:
+                self._singletons['unit_of_work'] = DirectUnitOfWork
+        return self._singletons['unit_of_work']
+
+    async def get_campaign_counters(self):
+        """Get sharded campaign counter aggregator (write-behind click and conversion counts)."""
+        if 'campaign_counters' not in self._singletons:
+            self._singletons['campaign_counters'] = CampaignCounterAggregator(shard_count=16, flush_interval=1.0)
+        return self._singletons['campaign_counters']
+
+    async def get_routing_cache(self):
+        """Get read-through campaign/landing page/offer routing cache (None when disabled in settings)."""
+        if 'routing_cache' not in self._singletons:
+            cache_settings = self._settings.cache if self._settings else CacheSettings()
+            routing_cache = None
+            if cache_settings.routing_cache_enabled:
+                routing_cache = RoutingCache(
+                    campaign_repository=(await self.get_click_path_repositories())[1],
+                    landing_page_repository=await self.get_landing_page_repository(),
+                    offer_repository=await self.get_offer_repository(),
+                    max_entries=cache_settings.routing_cache_max_entries,
+                    ttl=cache_settings.routing_cache_ttl_seconds,
+                    negative_ttl=cache_settings.routing_cache_negative_ttl_seconds,
+                )
+                # Keep the caches of all worker processes coherent via LISTEN/NOTIFY
+                try:
+                    if not ASYNCPG_AVAILABLE:
+                        raise RuntimeError("asyncpg is not installed")
+                    routing_cache.set_invalidator(PostgresCacheInvalidator(
+                        cache=routing_cache,
+                        pool=await self.get_async_db_connection_pool(),
+                        channel=cache_settings.routing_cache_notify_channel,
+                    ))
+                except Exception as e:
+                    logger.warning(f"⚠️ Routing cache invalidation is local to this process ({e}); "
+                                   f"other workers rely on the TTL")
+            self._singletons['routing_cache'] = routing_cache
+        return self._singletons['routing_cache']
+
+    async def get_click_write_buffer(self):
+        """Get write-behind click buffer (None when disabled in settings)."""
+        if 'click_write_buffer' not in self._singletons:
+            ingestion = self._settings.ingestion if self._settings else IngestionSettings()
+            click_write_buffer = None
+            if ingestion.click_buffer_enabled:
+                click_repo = (await self.get_click_path_repositories())[0]
+                click_write_buffer = ClickWriteBuffer(
+                    sink=click_repo.save_many,
+                    max_batch_size=ingestion.click_buffer_max_batch_size,
+                    flush_interval=ingestion.click_buffer_flush_interval_ms / 1000,
+                    max_pending=ingestion.click_buffer_max_pending,
+                    enqueue_timeout=ingestion.click_buffer_enqueue_timeout_ms / 1000,
+                    max_row_attempts=ingestion.click_buffer_max_row_attempts,
+                )
+            self._singletons['click_write_buffer'] = click_write_buffer
+        return self._singletons['click_write_buffer']
+
+    async def shutdown(self):
+        """Flush write-behind buffers and close async resources."""
+        with self._lock:
+            click_write_buffer = self._singletons.get('click_write_buffer')
+            campaign_counters = self._singletons.get('campaign_counters')
+            routing_cache = self._singletons.get('routing_cache')
+            async_pool = self._singletons.get('async_db_connection_pool')
+            geolocation = self._singletons.get('ip_geolocation_service')
+            upholder = self._singletons.get('postgres_upholder')
+        if upholder is not None and upholder.is_running:
+            try:
+                upholder.stop()
+            except Exception:
+                logger.exception("❌ Failed to stop PostgreSQL upholder on shutdown")
+        if click_write_buffer is not None:
+            try:
+                await click_write_buffer.close()
+            except Exception:
+                logger.exception("❌ Failed to drain click write buffer on shutdown")
+        if campaign_counters is not None:
+            try:
+                await campaign_counters.close()
+            except Exception:
+                logger.exception("❌ Failed to flush campaign counters on shutdown")
+        if routing_cache is not None:
+            await routing_cache.close()
+        if async_pool is not None:
+            await async_pool.close()
+        if isinstance(geolocation, MmapIpGeolocationService):
+            geolocation.close()
+
     async def get_track_click_handler(self):
         """Get track click handler."""
         if 'track_click_handler' not in self._singletons:
             start = time.time()
             logger.info("🖱️ Creating TrackClickHandler and dependencies...")
-            click_repo = await self.get_click_repository()
-            campaign_repo = await self.get_campaign_repository()
             landing_page_repo = await self.get_landing_page_repository()
             offer_repo = await self.get_offer_repository()
             validation_svc = await self.get_click_validation_service()
-            pre_click_data_repo = await self.get_postgres_pre_click_data_repository()
+            click_repo, campaign_repo, pre_click_data_repo = await self.get_click_path_repositories()
+            click_write_buffer = await self.get_click_write_buffer()
+            campaign_counters = (await self.get_campaign_counters()
+                                 if hasattr(campaign_repo, 'apply_counter_deltas') else None)
 
             track_click_handler = TrackClickHandler(
                 click_repository=click_repo,
@@ -402,6 +652,10 @@ class Container:
                 offer_repository=offer_repo,
                 pre_click_data_repository=pre_click_data_repo,
                 click_validation_service=validation_svc,
+                unit_of_work=await self.get_click_unit_of_work(),
+                click_write_buffer=click_write_buffer,
+                campaign_counters=campaign_counters,
+                routing_cache=await self.get_routing_cache(),
             )
             self._singletons['track_click_handler'] = track_click_handler
             duration = time.time() - start
@@ -505,7 +759,9 @@ class Container:
     async def get_event_service(self):
         """Get event service."""
         if 'event_service' not in self._singletons:
-            self._singletons['event_service'] = EventService()
+            self._singletons['event_service'] = EventService(
+                user_agent_classifier=await self.get_user_agent_classifier()
+            )
         return self._singletons['event_service']
 
     async def get_track_event_handler(self):
@@ -558,7 +814,9 @@ class Container:
             self._singletons['track_conversion_handler'] = TrackConversionHandler(
                 conversion_repository=await self.get_conversion_repository(),
                 click_repository=await self.get_click_repository(),
-                conversion_service=await self.get_conversion_service()
+                conversion_service=await self.get_conversion_service(),
+                unit_of_work=await self.get_unit_of_work(),
+                campaign_counters=await self.get_campaign_counters()
             )
         return self._singletons['track_conversion_handler']
 
@@ -570,7 +828,8 @@ class Container:
                 click_repository=await self.get_click_repository(),
                 customer_ltv_repository=await self.get_postgres_customer_ltv_repository(),
                 conversion_service=await self.get_conversion_service(),
-                gaming_webhook_service=await self.get_gaming_webhook_service()
+                gaming_webhook_service=await self.get_gaming_webhook_service(),
+                unit_of_work=await self.get_unit_of_work()
             )
         return self._singletons['gaming_webhook_handler']
 
@@ -692,7 +951,8 @@ class Container:
     async def get_postgres_campaign_repository(self):
         """Get PostgreSQL campaign repository."""
         if 'postgres_campaign_repository' not in self._singletons:
-            self._singletons['postgres_campaign_repository'] = PostgresCampaignRepository(container=self)
+            self._singletons['postgres_campaign_repository'] = PostgresCampaignRepository(
+                container=self, counters=await self.get_campaign_counters())
         return self._singletons['postgres_campaign_repository']
 
     async def get_postgres_click_repository(self):
@@ -825,6 +1085,38 @@ class Container:
             logger.debug("🗂️ Reusing PostgresPreClickDataRepository singleton")
         return self._singletons['postgres_pre_click_data_repository']
 
+    async def get_async_click_repository(self):
+        """Get asyncpg click repository."""
+        if 'async_click_repository' not in self._singletons:
+            await self.get_async_db_connection_pool()
+            self._singletons['async_click_repository'] = AsyncPostgresClickRepository(container=self)
+        return self._singletons['async_click_repository']
+
+    async def get_async_campaign_repository(self):
+        """Get asyncpg campaign repository."""
+        if 'async_campaign_repository' not in self._singletons:
+            await self.get_async_db_connection_pool()
+            self._singletons['async_campaign_repository'] = AsyncPostgresCampaignRepository(
+                container=self, counters=await self.get_campaign_counters())
+        return self._singletons['async_campaign_repository']
+
+    async def get_async_conversion_repository(self):
+        """Get asyncpg conversion repository."""
+        if 'async_conversion_repository' not in self._singletons:
+            await self.get_async_db_connection_pool()
+            self._singletons['async_conversion_repository'] = AsyncPostgresConversionRepository(container=self)
+        return self._singletons['async_conversion_repository']
+
+    async def get_async_pre_click_data_repository(self):
+        """Get asyncpg pre-click data repository."""
+        if 'async_pre_click_data_repository' not in self._singletons:
+            start = time.time()
+            repo = AsyncPostgresPreClickDataRepository(container=self)
+            await asyncio.wait_for(repo._initialize_db(), timeout=15)
+            self._singletons['async_pre_click_data_repository'] = repo
+            logger.info(f"🗂️ AsyncPostgresPreClickDataRepository ready in {time.time() - start:.3f}s")
+        return self._singletons['async_pre_click_data_repository']
+
     async def get_landing_page_repository(self):
         """Get landing page repository."""
         if 'landing_page_repository' not in self._singletons:
@@ -922,18 +1214,58 @@ class Container:
             self._singletons['click_validation_handler'] = ClickValidationHandler()
         return self._singletons['click_validation_handler']
 
+    async def get_bulk_click_ingestion_handler(self):
+        """Get bulk click ingestion handler (vectorized screening, batched fraud scoring, COPY writes)."""
+        if 'bulk_click_ingestion_handler' not in self._singletons:
+            click_repository, _, _ = await self.get_click_path_repositories()
+            self._singletons['bulk_click_ingestion_handler'] = BulkClickIngestionHandler(
+                click_repository=click_repository,
+                click_validation_service=await self.get_click_validation_service(),
+                click_screener=await self.get_bulk_optimizer(),
+                campaign_counters=await self.get_campaign_counters()
+            )
+        return self._singletons['bulk_click_ingestion_handler']
+
     async def get_bulk_operations_routes(self):
         """Get bulk operations routes."""
         if 'bulk_operations_routes' not in self._singletons:
             bulk_handler = await self.get_bulk_click_handler()
             validation_handler = await self.get_click_validation_handler()
-            self._singletons['bulk_operations_routes'] = BulkOperationsRoutes(bulk_handler, validation_handler)
+            ingestion_handler = await self.get_bulk_click_ingestion_handler()
+            self._singletons['bulk_operations_routes'] = BulkOperationsRoutes(bulk_handler, validation_handler,
+                                                                              ingestion_handler)
         return self._singletons['bulk_operations_routes']
 
+    async def get_fraud_rule_repository(self):
+        """Get fraud rule repository."""
+        if 'fraud_rule_repository' not in self._singletons:
+            # Try PostgreSQL first, fallback to SQLite
+            try:
+                await self.get_db_connection_pool()
+                self._singletons['fraud_rule_repository'] = PostgresFraudRuleRepository(container=self)
+            except Exception:
+                db_path = self._settings.database.get_sqlite_path() if self._settings else ":memory:"
+                self._singletons['fraud_rule_repository'] = SQLiteFraudRuleRepository(db_path)
+        return self._singletons['fraud_rule_repository']
+
     async def get_fraud_handler(self):
-        """Get fraud handler."""
+        """Get fraud handler.
+
+        Rules are persisted and loaded from the fraud rule repository; changes are
+        announced over the routing cache's invalidation channel so every worker
+        reloads them into its rule engine.
+        """
         if 'fraud_handler' not in self._singletons:
-            self._singletons['fraud_handler'] = FraudHandler()
+            routing_cache = await self.get_routing_cache()
+            invalidator = routing_cache.invalidator if routing_cache is not None else None
+            if invalidator is None:
+                logger.warning("⚠️ Fraud rule changes reach other workers only after a restart "
+                               "(no cross-process invalidation channel)")
+            self._singletons['fraud_handler'] = FraudHandler(
+                fraud_repository=await self.get_fraud_rule_repository(),
+                rule_engine=await self.get_fraud_rule_engine(),
+                invalidator=invalidator,
+            )
         return self._singletons['fraud_handler']
 
     async def get_fraud_routes(self):
@@ -943,9 +1275,26 @@ class Container:
         return self._singletons['fraud_routes']
 
     async def get_system_handler(self):
-        """Get system handler."""
+        """Get system handler.
+
+        IP reputation reloads are announced over the routing cache's invalidation
+        channel so every worker swaps in the rebuilt index.
+        """
         if 'system_handler' not in self._singletons:
-            self._singletons['system_handler'] = SystemHandler()
+            routing_cache = await self.get_routing_cache()
+            invalidator = routing_cache.invalidator if routing_cache is not None else None
+            if invalidator is None:
+                logger.warning("⚠️ IP reputation reloads reach other workers only after a restart "
+                               "(no cross-process invalidation channel)")
+            self._singletons['system_handler'] = SystemHandler(
+                click_write_buffer=await self.get_click_write_buffer(),
+                campaign_counters=await self.get_campaign_counters(),
+                routing_cache=routing_cache,
+                user_agent_classifier=await self.get_user_agent_classifier(),
+                ip_reputation=await self.get_ip_reputation_service(),
+                token_cache=get_token_cache(),
+                invalidator=invalidator,
+            )
         return self._singletons['system_handler']
 
     async def get_auth_routes(self):
@@ -994,7 +1343,8 @@ class Container:
         """Get form handler."""
         if 'form_handler' not in self._singletons:
             self._singletons['form_handler'] = FormHandler(
-                form_repository=await self.get_postgres_form_repository()
+                form_repository=await self.get_postgres_form_repository(),
+                user_agent_classifier=await self.get_user_agent_classifier(),
             )
         return self._singletons['form_handler']
 
@@ -13,13 +13,17 @@
 
 """Click domain entity."""
 
+import re
 from dataclasses import dataclass, field
 from datetime import datetime, timezone
 from ipaddress import IPv4Address, IPv6Address
 from typing import Optional
 
+from ..constants import VALID_TRACKING_PATTERN
 from ..value_objects import ClickId, CampaignId
 
+_VALID_TRACKING_RE = re.compile(VALID_TRACKING_PATTERN)
+
 
 @dataclass
 class Click:
@@ -95,11 +99,8 @@ class Click:
                            self.affiliate_sub, self.affiliate_sub2, self.affiliate_sub3,
                            self.affiliate_sub4, self.affiliate_sub5, self.click_id_param]
 
-        import re
-        pattern = re.compile(r'^[a-zA-Z0-9._-]*$')
-
         for param in tracking_params:
-            if param is not None and not pattern.match(param):
+            if param is not None and not _VALID_TRACKING_RE.match(param):
                 raise ValueError(f"Invalid tracking parameter format: {param}")
 
     def mark_as_fraudulent(self, reason: str, score: float = 1.0) -> None:
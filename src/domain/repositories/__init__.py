@@ -18,6 +18,7 @@ from .campaign_repository import CampaignRepository
 from .click_repository import ClickRepository
 from .conversion_repository import ConversionRepository
 from .event_repository import EventRepository
+from .fraud_rule_repository import FraudRuleRepository
 from .goal_repository import GoalRepository
 from .impression_repository import ImpressionRepository
 from .ltv_repository import LTVRepository
@@ -31,6 +32,7 @@ __all__ = [
     'AnalyticsRepository',
     'ConversionRepository',
     'EventRepository',
+    'FraudRuleRepository',
     'GoalRepository',
     'PostbackRepository',
     'WebhookRepository',
@@ -29,6 +29,24 @@ class ClickRepository(ABC):
         """Save a click."""
         pass
 
+    def save_many(self, clicks: List[Click]) -> int:
+        """Save a batch of clicks. Returns the number of clicks written.
+
+        Implementations with a bulk path (e.g. COPY) override this.
+        """
+        for click in clicks:
+            self.save(click)
+        return len(clicks)
+
+    def upsert_many(self, clicks: List[Click]) -> List[str]:
+        """Save a batch of clicks. Returns the ids of clicks that were not stored before.
+
+        Lets callers count a click once even when the same batch is submitted again.
+        """
+        inserted = [click.id.value for click in clicks if self.find_by_id(click.id) is None]
+        self.save_many(clicks)
+        return inserted
+
     @abstractmethod
     def find_by_id(self, click_id: ClickId) -> Optional[Click]:
         """Find click by ID."""
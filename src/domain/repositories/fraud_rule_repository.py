@@ -0,0 +1,33 @@
+# Copyright (c) 2025 Bivex
+#
+# Author: Bivex
+# Available for contact via email: support@b-b.top
+# For up-to-date contact information:
+# https://github.com/bivex
+#
+# Created: 2026-10-16T09:12:04
+# Last Updated: 2026-10-16T09:12:04
+#
+# Licensed under the MIT License.
+# Commercial licensing available upon request.
+
+"""Fraud rule repository interface."""
+
+from abc import ABC, abstractmethod
+from typing import List
+
+from ..services.click.fraud_rule_engine import FraudRule
+
+
+class FraudRuleRepository(ABC):
+    """Abstract base class for fraud rule repositories."""
+
+    @abstractmethod
+    def save(self, rule: FraudRule) -> None:
+        """Save a fraud rule (insert or replace by ID)."""
+        pass
+
+    @abstractmethod
+    def find_all(self) -> List[FraudRule]:
+        """Get all fraud rules."""
+        pass
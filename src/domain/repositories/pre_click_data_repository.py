@@ -22,3 +22,11 @@ class PreClickDataRepository(ABC):
     async def delete_by_click_id(self, click_id: ClickId) -> None:
         """Deletes pre-click data by click ID."""
         pass
+
+    @abstractmethod
+    async def take_by_click_id(self, click_id: ClickId) -> Optional[PreClickData]:
+        """Atomically removes and returns pre-click data by click ID.
+
+        At most one caller gets the row for a given click ID; concurrent callers get None.
+        """
+        pass
@@ -15,8 +15,17 @@
 
 from .click_generation_service import ClickGenerationService
 from .click_validation_service import ClickValidationService
+from .fraud_rule_engine import FraudRuleEngine, FraudRule, FraudVerdict, FraudSignal
+from .redirect_decision import RedirectDecisionTable, RedirectTarget, FALLBACK_REDIRECT_URL
 
 __all__ = [
     'ClickValidationService',
-    'ClickGenerationService'
+    'ClickGenerationService',
+    'FraudRuleEngine',
+    'FraudRule',
+    'FraudVerdict',
+    'FraudSignal',
+    'RedirectDecisionTable',
+    'RedirectTarget',
+    'FALLBACK_REDIRECT_URL'
 ]
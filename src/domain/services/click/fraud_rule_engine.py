@@ -0,0 +1,443 @@
+# Copyright (c) 2025 Bivex
+#
+# Author: Bivex
+# Available for contact via email: support@b-b.top
+# For up-to-date contact information:
+# https://github.com/bivex
+#
+# Created: 2026-10-16T09:12:04
+# Last Updated: 2026-10-16T09:12:04
+#
+# Licensed under the MIT License.
+# Commercial licensing available upon request.
+
+"""Compiled fraud rules evaluated in a single pass per click."""
+
+import re
+from dataclasses import dataclass, field
+from ipaddress import ip_address, ip_network
+from typing import Any, Dict, Iterable, List, Optional, Pattern, Sequence, Tuple
+
+from ...constants import (
+    REFERRER_MAX_LENGTH, VALID_TRACKING_PATTERN, FRAUD_SCORE_THRESHOLD, FRAUD_SCORE_MAX
+)
+from ...entities.click import Click
+from ..traffic.ip_reputation import CidrIndex, IpReputationService
+from ..traffic.user_agent_classifier import UserAgentClassifier
+
+RULE_TYPES = ('user_agent', 'referrer', 'ip', 'tracking_param', 'country')
+RULE_ACTIONS = ('block', 'flag')
+
+# Score contributed by each built-in check
+BOT_SCORE = 1.0
+IP_SCORE = 0.3
+REFERRER_SCORE = 0.2
+CAMPAIGN_FILTER_SCORE = 0.8
+GEO_FILTER_KEYS = ('allowed_countries', 'blocked_countries')
+TRACKING_SCORE = 0.1
+# Score for addresses found in the IP reputation blocklists, by list category
+IP_REPUTATION_SCORES = {'blocklist': 1.0, 'proxy': 0.5, 'tor': 0.5, 'datacenter': 0.3}
+IP_REPUTATION_DEFAULT_SCORE = 0.5
+
+# Compiled per-campaign ``ip_blacklist`` filters kept around between clicks
+_MAX_COMPILED_BLACKLISTS = 1024
+
+SUSPICIOUS_REFERRER_PATTERNS = [
+    r'localhost',
+    r'127\.0\.0\.1',
+    r'0\.0\.0\.0',
+    r'example\.com',
+    r'test\.',
+]
+
+SUSPICIOUS_TRACKING_CONTENT = ['[filtered]', 'schemathesis', 'null', 'undefined', '<script>']
+
+_VALID_TRACKING_RE = re.compile(VALID_TRACKING_PATTERN)
+
+
+@dataclass(frozen=True)
+class FraudRule:
+    """
+    A configurable fraud rule.
+
+    ``user_agent`` patterns are case-insensitive substrings, ``referrer`` and
+    ``tracking_param`` patterns are case-insensitive regular expressions, and
+    ``ip`` patterns are addresses or CIDR blocks, and ``country`` patterns are
+    ISO 3166 alpha-2 codes matched against the geolocated click address. A rule
+    without ``campaign_id`` applies to every campaign.
+    """
+    id: str
+    name: str
+    type: str
+    action: str
+    patterns: Tuple[str, ...]
+    score: float = 1.0
+    campaign_id: Optional[str] = None
+    is_active: bool = True
+    priority: int = 0
+
+    def __post_init__(self) -> None:
+        if self.type not in RULE_TYPES:
+            raise ValueError(f"Rule type must be one of: {', '.join(RULE_TYPES)}")
+        if self.action not in RULE_ACTIONS:
+            raise ValueError(f"Rule action must be one of: {', '.join(RULE_ACTIONS)}")
+        if not self.patterns:
+            raise ValueError("Rule must have at least one pattern")
+        if not 0.0 <= self.score <= FRAUD_SCORE_MAX:
+            raise ValueError(f"Rule score must be between 0.0 and {FRAUD_SCORE_MAX}")
+        if self.type in ('referrer', 'tracking_param'):
+            for pattern in self.patterns:
+                re.compile(pattern)  # Raises re.error for invalid patterns
+        if self.type == 'ip':
+            for pattern in self.patterns:
+                ip_network(pattern, strict=False)  # Raises ValueError for invalid addresses
+        if self.type == 'country':
+            for pattern in self.patterns:
+                if len(pattern) != 2 or not pattern.isalpha():
+                    raise ValueError(f"Invalid country code: {pattern}")
+
+    @property
+    def weight(self) -> float:
+        """Score added when the rule matches; blocking rules always invalidate the click."""
+        return max(self.score, FRAUD_SCORE_THRESHOLD) if self.action == 'block' else self.score
+
+
+@dataclass(frozen=True)
+class FraudSignal:
+    """One check that contributed to a click's fraud score."""
+    check: str
+    reason: str
+    score: float
+
+
+@dataclass(frozen=True)
+class FraudVerdict:
+    """Structured result of evaluating all fraud checks for a click."""
+    signals: Tuple[FraudSignal, ...] = ()
+
+    @property
+    def score(self) -> float:
+        return min(sum(signal.score for signal in self.signals), FRAUD_SCORE_MAX)
+
+    @property
+    def is_valid(self) -> bool:
+        return sum(signal.score for signal in self.signals) < FRAUD_SCORE_THRESHOLD
+
+    @property
+    def reason(self) -> Optional[str]:
+        return '; '.join(signal.reason for signal in self.signals) or None
+
+    def breakdown(self) -> Dict[str, float]:
+        """Score per check."""
+        result: Dict[str, float] = {}
+        for signal in self.signals:
+            result[signal.check] = result.get(signal.check, 0.0) + signal.score
+        return result
+
+
+def _alternation(patterns: List[Tuple[str, str]]) -> Optional[Pattern]:
+    """Combine (group_name, regex) pairs into one case-insensitive pattern; lastgroup names the match."""
+    if not patterns:
+        return None
+    return re.compile('|'.join(f'(?P<{name}>{regex})' for name, regex in patterns), re.IGNORECASE)
+
+
+class _CompiledRules:
+    """All rules of one scope (global or one campaign) compiled into one pattern per rule type."""
+
+    __slots__ = ('user_agent', 'referrer', 'tracking', 'ips', 'countries', 'rules')
+
+    def __init__(self, rules: Iterable[FraudRule]):
+        self.rules: Dict[str, FraudRule] = {}
+        ips: Dict[str, FraudRule] = {}
+        self.countries: Dict[str, FraudRule] = {}
+        grouped: Dict[str, List[Tuple[str, str]]] = {'user_agent': [], 'referrer': [], 'tracking_param': []}
+        for index, rule in enumerate(sorted(rules, key=lambda r: -r.priority)):
+            if not rule.is_active:
+                continue
+            if rule.type == 'ip':
+                for ip in rule.patterns:
+                    ips.setdefault(ip, rule)
+                continue
+            if rule.type == 'country':
+                for country in rule.patterns:
+                    self.countries.setdefault(country.upper(), rule)
+                continue
+            for pattern_index, pattern in enumerate(rule.patterns):
+                group = f"r{index}_{pattern_index}"
+                self.rules[group] = rule
+                regex = re.escape(pattern) if rule.type == 'user_agent' else f"(?:{pattern})"
+                grouped[rule.type].append((group, regex))
+        self.user_agent = _alternation(grouped['user_agent'])
+        self.referrer = _alternation(grouped['referrer'])
+        self.tracking = _alternation(grouped['tracking_param'])
+        self.ips = CidrIndex(ips.items()) if ips else None
+
+    def evaluate(self, click: Click, signals: List[FraudSignal], country: Optional[str] = None) -> None:
+        if country and country in self.countries:
+            self._add(signals, self.countries[country])
+        if self.ips is not None:
+            rule = self.ips.lookup(click.ip_address)
+            if rule is not None:
+                self._add(signals, rule)
+        if self.user_agent is not None and click.user_agent:
+            match = self.user_agent.search(click.user_agent)
+            if match:
+                self._add(signals, self.rules[match.lastgroup])
+        if self.referrer is not None and click.referrer:
+            match = self.referrer.search(click.referrer)
+            if match:
+                self._add(signals, self.rules[match.lastgroup])
+        if self.tracking is not None:
+            for value in click.tracking_params.values():
+                match = self.tracking.search(value) if value else None
+                if match:
+                    self._add(signals, self.rules[match.lastgroup])
+                    break
+
+    @staticmethod
+    def _add(signals: List[FraudSignal], rule: FraudRule) -> None:
+        signals.append(FraudSignal(check=f"rule:{rule.type}", reason=f"rule_matched: {rule.name}",
+                                   score=rule.weight))
+
+
+@dataclass
+class _RuleState:
+    """Immutable-by-convention snapshot swapped atomically on reload."""
+    global_rules: Optional[_CompiledRules] = None
+    campaign_rules: Dict[str, _CompiledRules] = field(default_factory=dict)
+    rule_count: int = 0
+    uses_country: bool = False
+
+
+class FraudRuleEngine:
+    """
+    Single-pass fraud evaluation with all patterns compiled up front.
+
+    Built-in checks (bot user agents, IP sanity, suspicious referrers, tracking
+    parameter format) use combined regular expressions compiled once. The
+    configurable rules from FraudHandler are compiled per scope: one global
+    set plus one set per campaign. ``load_rules()`` builds the new state off to
+    the side and swaps it in with a single assignment, so evaluations running
+    concurrently see either the old rules or the new ones, never a mix.
+
+    With a ``geolocation`` service (anything with ``get_location(ip)``), the
+    click's country is resolved at most once per evaluation, and only when a
+    ``country`` rule or an ``allowed_countries``/``blocked_countries`` filter
+    needs it.
+    """
+
+    def __init__(self, rules: Iterable[FraudRule] = (),
+                 user_agent_classifier: Optional[UserAgentClassifier] = None,
+                 ip_reputation: Optional[IpReputationService] = None, geolocation=None):
+        self._user_agents = user_agent_classifier or UserAgentClassifier()
+        self._ip_reputation = ip_reputation
+        self._geolocation = geolocation
+        self._blacklists: Dict[Tuple[str, ...], Optional[CidrIndex]] = {}
+        self._referrer_re = _alternation([(f"p{i}", p) for i, p in enumerate(SUSPICIOUS_REFERRER_PATTERNS)])
+        self._referrer_patterns = {f"p{i}": p for i, p in enumerate(SUSPICIOUS_REFERRER_PATTERNS)}
+        self._suspicious_tracking_re = re.compile(
+            '|'.join(re.escape(p) for p in SUSPICIOUS_TRACKING_CONTENT), re.IGNORECASE)
+        self._state = _RuleState()
+        self.load_rules(rules)
+
+    def load_rules(self, rules: Iterable[FraudRule]) -> None:
+        """Compile ``rules`` and replace the active rule set atomically."""
+        rules = list(rules)
+        by_campaign: Dict[Optional[str], List[FraudRule]] = {}
+        for rule in rules:
+            by_campaign.setdefault(rule.campaign_id, []).append(rule)
+        global_rules = by_campaign.pop(None, [])
+        self._state = _RuleState(
+            global_rules=_CompiledRules(global_rules) if global_rules else None,
+            campaign_rules={campaign_id: _CompiledRules(campaign_rules)
+                            for campaign_id, campaign_rules in by_campaign.items()},
+            rule_count=len(rules),
+            uses_country=any(rule.type == 'country' and rule.is_active for rule in rules),
+        )
+
+    @property
+    def rule_count(self) -> int:
+        return self._state.rule_count
+
+    @property
+    def user_agent_classifier(self) -> UserAgentClassifier:
+        return self._user_agents
+
+    @property
+    def ip_reputation(self) -> Optional[IpReputationService]:
+        return self._ip_reputation
+
+    def evaluate(self, click: Click, campaign_id: Optional[str] = None,
+                 campaign_filters: Optional[dict] = None) -> FraudVerdict:
+        """Run every check against the click and return the score breakdown."""
+        return self._evaluate(self._state, click, campaign_id, campaign_filters)
+
+    def evaluate_batch(self, clicks: Sequence[Click],
+                       campaign_filters: Optional[dict] = None) -> List[FraudVerdict]:
+        """
+        Evaluate many clicks against one rule snapshot, each with its own campaign's rules.
+
+        The user agent, address, referrer and country checks each depend on a
+        single value. Within a batch they run once per distinct value and every
+        click carrying it shares the result. Server-to-server feeds repeat a few
+        user agents and source addresses, so that is most of the work.
+        """
+        state = self._state
+        memo: Dict[Tuple[str, Optional[str]], Any] = {}
+        return [self._evaluate(state, click, getattr(click.campaign_id, 'value', click.campaign_id),
+                               campaign_filters, memo)
+                for click in clicks]
+
+    def _evaluate(self, state: _RuleState, click: Click, campaign_id: Optional[str],
+                  campaign_filters: Optional[dict], memo: Optional[dict] = None) -> FraudVerdict:
+        signals: List[FraudSignal] = []
+        country = None
+        if self._geolocation is not None and (
+                state.uses_country or (campaign_filters and any(k in campaign_filters for k in GEO_FILTER_KEYS))):
+            country = self._per_value(memo, 'country', click.ip_address, self._country_of)
+
+        for check, value, signal_of in (('user_agent', click.user_agent, self._user_agent_signal),
+                                        ('ip', click.ip_address, self._ip_signal),
+                                        ('referrer', click.referrer, self._referrer_signal)):
+            signal = self._per_value(memo, check, value, signal_of)
+            if signal is not None:
+                signals.append(signal)
+
+        if campaign_filters:
+            filter_reason = self._check_campaign_filters(click, campaign_filters, country)
+            if filter_reason:
+                signals.append(FraudSignal('campaign_filters', filter_reason, CAMPAIGN_FILTER_SCORE))
+
+        tracking_reason = self._check_tracking_parameters(click)
+        if tracking_reason:
+            signals.append(FraudSignal('tracking_params', tracking_reason, TRACKING_SCORE))
+
+        if state.global_rules is not None:
+            state.global_rules.evaluate(click, signals, country)
+        campaign_rules = state.campaign_rules.get(campaign_id) if campaign_id else None
+        if campaign_rules is not None:
+            campaign_rules.evaluate(click, signals, country)
+
+        return FraudVerdict(tuple(signals))
+
+    @staticmethod
+    def _per_value(memo: Optional[dict], check: str, value: Optional[str], compute):
+        """``compute(value)``, shared through ``memo`` by every click of a batch with the same value."""
+        if memo is None:
+            return compute(value)
+        key = (check, value)
+        if key not in memo:
+            memo[key] = compute(value)
+        return memo[key]
+
+    def _user_agent_signal(self, user_agent: Optional[str]) -> Optional[FraudSignal]:
+        bot_reason = self.classify_user_agent(user_agent)
+        return FraudSignal('user_agent', bot_reason, BOT_SCORE) if bot_reason else None
+
+    def _ip_signal(self, ip: Optional[str]) -> Optional[FraudSignal]:
+        ip_reason = self._check_ip(ip)
+        if ip_reason:
+            return FraudSignal('ip', ip_reason, IP_SCORE)
+        if self._ip_reputation is not None:
+            listed = self._ip_reputation.lookup(ip)
+            if listed is not None:
+                return FraudSignal(
+                    'ip_reputation', f"ip_listed: {listed.category} ({listed.network})",
+                    IP_REPUTATION_SCORES.get(listed.category, IP_REPUTATION_DEFAULT_SCORE))
+        return None
+
+    def _referrer_signal(self, referrer: Optional[str]) -> Optional[FraudSignal]:
+        referrer_reason = self._check_referrer(referrer)
+        return FraudSignal('referrer', referrer_reason, REFERRER_SCORE) if referrer_reason else None
+
+    def classify_user_agent(self, user_agent: Optional[str]) -> Optional[str]:
+        """Return the bot reason for a user agent, or None if it looks human."""
+        return self._user_agents.classify(user_agent).reason
+
+    @staticmethod
+    def _check_ip(ip: Optional[str]) -> Optional[str]:
+        if not ip:
+            return "missing_ip_address"
+        try:
+            ip_obj = ip_address(ip)
+        except ValueError:
+            return "invalid_ip_format"
+        if ip_obj.is_private:
+            return "private_ip_address"
+        if ip_obj.is_reserved:
+            return "reserved_ip_address"
+        if ip_obj.is_loopback:
+            return "localhost_ip_address"
+        return None
+
+    def _compiled_blacklist(self, blacklist) -> Optional[CidrIndex]:
+        """Compile a campaign's address/CIDR blacklist once and reuse it for later clicks."""
+        key = tuple(blacklist)
+        if key not in self._blacklists:
+            if len(self._blacklists) >= _MAX_COMPILED_BLACKLISTS:
+                self._blacklists.clear()
+            entries = []
+            for entry in key:
+                try:
+                    ip_network(entry, strict=False)
+                except (TypeError, ValueError):
+                    continue  # Ignore malformed entries instead of failing the click
+                entries.append((entry, True))
+            self._blacklists[key] = CidrIndex(entries) if entries else None
+        return self._blacklists[key]
+
+    def _check_referrer(self, referrer: Optional[str]) -> Optional[str]:
+        if not referrer:
+            return None  # Missing referrer is not necessarily fraudulent
+        if len(referrer) > REFERRER_MAX_LENGTH:
+            return "referrer_too_long"
+        match = self._referrer_re.search(referrer)
+        if match:
+            return f"suspicious_referrer_pattern: {self._referrer_patterns[match.lastgroup]}"
+        if not (referrer.startswith('http://') or referrer.startswith('https://')):
+            return "invalid_referrer_scheme"
+        return None
+
+    def _check_tracking_parameters(self, click: Click) -> Optional[str]:
+        for param_name, param_value in click.tracking_params.items():
+            if param_value is None:
+                continue
+            if not _VALID_TRACKING_RE.match(param_value):
+                return f"invalid_{param_name}_format"
+            if self._suspicious_tracking_re.search(param_value):
+                return f"suspicious_{param_name}_content"
+        return None
+
+    def _country_of(self, ip: Optional[str]) -> Optional[str]:
+        """Country code of the click address from the (local, cached) geolocation service."""
+        if not ip:
+            return None
+        try:
+            location = self._geolocation.get_location(ip)
+        except Exception:
+            return None  # Geo data must never break click validation
+        country = location.get('country') if location else None
+        return country.upper() if country else None
+
+    def _check_campaign_filters(self, click: Click, filters: dict,
+                                country: Optional[str] = None) -> Optional[str]:
+        """Legacy ``campaign_filters`` dict (ip_blacklist, blocked_user_agents, allowed/blocked_countries)."""
+        blacklist = filters.get('ip_blacklist')
+        if blacklist and click.ip_address:
+            index = self._compiled_blacklist(blacklist)
+            if index is not None and index.lookup(click.ip_address) is not None:
+                return "ip_blacklisted"
+        blocked_uas = filters.get('blocked_user_agents')
+        if blocked_uas and click.user_agent:
+            ua_lower = click.user_agent.lower()
+            if any(blocked.lower() in ua_lower for blocked in blocked_uas):
+                return "user_agent_blocked"
+        if country:
+            blocked_countries = filters.get('blocked_countries')
+            if blocked_countries and country in {c.upper() for c in blocked_countries}:
+                return "geo_blocked"
+            allowed_countries = filters.get('allowed_countries')
+            if allowed_countries and country not in {c.upper() for c in allowed_countries}:
+                return "geo_not_targeted"
+        return None
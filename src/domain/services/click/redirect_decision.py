@@ -0,0 +1,91 @@
+# Copyright (c) 2025 Bivex
+#
+# Author: Bivex
+# Available for contact via email: support@b-b.top
+# For up-to-date contact information:
+# https://github.com/bivex
+#
+# Created: 2026-10-16T09:12:04
+# Last Updated: 2026-10-16T09:12:04
+#
+# Licensed under the MIT License.
+# Commercial licensing available upon request.
+
+"""Precompiled redirect decisions for the click hot path."""
+
+from dataclasses import dataclass, field
+from typing import Iterable, Mapping, Optional
+from urllib.parse import quote_plus
+
+from ...value_objects import Url
+
+FALLBACK_REDIRECT_URL = "http://localhost:5000/mock-safe-page"
+
+# Alphanumeric, so urlencode() leaves it untouched and it can be found again after encoding
+_CLICK_ID_SLOT = "CLICKIDSLOT7f3a9c"
+
+
+@dataclass(frozen=True)
+class RedirectTarget:
+    """A redirect URL with its test-mode ``click_id`` variant pre-split around the click id."""
+    url: str
+    test_prefix: str
+    test_suffix: str
+
+    @classmethod
+    def compile(cls, url) -> 'RedirectTarget':
+        """Compile a Url (or URL string). The only place that parses the URL."""
+        url = url if isinstance(url, Url) else Url(url)
+        template = url.with_query_params({'click_id': _CLICK_ID_SLOT}).value
+        prefix, _, suffix = template.partition(_CLICK_ID_SLOT)
+        return cls(url=url.value, test_prefix=prefix, test_suffix=suffix)
+
+    def build(self, click_id: str, test_mode: bool = False) -> str:
+        """Final redirect location; test mode appends the click id like Url.with_query_params."""
+        if not test_mode:
+            return self.url
+        return self.test_prefix + quote_plus(click_id) + self.test_suffix
+
+
+FALLBACK_TARGET = RedirectTarget.compile(FALLBACK_REDIRECT_URL)
+
+
+@dataclass(frozen=True)
+class RedirectDecisionTable:
+    """
+    Flat routing decision for one campaign.
+
+    Resolves, in priority order: explicit landing page, explicit offer, the
+    campaign's offer page (valid clicks, falling back to its safe page), the
+    safe page (invalid clicks), and finally the fallback page. Only active
+    landing pages and offers are present in the maps.
+    """
+    landing_pages: Mapping[str, RedirectTarget] = field(default_factory=dict)
+    offers: Mapping[str, RedirectTarget] = field(default_factory=dict)
+    valid_target: RedirectTarget = FALLBACK_TARGET
+    invalid_target: RedirectTarget = FALLBACK_TARGET
+
+    @classmethod
+    def compile(cls, campaign, landing_pages: Iterable = (), offers: Iterable = ()) -> 'RedirectDecisionTable':
+        """Build the table from a Campaign and its landing pages and offers."""
+        offer_page = RedirectTarget.compile(campaign.offer_page_url) if campaign.offer_page_url else None
+        safe_page = RedirectTarget.compile(campaign.safe_page_url) if campaign.safe_page_url else None
+        return cls(
+            landing_pages={str(lp.id): RedirectTarget.compile(lp.url) for lp in landing_pages if lp.is_active},
+            offers={str(offer.id): RedirectTarget.compile(offer.url) for offer in offers if offer.is_active},
+            valid_target=offer_page or safe_page or FALLBACK_TARGET,
+            invalid_target=safe_page or FALLBACK_TARGET,
+        )
+
+    def decide(self, is_valid: bool, landing_page_id: Optional[str] = None,
+               offer_id: Optional[str] = None) -> RedirectTarget:
+        """Pick the redirect target for a click."""
+        if landing_page_id:
+            target = self.landing_pages.get(landing_page_id)
+            if target is not None:
+                return target
+        if offer_id:
+            target = self.offers.get(offer_id)
+            if target is not None:
+                return target
+        return self.valid_target if is_valid else self.invalid_target
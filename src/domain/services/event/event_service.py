@@ -19,12 +19,14 @@ from typing import Dict, Any, Optional, List
 from loguru import logger
 
 from ...entities.event import Event
+from ..traffic.user_agent_classifier import UserAgentClassifier
 
 
 class EventService:
     """Service for processing and analyzing events."""
 
-    def __init__(self):
+    def __init__(self, user_agent_classifier: Optional[UserAgentClassifier] = None):
+        self._user_agents = user_agent_classifier or UserAgentClassifier()
         self._valid_event_types = {
             'page_view', 'click', 'form_submit', 'form_start', 'form_complete',
             'scroll', 'time_spent', 'conversion', 'purchase', 'signup',
@@ -147,9 +149,8 @@ class EventService:
         if not event.user_agent:
             return "missing_user_agent"
 
-        # Check for suspicious user agents
-        suspicious_agents = ['bot', 'crawler', 'spider', 'scraper']
-        if event.user_agent and any(agent in event.user_agent.lower() for agent in suspicious_agents):
+        # Check for suspicious user agents (verdicts shared with click validation)
+        if self._user_agents.classify(event.user_agent).is_bot:
             return "suspicious_user_agent"
 
         # Check for rapid-fire events (would need more context for this)
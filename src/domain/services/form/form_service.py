@@ -19,12 +19,14 @@ from datetime import datetime
 from typing import List, Dict, Optional, Tuple
 
 from ...entities.form import Lead, FormSubmission, LeadScore, FormValidationRule, LeadStatus, LeadSource
+from ..traffic.user_agent_classifier import UserAgentClassifier
 
 
 class FormService:
     """Domain service for form processing, validation, and lead management."""
 
-    def __init__(self):
+    def __init__(self, user_agent_classifier: Optional[UserAgentClassifier] = None):
+        self._user_agents = user_agent_classifier or UserAgentClassifier()
         self._validation_rules = self._create_default_validation_rules()
 
     def validate_form_submission(self, form_data: Dict,
@@ -293,6 +295,11 @@ class FormService:
                 spam_indicators.append(f"Suspicious content in {field}")
                 is_spam = True
 
+        # Check for automated clients
+        if submission.user_agent and self._user_agents.classify(submission.user_agent).is_bot:
+            spam_indicators.append("Automated user agent")
+            is_spam = True
+
         return is_spam, spam_indicators
 
     def _create_default_validation_rules(self) -> List[FormValidationRule]:
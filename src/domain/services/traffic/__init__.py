@@ -0,0 +1,27 @@
+# Copyright (c) 2025 Bivex
+#
+# Author: Bivex
+# Available for contact via email: support@b-b.top
+# For up-to-date contact information:
+# https://github.com/bivex
+#
+# Created: 2026-10-16T09:12:04
+# Last Updated: 2026-10-16T09:12:04
+#
+# Licensed under the MIT License.
+# Commercial licensing available upon request.
+
+"""Traffic classification services shared by clicks, events and forms."""
+
+from .ip_reputation import CidrIndex, IpReputation, IpReputationIndex, IpReputationService, parse_ip
+from .user_agent_classifier import UserAgentClassifier, UserAgentVerdict
+
+__all__ = [
+    'CidrIndex',
+    'IpReputation',
+    'IpReputationIndex',
+    'IpReputationService',
+    'parse_ip',
+    'UserAgentClassifier',
+    'UserAgentVerdict',
+]
@@ -0,0 +1,216 @@
+# Copyright (c) 2025 Bivex
+#
+# Author: Bivex
+# Available for contact via email: support@b-b.top
+# For up-to-date contact information:
+# https://github.com/bivex
+#
+# Created: 2026-10-16T09:12:04
+# Last Updated: 2026-10-16T09:12:04
+#
+# Licensed under the MIT License.
+# Commercial licensing available upon request.
+
+"""CIDR indexes for IP reputation and location lookups."""
+
+import socket
+import time
+from bisect import bisect_right
+from dataclasses import dataclass
+from ipaddress import ip_network
+from typing import Any, Callable, Dict, Iterable, List, Optional, Tuple
+
+_FAMILY_BITS = {4: 32, 6: 128}
+
+
+def parse_ip(ip: Optional[str]) -> Optional[Tuple[int, int]]:
+    """Return (version, integer value) for an address string, or None if it is not a valid IP."""
+    if not ip:
+        return None
+    try:
+        return 4, int.from_bytes(socket.inet_pton(socket.AF_INET, ip), 'big')
+    except (OSError, ValueError):
+        pass
+    try:
+        return 6, int.from_bytes(socket.inet_pton(socket.AF_INET6, ip.split('%', 1)[0]), 'big')
+    except (OSError, ValueError):
+        return None
+
+
+class CidrIndex:
+    """
+    Immutable longest-prefix-match index over CIDR blocks.
+
+    ``radix`` keeps one level per prefix length present in the data, each a
+    dict keyed by the network bits, and probes them longest first: a lookup
+    costs at most one dict probe per distinct prefix length, bounded by the
+    address length. ``sorted`` flattens the blocks into disjoint intervals and
+    binary-searches them, which is cheaper to build for very large lists with
+    many different prefix lengths.
+
+    When the same network is added twice, the later value wins.
+    """
+
+    BACKENDS = ('radix', 'sorted')
+
+    def __init__(self, entries: Iterable[Tuple[str, Any]] = (), backend: str = 'radix'):
+        if backend not in self.BACKENDS:
+            raise ValueError(f"CIDR index backend must be one of: {', '.join(self.BACKENDS)}")
+        self.backend = backend
+        blocks: Dict[int, Dict[Tuple[int, int], Any]] = {4: {}, 6: {}}
+        for cidr, value in entries:
+            network = ip_network(cidr.strip(), strict=False)  # Raises ValueError for invalid blocks
+            blocks[network.version][(int(network.network_address), network.prefixlen)] = value
+        self._size = sum(len(family) for family in blocks.values())
+
+        if backend == 'radix':
+            self._levels = {version: self._build_levels(version, family) for version, family in blocks.items()}
+        else:
+            self._intervals = {version: self._build_intervals(version, family) for version, family in blocks.items()}
+
+    def __len__(self) -> int:
+        return self._size
+
+    def lookup(self, ip: Optional[str]) -> Optional[Any]:
+        """Return the value of the most specific block containing ``ip``, or None."""
+        parsed = parse_ip(ip)
+        return self.lookup_int(*parsed) if parsed else None
+
+    def lookup_int(self, version: int, value: int) -> Optional[Any]:
+        """Like ``lookup`` for an already parsed address."""
+        if self.backend == 'radix':
+            for shift, level in self._levels[version]:
+                hit = level.get(value >> shift)
+                if hit is not None:
+                    return hit
+            return None
+
+        starts, ends, values = self._intervals[version]
+        index = bisect_right(starts, value) - 1
+        if index >= 0 and value <= ends[index]:
+            return values[index]
+        return None
+
+    @staticmethod
+    def _build_levels(version: int, blocks: Dict[Tuple[int, int], Any]) -> List[Tuple[int, Dict[int, Any]]]:
+        bits = _FAMILY_BITS[version]
+        levels: Dict[int, Dict[int, Any]] = {}
+        for (network, prefixlen), value in blocks.items():
+            levels.setdefault(prefixlen, {})[network >> (bits - prefixlen)] = value
+        return [(bits - prefixlen, levels[prefixlen]) for prefixlen in sorted(levels, reverse=True)]
+
+    @staticmethod
+    def _build_intervals(version: int, blocks: Dict[Tuple[int, int], Any]) -> Tuple[List[int], List[int], List[Any]]:
+        bits = _FAMILY_BITS[version]
+        # CIDR blocks either nest or are disjoint; parents sort before their children
+        ordered = sorted(blocks.items(), key=lambda item: (item[0][0], item[0][1]))
+        starts: List[int] = []
+        ends: List[int] = []
+        values: List[Any] = []
+
+        def emit(start: int, end: int, value: Any) -> None:
+            if start <= end:
+                starts.append(start)
+                ends.append(end)
+                values.append(value)
+
+        open_blocks: List[Tuple[int, Any]] = []  # (end, value), innermost last
+        cursor = 0
+        for (network, prefixlen), value in ordered:
+            end = network + (1 << (bits - prefixlen)) - 1
+            while open_blocks and open_blocks[-1][0] < network:
+                block_end, block_value = open_blocks.pop()
+                emit(cursor, block_end, block_value)
+                cursor = block_end + 1
+            if open_blocks:
+                emit(cursor, network - 1, open_blocks[-1][1])
+            open_blocks.append((end, value))
+            cursor = network
+        while open_blocks:
+            block_end, block_value = open_blocks.pop()
+            emit(cursor, block_end, block_value)
+            cursor = block_end + 1
+        return starts, ends, values
+
+
+@dataclass(frozen=True)
+class IpReputation:
+    """Blocklist entry matched by an address."""
+    category: str
+    network: str
+
+
+class IpReputationIndex:
+    """
+    Snapshot of the IP intelligence data: categorised blocklists (datacenter
+    ranges, known proxies, ...) and CIDR-level locations.
+    """
+
+    def __init__(self, blocklists: Optional[Dict[str, Iterable[str]]] = None,
+                 locations: Iterable[Tuple[str, Dict[str, Any]]] = (), backend: str = 'radix'):
+        listed = [(cidr, IpReputation(category, cidr.strip()))
+                  for category, cidrs in (blocklists or {}).items() for cidr in cidrs]
+        self._reputation = CidrIndex(listed, backend)
+        self._locations = CidrIndex(locations, backend)
+        self.categories = tuple(sorted(blocklists or ()))
+        self.backend = backend
+
+    def lookup(self, ip: Optional[str]) -> Optional[IpReputation]:
+        """Return the blocklist entry covering ``ip``, or None if it is not listed."""
+        return self._reputation.lookup(ip)
+
+    def locate(self, ip: Optional[str]) -> Optional[Dict[str, Any]]:
+        """Return the location of the block covering ``ip``, or None if unknown."""
+        return self._locations.lookup(ip)
+
+    def get_stats(self) -> Dict[str, Any]:
+        return {
+            'backend': self.backend,
+            'categories': list(self.categories),
+            'blocklist_entries': len(self._reputation),
+            'location_entries': len(self._locations),
+        }
+
+
+class IpReputationService:
+    """
+    Holds the current IpReputationIndex and swaps in new ones on reload.
+
+    Readers grab ``self._index`` once per lookup, so a reload is a single
+    reference assignment and concurrent lookups see either the old snapshot or
+    the new one.
+    """
+
+    def __init__(self, index: Optional[IpReputationIndex] = None,
+                 loader: Optional[Callable[[], IpReputationIndex]] = None):
+        self._loader = loader
+        self._index = index or IpReputationIndex()
+        self._reloads = 0
+        self._loaded_at: Optional[float] = None
+
+    def reload(self) -> Dict[str, Any]:
+        """Build a fresh index with the loader and swap it in."""
+        if self._loader is None:
+            raise RuntimeError("IP reputation service has no loader configured")
+        self.swap(self._loader())
+        return self.get_stats()
+
+    def swap(self, index: IpReputationIndex) -> None:
+        self._index = index
+        self._reloads += 1
+        self._loaded_at = time.time()
+
+    @property
+    def index(self) -> IpReputationIndex:
+        return self._index
+
+    def lookup(self, ip: Optional[str]) -> Optional[IpReputation]:
+        return self._index.lookup(ip)
+
+    def locate(self, ip: Optional[str]) -> Optional[Dict[str, Any]]:
+        return self._index.locate(ip)
+
+    def get_stats(self) -> Dict[str, Any]:
+        stats = self._index.get_stats()
+        stats.update(reloads=self._reloads, loaded_at=self._loaded_at)
+        return stats
@@ -0,0 +1,138 @@
+# Copyright (c) 2025 Bivex
+#
+# Author: Bivex
+# Available for contact via email: support@b-b.top
+# For up-to-date contact information:
+# https://github.com/bivex
+#
+# Created: 2026-10-16T09:12:04
+# Last Updated: 2026-10-16T09:12:04
+#
+# Licensed under the MIT License.
+# Commercial licensing available upon request.
+
+"""User-agent classification with a bounded LRU of verdicts."""
+
+import re
+import threading
+from collections import OrderedDict
+from dataclasses import dataclass
+from typing import Any, Dict, Optional
+
+from ...constants import (
+    BOT_DETECTION_PATTERNS, BOT_USER_AGENT_MIN_LENGTH, BOT_USER_AGENT_MAX_SPACES, MAX_HEADER_LENGTH
+)
+
+_BOT_RE = re.compile('|'.join(re.escape(p) for p in BOT_DETECTION_PATTERNS), re.IGNORECASE)
+
+# Order matters: Edge and Opera also advertise Chrome, Chrome also advertises Safari
+_BROWSER_FAMILIES = (
+    ('edge', re.compile(r'edg(e|a|ios)?/', re.IGNORECASE)),
+    ('opera', re.compile(r'opr/|opera', re.IGNORECASE)),
+    ('samsung', re.compile(r'samsungbrowser', re.IGNORECASE)),
+    ('firefox', re.compile(r'firefox|fxios', re.IGNORECASE)),
+    ('chrome', re.compile(r'chrome|crios|chromium', re.IGNORECASE)),
+    ('safari', re.compile(r'safari', re.IGNORECASE)),
+)
+_TABLET_RE = re.compile(r'ipad|tablet|kindle|silk|(android(?!.*mobile))', re.IGNORECASE)
+_MOBILE_RE = re.compile(r'mobi|iphone|ipod|android|blackberry|opera mini|iemobile', re.IGNORECASE)
+
+
+@dataclass(frozen=True)
+class UserAgentVerdict:
+    """Classification of one user-agent string."""
+    is_bot: bool
+    reason: Optional[str]
+    device_family: str
+    browser_family: str
+
+
+class UserAgentClassifier:
+    """
+    Classifies user agents as bot/human and by device and browser family.
+
+    Real traffic has few distinct user agents compared with its volume, so
+    verdicts are cached by the raw header in a thread-safe LRU. Headers longer
+    than MAX_HEADER_LENGTH are classified but not cached, so a flood of junk
+    headers cannot evict the real ones.
+    """
+
+    def __init__(self, max_entries: int = 10000):
+        self._max_entries = max_entries
+        self._verdicts: 'OrderedDict[str, UserAgentVerdict]' = OrderedDict()
+        self._lock = threading.Lock()
+        self._hits = 0
+        self._misses = 0
+        self._evictions = 0
+
+    def classify(self, user_agent: Optional[str]) -> UserAgentVerdict:
+        """Return the (possibly cached) verdict for a raw User-Agent header."""
+        if not user_agent:
+            return _MISSING_VERDICT
+        with self._lock:
+            verdict = self._verdicts.get(user_agent)
+            if verdict is not None:
+                self._verdicts.move_to_end(user_agent)
+                self._hits += 1
+                return verdict
+            self._misses += 1
+
+        verdict = self._classify(user_agent)
+        if len(user_agent) <= MAX_HEADER_LENGTH:
+            with self._lock:
+                self._verdicts[user_agent] = verdict
+                if len(self._verdicts) > self._max_entries:
+                    self._verdicts.popitem(last=False)
+                    self._evictions += 1
+        return verdict
+
+    @staticmethod
+    def _classify(user_agent: str) -> UserAgentVerdict:
+        reason = None
+        match = _BOT_RE.search(user_agent)
+        if match:
+            reason = f"bot_pattern_detected: {match.group(0).lower()}"
+        elif len(user_agent) < BOT_USER_AGENT_MIN_LENGTH:
+            reason = "user_agent_too_short"
+        elif user_agent.count(' ') > BOT_USER_AGENT_MAX_SPACES:
+            reason = "user_agent_suspiciously_long"
+
+        browser = next((name for name, pattern in _BROWSER_FAMILIES if pattern.search(user_agent)), 'other')
+        if match:
+            device = 'bot'
+        elif _TABLET_RE.search(user_agent):
+            device = 'tablet'
+        elif _MOBILE_RE.search(user_agent):
+            device = 'mobile'
+        elif browser != 'other':
+            device = 'desktop'
+        else:
+            device = 'unknown'
+
+        return UserAgentVerdict(is_bot=reason is not None, reason=reason,
+                                device_family=device, browser_family=browser)
+
+    def clear(self) -> int:
+        """Drop all cached verdicts. Returns the number removed."""
+        with self._lock:
+            removed = len(self._verdicts)
+            self._verdicts.clear()
+        return removed
+
+    def get_stats(self) -> Dict[str, Any]:
+        """Get cache statistics."""
+        with self._lock:
+            lookups = self._hits + self._misses
+            return {
+                'enabled': True,
+                'keys': len(self._verdicts),
+                'max_entries': self._max_entries,
+                'hits': self._hits,
+                'misses': self._misses,
+                'hit_ratio': round(self._hits / lookups, 4) if lookups else 0.0,
+                'evictions': self._evictions,
+            }
+
+
+_MISSING_VERDICT = UserAgentVerdict(is_bot=True, reason="missing_user_agent",
+                                    device_family='unknown', browser_family='other')
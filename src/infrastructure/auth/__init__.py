@@ -0,0 +1,19 @@
+# Copyright (c) 2025 Bivex
+#
+# Author: Bivex
+# Available for contact via email: support@b-b.top
+# For up-to-date contact information:
+# https://github.com/bivex
+#
+# Created: 2026-10-16T09:12:04
+# Last Updated: 2026-10-16T09:12:04
+#
+# Licensed under the MIT License.
+# Commercial licensing available upon request.
+
+"""Authentication support infrastructure."""
+
+from .revocation_list import RevocationList
+from .verified_token_cache import VerifiedTokenCache
+
+__all__ = ['RevocationList', 'VerifiedTokenCache']
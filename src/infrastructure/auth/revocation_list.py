@@ -0,0 +1,133 @@
+# Copyright (c) 2025 Bivex
+#
+# Author: Bivex
+# Available for contact via email: support@b-b.top
+# For up-to-date contact information:
+# https://github.com/bivex
+#
+# Created: 2026-10-16T09:12:04
+# Last Updated: 2026-10-16T09:12:04
+#
+# Licensed under the MIT License.
+# Commercial licensing available upon request.
+"""Fixed-size revocation list of token digests and ``jti`` values.
+
+Entries are 64-bit key hashes with the time until which the key stays
+revoked, kept in a set-associative ring like the rate limiter's. Expired
+entries are reclaimed lazily. A live revocation is never evicted: when all
+ways of a set are live, ``add`` refuses the new key instead. A generation counter in the header is bumped on
+every revocation, so caches of verified claims can tell cheaply whether they
+have to re-check what they hold.
+
+The ring lives either in a private bytearray or in an anonymous shared
+mapping. The shared variant must be created before the workers are forked;
+a token revoked through any worker is then rejected by all of them.
+Revocations do not survive a restart of the supervisor.
+"""
+
+import hashlib
+import logging
+import math
+import mmap
+import multiprocessing
+import struct
+import threading
+import time
+from typing import Dict, Optional, Set
+
+logger = logging.getLogger(__name__)
+
+# generation
+_HEADER = struct.Struct('<Q')
+# key hash, revoked until
+_SLOT = struct.Struct('<Qd')
+
+
+def token_key(digest: bytes) -> int:
+    """Key of a token, from its SHA-256 digest; 0 marks an empty slot."""
+    return int.from_bytes(digest[:8], 'little') or 1
+
+
+def jti_key(jti: str) -> int:
+    """Key of a ``jti`` claim."""
+    return int.from_bytes(hashlib.blake2b(f"jti:{jti}".encode('utf-8'), digest_size=8).digest(), 'little') or 1
+
+
+class RevocationList:
+    """Set-associative ring of revoked keys with expiry."""
+
+    def __init__(self, slots: int = 16384, ways: int = 4, shared: bool = False):
+        if slots < ways or ways < 1:
+            raise ValueError("Revocation list needs at least one set of slots")
+        self._ways = ways
+        self._sets = slots // ways
+        self._shared = shared
+        size = _HEADER.size + self._sets * ways * _SLOT.size
+        if shared:
+            # Anonymous MAP_SHARED mapping: inherited, and shared, by forked workers
+            self._ring = mmap.mmap(-1, size)
+            self._lock = multiprocessing.Lock()
+        else:
+            self._ring = bytearray(size)
+            self._lock = threading.Lock()
+        self._overflows = 0
+
+    @property
+    def generation(self) -> int:
+        """Number of revocations so far (read without locking; an aligned 8-byte read)."""
+        return _HEADER.unpack_from(self._ring, 0)[0]
+
+    def add(self, key: int, until: float = math.inf, now: Optional[float] = None) -> bool:
+        """Revoke ``key`` until ``until`` (forever by default).
+
+        Returns False, and revokes nothing, if every way of the key's set holds a live revocation.
+        """
+        now = time.time() if now is None else now
+        base = _HEADER.size + (key % self._sets) * self._ways * _SLOT.size
+        ring = self._ring
+        with self._lock:
+            target = None
+            for way in range(self._ways):
+                offset = base + way * _SLOT.size
+                slot_key, slot_until = _SLOT.unpack_from(ring, offset)
+                if slot_key == key:
+                    target = offset
+                    until = max(until, slot_until)
+                    break
+                if target is None and (slot_key == 0 or slot_until <= now):
+                    target = offset  # Empty or expired: reclaim
+            if target is None:
+                # Evicting a live revocation would make that token valid again
+                self._overflows += 1
+                logger.warning("Revocation list set is full; revocation refused")
+                return False
+            _SLOT.pack_into(ring, target, key, until)
+            _HEADER.pack_into(ring, 0, _HEADER.unpack_from(ring, 0)[0] + 1)
+        return True
+
+    def contains(self, key: int, now: Optional[float] = None) -> bool:
+        """True if ``key`` is revoked at ``now``."""
+        now = time.time() if now is None else now
+        base = _HEADER.size + (key % self._sets) * self._ways * _SLOT.size
+        with self._lock:
+            for way in range(self._ways):
+                slot_key, slot_until = _SLOT.unpack_from(self._ring, base + way * _SLOT.size)
+                if slot_key == key:
+                    return now < slot_until
+        return False
+
+    def live_keys(self, now: Optional[float] = None) -> Set[int]:
+        """All keys revoked at ``now`` (one pass over a copy of the ring)."""
+        now = time.time() if now is None else now
+        with self._lock:
+            slots = bytes(self._ring[_HEADER.size:])
+        return {key for key, until in _SLOT.iter_unpack(slots) if key and now < until}
+
+    def get_stats(self) -> Dict[str, object]:
+        return {
+            'backend': 'shared_memory' if self._shared else 'local',
+            'slots': self._sets * self._ways,
+            'revocations': self.generation,
+            'live': len(self.live_keys()),
+            'overflows': self._overflows,
+        }
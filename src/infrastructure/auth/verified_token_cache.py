@@ -0,0 +1,162 @@
+# Copyright (c) 2025 Bivex
+#
+# Author: Bivex
+# Available for contact via email: support@b-b.top
+# For up-to-date contact information:
+# https://github.com/bivex
+#
+# Created: 2026-10-16T09:12:04
+# Last Updated: 2026-10-16T09:12:04
+#
+# Licensed under the MIT License.
+# Commercial licensing available upon request.
+
+"""Cache of verified JWT claims keyed by token digest."""
+
+import hashlib
+import math
+import threading
+import time
+from collections import OrderedDict
+from typing import Any, Dict, Optional, Tuple
+
+from .revocation_list import RevocationList, jti_key, token_key
+
+
+def token_digest(token: str) -> bytes:
+    """SHA-256 of the raw token; the cache never keeps tokens themselves."""
+    return hashlib.sha256(token.encode('utf-8')).digest()
+
+
+class VerifiedTokenCache:
+    """
+    Bounded LRU of claims for tokens whose signature has already been verified.
+
+    Entries expire with the token's own ``exp`` claim, and tokens without one
+    are never cached, so a hit is exactly as valid as a fresh ``jwt.decode``
+    would be (the secret and validation options are fixed for the process).
+    Revoked tokens, by digest or by ``jti``, are rejected until they would have
+    expired anyway. Revocations go to a ``RevocationList``; with a shared one,
+    a revocation made in any worker applies to all of them. The hit path only
+    compares the list's generation with the last one seen, and drops revoked
+    entries when it has moved.
+    """
+
+    def __init__(self, max_entries: int = 10000, revocations: Optional[RevocationList] = None):
+        self._max_entries = max_entries
+        self._entries: 'OrderedDict[bytes, Tuple[float, Dict[str, Any]]]' = OrderedDict()
+        self._revocations = revocations if revocations is not None else RevocationList()
+        self._seen_generation = self._revocations.generation
+        self._lock = threading.Lock()
+        self._hits = 0
+        self._misses = 0
+        self._expired = 0
+        self._evictions = 0
+        self._rejected_revoked = 0
+
+    def get(self, token: str, now: Optional[float] = None) -> Optional[Dict[str, Any]]:
+        """Return cached claims for a still-valid verified token, or None."""
+        digest = token_digest(token)
+        now = time.time() if now is None else now
+        if self._revocations.generation != self._seen_generation:
+            self._drop_revoked(now)
+        with self._lock:
+            entry = self._entries.get(digest)
+            if entry is None:
+                self._misses += 1
+                return None
+            expires_at, claims = entry
+            if now >= expires_at:
+                del self._entries[digest]
+                self._expired += 1
+                self._misses += 1
+                return None
+            self._entries.move_to_end(digest)
+            self._hits += 1
+            return claims
+
+    def put(self, token: str, claims: Dict[str, Any], now: Optional[float] = None) -> None:
+        """Remember the claims of a token that passed full verification."""
+        exp = claims.get('exp')
+        nbf = claims.get('nbf')
+        now = time.time() if now is None else now
+        if not isinstance(exp, (int, float)) or exp <= now:
+            return
+        if isinstance(nbf, (int, float)) and nbf > now:
+            return
+        digest = token_digest(token)
+        with self._lock:
+            self._entries[digest] = (float(exp), claims)
+            self._entries.move_to_end(digest)
+            if len(self._entries) > self._max_entries:
+                self._entries.popitem(last=False)
+                self._evictions += 1
+
+    def revoke(self, token: Optional[str] = None, jti: Optional[str] = None,
+               expires_at: Optional[float] = None) -> bool:
+        """Reject a token (or every token with ``jti``) until ``expires_at``; forever if omitted.
+
+        Returns False if the revocation list had no room for it (see ``RevocationList.add``).
+        """
+        until = math.inf if expires_at is None else float(expires_at)
+        digest = token_digest(token) if token else None
+        stored = True
+        if digest is not None:
+            stored = self._revocations.add(token_key(digest), until)
+        if jti:
+            stored = self._revocations.add(jti_key(jti), until) and stored
+        with self._lock:
+            if digest is not None:
+                self._entries.pop(digest, None)
+            if jti:
+                for cached in [d for d, (_, claims) in self._entries.items() if claims.get('jti') == jti]:
+                    del self._entries[cached]
+        return stored
+
+    def is_revoked(self, token: str, claims: Optional[Dict[str, Any]] = None,
+                   now: Optional[float] = None) -> bool:
+        """Check the revocation list for the token and its ``jti``."""
+        if self._revocations.generation == 0:
+            return False
+        now = time.time() if now is None else now
+        jti = claims.get('jti') if claims else None
+        revoked = (self._revocations.contains(token_key(token_digest(token)), now)
+                   or bool(jti) and self._revocations.contains(jti_key(jti), now))
+        if revoked:
+            with self._lock:
+                self._rejected_revoked += 1
+        return revoked
+
+    def _drop_revoked(self, now: float) -> None:
+        """Evict cached claims revoked since the last check (possibly by another worker)."""
+        generation = self._revocations.generation
+        live = self._revocations.live_keys(now)
+        with self._lock:
+            for digest in [d for d, (_, claims) in self._entries.items()
+                           if token_key(d) in live or (claims.get('jti') and jti_key(claims['jti']) in live)]:
+                del self._entries[digest]
+            self._seen_generation = generation
+
+    def clear(self) -> int:
+        """Drop all cached claims (revocations are kept). Returns the number removed."""
+        with self._lock:
+            removed = len(self._entries)
+            self._entries.clear()
+        return removed
+
+    def get_stats(self) -> Dict[str, Any]:
+        """Get cache statistics."""
+        with self._lock:
+            lookups = self._hits + self._misses
+            return {
+                'enabled': True,
+                'keys': len(self._entries),
+                'max_entries': self._max_entries,
+                'hits': self._hits,
+                'misses': self._misses,
+                'hit_ratio': round(self._hits / lookups, 4) if lookups else 0.0,
+                'expired': self._expired,
+                'evictions': self._evictions,
+                'rejected_revoked': self._rejected_revoked,
+                'revocations': self._revocations.get_stats(),
+            }
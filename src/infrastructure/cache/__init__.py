@@ -0,0 +1,26 @@
+# Copyright (c) 2025 Bivex
+#
+# Author: Bivex
+# Available for contact via email: support@b-b.top
+# For up-to-date contact information:
+# https://github.com/bivex
+#
+# Created: 2026-10-16T09:12:04
+# Last Updated: 2026-10-16T09:12:04
+#
+# Licensed under the MIT License.
+# Commercial licensing available upon request.
+
+"""In-process caches for the redirect hot path."""
+
+from .cache_invalidation import PostgresCacheInvalidator
+from .routing_cache import RoutingCache
+from .routing_snapshots import CampaignRoutingSnapshot, LandingPageRoutingSnapshot, OfferRoutingSnapshot
+
+__all__ = [
+    'PostgresCacheInvalidator',
+    'RoutingCache',
+    'CampaignRoutingSnapshot',
+    'LandingPageRoutingSnapshot',
+    'OfferRoutingSnapshot',
+]
@@ -0,0 +1,198 @@
+# Copyright (c) 2025 Bivex
+#
+# Author: Bivex
+# Available for contact via email: support@b-b.top
+# For up-to-date contact information:
+# https://github.com/bivex
+#
+# Created: 2026-10-16T09:12:04
+# Last Updated: 2026-10-16T09:12:04
+#
+# Licensed under the MIT License.
+# Commercial licensing available upon request.
+"""
+Cross-process routing cache invalidation over PostgreSQL LISTEN/NOTIFY.
+
+Each worker process keeps its own RoutingCache. When one worker writes a
+campaign, it publishes ``{"origin", "namespace", "key"}`` on a NOTIFY channel.
+Every other worker LISTENs on a dedicated connection and drops the same
+entry. After a reconnect, a listener flushes its whole cache, because it may
+have missed notifications while it was disconnected.
+
+Other per-process state can ride on the same channel under its own namespace
+(``subscribe``); fraud rules are reloaded from their store and IP reputation
+indexes from their files this way.
+Subscribers are also called with key None whenever the listener connects,
+since a change may have been published before this worker was listening.
+"""
+
+import asyncio
+import json
+import logging
+import os
+import uuid
+from typing import Any, Callable, Dict, List, Optional
+
+logger = logging.getLogger(__name__)
+
+
+class PostgresCacheInvalidator:
+    """LISTEN/NOTIFY bridge between the routing caches of all worker processes."""
+
+    def __init__(self, cache, pool, channel: str = "routing_cache_invalidation",
+                 max_reconnect_delay: float = 30.0):
+        """
+        Args:
+            cache: RoutingCache whose entries are dropped on notification
+            pool: AsyncConnectionPool used to publish and to open the listener connection
+            channel: NOTIFY channel name
+            max_reconnect_delay: Upper bound for the backoff between listener reconnects (seconds)
+        """
+        self._cache = cache
+        self._pool = pool
+        self._channel = channel
+        self._max_reconnect_delay = max_reconnect_delay
+        self._origin = f"{os.getpid()}-{uuid.uuid4().hex[:8]}"
+        self._subscribers: Dict[str, List[Callable[[Optional[str]], None]]] = {}
+
+        self._loop: Optional[asyncio.AbstractEventLoop] = None
+        self._listener: Optional[asyncio.Task] = None
+        self._conn = None
+        self._closed = False
+
+        self._published = 0
+        self._publish_errors = 0
+        self._received = 0
+        self._reconnects = 0
+        self._last_error: Optional[str] = None
+
+    def subscribe(self, namespace: str, callback: Callable[[Optional[str]], None]) -> None:
+        """Call ``callback(key)`` on the loop when another worker publishes on ``namespace``."""
+        self._subscribers.setdefault(namespace, []).append(callback)
+
+    def _notify_subscribers(self, namespace: str, key: Optional[str]) -> None:
+        for callback in self._subscribers.get(namespace, ()):
+            try:
+                callback(key)
+            except Exception as e:
+                logger.error(f"Invalidation subscriber for '{namespace}' failed: {e}")
+
+    def ensure_started(self) -> None:
+        """Start the listener on the running loop if it is not already running there."""
+        if self._closed:
+            return
+        loop = asyncio.get_running_loop()
+        if self._loop is loop and self._listener is not None and not self._listener.done():
+            return
+        self._loop = loop
+        self._listener = loop.create_task(self._listen(), name="routing-cache-listener")
+
+    async def _listen(self) -> None:
+        delay = 1.0
+        connected_before = False
+        while not self._closed:
+            lost = asyncio.Event()
+            try:
+                self._conn = await self._pool.connect()
+                self._conn.add_termination_listener(lambda _conn: lost.set())
+                await self._conn.add_listener(self._channel, self._on_notify)
+                if connected_before:
+                    # Notifications sent while we were disconnected are gone
+                    self._reconnects += 1
+                    self._cache.flush(broadcast=False)
+                for namespace in self._subscribers:
+                    self._notify_subscribers(namespace, None)
+                connected_before = True
+                delay = 1.0
+                logger.info(f"Routing cache listening on channel '{self._channel}'")
+                await lost.wait()
+                logger.warning("Routing cache listener connection lost, reconnecting")
+            except asyncio.CancelledError:
+                raise
+            except Exception as e:
+                self._last_error = str(e)[:200]
+                logger.error(f"Routing cache listener error (retry in {delay:.0f}s): {e}")
+                await asyncio.sleep(delay)
+                delay = min(delay * 2, self._max_reconnect_delay)
+            finally:
+                conn, self._conn = self._conn, None
+                if conn is not None and not conn.is_closed():
+                    conn.terminate()
+
+    def _on_notify(self, _conn, _pid, _channel, payload: str) -> None:
+        try:
+            message = json.loads(payload)
+        except ValueError:
+            logger.warning(f"Ignoring malformed routing cache notification: {payload[:100]}")
+            return
+        if message.get('origin') == self._origin:
+            return
+        self._received += 1
+        namespace, key = message.get('namespace'), message.get('key')
+        if namespace in self._subscribers:
+            self._notify_subscribers(namespace, key)
+            return
+        if namespace not in self._cache.NAMESPACES:
+            return
+        if key is None:
+            self._cache.flush([namespace], broadcast=False)
+        else:
+            self._cache.invalidate(namespace, key, broadcast=False)
+
+    def publish(self, namespace: str, key: Optional[str]) -> None:
+        """Tell the other workers to drop ``namespace/key`` (whole namespace if key is None)."""
+        if self._closed:
+            return
+        payload = json.dumps({'origin': self._origin, 'namespace': namespace, 'key': key})
+        try:
+            running = asyncio.get_running_loop()
+        except RuntimeError:
+            running = None
+        if running is not None:
+            running.create_task(self._notify(payload))
+        elif self._loop is not None and self._loop.is_running():
+            # Invalidated from a worker thread; NOTIFY from the loop that owns the pool
+            asyncio.run_coroutine_threadsafe(self._notify(payload), self._loop)
+        else:
+            logger.debug("No running event loop; routing cache invalidation not broadcast")
+
+    async def _notify(self, payload: str) -> None:
+        try:
+            await self._pool.execute("SELECT pg_notify($1, $2)", self._channel, payload)
+            self._published += 1
+        except Exception as e:
+            self._publish_errors += 1
+            self._last_error = str(e)[:200]
+            logger.error(f"Failed to publish routing cache invalidation: {e}")
+
+    def get_stats(self) -> Dict[str, Any]:
+        """Get invalidation statistics."""
+        return {
+            'enabled': True,
+            'channel': self._channel,
+            'listening': self._conn is not None,
+            'published': self._published,
+            'publish_errors': self._publish_errors,
+            'received': self._received,
+            'reconnects': self._reconnects,
+            'last_error': self._last_error,
+        }
+
+    async def close(self) -> None:
+        """Stop listening."""
+        self._closed = True
+        listener, self._listener = self._listener, None
+        if listener is not None and not listener.done():
+            try:
+                same_loop = listener.get_loop() is asyncio.get_running_loop()
+            except RuntimeError:
+                same_loop = False
+            if same_loop:
+                listener.cancel()
+                try:
+                    await listener
+                except asyncio.CancelledError:
+                    pass
+        conn, self._conn = self._conn, None
+        if conn is not None and not conn.is_closed():
+            conn.terminate()
@@ -0,0 +1,282 @@
+# Copyright (c) 2025 Bivex
+#
+# Author: Bivex
+# Available for contact via email: support@b-b.top
+# For up-to-date contact information:
+# https://github.com/bivex
+#
+# Created: 2026-10-16T09:12:04
+# Last Updated: 2026-10-16T09:12:04
+#
+# Licensed under the MIT License.
+# Commercial licensing available upon request.
+"""
+Read-through TTL+LRU cache of routing snapshots for the redirect path.
+
+Every click used to run ``find_by_id`` for its campaign, and for its landing
+page or offer when ``lp_id``/``offer_id`` was present. Each call was a pooled
+query, and every row was re-parsed into an entity. The cache keeps an immutable
+snapshot per id. Repositories are only consulted on a miss, and concurrent
+misses for the same id share one lookup.
+
+Entries expire after ``ttl`` seconds. Writers invalidate them explicitly, and
+an optional invalidator broadcasts invalidations to the other worker processes.
+"""
+
+import asyncio
+import logging
+import threading
+import time
+from collections import OrderedDict
+from typing import Any, Callable, Dict, Iterable, Optional, Tuple
+
+from .routing_snapshots import CampaignRoutingSnapshot, LandingPageRoutingSnapshot, OfferRoutingSnapshot
+from ...domain.value_objects import CampaignId
+from ...utils.awaitables import maybe_await
+
+logger = logging.getLogger(__name__)
+
+_MISSING = object()
+
+
+class _Namespace:
+    """One LRU-ordered map of key -> (value, expires_at) with hit/miss counters.
+
+    ``generation`` is bumped by every invalidation; a load that started before
+    the bump does not store its (possibly stale) result.
+    """
+
+    __slots__ = ('entries', 'max_entries', 'hits', 'misses', 'evictions', 'invalidations', 'generation')
+
+    def __init__(self, max_entries: int):
+        self.entries: 'OrderedDict[str, Tuple[Any, float]]' = OrderedDict()
+        self.max_entries = max_entries
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+        self.invalidations = 0
+        self.generation = 0
+
+    def get_stats(self) -> Dict[str, Any]:
+        lookups = self.hits + self.misses
+        return {
+            'enabled': True,
+            'keys': len(self.entries),
+            'max_entries': self.max_entries,
+            'hits': self.hits,
+            'misses': self.misses,
+            'hit_ratio': round(self.hits / lookups, 4) if lookups else 0.0,
+            'evictions': self.evictions,
+            'invalidations': self.invalidations,
+        }
+
+
+class RoutingCache:
+    """
+    In-process cache of campaign, landing page and offer routing snapshots.
+
+    Thread-safe: lookups run on the event loop, but the campaign management
+    handlers may invalidate from worker threads.
+    """
+
+    CAMPAIGNS = 'campaigns'
+    LANDING_PAGES = 'landing_pages'
+    OFFERS = 'offers'
+    NAMESPACES = (CAMPAIGNS, LANDING_PAGES, OFFERS)
+
+    def __init__(self,
+                 campaign_repository,
+                 landing_page_repository=None,
+                 offer_repository=None,
+                 max_entries: int = 10000,
+                 ttl: float = 30.0,
+                 negative_ttl: float = 5.0):
+        """
+        Args:
+            campaign_repository: Source of campaigns (sync or asyncio-native)
+            landing_page_repository: Source of landing pages
+            offer_repository: Source of offers
+            max_entries: Upper bound on entries per namespace (least recently used are evicted)
+            ttl: Seconds a snapshot is served before it is reloaded
+            negative_ttl: Seconds a "not found" result is served, so unknown ids do not hit the database
+        """
+        self._campaign_repository = campaign_repository
+        self._landing_page_repository = landing_page_repository
+        self._offer_repository = offer_repository
+        self._loaders: Dict[str, Callable[[str], Any]] = {self.CAMPAIGNS: self._load_campaign}
+        if landing_page_repository is not None:
+            self._loaders[self.LANDING_PAGES] = lambda key: self._load(
+                landing_page_repository.find_by_id(key), LandingPageRoutingSnapshot.from_landing_page)
+        if offer_repository is not None:
+            self._loaders[self.OFFERS] = lambda key: self._load(
+                offer_repository.find_by_id(key), OfferRoutingSnapshot.from_offer)
+
+        self._ttl = ttl
+        self._negative_ttl = negative_ttl
+        self._namespaces = {name: _Namespace(max_entries) for name in self.NAMESPACES}
+        self._lock = threading.Lock()
+        self._inflight: Dict[Tuple[str, str], asyncio.Future] = {}
+        self._invalidator = None
+
+    def set_invalidator(self, invalidator) -> None:
+        """Attach a cross-process invalidator (see PostgresCacheInvalidator)."""
+        self._invalidator = invalidator
+
+    @property
+    def invalidator(self):
+        """The cross-process invalidator, or None if invalidation is local to this process."""
+        return self._invalidator
+
+    async def _load_campaign(self, key: str) -> Optional[CampaignRoutingSnapshot]:
+        """Load a campaign with its landing pages and offers and compile its redirect table."""
+        campaign = await maybe_await(self._campaign_repository.find_by_id(CampaignId.from_string(key)))
+        if campaign is None:
+            return None
+        landing_pages, offers = (), ()
+        try:
+            if self._landing_page_repository is not None:
+                landing_pages = await maybe_await(self._landing_page_repository.find_by_campaign_id(key))
+            if self._offer_repository is not None:
+                offers = await maybe_await(self._offer_repository.find_by_campaign_id(key))
+        except Exception as e:
+            # Explicit lp_id/offer_id clicks still resolve through get_landing_page()/get_offer()
+            logger.warning(f"Could not load landing pages/offers for campaign {key}: {e}")
+        return CampaignRoutingSnapshot.from_campaign(campaign, landing_pages, offers)
+
+    @staticmethod
+    async def _load(result, to_snapshot):
+        entity = await maybe_await(result)
+        return to_snapshot(entity) if entity is not None else None
+
+    async def get_campaign(self, campaign_id) -> Optional[CampaignRoutingSnapshot]:
+        """Get a campaign snapshot by CampaignId or id string."""
+        key = campaign_id.value if isinstance(campaign_id, CampaignId) else str(campaign_id)
+        return await self._get(self.CAMPAIGNS, key)
+
+    async def get_landing_page(self, landing_page_id) -> Optional[LandingPageRoutingSnapshot]:
+        """Get a landing page snapshot by id."""
+        return await self._get(self.LANDING_PAGES, str(landing_page_id))
+
+    async def get_offer(self, offer_id) -> Optional[OfferRoutingSnapshot]:
+        """Get an offer snapshot by id."""
+        return await self._get(self.OFFERS, str(offer_id))
+
+    def _lookup(self, namespace: str, key: str) -> Any:
+        """Return the cached value or _MISSING, maintaining LRU order and counters."""
+        ns = self._namespaces[namespace]
+        with self._lock:
+            entry = ns.entries.get(key)
+            if entry is not None:
+                if entry[1] > time.monotonic():
+                    ns.entries.move_to_end(key)
+                    ns.hits += 1
+                    return entry[0]
+                del ns.entries[key]
+            ns.misses += 1
+            return _MISSING
+
+    def _store(self, namespace: str, key: str, value: Any, generation: int) -> None:
+        ns = self._namespaces[namespace]
+        ttl = self._ttl if value is not None else self._negative_ttl
+        with self._lock:
+            if ns.generation != generation:
+                return  # Invalidated while loading; the value may predate the write
+            ns.entries[key] = (value, time.monotonic() + ttl)
+            ns.entries.move_to_end(key)
+            while len(ns.entries) > ns.max_entries:
+                ns.entries.popitem(last=False)
+                ns.evictions += 1
+
+    async def _get(self, namespace: str, key: str) -> Any:
+        if self._invalidator is not None:
+            self._invalidator.ensure_started()
+
+        value = self._lookup(namespace, key)
+        if value is not _MISSING:
+            return value
+
+        loader = self._loaders.get(namespace)
+        if loader is None:
+            return None
+
+        # Single flight: concurrent misses for the same key wait for one load
+        loop = asyncio.get_running_loop()
+        inflight = self._inflight.get((namespace, key))
+        if inflight is not None and inflight.get_loop() is loop:
+            try:
+                return await asyncio.shield(inflight)
+            except asyncio.CancelledError:
+                if not inflight.cancelled():
+                    raise
+                return await self._get(namespace, key)
+
+        generation = self._namespaces[namespace].generation
+        future = loop.create_future()
+        self._inflight[(namespace, key)] = future
+        try:
+            value = await loader(key)
+        except Exception as e:
+            future.set_exception(e)
+            future.exception()  # Mark retrieved; waiters re-raise it
+            raise
+        else:
+            self._store(namespace, key, value, generation)
+            future.set_result(value)
+            return value
+        finally:
+            if not future.done():
+                future.cancel()  # Loader was cancelled; waiters retry on their own
+            if self._inflight.get((namespace, key)) is future:
+                del self._inflight[(namespace, key)]
+
+    def invalidate(self, namespace: str, key, broadcast: bool = True) -> bool:
+        """Drop one entry. Returns True if it was cached."""
+        key = key.value if isinstance(key, CampaignId) else str(key)
+        ns = self._namespaces[namespace]
+        with self._lock:
+            removed = ns.entries.pop(key, None) is not None
+            ns.invalidations += 1
+            ns.generation += 1
+        # Later misses start a fresh load instead of joining one that may read the old row
+        self._inflight.pop((namespace, key), None)
+        if broadcast and self._invalidator is not None:
+            self._invalidator.publish(namespace, key)
+        return removed
+
+    def invalidate_campaign(self, campaign_id, broadcast: bool = True) -> bool:
+        """Drop a campaign snapshot (after campaign, landing page or offer writes)."""
+        return self.invalidate(self.CAMPAIGNS, campaign_id, broadcast=broadcast)
+
+    def flush(self, namespaces: Optional[Iterable[str]] = None, broadcast: bool = True) -> Dict[str, int]:
+        """Drop every entry of the given namespaces (all if None). Returns keys removed per namespace."""
+        names = [n for n in (namespaces or self.NAMESPACES) if n in self._namespaces]
+        flushed = {}
+        with self._lock:
+            for name in names:
+                ns = self._namespaces[name]
+                flushed[name] = len(ns.entries)
+                ns.invalidations += len(ns.entries)
+                ns.generation += 1
+                ns.entries.clear()
+        for inflight_key in [k for k in list(self._inflight) if k[0] in names]:
+            self._inflight.pop(inflight_key, None)
+        if broadcast and self._invalidator is not None:
+            for name in names:
+                self._invalidator.publish(name, None)
+        return flushed
+
+    def get_stats(self) -> Dict[str, Any]:
+        """Get per-namespace cache statistics."""
+        with self._lock:
+            namespaces = {name: ns.get_stats() for name, ns in self._namespaces.items()}
+        return {
+            'ttl_seconds': self._ttl,
+            'negative_ttl_seconds': self._negative_ttl,
+            'namespaces': namespaces,
+            'invalidator': self._invalidator.get_stats() if self._invalidator is not None else {'enabled': False},
+        }
+
+    async def close(self) -> None:
+        """Stop the cross-process invalidator, if any."""
+        if self._invalidator is not None:
+            await self._invalidator.close()
@@ -0,0 +1,98 @@
+# Copyright (c) 2025 Bivex
+#
+# Author: Bivex
+# Available for contact via email: support@b-b.top
+# For up-to-date contact information:
+# https://github.com/bivex
+#
+# Created: 2026-10-16T09:12:04
+# Last Updated: 2026-10-16T09:12:04
+#
+# Licensed under the MIT License.
+# Commercial licensing available upon request.
+"""
+Immutable routing snapshots of campaigns, landing pages and offers.
+
+A snapshot keeps only what the redirect path needs. It is safe to share one
+instance between concurrent requests, so the routing cache can hand out the
+same object on every hit without copying it.
+"""
+
+from dataclasses import dataclass
+from datetime import datetime, timezone
+from typing import Iterable, Optional
+
+from ...domain.services.click.redirect_decision import RedirectDecisionTable, RedirectTarget
+from ...domain.value_objects import CampaignId, CampaignStatus, Url
+
+
+@dataclass(frozen=True)
+class CampaignRoutingSnapshot:
+    """Routing view of a Campaign: status, target URLs, schedule, budget flags and compiled redirects."""
+    id: CampaignId
+    status: CampaignStatus
+    offer_page_url: Optional[Url]
+    safe_page_url: Optional[Url]
+    start_date: Optional[datetime]
+    end_date: Optional[datetime]
+    has_budget: bool
+    budget_exhausted: bool
+    redirects: RedirectDecisionTable
+
+    @classmethod
+    def from_campaign(cls, campaign, landing_pages: Iterable = (),
+                      offers: Iterable = ()) -> 'CampaignRoutingSnapshot':
+        return cls(
+            id=campaign.id,
+            status=campaign.status,
+            offer_page_url=campaign.offer_page_url,
+            safe_page_url=campaign.safe_page_url,
+            start_date=campaign.start_date,
+            end_date=campaign.end_date,
+            has_budget=campaign.total_budget is not None,
+            budget_exhausted=not campaign.is_within_budget(),
+            redirects=RedirectDecisionTable.compile(campaign, landing_pages, offers),
+        )
+
+    @property
+    def is_active(self) -> bool:
+        return self.status == CampaignStatus.ACTIVE
+
+    def is_within_schedule(self, check_time: Optional[datetime] = None) -> bool:
+        """Same rule as Campaign.is_within_schedule, evaluated against the snapshot."""
+        check_time = check_time or datetime.now(timezone.utc)
+        if self.start_date and check_time < self.start_date:
+            return False
+        if self.end_date and check_time > self.end_date:
+            return False
+        return True
+
+
+@dataclass(frozen=True)
+class LandingPageRoutingSnapshot:
+    """Routing view of a LandingPage."""
+    id: str
+    campaign_id: str
+    url: Url
+    is_active: bool
+    target: RedirectTarget
+
+    @classmethod
+    def from_landing_page(cls, landing_page) -> 'LandingPageRoutingSnapshot':
+        return cls(id=landing_page.id, campaign_id=landing_page.campaign_id, url=landing_page.url,
+                   is_active=landing_page.is_active, target=RedirectTarget.compile(landing_page.url))
+
+
+@dataclass(frozen=True)
+class OfferRoutingSnapshot:
+    """Routing view of an Offer."""
+    id: str
+    campaign_id: str
+    url: Url
+    is_active: bool
+    target: RedirectTarget
+
+    @classmethod
+    def from_offer(cls, offer) -> 'OfferRoutingSnapshot':
+        return cls(id=offer.id, campaign_id=offer.campaign_id, url=offer.url,
+                   is_active=offer.is_active, target=RedirectTarget.compile(offer.url))
@@ -14,15 +14,19 @@
 Advanced PostgreSQL connection pool with monitoring and optimization.
 """
 
+import bisect
 import logging
 import threading
 import time
+from collections import deque
 from contextlib import contextmanager
 from datetime import datetime
-from typing import Dict, Any
+from typing import Any, Deque, Dict, Optional, Tuple
 
 import psycopg2
-from psycopg2 import pool
+from psycopg2 import extensions, pool
+
+from .prepared_statements import PreparedStatementCache, PreparedStatementStats, StatementCachingConnection
 
 logger = logging.getLogger(__name__)
 
@@ -54,20 +58,68 @@ def timeout_context(seconds: int):
         yield
 
 
+_WAIT_TIME_BUCKETS = (0.001, 0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0)  # seconds
+
+
+class PoolTimeoutError(pool.PoolError):
+    """No connection became free within the checkout timeout."""
+    pass
+
+
+class WaitTimeHistogram:
+    """Histogram of checkout wait times with cumulative, Prometheus-style buckets."""
+
+    def __init__(self, buckets: Tuple[float, ...] = _WAIT_TIME_BUCKETS):
+        self.buckets = buckets
+        self.reset()
+
+    def reset(self):
+        self.counts = [0] * (len(self.buckets) + 1)
+        self.count = 0
+        self.total = 0.0
+        self.max = 0.0
+
+    def observe(self, seconds: float) -> None:
+        self.counts[bisect.bisect_left(self.buckets, seconds)] += 1
+        self.count += 1
+        self.total += seconds
+        self.max = max(self.max, seconds)
+
+    def snapshot(self) -> Dict[str, Any]:
+        cumulative = {}
+        running = 0
+        for bound, count in zip(self.buckets, self.counts):
+            running += count
+            cumulative[f"le_{bound:g}"] = running
+        cumulative['le_inf'] = self.count
+        return {
+            'buckets': cumulative,
+            'count': self.count,
+            'sum_seconds': round(self.total, 6),
+            'avg_ms': round(self.total / max(self.count, 1) * 1000, 3),
+            'max_ms': round(self.max * 1000, 3),
+        }
+
+
 class ConnectionPoolStats:
     """Statistics for connection pool monitoring."""
 
     def __init__(self):
+        self.wait_times = WaitTimeHistogram()
         self.reset()
 
     def reset(self):
         self.connections_created = 0
         self.connections_returned = 0
         self.connections_failed = 0
+        self.connections_discarded = 0
+        self.checkout_timeouts = 0
+        self.health_checks = 0
         self.query_count = 0
         self.total_query_time = 0.0
         self.slow_queries = 0
         self.errors = 0
+        self.wait_times.reset()
         self.created_at = datetime.now()
 
     def get_summary(self) -> Dict[str, Any]:
@@ -79,6 +131,10 @@ class ConnectionPoolStats:
             'connections_created': self.connections_created,
             'connections_returned': self.connections_returned,
             'connections_failed': self.connections_failed,
+            'connections_discarded': self.connections_discarded,
+            'checkout_timeouts': self.checkout_timeouts,
+            'health_checks': self.health_checks,
+            'checkout_wait': self.wait_times.snapshot(),
             'query_count': self.query_count,
             'avg_query_time_ms': round(avg_query_time * 1000, 2),
             'slow_queries': self.slow_queries,
@@ -88,9 +144,40 @@ class ConnectionPoolStats:
         }
 
 
+class _PooledConnection:
+    """A pooled connection with the timestamps the reaper works from."""
+
+    __slots__ = ('conn', 'created_at', 'last_used', 'last_checked')
+
+    def __init__(self, conn: psycopg2.extensions.connection):
+        self.conn = conn
+        self.created_at = self.last_used = self.last_checked = time.monotonic()
+
+
+class _Waiter:
+    """A thread queued for a connection; woken with a connection or a free slot to open one."""
+
+    __slots__ = ('event', 'pooled')
+
+    def __init__(self):
+        self.event = threading.Event()
+        self.pooled: Optional[_PooledConnection] = None
+
+
 class AdvancedConnectionPool:
     """
-    Advanced PostgreSQL connection pool with monitoring, optimization and health checks.
+    Thread-safe PostgreSQL connection pool with monitoring and background health checks.
+
+    Checkout does no round-trip: idle connections are handed out as they are,
+    and a connection is only validated by the reaper thread once it has been
+    idle for ``health_check_interval`` seconds. The reaper also closes
+    connections idle longer than ``max_idle_seconds`` (down to ``minconn``) or
+    older than ``max_lifetime_seconds``, and reopens connections up to ``minconn``.
+
+    When all ``maxconn`` connections are in use, ``getconn`` queues the caller
+    in FIFO order and a returned connection is handed directly to the longest
+    waiter, so late callers cannot overtake queued ones. A caller still waiting
+    after ``checkout_timeout`` seconds gets ``PoolTimeoutError``.
     """
 
     def __init__(self,
@@ -101,6 +188,12 @@ class AdvancedConnectionPool:
                  database: str = "supreme_octosuccotash_db",
                  user: str = "app_user",
                  password: str = "app_password",
+                 checkout_timeout: float = 30.0,
+                 max_idle_seconds: float = 300.0,
+                 max_lifetime_seconds: float = 1800.0,
+                 health_check_interval: float = 60.0,
+                 reaper_interval: float = 15.0,
+                 statement_cache_size: int = PreparedStatementCache.DEFAULT_CAPACITY,
                  **kwargs):
         """
         Initialize advanced connection pool.
@@ -113,11 +206,15 @@ class AdvancedConnectionPool:
             database: Database name
             user: Database user
             password: Database password
+            checkout_timeout: Seconds getconn() waits for a free connection
+            max_idle_seconds: Idle connections above minconn are closed after this long
+            max_lifetime_seconds: Connections are recycled after this long
+            health_check_interval: Idle connections are re-validated after this long
+            reaper_interval: How often the reaper thread runs
+            statement_cache_size: Prepared statements kept per connection (0 disables the cache)
             **kwargs: Additional psycopg2 connection parameters
         """
-        self._config = {
-            'minconn': minconn,
-            'maxconn': maxconn,
+        self._connect_kwargs = {
             'host': host,
             'port': port,
             'database': database,
@@ -125,99 +222,276 @@ class AdvancedConnectionPool:
             'password': password,
             **kwargs
         }
-
-        # Connection pool (SimpleConnectionPool is better for asyncio with thread executors)
-        # Extract minconn and maxconn as they must be positional arguments
-        pool_minconn = self._config.pop('minconn')
-        pool_maxconn = self._config.pop('maxconn')
-        self._pool = pool.SimpleConnectionPool(pool_minconn, pool_maxconn, **self._config)
-
-        # Store them back in config for reference
-        self._config['minconn'] = pool_minconn
-        self._config['maxconn'] = pool_maxconn
+        self._config = {'minconn': minconn, 'maxconn': maxconn, **self._connect_kwargs}
+        self._minconn = minconn
+        self._maxconn = maxconn
+        self._checkout_timeout = checkout_timeout
+        self._max_idle_seconds = max_idle_seconds
+        self._max_lifetime_seconds = max_lifetime_seconds
+        self._health_check_interval = health_check_interval
+        self._statement_cache_size = statement_cache_size
+        self._statement_stats = PreparedStatementStats()
+
+        # Pool state, guarded by _pool_lock. Idle connections are reused LIFO so
+        # the least recently used ones collect at the left end for the reaper.
+        self._pool_lock = threading.Lock()
+        self._idle: Deque[_PooledConnection] = deque()
+        self._in_use: Dict[int, _PooledConnection] = {}
+        self._waiters: Deque[_Waiter] = deque()
+        self._opening = 0  # Slots reserved for connections being opened or health-checked
+        self._closed = False
 
         # Statistics and monitoring
         self._stats = ConnectionPoolStats()
         self._lock = threading.RLock()  # RLock вместо Lock для реентерабельности
-        self._health_check_interval = 60  # seconds
-        self._last_health_check = 0
 
         # Кеширование статистики для защиты от блокировок
         self._stats_cache = None
         self._stats_cache_time = 0
         self._stats_cache_ttl = 5  # Кеш на 5 секунд
 
+        for _ in range(minconn):
+            self._idle.append(_PooledConnection(self._create_new_connection()))
+
+        self._reaper_stop = threading.Event()
+        self._reaper = threading.Thread(target=self._run_reaper, args=(reaper_interval,),
+                                        name="DB-Pool-Reaper", daemon=True)
+        self._reaper.start()
+
         import traceback
         logger.warning(f"🔴 NEW AdvancedConnectionPool created! minconn={minconn}, maxconn={maxconn}")
         logger.warning(f"🔴 Call stack:\n{''.join(traceback.format_stack()[-5:])}")
 
-    def getconn(self) -> psycopg2.extensions.connection:
+    def getconn(self, timeout: Optional[float] = None) -> psycopg2.extensions.connection:
         """
         Get a connection from the pool with monitoring.
 
+        Args:
+            timeout: Seconds to wait for a free connection (default: checkout_timeout)
+
         Returns:
             Database connection
 
         Raises:
-            Exception: If connection cannot be obtained
+            PoolTimeoutError: If no connection became free within the timeout
+            Exception: If a new connection cannot be opened
         """
-        start_time = time.time()
+        start_time = time.monotonic()
 
         try:
-            conn = self._pool.getconn()
-            elapsed = time.time() - start_time
-
-            with self._lock:
-                self._stats.connections_created += 1
-
-            # Test connection health
-            if not self._is_connection_healthy(conn):
-                logger.warning("Unhealthy connection detected, closing and getting another from pool")
-                try:
-                    conn.close()
-                except:
-                    pass
-                # Try to get another connection from the pool
-                try:
-                    conn = self._pool.getconn()
-                except Exception as pool_error:
-                    logger.error(f"Pool exhausted while trying to replace unhealthy connection: {pool_error}")
-                    raise pool_error
-
-            logger.debug(".3f")
-            return conn
-
+            pooled = self._checkout(self._checkout_timeout if timeout is None else timeout)
         except Exception as e:
-            elapsed = time.time() - start_time
+            elapsed = time.monotonic() - start_time
             with self._lock:
                 self._stats.connections_failed += 1
+                if isinstance(e, PoolTimeoutError):
+                    self._stats.checkout_timeouts += 1
+            logger.error(f"Connection checkout failed after {elapsed:.3f}s: {e}")
+            raise
 
-            logger.error(".3f")
-            raise e
+        elapsed = time.monotonic() - start_time
+        with self._lock:
+            self._stats.connections_created += 1
+            self._stats.wait_times.observe(elapsed)
+
+        logger.debug(f"Connection checked out in {elapsed:.3f}s")
+        return pooled.conn
 
-    def putconn(self, conn: psycopg2.extensions.connection) -> None:
+    def putconn(self, conn: psycopg2.extensions.connection, close: bool = False) -> None:
         """
         Return a connection to the pool.
 
+        An open transaction is rolled back first; a closed or broken
+        connection is discarded and its slot offered to the next waiter.
+
         Args:
             conn: Database connection to return
+            close: Close the connection instead of keeping it
         """
-        try:
-            # Quick health check before returning
-            if self._is_connection_healthy(conn, quick=True):
-                self._pool.putconn(conn)
-                with self._lock:
-                    self._stats.connections_returned += 1
-                logger.debug("Connection returned to pool")
+        with self._pool_lock:
+            pooled = self._in_use.pop(id(conn), None)
+        if pooled is None:
+            logger.error("Connection returned to a pool it does not belong to")
+            return
+
+        keep = (not close and not self._closed and self._reset_for_reuse(conn)
+                and time.monotonic() - pooled.created_at < self._max_lifetime_seconds)
+        if not keep:
+            self._close_quietly(conn)
+            with self._pool_lock:
+                self._grant_free_slot()
+            with self._lock:
+                self._stats.connections_discarded += 1
+            logger.debug("Connection discarded instead of being returned to pool")
+            return
+
+        pooled.last_used = time.monotonic()
+        with self._pool_lock:
+            self._release(pooled)
+        with self._lock:
+            self._stats.connections_returned += 1
+        logger.debug("Connection returned to pool")
+
+    # ---------- pool internals ----------
+
+    def _checkout(self, timeout: float) -> _PooledConnection:
+        waiter = None
+        with self._pool_lock:
+            if self._closed:
+                raise pool.PoolError("connection pool is closed")
+            if not self._waiters and self._idle:
+                return self._lease(self._idle.pop())
+            if not self._waiters and self._total() < self._maxconn:
+                self._opening += 1
             else:
-                logger.warning("Unhealthy connection discarded")
-                try:
-                    conn.close()
-                except Exception as e:
-                    logger.error(f"Error closing unhealthy connection: {e}")
+                waiter = _Waiter()
+                self._waiters.append(waiter)
+
+        if waiter is not None and not waiter.event.wait(timeout):
+            with self._pool_lock:
+                # Re-check under the lock: a connection may have been granted just now
+                if not waiter.event.is_set():
+                    self._waiters.remove(waiter)
+                    raise PoolTimeoutError(f"no connection available within {timeout:.1f}s "
+                                           f"({self._maxconn} in use)")
+        if waiter is not None and waiter.pooled is not None:
+            return waiter.pooled
+        if self._closed:
+            with self._pool_lock:
+                self._opening -= 1
+            raise pool.PoolError("connection pool is closed")
+
+        # A slot was reserved for us (directly or by a waker): open a new connection
+        try:
+            pooled = _PooledConnection(self._create_new_connection())
+        except Exception:
+            with self._pool_lock:
+                self._opening -= 1
+                self._grant_free_slot()
+            raise
+        with self._pool_lock:
+            self._opening -= 1
+            return self._lease(pooled)
+
+    def _total(self) -> int:
+        return len(self._idle) + len(self._in_use) + self._opening
+
+    def _lease(self, pooled: _PooledConnection) -> _PooledConnection:
+        pooled.last_used = time.monotonic()
+        self._in_use[id(pooled.conn)] = pooled
+        return pooled
+
+    def _release(self, pooled: _PooledConnection) -> None:
+        """Hand an idle connection to the longest waiter, or park it. Caller holds _pool_lock."""
+        if self._waiters:
+            waiter = self._waiters.popleft()
+            waiter.pooled = self._lease(pooled)
+            waiter.event.set()
+        else:
+            self._idle.append(pooled)
 
+    def _grant_free_slot(self) -> None:
+        """Let the longest waiter open a connection in a freed slot. Caller holds _pool_lock."""
+        if self._waiters and not self._closed and self._total() < self._maxconn:
+            self._opening += 1
+            self._waiters.popleft().event.set()
+
+    def _reset_for_reuse(self, conn: psycopg2.extensions.connection) -> bool:
+        """Bring a returned connection back to idle state without a round-trip when possible."""
+        if conn.closed:
+            return False
+        status = conn.get_transaction_status()
+        if status == extensions.TRANSACTION_STATUS_IDLE:
+            return True
+        if status in (extensions.TRANSACTION_STATUS_INTRANS, extensions.TRANSACTION_STATUS_INERROR):
+            try:
+                conn.rollback()
+                return True
+            except Exception as e:
+                logger.warning(f"Rollback of returned connection failed: {e}")
+        return False
+
+    @staticmethod
+    def _close_quietly(conn: psycopg2.extensions.connection) -> None:
+        try:
+            conn.close()
         except Exception as e:
-            logger.error(f"Error returning connection to pool: {e}")
+            logger.error(f"Error closing connection: {e}")
+
+    def _run_reaper(self, interval: float) -> None:
+        while not self._reaper_stop.wait(interval):
+            try:
+                self.reap()
+            except Exception:
+                logger.exception("Connection pool reaper failed")
+
+    def reap(self) -> None:
+        """
+        Close expired idle connections, health-check long-idle ones and refill to minconn.
+
+        Runs periodically on the reaper thread; connections being checked are
+        taken out of the idle list, so checkouts never wait for a health check.
+        """
+        now = time.monotonic()
+        expired, to_check = [], []
+        with self._pool_lock:
+            if self._closed:
+                return
+            keep: Deque[_PooledConnection] = deque()
+            total = self._total()
+            for pooled in self._idle:
+                if now - pooled.created_at >= self._max_lifetime_seconds:
+                    expired.append(pooled)
+                elif now - pooled.last_used >= self._max_idle_seconds and total - len(expired) > self._minconn:
+                    expired.append(pooled)
+                elif now - max(pooled.last_used, pooled.last_checked) >= self._health_check_interval:
+                    to_check.append(pooled)
+                else:
+                    keep.append(pooled)
+            self._idle = keep
+            self._opening += len(to_check)
+
+        for pooled in expired:
+            self._close_quietly(pooled.conn)
+        healthy = []
+        for pooled in to_check:
+            if self._is_connection_healthy(pooled.conn):
+                pooled.last_checked = time.monotonic()
+                healthy.append(pooled)
+            else:
+                self._close_quietly(pooled.conn)
+
+        with self._pool_lock:
+            self._opening -= len(to_check)
+            # Healthy connections go to waiters first, the rest back to the least recently used end
+            handed = min(len(healthy), len(self._waiters))
+            for pooled in healthy[:handed]:
+                self._release(pooled)
+            self._idle.extendleft(reversed(healthy[handed:]))
+            for _ in range(len(expired) + len(to_check) - len(healthy)):
+                self._grant_free_slot()
+            refill = 0 if self._closed or self._waiters else max(0, self._minconn - self._total())
+            self._opening += refill
+
+        with self._lock:
+            self._stats.health_checks += len(to_check)
+            self._stats.connections_discarded += len(expired) + len(to_check) - len(healthy)
+        if expired or len(healthy) < len(to_check):
+            logger.info(f"Pool reaper closed {len(expired)} expired and "
+                        f"{len(to_check) - len(healthy)} unhealthy connections")
+
+        for _ in range(refill):
+            try:
+                pooled = _PooledConnection(self._create_new_connection())
+            except Exception as e:
+                logger.warning(f"Pool reaper could not reopen a connection: {e}")
+                with self._pool_lock:
+                    self._opening -= 1
+                    self._grant_free_slot()
+                continue
+            with self._pool_lock:
+                self._opening -= 1
+                self._release(pooled)
 
     def execute_with_monitoring(self, conn: psycopg2.extensions.connection,
                                 query: str, params: tuple = None) -> Any:
@@ -286,20 +560,20 @@ class AdvancedConnectionPool:
 
         try:
             # Быстрая операция без внешних вызовов
-            # psycopg2 ThreadedConnectionPool stores connections as:
-            # _pool: list of available connections
-            # _used: dict of thread_id -> connection for used connections
-            # _rused: dict of thread_id -> connection for reserved connections
-            pool_stats = {
-                'minconn': self._pool.minconn,
-                'maxconn': self._pool.maxconn,
-                'used': len(self._pool._used),
-                'available': len(self._pool._pool),
-            }
+            with self._pool_lock:
+                pool_stats = {
+                    'minconn': self._minconn,
+                    'maxconn': self._maxconn,
+                    'used': len(self._in_use),
+                    'available': len(self._idle),
+                    'waiting': len(self._waiters),
+                    'opening': self._opening,
+                }
 
             stats = {
                 **pool_stats,
                 **self._stats.get_summary(),
+                'prepared_statements': self._statement_stats.get_summary(),
                 'pool_efficiency': self._calculate_pool_efficiency(pool_stats),
                 'health_status': self._get_health_status(),
                 'cached': False,
@@ -325,6 +599,8 @@ class AdvancedConnectionPool:
             'maxconn': self._config.get('maxconn', 0),
             'used': 0,
             'available': 0,
+            'waiting': 0,
+            'opening': 0,
             'pool_efficiency': 0.0,
             'health_status': 'unknown',
             'cached': True,
@@ -333,6 +609,11 @@ class AdvancedConnectionPool:
             'connections_created': 0,
             'connections_returned': 0,
             'connections_failed': 0,
+            'connections_discarded': 0,
+            'checkout_timeouts': 0,
+            'health_checks': 0,
+            'checkout_wait': WaitTimeHistogram().snapshot(),
+            'prepared_statements': PreparedStatementStats().get_summary(),
             'query_count': 0,
             'avg_query_time_ms': 0.0,
             'slow_queries': 0,
@@ -381,14 +662,12 @@ class AdvancedConnectionPool:
         else:
             return "HEALTHY"
 
-    def _is_connection_healthy(self, conn: psycopg2.extensions.connection,
-                               quick: bool = False) -> bool:
+    def _is_connection_healthy(self, conn: psycopg2.extensions.connection) -> bool:
         """
-        Check if connection is healthy.
+        Check if connection is healthy (one ``SELECT 1`` round-trip; reaper only).
 
         Args:
             conn: Connection to check
-            quick: If True, do only basic checks
 
         Returns:
             True if connection is healthy
@@ -396,38 +675,48 @@ class AdvancedConnectionPool:
         if conn.closed:
             return False
 
-        if quick:
-            # Just check if we can get cursor
-            try:
-                cursor = conn.cursor()
-                cursor.close()
-                return True
-            except:
-                return False
-
-        # Full health check
         try:
             cursor = conn.cursor()
             cursor.execute("SELECT 1")
             cursor.fetchone()
             cursor.close()
+            # Leave the connection idle, not inside the transaction SELECT opened
+            conn.rollback()
             return True
-        except:
+        except Exception:
             return False
 
     def _create_new_connection(self) -> psycopg2.extensions.connection:
-        """Create a new database connection."""
-        return psycopg2.connect(**self._config)
+        """Create a new database connection with its own prepared statement cache."""
+        if self._statement_cache_size <= 0:
+            return psycopg2.connect(**self._connect_kwargs)
+        conn = psycopg2.connect(connection_factory=StatementCachingConnection, **self._connect_kwargs)
+        conn.statements = PreparedStatementCache(self._statement_cache_size, self._statement_stats)
+        return conn
 
     def closeall(self) -> None:
-        """Close all connections in the pool."""
+        """Close all connections in the pool and fail pending checkouts."""
         logger.info("Closing all connections in advanced pool")
-        self._pool.closeall()
+        self._reaper_stop.set()
+        with self._pool_lock:
+            self._closed = True
+            connections = [pooled.conn for pooled in self._idle] + [pooled.conn for pooled in self._in_use.values()]
+            self._idle.clear()
+            self._in_use.clear()
+            waiters = list(self._waiters)
+            self._waiters.clear()
+            # Each waiter is woken with a reserved slot; _checkout sees the closed pool and gives it back
+            self._opening += len(waiters)
+        for waiter in waiters:
+            waiter.event.set()
+        for conn in connections:
+            self._close_quietly(conn)
 
     def reset_stats(self) -> None:
         """Reset statistics counters."""
         with self._lock:
             self._stats.reset()
+            self._statement_stats.reset()
         logger.info("Pool statistics reset")
 
     def __enter__(self):
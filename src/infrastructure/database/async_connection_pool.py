@@ -0,0 +1,243 @@
+# Copyright (c) 2025 Bivex
+#
+# Author: Bivex
+# Available for contact via email: support@b-b.top
+# For up-to-date contact information:
+# https://github.com/bivex
+#
+# Created: 2026-10-16T09:12:04
+# Last Updated: 2026-10-16T09:12:04
+#
+# Licensed under the MIT License.
+# Commercial licensing available upon request.
+"""
+Native asyncio PostgreSQL connection pool (asyncpg).
+
+Unlike AdvancedConnectionPool, which wraps blocking psycopg2 connections and
+forces every call through ``run_in_executor``, this pool speaks the PostgreSQL
+protocol directly on the event loop: one query is one awaited round-trip.
+"""
+
+import asyncio
+import json
+import logging
+import time
+from contextlib import asynccontextmanager
+from typing import Any, Dict, List, Optional
+
+logger = logging.getLogger(__name__)
+
+try:
+    import asyncpg
+
+    ASYNCPG_AVAILABLE = True
+except ImportError:
+    asyncpg = None
+    ASYNCPG_AVAILABLE = False
+
+
+class AsyncPoolStats:
+    """Statistics for async connection pool monitoring."""
+
+    def __init__(self):
+        self.reset()
+
+    def reset(self):
+        self.acquisitions = 0
+        self.query_count = 0
+        self.total_query_time = 0.0
+        self.slow_queries = 0
+        self.errors = 0
+        self.created_at = time.time()
+
+    def get_summary(self) -> Dict[str, Any]:
+        """Get summary statistics."""
+        uptime = time.time() - self.created_at
+        return {
+            'acquisitions': self.acquisitions,
+            'query_count': self.query_count,
+            'avg_query_time_ms': round(self.total_query_time / max(self.query_count, 1) * 1000, 2),
+            'slow_queries': self.slow_queries,
+            'errors': self.errors,
+            'qps': round(self.query_count / max(uptime, 1), 2),
+            'uptime_seconds': round(uptime, 1)
+        }
+
+
+class AsyncConnectionPool:
+    """
+    asyncio-native PostgreSQL pool with JSONB codecs and query monitoring.
+
+    asyncpg connections belong to the event loop that created them. The app is
+    built under ``asyncio.run()`` and then served from socketify's own loop, so
+    the pool remembers its loop and ``open()`` transparently re-creates it when
+    first used from a different one.
+    """
+
+    SLOW_QUERY_THRESHOLD = 0.1  # seconds
+
+    def __init__(self,
+                 minconn: int = 5,
+                 maxconn: int = 50,
+                 host: str = "localhost",
+                 port: int = 5432,
+                 database: str = "supreme_octosuccotash_db",
+                 user: str = "app_user",
+                 password: str = "app_password",
+                 command_timeout: float = 30.0,
+                 max_inactive_connection_lifetime: float = 300.0,
+                 **kwargs):
+        """
+        Initialize async connection pool configuration.
+
+        Args:
+            minconn: Minimum number of connections
+            maxconn: Maximum number of connections
+            host: Database host
+            port: Database port
+            database: Database name
+            user: Database user
+            password: Database password
+            command_timeout: Default timeout for a single statement in seconds
+            max_inactive_connection_lifetime: Idle connections older than this are closed
+            **kwargs: Additional asyncpg.create_pool parameters
+        """
+        if not ASYNCPG_AVAILABLE:
+            raise RuntimeError("asyncpg is not installed. Install with: pip install asyncpg")
+
+        self._config = {
+            'min_size': minconn,
+            'max_size': maxconn,
+            'host': host,
+            'port': port,
+            'database': database,
+            'user': user,
+            'password': password,
+            'command_timeout': command_timeout,
+            'max_inactive_connection_lifetime': max_inactive_connection_lifetime,
+            **kwargs
+        }
+        self._pool = None
+        self._loop: Optional[asyncio.AbstractEventLoop] = None
+        self._open_lock: Optional[asyncio.Lock] = None
+        self._open_lock_loop: Optional[asyncio.AbstractEventLoop] = None
+        self._stats = AsyncPoolStats()
+
+    @property
+    def is_open(self) -> bool:
+        """Whether the underlying asyncpg pool has been created."""
+        return self._pool is not None
+
+    def _is_current(self) -> bool:
+        """Whether the pool exists and belongs to the running event loop."""
+        return self._pool is not None and self._loop is asyncio.get_running_loop()
+
+    async def open(self) -> 'AsyncConnectionPool':
+        """Create the underlying asyncpg pool for the running loop (idempotent)."""
+        if self._is_current():
+            return self
+        loop = asyncio.get_running_loop()
+        if self._open_lock is None or self._open_lock_loop is not loop:
+            self._open_lock = asyncio.Lock()
+            self._open_lock_loop = loop
+        async with self._open_lock:
+            if self._pool is not None and self._loop is not loop:
+                # Connections of a pool created on another loop cannot be awaited here
+                logger.info("Async PostgreSQL pool belongs to another event loop, re-creating it")
+                self._pool.terminate()
+                self._pool = None
+            if self._pool is None:
+                start = time.time()
+                self._pool = await asyncpg.create_pool(init=self._init_connection, **self._config)
+                self._loop = loop
+                logger.info(f"Async PostgreSQL pool opened in {time.time() - start:.3f}s "
+                            f"(min={self._config['min_size']}, max={self._config['max_size']})")
+        return self
+
+    @staticmethod
+    async def _init_connection(conn) -> None:
+        """Configure codecs so JSON/JSONB columns round-trip as Python objects."""
+        for type_name in ('json', 'jsonb'):
+            await conn.set_type_codec(type_name, encoder=json.dumps, decoder=json.loads, schema='pg_catalog')
+
+    @asynccontextmanager
+    async def acquire(self):
+        """Acquire a connection for the duration of the ``async with`` block."""
+        if not self._is_current():
+            await self.open()
+        self._stats.acquisitions += 1
+        async with self._pool.acquire() as conn:
+            yield conn
+
+    @asynccontextmanager
+    async def transaction(self):
+        """Acquire a connection and run the block inside a single transaction."""
+        async with self.acquire() as conn:
+            async with conn.transaction():
+                yield conn
+
+    async def _timed(self, method: str, query: str, *args, conn=None):
+        """Run one asyncpg call, on ``conn`` if given, recording timing statistics."""
+        start = time.time()
+        try:
+            if conn is not None:
+                return await getattr(conn, method)(query, *args)
+            if not self._is_current():
+                await self.open()
+            self._stats.acquisitions += 1
+            return await getattr(self._pool, method)(query, *args)
+        except Exception:
+            self._stats.errors += 1
+            raise
+        finally:
+            elapsed = time.time() - start
+            self._stats.query_count += 1
+            self._stats.total_query_time += elapsed
+            if elapsed > self.SLOW_QUERY_THRESHOLD:
+                self._stats.slow_queries += 1
+                logger.warning(f"Slow async query ({elapsed * 1000:.1f}ms): {query[:100]}")
+
+    async def execute(self, query: str, *args, conn=None) -> str:
+        """Execute a statement and return the command status tag."""
+        return await self._timed('execute', query, *args, conn=conn)
+
+    async def fetch(self, query: str, *args, conn=None) -> List[Any]:
+        """Execute a query and return all rows."""
+        return await self._timed('fetch', query, *args, conn=conn)
+
+    async def fetchrow(self, query: str, *args, conn=None) -> Optional[Any]:
+        """Execute a query and return the first row or None."""
+        return await self._timed('fetchrow', query, *args, conn=conn)
+
+    async def fetchval(self, query: str, *args, conn=None) -> Any:
+        """Execute a query and return the first column of the first row."""
+        return await self._timed('fetchval', query, *args, conn=conn)
+
+    async def connect(self):
+        """Open a dedicated connection outside the pool (e.g. for LISTEN); the caller closes it."""
+        pool_only = ('min_size', 'max_size', 'max_queries', 'max_inactive_connection_lifetime',
+                     'setup', 'init', 'reset')
+        conn = await asyncpg.connect(**{k: v for k, v in self._config.items() if k not in pool_only})
+        await self._init_connection(conn)
+        return conn
+
+    def get_stats(self) -> Dict[str, Any]:
+        """Get pool and query statistics."""
+        pool_stats = {
+            'minconn': self._config['min_size'],
+            'maxconn': self._config['max_size'],
+            'size': self._pool.get_size() if self._pool else 0,
+            'idle': self._pool.get_idle_size() if self._pool else 0,
+        }
+        return {**pool_stats, **self._stats.get_summary()}
+
+    async def close(self) -> None:
+        """Gracefully close all connections."""
+        if self._pool is not None:
+            logger.info("Closing async PostgreSQL pool")
+            if self._loop is asyncio.get_running_loop():
+                await self._pool.close()
+            else:
+                self._pool.terminate()
+            self._pool = None
+            self._loop = None
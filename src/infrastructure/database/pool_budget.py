@@ -0,0 +1,62 @@
+# Copyright (c) 2025 Bivex
+#
+# Author: Bivex
+# Available for contact via email: support@b-b.top
+# For up-to-date contact information:
+# https://github.com/bivex
+#
+# Created: 2026-10-16T09:12:04
+# Last Updated: 2026-10-16T09:12:04
+#
+# Licensed under the MIT License.
+# Commercial licensing available upon request.
+
+"""Per-process connection pool sizes derived from a server-wide budget.
+
+Every worker opens its own psycopg2 and asyncpg pools, so with N workers the
+database sees N times whatever one process asks for. The supervisor divides
+``DB_CONNECTION_BUDGET`` by the worker count before forking; each worker then
+sizes both pools from its share.
+"""
+
+import logging
+from dataclasses import dataclass
+
+logger = logging.getLogger(__name__)
+
+_DEFAULT_MINCONN = 5
+
+
+@dataclass(frozen=True)
+class PoolSizes:
+    """Bounds of the two pools one process opens."""
+    sync_min: int = _DEFAULT_MINCONN
+    sync_max: int = 100
+    async_min: int = _DEFAULT_MINCONN
+    async_max: int = 50
+
+
+def split_connection_budget(budget: int, workers: int) -> PoolSizes:
+    """
+    Give each of ``workers`` processes an equal share of ``budget`` connections.
+
+    A share is split two thirds to the psycopg2 pool and one third to asyncpg,
+    the same ratio as the single-process defaults (a budget of 150 with one
+    worker reproduces them). Every pool keeps at least one connection, so a
+    budget smaller than ``2 * workers`` is exceeded rather than starved.
+    """
+    workers = max(workers, 1)
+    share = budget // workers
+    if share < 2:
+        logger.warning(f"Connection budget {budget} is too small for {workers} workers; "
+                       f"each worker still opens 2 connections ({2 * workers} in total)")
+        share = 2
+
+    sync_max = max(1, share * 2 // 3)
+    async_max = max(1, share - sync_max)
+    return PoolSizes(
+        sync_min=min(_DEFAULT_MINCONN, sync_max),
+        sync_max=sync_max,
+        async_min=min(_DEFAULT_MINCONN, async_max),
+        async_max=async_max,
+    )
@@ -0,0 +1,160 @@
+# Copyright (c) 2025 Bivex
+#
+# Author: Bivex
+# Available for contact via email: support@b-b.top
+# For up-to-date contact information:
+# https://github.com/bivex
+#
+# Created: 2026-10-16T09:12:04
+# Last Updated: 2026-10-16T09:12:04
+#
+# Licensed under the MIT License.
+# Commercial licensing available upon request.
+"""
+Server-side prepared statements cached per pooled psycopg2 connection.
+
+psycopg2 interpolates parameters on the client and sends every query as
+plain text, so PostgreSQL parses and plans hot statements on each call.
+AdvancedConnectionPool opens its connections as ``StatementCachingConnection``.
+Each of these carries a ``PreparedStatementCache`` keyed by SQL text: the
+first ``execute_prepared`` of a query sends ``PREPARE``, later ones send
+``EXECUTE name (...)`` with the parameters still quoted by psycopg2. Once a
+connection holds ``capacity`` statements, the least recently used one is
+deallocated. Prepared statements belong to the session, so a cache lives and
+dies with its connection.
+"""
+
+import logging
+import re
+import threading
+from collections import OrderedDict
+from typing import Any, Dict, Optional, Sequence, Tuple
+
+from psycopg2 import extensions
+
+logger = logging.getLogger(__name__)
+
+_PLACEHOLDER = re.compile(r"%([%s])")
+
+# SQLSTATEs after which a cached statement can no longer be executed as prepared
+_INVALID_STATEMENT_NAME = '26000'  # Dropped server-side (DEALLOCATE ALL, DISCARD ALL)
+_FEATURE_NOT_SUPPORTED = '0A000'  # "cached plan must not change result type" after a schema change
+
+
+def to_server_placeholders(sql: str) -> Tuple[str, int]:
+    """Rewrite psycopg2 ``%s`` placeholders as ``$1..$n``; ``%%`` becomes ``%``."""
+    count = 0
+
+    def replace(match):
+        nonlocal count
+        if match.group(1) == '%':
+            return '%'
+        count += 1
+        return f"${count}"
+
+    return _PLACEHOLDER.sub(replace, sql), count
+
+
+class PreparedStatementStats:
+    """Hit/miss counters shared by all statement caches of one pool."""
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self.reset()
+
+    def reset(self):
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+        self.invalidations = 0
+
+    def record(self, counter: str) -> None:
+        with self._lock:
+            setattr(self, counter, getattr(self, counter) + 1)
+
+    def get_summary(self) -> Dict[str, Any]:
+        lookups = self.hits + self.misses
+        return {
+            'hits': self.hits,
+            'misses': self.misses,
+            'evictions': self.evictions,
+            'invalidations': self.invalidations,
+            'hit_rate': round(self.hits / lookups * 100, 2) if lookups else 0.0,
+        }
+
+
+class PreparedStatementCache:
+    """LRU of statements prepared on one connection, keyed by SQL text."""
+
+    DEFAULT_CAPACITY = 64
+
+    def __init__(self, capacity: int = DEFAULT_CAPACITY, stats: Optional[PreparedStatementStats] = None):
+        self.capacity = capacity
+        self.stats = stats or PreparedStatementStats()
+        self._statements: "OrderedDict[str, Tuple[str, int]]" = OrderedDict()  # sql -> (name, param count)
+        self._counter = 0
+
+    def __len__(self) -> int:
+        return len(self._statements)
+
+    def execute(self, cursor, sql: str, params: Optional[Sequence[Any]] = None) -> None:
+        """Execute ``sql`` on ``cursor`` as a prepared statement, preparing it on first use."""
+        entry = self._statements.get(sql)
+        if entry is None:
+            entry = self._prepare(cursor, sql)
+            self.stats.record('misses')
+        else:
+            self._statements.move_to_end(sql)
+            self.stats.record('hits')
+
+        name, count = entry
+        try:
+            if count:
+                cursor.execute(f"EXECUTE {name} ({', '.join(['%s'] * count)})", params)
+            else:
+                cursor.execute(f"EXECUTE {name}")
+        except Exception as e:
+            if getattr(e, 'pgcode', None) in (_INVALID_STATEMENT_NAME, _FEATURE_NOT_SUPPORTED):
+                # The transaction is aborted either way; forget the statement so the next call re-prepares it
+                self._statements.pop(sql, None)
+                self.stats.record('invalidations')
+            raise
+
+    def _prepare(self, cursor, sql: str) -> Tuple[str, int]:
+        if len(self._statements) >= self.capacity:
+            old_sql, (old_name, _) = self._statements.popitem(last=False)
+            cursor.execute(f"DEALLOCATE {old_name}")
+            self.stats.record('evictions')
+            logger.debug(f"Deallocated prepared statement {old_name}: {old_sql[:80]}")
+
+        server_sql, count = to_server_placeholders(sql)
+        self._counter += 1
+        name = f"ps_{self._counter}"
+        cursor.execute(f"PREPARE {name} AS {server_sql}")
+        self._statements[sql] = (name, count)
+        return name, count
+
+    def clear(self) -> None:
+        """Forget every statement (after the session was reset server-side)."""
+        self._statements.clear()
+
+
+class StatementCachingConnection(extensions.connection):
+    """psycopg2 connection carrying its own ``PreparedStatementCache``."""
+
+    statements: Optional[PreparedStatementCache] = None
+
+
+def execute_prepared(cursor, sql: str, params: Optional[Sequence[Any]] = None):
+    """
+    Execute ``sql`` through the statement cache of the cursor's connection.
+
+    Falls back to a plain ``cursor.execute`` for connections without a cache
+    and for queries with named (``%(name)s``) placeholders. Returns the cursor.
+    """
+    cache = getattr(cursor.connection, 'statements', None)
+    if cache is None or '%(' in sql:
+        cursor.execute(sql, params)
+    else:
+        cache.execute(cursor, sql, params)
+    return cursor
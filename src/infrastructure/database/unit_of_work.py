@@ -0,0 +1,275 @@
+# Copyright (c) 2025 Bivex
+#
+# Author: Bivex
+# Available for contact via email: support@b-b.top
+# For up-to-date contact information:
+# https://github.com/bivex
+#
+# Created: 2026-10-16T09:12:04
+# Last Updated: 2026-10-16T09:12:04
+#
+# Licensed under the MIT License.
+# Commercial licensing available upon request.
+"""
+Units of work: one checked-out connection and one transaction per request.
+
+Without one, every repository call checks out its own connection, runs its
+statement and commits. A unit of work checks out a single connection on first
+use, opens a transaction on it and keeps both for the request:
+
+    with UnitOfWork(pool) as uow:
+        click = uow.run(click_repository.find_by_id, click_id)    # runs now
+        uow.add(conversion_repository.save, conversion)            # collected
+    # leaving the block sends the collected writes and commits, then returns the connection
+
+``run`` and ``add`` call repository methods with ``conn=<connection>``;
+repositories that accept ``conn`` neither commit nor release it. Statements
+run through ``run`` (including consuming ones such as DELETE ... RETURNING)
+commit together with the collected writes, and roll back with them when the
+block or the commit fails.
+
+``UnitOfWork`` (psycopg2) renders the collected writes into a single
+multi-statement query, so the writes cost one round trip before the COMMIT.
+It also works with ``async with`` for the executor-based psycopg2 click path:
+coroutine operations passed to ``run`` are awaited on the unit's connection,
+and checkout, commit and release run in the default executor.
+
+``AsyncUnitOfWork`` (asyncpg) cannot inline parameters client-side, so its
+writes run one by one inside the transaction.
+
+``DirectUnitOfWork`` has the same interface for repositories that manage their
+own connections (SQLite fallback); each of their calls commits on its own.
+"""
+
+import asyncio
+import inspect
+import logging
+from contextlib import AsyncExitStack
+from typing import Any, Callable, List, Tuple
+
+from ...utils.awaitables import maybe_await
+
+logger = logging.getLogger(__name__)
+
+_Write = Tuple[Callable[..., Any], tuple, dict]
+
+
+class _StatementBatch:
+    """Passed as ``conn`` to collected writes: records their SQL instead of sending it."""
+
+    # No prepared statement cache: execute_prepared falls back to plain execute()
+    statements = None
+
+    def __init__(self, connection):
+        self._cursor = connection.cursor()
+        self.sql: List[bytes] = []
+
+    @property
+    def connection(self):
+        return self
+
+    def cursor(self):
+        return self
+
+    def execute(self, sql, params=None) -> None:
+        self.sql.append(self._cursor.mogrify(sql, params))
+
+    def close(self) -> None:
+        pass
+
+
+class UnitOfWork:
+    """One psycopg2 connection and transaction per request; collected writes go out as one batch."""
+
+    def __init__(self, pool):
+        self._pool = pool
+        self._connection = None
+        self._writes: List[_Write] = []
+
+    def __enter__(self) -> "UnitOfWork":
+        return self
+
+    def __exit__(self, exc_type, exc, tb) -> bool:
+        try:
+            if exc_type is None:
+                self.commit()
+        finally:
+            self._writes.clear()
+            self._release()
+        return False
+
+    async def __aenter__(self) -> "UnitOfWork":
+        return self
+
+    async def __aexit__(self, exc_type, exc, tb) -> bool:
+        # Commit and release block on psycopg2; keep them off the event loop
+        return await asyncio.get_running_loop().run_in_executor(None, self.__exit__, exc_type, exc, tb)
+
+    @property
+    def connection(self):
+        """The unit's connection, checked out on first use; psycopg2 opens the transaction."""
+        if self._connection is None:
+            self._connection = self._pool.getconn()
+        return self._connection
+
+    def run(self, operation: Callable[..., Any], *args, **kwargs) -> Any:
+        """Call ``operation`` now, on the unit's connection.
+
+        For a coroutine function the result is a coroutine that checks the
+        connection out in the executor before awaiting ``operation``.
+        """
+        if inspect.iscoroutinefunction(operation):
+            return self._run_async(operation, *args, **kwargs)
+        return operation(*args, conn=self.connection, **kwargs)
+
+    async def _run_async(self, operation: Callable[..., Any], *args, **kwargs) -> Any:
+        if self._connection is None:
+            await asyncio.get_running_loop().run_in_executor(None, lambda: self.connection)
+        return await operation(*args, conn=self._connection, **kwargs)
+
+    def add(self, write: Callable[..., Any], *args, **kwargs) -> None:
+        """Collect ``write`` to be sent with the others on commit."""
+        self._writes.append((write, args, kwargs))
+
+    def commit(self) -> None:
+        """Send the collected writes in one round trip and commit them with everything run so far."""
+        writes, self._writes = self._writes, []
+        if writes:
+            batch = _StatementBatch(self.connection)
+            for write, args, kwargs in writes:
+                write(*args, conn=batch, **kwargs)
+            if batch.sql:
+                cursor = self.connection.cursor()
+                try:
+                    cursor.execute(b";\n".join(batch.sql))
+                finally:
+                    cursor.close()
+                logger.debug(f"Unit of work sent {len(batch.sql)} statement(s) in one batch")
+
+        if self._connection is not None:
+            self._connection.commit()
+
+    def _release(self) -> None:
+        conn, self._connection = self._connection, None
+        if conn is None:
+            return
+        try:
+            # Ends a failed or abandoned transaction; a no-op after commit
+            conn.rollback()
+        except Exception:
+            # Broken connection; the pool must not hand it out again
+            self._pool.putconn(conn, close=True)
+            return
+        self._pool.putconn(conn)
+
+
+class AsyncUnitOfWork:
+    """One asyncpg connection and transaction per request."""
+
+    def __init__(self, pool):
+        self._pool = pool
+        self._connection = None
+        self._transaction = None
+        self._stack = AsyncExitStack()
+        self._writes: List[_Write] = []
+
+    async def __aenter__(self) -> "AsyncUnitOfWork":
+        return self
+
+    async def __aexit__(self, exc_type, exc, tb) -> bool:
+        try:
+            if exc_type is None:
+                await self.commit()
+        finally:
+            try:
+                await self._rollback()
+            finally:
+                self._connection = None
+                await self._stack.aclose()
+        return False
+
+    async def connection(self):
+        """The unit's connection, acquired with its transaction started on first use."""
+        if self._connection is None:
+            self._connection = await self._stack.enter_async_context(self._pool.acquire())
+        if self._transaction is None:
+            transaction = self._connection.transaction()
+            await transaction.start()
+            self._transaction = transaction
+        return self._connection
+
+    async def run(self, operation: Callable[..., Any], *args, **kwargs) -> Any:
+        """Await ``operation`` now, inside the unit's transaction."""
+        return await operation(*args, conn=await self.connection(), **kwargs)
+
+    def add(self, write: Callable[..., Any], *args, **kwargs) -> None:
+        """Collect ``write`` to be run with the others on commit."""
+        self._writes.append((write, args, kwargs))
+
+    async def commit(self) -> None:
+        """Run the collected writes and commit them with everything run so far."""
+        writes, self._writes = self._writes, []
+        if not writes and self._transaction is None:
+            return
+        conn = await self.connection()
+        for write, args, kwargs in writes:
+            await write(*args, conn=conn, **kwargs)
+        transaction, self._transaction = self._transaction, None
+        await transaction.commit()
+
+    async def _rollback(self) -> None:
+        """Drop uncommitted work; a no-op after commit."""
+        self._writes.clear()
+        transaction, self._transaction = self._transaction, None
+        if transaction is not None:
+            await transaction.rollback()
+
+
+class DirectUnitOfWork:
+    """Unit of work for repositories that check out and commit their own connections.
+
+    ``run`` calls straight through; ``add`` still defers writes to ``commit``
+    so handlers behave the same whichever unit the container gives them.
+    Works with ``with`` for sync repositories and ``async with`` for either kind.
+    """
+
+    def __init__(self):
+        self._writes: List[_Write] = []
+
+    def __enter__(self) -> "DirectUnitOfWork":
+        return self
+
+    def __exit__(self, exc_type, exc, tb) -> bool:
+        try:
+            if exc_type is None:
+                self.commit()
+        finally:
+            self._writes.clear()
+        return False
+
+    async def __aenter__(self) -> "DirectUnitOfWork":
+        return self
+
+    async def __aexit__(self, exc_type, exc, tb) -> bool:
+        try:
+            if exc_type is None:
+                await self.commit_async()
+        finally:
+            self._writes.clear()
+        return False
+
+    def run(self, operation: Callable[..., Any], *args, **kwargs) -> Any:
+        return operation(*args, **kwargs)
+
+    def add(self, write: Callable[..., Any], *args, **kwargs) -> None:
+        self._writes.append((write, args, kwargs))
+
+    def commit(self) -> None:
+        writes, self._writes = self._writes, []
+        for write, args, kwargs in writes:
+            write(*args, **kwargs)
+
+    async def commit_async(self) -> None:
+        writes, self._writes = self._writes, []
+        for write, args, kwargs in writes:
+            await maybe_await(write(*args, **kwargs))
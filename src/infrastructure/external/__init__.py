@@ -14,8 +14,14 @@
 """External service implementations."""
 
 from .ip_geolocation_service import IpGeolocationService, MockIpGeolocationService
+from .ip_reputation_loader import load_ip_reputation_index
+from .mmap_geolocation_service import MmapIpGeolocationService, compile_geo_database, MAXMINDDB_AVAILABLE
 
 __all__ = [
     'IpGeolocationService',
-    'MockIpGeolocationService'
+    'MockIpGeolocationService',
+    'MmapIpGeolocationService',
+    'compile_geo_database',
+    'MAXMINDDB_AVAILABLE',
+    'load_ip_reputation_index'
 ]
@@ -17,6 +17,8 @@ from abc import ABC, abstractmethod
 from ipaddress import IPv4Address, IPv6Address
 from typing import Optional, Dict, Any
 
+from ...domain.services.traffic.ip_reputation import IpReputationService
+
 
 class IpGeolocationService(ABC):
     """Abstract service for IP geolocation."""
@@ -32,9 +34,15 @@ class IpGeolocationService(ABC):
 
 
 class MockIpGeolocationService(IpGeolocationService):
-    """Mock implementation of IP geolocation service."""
+    """Mock implementation of IP geolocation service.
+
+    When an IP reputation service is supplied, CIDR locations loaded with the
+    blocklists are answered from the same index before falling back to the
+    mock data.
+    """
 
-    def __init__(self):
+    def __init__(self, ip_reputation: Optional[IpReputationService] = None):
+        self._ip_reputation = ip_reputation
         # Mock location data
         self._mock_locations = {
             "192.168.1.100": {"country": "US", "region": "CA", "city": "San Francisco"},
@@ -54,5 +62,10 @@ class MockIpGeolocationService(IpGeolocationService):
                 # Invalid IP format, return None
                 return None
 
+        if self._ip_reputation is not None:
+            location = self._ip_reputation.locate(ip_address)
+            if location is not None:
+                return location
+
         # Return mock data or default
         return self._mock_locations.get(ip_address, {"country": "US", "region": "CA", "city": "Unknown"})
@@ -0,0 +1,87 @@
+# Copyright (c) 2025 Bivex
+#
+# Author: Bivex
+# Available for contact via email: support@b-b.top
+# For up-to-date contact information:
+# https://github.com/bivex
+#
+# Created: 2026-10-16T09:12:04
+# Last Updated: 2026-10-16T09:12:04
+#
+# Licensed under the MIT License.
+# Commercial licensing available upon request.
+
+"""Load IP reputation blocklists and CIDR locations from local files.
+
+Layout of the data directory::
+
+    datacenter.txt   one CIDR or address per line, '#' starts a comment;
+    proxy.netset     the file name (without extension) is the category
+    locations.csv    cidr,country,region,city
+"""
+
+import csv
+import logging
+import os
+from typing import Any, Dict, List, Tuple
+
+from ...domain.services.traffic.ip_reputation import IpReputationIndex, CidrIndex
+
+logger = logging.getLogger(__name__)
+
+BLOCKLIST_EXTENSIONS = ('.txt', '.netset', '.cidr')
+LOCATIONS_FILE = 'locations.csv'
+LOCATION_FIELDS = ('country', 'region', 'city')
+
+
+def _read_blocklist(path: str) -> List[str]:
+    entries = []
+    with open(path, encoding='utf-8') as handle:
+        for line_number, line in enumerate(handle, 1):
+            entry = line.split('#', 1)[0].split(';', 1)[0].strip()
+            if not entry:
+                continue
+            try:
+                CidrIndex([(entry, True)])
+            except ValueError:
+                logger.warning(f"Skipping invalid CIDR {entry!r} at {path}:{line_number}")
+                continue
+            entries.append(entry)
+    return entries
+
+
+def _read_locations(path: str) -> List[Tuple[str, Dict[str, Any]]]:
+    locations = []
+    with open(path, encoding='utf-8', newline='') as handle:
+        for line_number, row in enumerate(csv.reader(handle), 1):
+            if not row or row[0].startswith('#') or row[0].strip().lower() == 'cidr':
+                continue
+            cidr = row[0].strip()
+            location = {field: (row[i + 1].strip() if len(row) > i + 1 else None)
+                        for i, field in enumerate(LOCATION_FIELDS)}
+            try:
+                CidrIndex([(cidr, location)])
+            except ValueError:
+                logger.warning(f"Skipping invalid CIDR {cidr!r} at {path}:{line_number}")
+                continue
+            locations.append((cidr, location))
+    return locations
+
+
+def load_ip_reputation_index(directory: str, backend: str = 'radix') -> IpReputationIndex:
+    """Build an IpReputationIndex from the blocklist and location files in ``directory``."""
+    blocklists: Dict[str, List[str]] = {}
+    locations: List[Tuple[str, Dict[str, Any]]] = []
+    for name in sorted(os.listdir(directory)):
+        path = os.path.join(directory, name)
+        if not os.path.isfile(path):
+            continue
+        stem, extension = os.path.splitext(name)
+        if name == LOCATIONS_FILE:
+            locations = _read_locations(path)
+        elif extension in BLOCKLIST_EXTENSIONS:
+            blocklists.setdefault(stem, []).extend(_read_blocklist(path))
+
+    index = IpReputationIndex(blocklists, locations, backend=backend)
+    logger.info(f"Loaded IP reputation data from {directory}: {index.get_stats()}")
+    return index
@@ -0,0 +1,226 @@
+# Copyright (c) 2025 Bivex
+#
+# Author: Bivex
+# Available for contact via email: support@b-b.top
+# For up-to-date contact information:
+# https://github.com/bivex
+#
+# Created: 2026-10-16T09:12:04
+# Last Updated: 2026-10-16T09:12:04
+#
+# Licensed under the MIT License.
+# Commercial licensing available upon request.
+
+"""Offline IP geolocation backed by a memory-mapped range database.
+
+Two database formats are supported:
+
+* the compact format written by ``compile_geo_database`` from a CSV of
+  ``start_ip,end_ip,country,region,city`` (or ``cidr,country,region,city``)
+  rows: sorted, disjoint ranges binary-searched in place in the mapping;
+* MaxMind ``.mmdb`` files, when the optional ``maxminddb`` package is installed.
+
+Lookups never touch the network, and results are memoised in an LRU.
+"""
+
+import csv
+import functools
+import json
+import logging
+import mmap
+import struct
+from ipaddress import IPv4Address, IPv6Address, ip_address, ip_network
+from typing import Any, Dict, List, Optional, Tuple
+
+from .ip_geolocation_service import IpGeolocationService
+from ...domain.services.traffic.ip_reputation import parse_ip
+
+try:
+    import maxminddb
+    MAXMINDDB_AVAILABLE = True
+except ImportError:
+    maxminddb = None
+    MAXMINDDB_AVAILABLE = False
+
+logger = logging.getLogger(__name__)
+
+MAGIC = b'GEORNG01'
+# magic, IPv4 range count, IPv6 range count, location table length
+_HEADER = struct.Struct('>8sIII')
+# start, end, location index
+_V4_RECORD = struct.Struct('>III')
+_V6_RECORD = struct.Struct('>16s16sI')
+
+LOCATION_FIELDS = ('country', 'region', 'city')
+
+
+def _parse_range(first: str, second: Optional[str]) -> Tuple[int, int, int]:
+    """Return (version, start, end) for either a CIDR or a start/end address pair."""
+    if second is None or '/' in first:
+        network = ip_network(first.strip(), strict=False)
+        return network.version, int(network.network_address), int(network.broadcast_address)
+    start, end = ip_address(first.strip()), ip_address(second.strip())
+    if start.version != end.version or start > end:
+        raise ValueError(f"Invalid address range {first} - {second}")
+    return start.version, int(start), int(end)
+
+
+def compile_geo_database(csv_path: str, output_path: str) -> Dict[str, int]:
+    """
+    Compile a CSV range list into the compact binary format.
+
+    Rows with a CIDR in the first column use ``cidr,country,region,city``;
+    otherwise ``start_ip,end_ip,country,region,city``. Ranges must not overlap.
+    """
+    ranges: Dict[int, List[Tuple[int, int, int]]] = {4: [], 6: []}
+    locations: List[Tuple[Optional[str], ...]] = []
+    location_ids: Dict[Tuple[Optional[str], ...], int] = {}
+
+    with open(csv_path, encoding='utf-8', newline='') as handle:
+        for line_number, row in enumerate(csv.reader(handle), 1):
+            if not row or row[0].startswith('#') or row[0].strip().lower() in ('cidr', 'start_ip', 'network'):
+                continue
+            is_cidr = '/' in row[0]
+            try:
+                version, start, end = _parse_range(row[0], None if is_cidr else row[1])
+            except (ValueError, IndexError) as e:
+                raise ValueError(f"{csv_path}:{line_number}: {e}") from e
+            fields = row[1:] if is_cidr else row[2:]
+            location = tuple((fields[i].strip() or None) if i < len(fields) else None
+                             for i in range(len(LOCATION_FIELDS)))
+            location_id = location_ids.setdefault(location, len(location_ids))
+            if location_id == len(locations):
+                locations.append(location)
+            ranges[version].append((start, end, location_id))
+
+    for version, version_ranges in ranges.items():
+        version_ranges.sort()
+        for previous, current in zip(version_ranges, version_ranges[1:]):
+            if current[0] <= previous[1]:
+                raise ValueError(f"Overlapping IPv{version} ranges in {csv_path}")
+
+    location_table = json.dumps(locations, separators=(',', ':')).encode('utf-8')
+    with open(output_path, 'wb') as out:
+        out.write(_HEADER.pack(MAGIC, len(ranges[4]), len(ranges[6]), len(location_table)))
+        for start, end, location_id in ranges[4]:
+            out.write(_V4_RECORD.pack(start, end, location_id))
+        for start, end, location_id in ranges[6]:
+            out.write(_V6_RECORD.pack(start.to_bytes(16, 'big'), end.to_bytes(16, 'big'), location_id))
+        out.write(location_table)
+
+    return {'ipv4_ranges': len(ranges[4]), 'ipv6_ranges': len(ranges[6]), 'locations': len(locations)}
+
+
+class _RangeDatabase:
+    """Sorted disjoint ranges binary-searched directly in the memory mapping."""
+
+    def __init__(self, path: str):
+        self._file = open(path, 'rb')
+        try:
+            self._map = mmap.mmap(self._file.fileno(), 0, access=mmap.ACCESS_READ)
+        except Exception:
+            self._file.close()
+            raise
+        magic, self._v4_count, self._v6_count, table_length = _HEADER.unpack_from(self._map, 0)
+        if magic != MAGIC:
+            self.close()
+            raise ValueError(f"{path} is not a compiled geo range database")
+        self._v4_offset = _HEADER.size
+        self._v6_offset = self._v4_offset + self._v4_count * _V4_RECORD.size
+        table_offset = self._v6_offset + self._v6_count * _V6_RECORD.size
+        self._locations = [dict(zip(LOCATION_FIELDS, location)) for location in
+                           json.loads(self._map[table_offset:table_offset + table_length].decode('utf-8'))]
+
+    def lookup(self, version: int, value: int) -> Optional[Dict[str, Any]]:
+        if version == 4:
+            offset, count, record, key = self._v4_offset, self._v4_count, _V4_RECORD, value
+        else:
+            offset, count, record, key = self._v6_offset, self._v6_count, _V6_RECORD, value.to_bytes(16, 'big')
+        data, size = self._map, record.size
+        low, high = 0, count
+        # Find the last range whose start is <= key
+        while low < high:
+            middle = (low + high) // 2
+            start = record.unpack_from(data, offset + middle * size)[0]
+            if start <= key:
+                low = middle + 1
+            else:
+                high = middle
+        if low == 0:
+            return None
+        _, end, location_id = record.unpack_from(data, offset + (low - 1) * size)
+        return self._locations[location_id] if key <= end else None
+
+    def stats(self) -> Dict[str, Any]:
+        return {'format': 'ranges', 'ipv4_ranges': self._v4_count, 'ipv6_ranges': self._v6_count}
+
+    def close(self) -> None:
+        self._map.close()
+        self._file.close()
+
+
+class _MaxMindDatabase:
+    """MaxMind .mmdb reader opened in mmap mode."""
+
+    def __init__(self, path: str):
+        self._reader = maxminddb.open_database(path, maxminddb.MODE_MMAP)
+
+    def lookup(self, version: int, value: int) -> Optional[Dict[str, Any]]:
+        record = self._reader.get(IPv4Address(value) if version == 4 else IPv6Address(value))
+        if not record:
+            return None
+        subdivisions = record.get('subdivisions') or [{}]
+        return {
+            'country': (record.get('country') or {}).get('iso_code'),
+            'region': subdivisions[0].get('iso_code'),
+            'city': ((record.get('city') or {}).get('names') or {}).get('en'),
+        }
+
+    def stats(self) -> Dict[str, Any]:
+        return {'format': 'mmdb', 'database_type': self._reader.metadata().database_type}
+
+    def close(self) -> None:
+        self._reader.close()
+
+
+class MmapIpGeolocationService(IpGeolocationService):
+    """IpGeolocationService answering from a local memory-mapped database."""
+
+    def __init__(self, database_path: str, cache_size: int = 65536):
+        if database_path.endswith('.mmdb'):
+            if not MAXMINDDB_AVAILABLE:
+                raise RuntimeError("maxminddb is required to read .mmdb geolocation databases")
+            self._database = _MaxMindDatabase(database_path)
+        else:
+            self._database = _RangeDatabase(database_path)
+        self._database_path = database_path
+        self._cached_lookup = functools.lru_cache(maxsize=cache_size)(self._lookup)
+        logger.info(f"Opened geolocation database {database_path}: {self._database.stats()}")
+
+    def _lookup(self, ip: str) -> Optional[Dict[str, Any]]:
+        parsed = parse_ip(ip)
+        if parsed is None:
+            return None
+        return self._database.lookup(*parsed)
+
+    def get_location(self, ip_address: str) -> Optional[Dict[str, Any]]:
+        """Get location for an IP address, or None for unknown and invalid addresses."""
+        location = self._cached_lookup(ip_address)
+        return dict(location) if location is not None else None
+
+    def get_stats(self) -> Dict[str, Any]:
+        info = self._cached_lookup.cache_info()
+        lookups = info.hits + info.misses
+        stats = self._database.stats()
+        stats.update(
+            path=self._database_path,
+            cache_hits=info.hits,
+            cache_misses=info.misses,
+            cache_size=info.currsize,
+            cache_hit_ratio=round(info.hits / lookups, 4) if lookups else 0.0,
+        )
+        return stats
+
+    def close(self) -> None:
+        self._cached_lookup.cache_clear()
+        self._database.close()
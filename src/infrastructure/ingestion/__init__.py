@@ -0,0 +1,24 @@
+# Copyright (c) 2025 Bivex
+#
+# Author: Bivex
+# Available for contact via email: support@b-b.top
+# For up-to-date contact information:
+# https://github.com/bivex
+#
+# Created: 2026-10-16T09:12:04
+# Last Updated: 2026-10-16T09:12:04
+#
+# Licensed under the MIT License.
+# Commercial licensing available upon request.
+
+"""Write-behind ingestion pipelines for high-volume tracking data."""
+
+from .campaign_counters import CampaignCounterAggregator, CounterDelta
+from .click_write_buffer import ClickWriteBuffer, ClickBufferStats
+
+__all__ = [
+    'CampaignCounterAggregator',
+    'CounterDelta',
+    'ClickWriteBuffer',
+    'ClickBufferStats',
+]
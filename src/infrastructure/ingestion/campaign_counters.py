@@ -0,0 +1,259 @@
+# Copyright (c) 2025 Bivex
+#
+# Author: Bivex
+# Available for contact via email: support@b-b.top
+# For up-to-date contact information:
+# https://github.com/bivex
+#
+# Created: 2026-10-16T09:12:04
+# Last Updated: 2026-10-16T09:12:04
+#
+# Licensed under the MIT License.
+# Commercial licensing available upon request.
+"""
+Per-process aggregation of campaign performance counters.
+
+Instead of loading a Campaign and re-upserting all of its columns on every
+click or conversion, callers add deltas to sharded in-memory counters. A background task
+periodically applies the accumulated deltas with one
+``UPDATE campaigns SET clicks_count = clicks_count + $n ...`` round-trip, so
+concurrent clicks never lose increments and never serialize on the campaign row.
+"""
+
+import asyncio
+import inspect
+import logging
+import threading
+import time
+from dataclasses import dataclass
+from typing import Any, Callable, Dict, List, Optional
+
+logger = logging.getLogger(__name__)
+
+
+@dataclass
+class CounterDelta:
+    """Pending increments for one campaign."""
+    clicks: int = 0
+    conversions: int = 0
+
+    def add(self, other: 'CounterDelta') -> None:
+        self.clicks += other.clicks
+        self.conversions += other.conversions
+
+    def is_zero(self) -> bool:
+        return not (self.clicks or self.conversions)
+
+
+class _Shard:
+    """One lock-protected slice of the pending deltas."""
+
+    __slots__ = ('lock', 'deltas')
+
+    def __init__(self):
+        self.lock = threading.Lock()
+        self.deltas: Dict[str, CounterDelta] = {}
+
+
+class CampaignCounterAggregator:
+    """
+    Sharded, write-behind campaign counters.
+
+    Campaign ids are hashed onto ``shard_count`` independently locked dicts so
+    that executor threads and the event loop rarely contend. Deltas that are
+    being flushed stay visible through ``pending()`` until the database has
+    applied them, and are folded back into the shards if the flush fails.
+    """
+
+    def __init__(self,
+                 sink: Optional[Callable[[Dict[str, CounterDelta]], Any]] = None,
+                 shard_count: int = 16,
+                 flush_interval: float = 1.0):
+        """
+        Args:
+            sink: Applies a {campaign_id: CounterDelta} mapping atomically, e.g.
+                ``CampaignRepository.apply_counter_deltas``. Coroutine functions are
+                awaited; plain callables run in the default executor. May be bound
+                later with ``set_sink()`` when the repository itself needs the aggregator.
+            shard_count: Number of independently locked shards
+            flush_interval: Seconds between flushes
+        """
+        self.set_sink(sink)
+        self._shards: List[_Shard] = [_Shard() for _ in range(shard_count)]
+        self._flush_interval = flush_interval
+
+        self._in_flight: Dict[str, CounterDelta] = {}
+        self._in_flight_lock = threading.Lock()
+
+        self._loop: Optional[asyncio.AbstractEventLoop] = None
+        self._flusher: Optional[asyncio.Task] = None
+        self._closed = False
+
+        self._flushes = 0
+        self._failed_flushes = 0
+        self._campaigns_flushed = 0
+        self._last_flush_at: Optional[float] = None
+        self._last_error: Optional[str] = None
+
+    def set_sink(self, sink: Optional[Callable[[Dict[str, CounterDelta]], Any]]) -> None:
+        """Bind the callable that applies deltas to the database."""
+        self._sink = sink
+        self._sink_is_async = inspect.iscoroutinefunction(sink)
+
+    def _shard(self, campaign_id: str) -> _Shard:
+        return self._shards[hash(campaign_id) % len(self._shards)]
+
+    def increment(self, campaign_id: str, clicks: int = 0, conversions: int = 0) -> None:
+        """Record increments for a campaign. Never touches the database."""
+        shard = self._shard(campaign_id)
+        with shard.lock:
+            delta = shard.deltas.get(campaign_id)
+            if delta is None:
+                delta = shard.deltas[campaign_id] = CounterDelta()
+            delta.clicks += clicks
+            delta.conversions += conversions
+        self._ensure_flusher()
+
+    def pending(self, campaign_id: str) -> CounterDelta:
+        """Increments recorded in this process that the database does not reflect yet."""
+        result = CounterDelta()
+        shard = self._shard(campaign_id)
+        with shard.lock:
+            delta = shard.deltas.get(campaign_id)
+            if delta is not None:
+                result.add(delta)
+        with self._in_flight_lock:
+            delta = self._in_flight.get(campaign_id)
+            if delta is not None:
+                result.add(delta)
+        return result
+
+    def merge_into(self, campaign):
+        """Add pending increments to a Campaign loaded from the database (in place)."""
+        if campaign is None:
+            return campaign
+        delta = self.pending(campaign.id.value)
+        if not delta.is_zero():
+            campaign.clicks_count += delta.clicks
+            campaign.conversions_count += delta.conversions
+        return campaign
+
+    def _ensure_flusher(self) -> None:
+        """Start the periodic flusher on the running loop, if any."""
+        if self._closed:
+            return
+        try:
+            loop = asyncio.get_running_loop()
+        except RuntimeError:
+            return  # Called from a worker thread; the loop-side flusher picks the deltas up
+        if self._loop is loop and self._flusher is not None and not self._flusher.done():
+            return
+        self._loop = loop
+        self._flusher = loop.create_task(self._run(), name="campaign-counter-flusher")
+
+    async def _run(self) -> None:
+        while not self._closed:
+            await asyncio.sleep(self._flush_interval)
+            try:
+                await self.flush()
+            except asyncio.CancelledError:
+                raise
+            except Exception:
+                logger.exception("Unexpected error in campaign counter flusher")
+
+    def _take(self) -> Dict[str, CounterDelta]:
+        """Move all shard deltas into the in-flight set and return them."""
+        with self._in_flight_lock:
+            if self._in_flight:
+                return {}  # Previous flush still running
+            for shard in self._shards:
+                with shard.lock:
+                    deltas, shard.deltas = shard.deltas, {}
+                for campaign_id, delta in deltas.items():
+                    if not delta.is_zero():
+                        self._in_flight[campaign_id] = delta
+            return dict(self._in_flight)
+
+    def _restore(self, batch: Dict[str, CounterDelta]) -> None:
+        """Fold a failed batch back into the shards."""
+        for campaign_id, delta in batch.items():
+            shard = self._shard(campaign_id)
+            with shard.lock:
+                existing = shard.deltas.get(campaign_id)
+                if existing is None:
+                    shard.deltas[campaign_id] = delta
+                else:
+                    existing.add(delta)
+
+    async def flush(self) -> int:
+        """Apply all pending deltas now. Returns the number of campaigns updated."""
+        if self._sink is None:
+            return 0
+        batch = self._take()
+        if not batch:
+            return 0
+        start = time.time()
+        try:
+            if self._sink_is_async:
+                await self._sink(batch)
+            else:
+                await asyncio.get_running_loop().run_in_executor(None, self._sink, batch)
+        except Exception as e:
+            self._failed_flushes += 1
+            self._last_error = str(e)[:200]
+            with self._in_flight_lock:
+                self._in_flight = {}
+                self._restore(batch)
+            logger.error(f"Campaign counter flush failed for {len(batch)} campaigns: {e}")
+            return 0
+
+        with self._in_flight_lock:
+            self._in_flight = {}
+        self._flushes += 1
+        self._campaigns_flushed += len(batch)
+        self._last_flush_at = time.time()
+        logger.debug(f"Applied counter deltas for {len(batch)} campaigns in {(time.time() - start) * 1000:.1f}ms")
+        return len(batch)
+
+    async def close(self) -> None:
+        """Stop the flusher and apply whatever is still pending."""
+        self._closed = True
+        flusher, self._flusher = self._flusher, None
+        if flusher is not None and not flusher.done():
+            try:
+                same_loop = flusher.get_loop() is asyncio.get_running_loop()
+            except RuntimeError:
+                same_loop = False
+            if same_loop:
+                if self._in_flight:
+                    # Let a running flush finish rather than guess whether it committed
+                    await flusher
+                else:
+                    flusher.cancel()
+                    try:
+                        await flusher
+                    except asyncio.CancelledError:
+                        pass
+        with self._in_flight_lock:
+            # A flush interrupted by its loop stopping never reached the database; retry it
+            stranded, self._in_flight = self._in_flight, {}
+            self._restore(stranded)
+        await self.flush()
+
+    def get_stats(self) -> Dict[str, Any]:
+        """Get aggregation statistics."""
+        pending_campaigns = 0
+        for shard in self._shards:
+            with shard.lock:
+                pending_campaigns += len(shard.deltas)
+        return {
+            'shards': len(self._shards),
+            'flush_interval_seconds': self._flush_interval,
+            'pending_campaigns': pending_campaigns,
+            'in_flight_campaigns': len(self._in_flight),
+            'flushes': self._flushes,
+            'failed_flushes': self._failed_flushes,
+            'campaigns_flushed': self._campaigns_flushed,
+            'last_flush_age_seconds': round(time.time() - self._last_flush_at, 1) if self._last_flush_at else None,
+            'last_error': self._last_error,
+        }
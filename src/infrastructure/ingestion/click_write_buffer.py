@@ -0,0 +1,397 @@
+# Copyright (c) 2025 Bivex
+#
+# Author: Bivex
+# Available for contact via email: support@b-b.top
+# For up-to-date contact information:
+# https://github.com/bivex
+#
+# Created: 2026-10-16T09:12:04
+# Last Updated: 2026-10-16T09:12:04
+#
+# Licensed under the MIT License.
+# Commercial licensing available upon request.
+"""
+Write-behind ingestion buffer for clicks.
+
+The redirect path appends clicks to an in-process queue and returns; a
+background flusher drains the queue in batches through the click
+repository's ``save_many`` (COPY into a staging table plus one merge), so the
+302 no longer waits for a per-click INSERT and WAL fsync.
+"""
+
+import asyncio
+import inspect
+import logging
+import time
+from collections import deque
+from typing import Any, Callable, Deque, Dict, List, Optional, Tuple
+
+from ...domain.entities.click import Click
+
+logger = logging.getLogger(__name__)
+dead_letter_logger = logging.getLogger(f"{__name__}.dead_letter")
+
+# Errors caused by the rows themselves: retrying the same batch can never succeed
+_DATA_ERRORS: Tuple[type, ...] = (ValueError, TypeError)
+try:
+    import asyncpg
+
+    _DATA_ERRORS += (asyncpg.DataError, asyncpg.IntegrityConstraintViolationError)
+except ImportError:
+    pass
+try:
+    import psycopg2
+
+    _DATA_ERRORS += (psycopg2.DataError, psycopg2.IntegrityError)
+except ImportError:
+    pass
+
+
+def is_data_error(error: BaseException) -> bool:
+    """True if ``error`` is a bad value or constraint violation in the written rows.
+
+    Anything else (lost connection, timeout, pool exhaustion) is transient.
+    """
+    return isinstance(error, _DATA_ERRORS)
+
+
+def log_dead_letter(click: Click, error: BaseException) -> None:
+    """Default dead-letter sink: one log record per click that could not be written."""
+    dead_letter_logger.error(f"Dead-lettered click after failed writes ({error}): {click!r}")
+
+
+class ClickBufferStats:
+    """Counters for click ingestion monitoring."""
+
+    def __init__(self):
+        self.reset()
+
+    def reset(self):
+        self.enqueued = 0
+        self.flushed = 0
+        self.batches = 0
+        self.failed_batches = 0
+        self.data_errors = 0
+        self.dead_lettered = 0
+        self.rejected = 0
+        self.dropped = 0
+        self.high_watermark = 0
+        self.total_flush_time = 0.0
+        self.last_flush_at: Optional[float] = None
+        self.last_error: Optional[str] = None
+
+    def get_summary(self) -> Dict[str, Any]:
+        """Get summary statistics."""
+        return {
+            'enqueued': self.enqueued,
+            'flushed': self.flushed,
+            'batches': self.batches,
+            'failed_batches': self.failed_batches,
+            'data_errors': self.data_errors,
+            'dead_lettered': self.dead_lettered,
+            'rejected': self.rejected,
+            'dropped': self.dropped,
+            'high_watermark': self.high_watermark,
+            'avg_batch_size': round(self.flushed / max(self.batches, 1), 1),
+            'avg_flush_time_ms': round(self.total_flush_time / max(self.batches, 1) * 1000, 2),
+            'last_flush_age_seconds': round(time.time() - self.last_flush_at, 1) if self.last_flush_at else None,
+            'last_error': self.last_error,
+        }
+
+
+class ClickWriteBuffer:
+    """
+    Bounded asyncio queue of clicks with a size- or time-triggered batch flusher.
+
+    - Memory is bounded by ``max_pending``; when full, ``add()`` waits up to
+      ``enqueue_timeout`` for the flusher to make room and then returns False
+      so the caller can fall back to a direct write.
+    - Batches that fail with a transient error are put back at the head of the
+      queue and retried with exponential backoff; clicks that no longer fit are
+      dropped and counted.
+    - Batches that fail with a data error are bisected until the bad rows are
+      isolated; the rest is written. Isolated rows are retried on later ticks
+      and dead-lettered after ``max_row_attempts`` failed writes, so one bad row
+      never blocks the clicks behind it.
+    - ``close()`` drains everything that is still pending (call it on shutdown).
+
+    The flusher task is started lazily on the loop that first calls ``add()``,
+    i.e. the loop that serves requests, not the one that built the container.
+    """
+
+    def __init__(self,
+                 sink: Callable[[List[Click]], Any],
+                 max_batch_size: int = 500,
+                 flush_interval: float = 0.25,
+                 max_pending: int = 20000,
+                 enqueue_timeout: float = 0.05,
+                 max_retry_delay: float = 5.0,
+                 max_row_attempts: int = 3,
+                 dead_letter: Optional[Callable[[Click, BaseException], Any]] = None):
+        """
+        Args:
+            sink: Persists one batch, e.g. ``ClickRepository.save_many``. Coroutine
+                functions are awaited; plain callables run in the default executor.
+            max_batch_size: Flush as soon as this many clicks are pending
+            flush_interval: Flush at least this often (seconds)
+            max_pending: Upper bound on buffered clicks
+            enqueue_timeout: How long ``add()`` waits for room before giving up (seconds)
+            max_retry_delay: Upper bound for the backoff after a failed flush (seconds)
+            max_row_attempts: Failed writes of an isolated bad row before it is dead-lettered
+            dead_letter: Receives each dead-lettered click and its last error
+                (default: ``log_dead_letter``)
+        """
+        self._sink = sink
+        self._sink_is_async = inspect.iscoroutinefunction(sink)
+        self._max_batch_size = max_batch_size
+        self._flush_interval = flush_interval
+        self._max_pending = max_pending
+        self._enqueue_timeout = enqueue_timeout
+        self._max_retry_delay = max_retry_delay
+        self._max_row_attempts = max(1, max_row_attempts)
+        self._dead_letter = dead_letter or log_dead_letter
+
+        self._pending: Deque[Click] = deque()
+        # Rows isolated by a data error, with the number of failed writes so far
+        self._suspects: Deque[Tuple[Click, int]] = deque()
+        self._stats = ClickBufferStats()
+        self._retry_delay = 0.0
+        self._closed = False
+        self._flushing = False
+
+        # Loop-bound primitives, (re)created by _ensure_flusher()
+        self._loop: Optional[asyncio.AbstractEventLoop] = None
+        self._flusher: Optional[asyncio.Task] = None
+        self._wakeup: Optional[asyncio.Event] = None
+        self._space: Optional[asyncio.Event] = None
+
+    def __len__(self) -> int:
+        return len(self._pending)
+
+    def _ensure_flusher(self) -> None:
+        """Start the background flusher on the running loop if it is not already running there."""
+        loop = asyncio.get_running_loop()
+        if self._loop is loop and self._flusher is not None and not self._flusher.done():
+            return
+        self._loop = loop
+        self._wakeup = asyncio.Event()
+        self._space = asyncio.Event()
+        self._space.set()
+        self._flusher = loop.create_task(self._run(), name="click-write-buffer-flusher")
+        logger.info(f"Click write buffer flusher started (batch={self._max_batch_size}, "
+                    f"interval={self._flush_interval}s, max_pending={self._max_pending})")
+
+    async def add(self, click: Click) -> bool:
+        """Queue a click for persistence without touching the database.
+
+        Returns False if the click was not accepted (buffer full or closed).
+        """
+        if self._closed:
+            return False
+        self._ensure_flusher()
+
+        if len(self._pending) >= self._max_pending:
+            # Backpressure: let the flusher catch up, but never hold a redirect for long
+            self._space.clear()
+            self._wakeup.set()
+            try:
+                await asyncio.wait_for(self._space.wait(), timeout=self._enqueue_timeout)
+            except asyncio.TimeoutError:
+                pass
+            if len(self._pending) >= self._max_pending:
+                self._stats.rejected += 1
+                return False
+
+        self._pending.append(click)
+        self._stats.enqueued += 1
+        if len(self._pending) > self._stats.high_watermark:
+            self._stats.high_watermark = len(self._pending)
+        if len(self._pending) >= self._max_batch_size:
+            self._wakeup.set()
+        return True
+
+    async def _run(self) -> None:
+        """Flush on the size trigger or every ``flush_interval`` seconds."""
+        while not self._closed:
+            try:
+                await asyncio.wait_for(self._wakeup.wait(), timeout=self._flush_interval)
+            except asyncio.TimeoutError:
+                pass
+            self._wakeup.clear()
+
+            try:
+                while self._pending:
+                    if not await self._flush_batch():
+                        await asyncio.sleep(self._retry_delay)
+                        break
+                else:
+                    if self._suspects:
+                        await self._retry_suspects()
+            except asyncio.CancelledError:
+                raise
+            except Exception:
+                logger.exception("Unexpected error in click write buffer flusher")
+
+    async def _write(self, batch: List[Click]) -> None:
+        """Hand one batch to the sink."""
+        if self._sink_is_async:
+            await self._sink(batch)
+        else:
+            await asyncio.get_running_loop().run_in_executor(None, self._sink, batch)
+
+    async def _write_isolating(self, batch: List[Click]) -> List[Tuple[Click, BaseException]]:
+        """Write a batch, bisecting on data errors. Returns the rows that fail on their own.
+
+        Transient errors propagate; halves already written are merged again on retry.
+        """
+        try:
+            await self._write(batch)
+            return []
+        except Exception as e:
+            if not is_data_error(e):
+                raise
+            if len(batch) == 1:
+                return [(batch[0], e)]
+        mid = len(batch) // 2
+        return await self._write_isolating(batch[:mid]) + await self._write_isolating(batch[mid:])
+
+    async def _flush_batch(self) -> bool:
+        """Persist one batch from the head of the queue. Returns False on a transient sink failure."""
+        count = min(self._max_batch_size, len(self._pending))
+        batch = [self._pending.popleft() for _ in range(count)]
+        start = time.time()
+        self._flushing = True
+        try:
+            bad_rows = await self._write_isolating(batch)
+        except asyncio.CancelledError:
+            # The batch may or may not have been written; the merge is keyed by click id,
+            # so writing it again is harmless while dropping it loses clicks
+            self._requeue(batch)
+            raise
+        except Exception as e:
+            self._stats.failed_batches += 1
+            self._stats.last_error = str(e)[:200]
+            self._requeue(batch)
+            self._retry_delay = min(max(self._retry_delay * 2, self._flush_interval), self._max_retry_delay)
+            logger.error(f"Click batch flush failed ({len(batch)} clicks, retry in {self._retry_delay:.2f}s): {e}")
+            return False
+        finally:
+            self._flushing = False
+
+        elapsed = time.time() - start
+        self._retry_delay = 0.0
+        self._stats.batches += 1
+        self._stats.flushed += len(batch) - len(bad_rows)
+        self._stats.total_flush_time += elapsed
+        self._stats.last_flush_at = time.time()
+        if self._space is not None and len(self._pending) < self._max_pending:
+            self._space.set()
+        if bad_rows:
+            self._stats.data_errors += len(bad_rows)
+            self._stats.last_error = str(bad_rows[-1][1])[:200]
+            logger.error(f"Click batch flush isolated {len(bad_rows)} bad rows out of {len(batch)}: "
+                         f"{bad_rows[-1][1]}")
+            for click, error in bad_rows:
+                self._suspect(click, 1, error)
+        logger.debug(f"Flushed {len(batch)} clicks in {elapsed * 1000:.1f}ms ({len(self._pending)} pending)")
+        return True
+
+    def _suspect(self, click: Click, attempts: int, error: BaseException) -> None:
+        """Keep an isolated bad row for another try, or dead-letter it once it is out of attempts."""
+        if attempts < self._max_row_attempts:
+            self._suspects.append((click, attempts))
+        else:
+            self._send_to_dead_letter(click, error)
+
+    def _send_to_dead_letter(self, click: Click, error: BaseException) -> None:
+        self._stats.dead_lettered += 1
+        try:
+            self._dead_letter(click, error)
+        except Exception:
+            logger.exception("Click dead-letter sink failed")
+
+    async def _retry_suspects(self) -> None:
+        """Retry each isolated bad row once; stop at the first transient error."""
+        self._flushing = True
+        try:
+            for _ in range(len(self._suspects)):
+                click, attempts = self._suspects.popleft()
+                try:
+                    await self._write([click])
+                except asyncio.CancelledError:
+                    self._suspects.appendleft((click, attempts))
+                    raise
+                except Exception as e:
+                    if not is_data_error(e):
+                        self._suspects.appendleft((click, attempts))
+                        return
+                    self._stats.data_errors += 1
+                    self._suspect(click, attempts + 1, e)
+                else:
+                    self._stats.flushed += 1
+        finally:
+            self._flushing = False
+
+    def _requeue(self, batch: List[Click]) -> None:
+        """Put a failed batch back at the head of the queue, dropping what no longer fits."""
+        room = self._max_pending - len(self._pending)
+        if room < len(batch):
+            dropped = len(batch) - max(room, 0)
+            self._stats.dropped += dropped
+            logger.error(f"Click write buffer overflow: dropping {dropped} clicks")
+            batch = batch[dropped:]
+        self._pending.extendleft(reversed(batch))
+
+    async def flush(self) -> int:
+        """Flush everything pending now. Returns the number of clicks persisted."""
+        flushed_before = self._stats.flushed
+        while self._pending:
+            if not await self._flush_batch():
+                break
+        return self._stats.flushed - flushed_before
+
+    async def close(self) -> None:
+        """Stop accepting clicks, stop the flusher and drain the queue."""
+        self._closed = True
+        flusher, self._flusher = self._flusher, None
+        if flusher is not None and not flusher.done():
+            try:
+                same_loop = flusher.get_loop() is asyncio.get_running_loop()
+            except RuntimeError:
+                same_loop = False
+            if same_loop:
+                if self._flushing:
+                    # Let a running flush finish; the flusher exits once it sees _closed
+                    await flusher
+                else:
+                    flusher.cancel()
+                    try:
+                        await flusher
+                    except asyncio.CancelledError:
+                        pass
+            # A flusher on another (stopped) loop simply never runs again
+
+        pending = len(self._pending)
+        flushed = await self.flush()
+        if self._suspects:
+            await self._retry_suspects()
+            # Nothing will retry them after shutdown
+            while self._suspects:
+                click, _ = self._suspects.popleft()
+                self._send_to_dead_letter(click, RuntimeError("click write buffer closed"))
+        if self._pending:
+            logger.error(f"Click write buffer closed with {len(self._pending)} unflushed clicks")
+        else:
+            logger.info(f"Click write buffer drained on close ({flushed}/{pending} clicks)")
+
+    def get_stats(self) -> Dict[str, Any]:
+        """Get buffer configuration and ingestion statistics."""
+        return {
+            'pending': len(self._pending),
+            'suspect_rows': len(self._suspects),
+            'max_pending': self._max_pending,
+            'max_batch_size': self._max_batch_size,
+            'flush_interval_seconds': self._flush_interval,
+            'flusher_running': self._flusher is not None and not self._flusher.done(),
+            **self._stats.get_summary()
+        }
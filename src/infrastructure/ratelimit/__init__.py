@@ -0,0 +1,32 @@
+# Copyright (c) 2025 Bivex
+#
+# Author: Bivex
+# Available for contact via email: support@b-b.top
+# For up-to-date contact information:
+# https://github.com/bivex
+#
+# Created: 2026-10-16T09:12:04
+# Last Updated: 2026-10-16T09:12:04
+#
+# Licensed under the MIT License.
+# Commercial licensing available upon request.
+
+"""Request rate limiting."""
+
+from .rate_limiter import (
+    RateLimit,
+    RateLimitDecision,
+    RateLimitPolicy,
+    SlidingWindowRateLimiter,
+    build_rate_limiter,
+    parse_rate_limit_groups,
+)
+
+__all__ = [
+    'RateLimit',
+    'RateLimitDecision',
+    'RateLimitPolicy',
+    'SlidingWindowRateLimiter',
+    'build_rate_limiter',
+    'parse_rate_limit_groups',
+]
@@ -0,0 +1,206 @@
+# Copyright (c) 2025 Bivex
+#
+# Author: Bivex
+# Available for contact via email: support@b-b.top
+# For up-to-date contact information:
+# https://github.com/bivex
+#
+# Created: 2026-10-16T09:12:04
+# Last Updated: 2026-10-16T09:12:04
+#
+# Licensed under the MIT License.
+# Commercial licensing available upon request.
+
+"""Sliding-window rate limiter over a fixed-size hashed ring of counters.
+
+Each key (route group + client) owns one slot holding the request counts of
+the current and previous fixed windows; the sliding-window estimate is
+``previous * (1 - elapsed / window) + current``. Slots are found by hashing
+the key into a set of ``ways`` candidate slots, so a check is O(1), memory is
+bounded no matter how many clients there are, and stale counters are simply
+overwritten (lazy expiry) instead of being swept. Each slot also records
+when its counts stop mattering, in seconds, so slots of route groups with
+different window lengths can share a set.
+
+The ring lives either in a private bytearray or in an anonymous shared
+mapping. The shared variant must be created before the workers are forked;
+every worker then updates the same counters under a process-shared lock, so
+the configured budget is global rather than per worker.
+"""
+
+import hashlib
+import logging
+import mmap
+import multiprocessing
+import struct
+import threading
+import time
+from dataclasses import dataclass
+from typing import Dict, List, Optional, Tuple
+
+logger = logging.getLogger(__name__)
+
+# key hash, window number, expiry time, previous window count, current window count
+_SLOT = struct.Struct('<QqdII')
+
+
+@dataclass(frozen=True)
+class RateLimit:
+    """Allow ``requests`` per ``window_seconds`` (sliding)."""
+    requests: int
+    window_seconds: float
+
+    def __post_init__(self) -> None:
+        if self.requests <= 0 or self.window_seconds <= 0:
+            raise ValueError("Rate limit requests and window must be positive")
+
+
+@dataclass(frozen=True)
+class RateLimitDecision:
+    """Outcome of one rate limit check."""
+    allowed: bool
+    limit: int
+    remaining: int
+    retry_after: float
+
+
+class RateLimitPolicy:
+    """Maps request paths to route groups and their limits (longest prefix wins)."""
+
+    DEFAULT_GROUP = 'default'
+
+    def __init__(self, default: RateLimit, groups: Optional[Dict[str, RateLimit]] = None):
+        self.default = default
+        self._groups: List[Tuple[str, RateLimit]] = sorted((groups or {}).items(), key=lambda g: -len(g[0]))
+
+    def resolve(self, path: str) -> Tuple[str, RateLimit]:
+        """Return (group, limit) for a request path."""
+        for prefix, limit in self._groups:
+            if path.startswith(prefix):
+                return prefix, limit
+        return self.DEFAULT_GROUP, self.default
+
+    @property
+    def groups(self) -> Dict[str, RateLimit]:
+        return dict(self._groups)
+
+
+def parse_rate_limit_groups(spec: str) -> Dict[str, RateLimit]:
+    """Parse ``"/v1/click=600/60,/v1/auth=20/60"`` into per-prefix limits."""
+    groups: Dict[str, RateLimit] = {}
+    for item in filter(None, (part.strip() for part in (spec or '').split(','))):
+        prefix, _, limit = item.partition('=')
+        requests, _, window = limit.partition('/')
+        if not prefix or not requests:
+            raise ValueError(f"Invalid rate limit group: {item!r}")
+        groups[prefix.strip()] = RateLimit(int(requests), float(window or 60))
+    return groups
+
+
+class SlidingWindowRateLimiter:
+    """Set-associative ring of sliding-window counters."""
+
+    def __init__(self, policy: RateLimitPolicy, slots: int = 65536, ways: int = 4, shared: bool = False):
+        if slots < ways or ways < 1:
+            raise ValueError("Rate limiter needs at least one set of slots")
+        self.policy = policy
+        self._ways = ways
+        self._sets = slots // ways
+        self._shared = shared
+        size = self._sets * ways * _SLOT.size
+        if shared:
+            # Anonymous MAP_SHARED mapping: inherited, and shared, by forked workers
+            self._ring = mmap.mmap(-1, size)
+            self._lock = multiprocessing.Lock()
+        else:
+            self._ring = bytearray(size)
+            self._lock = threading.Lock()
+        self._evictions = 0
+
+    @staticmethod
+    def _hash(key: str) -> int:
+        # Stable across processes, unlike hash(); 0 marks an empty slot
+        return int.from_bytes(hashlib.blake2b(key.encode('utf-8'), digest_size=8).digest(), 'little') or 1
+
+    def check(self, client: str, path: str = '/', now: Optional[float] = None) -> RateLimitDecision:
+        """Count one request from ``client`` to ``path`` and decide whether it is allowed."""
+        group, limit = self.policy.resolve(path)
+        return self.hit(f"{group}|{client}", limit, now)
+
+    def hit(self, key: str, limit: RateLimit, now: Optional[float] = None) -> RateLimitDecision:
+        """Count one request for ``key`` against ``limit``."""
+        now = time.time() if now is None else now
+        key_hash = self._hash(key)
+        window = int(now // limit.window_seconds)
+        elapsed = (now % limit.window_seconds) / limit.window_seconds
+        base = (key_hash % self._sets) * self._ways
+        ring = self._ring
+
+        # Once the next window has also passed, neither count affects the estimate
+        expires_at = (window + 2) * limit.window_seconds
+
+        with self._lock:
+            offset, previous, current = self._find_slot(ring, base, key_hash, window, now)
+            estimate = previous * (1.0 - elapsed) + current
+            allowed = estimate < limit.requests
+            if allowed:
+                current += 1
+                estimate += 1
+            _SLOT.pack_into(ring, offset, key_hash, window, expires_at, previous, current)
+
+        remaining = max(int(limit.requests - estimate), 0)
+        retry_after = 0.0 if allowed else round((1.0 - elapsed) * limit.window_seconds, 3)
+        return RateLimitDecision(allowed, limit.requests, remaining, retry_after)
+
+    def _find_slot(self, ring, base: int, key_hash: int, window: int, now: float) -> Tuple[int, int, int]:
+        """Return (offset, previous count, current count) for the key, rolling or reclaiming as needed.
+
+        Window numbers are only compared within the key's own slot; other keys
+        may belong to groups with other window lengths, so their expiry and
+        eviction are decided on the stored expiry time.
+        """
+        free_offset = None
+        victim_offset, victim_expiry = None, None
+        for way in range(self._ways):
+            offset = (base + way) * _SLOT.size
+            slot_hash, slot_window, slot_expiry, previous, current = _SLOT.unpack_from(ring, offset)
+            if slot_hash == key_hash:
+                if slot_window == window:
+                    return offset, previous, current
+                if slot_window == window - 1:
+                    return offset, current, 0
+                return offset, 0, 0
+            if free_offset is None and (slot_hash == 0 or slot_expiry <= now):
+                free_offset = offset  # Empty or expired: reclaim without evicting anything live
+            elif victim_expiry is None or slot_expiry < victim_expiry:
+                victim_offset, victim_expiry = offset, slot_expiry
+        if free_offset is not None:
+            return free_offset, 0, 0
+        self._evictions += 1
+        return victim_offset, 0, 0
+
+    def get_stats(self) -> Dict[str, object]:
+        return {
+            'backend': 'shared_memory' if self._shared else 'local',
+            'slots': self._sets * self._ways,
+            'ways': self._ways,
+            'evictions': self._evictions,
+            'default_limit': {'requests': self.policy.default.requests,
+                              'window_seconds': self.policy.default.window_seconds},
+            'groups': {prefix: {'requests': limit.requests, 'window_seconds': limit.window_seconds}
+                       for prefix, limit in self.policy.groups.items()},
+        }
+
+    def reset(self) -> None:
+        """Forget all counters."""
+        with self._lock:
+            self._ring[:] = bytes(len(self._ring))
+
+
+def build_rate_limiter(default: RateLimit, groups_spec: str = '', slots: int = 65536,
+                       shared: bool = False) -> SlidingWindowRateLimiter:
+    """Build a limiter from settings values."""
+    policy = RateLimitPolicy(default, parse_rate_limit_groups(groups_spec))
+    limiter = SlidingWindowRateLimiter(policy, slots=slots, shared=shared)
+    logger.info(f"Rate limiter ready: {limiter.get_stats()}")
+    return limiter
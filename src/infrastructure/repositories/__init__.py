@@ -13,6 +13,10 @@
 
 """Infrastructure repository implementations."""
 
+from .async_postgres_campaign_repository import AsyncPostgresCampaignRepository
+from .async_postgres_click_repository import AsyncPostgresClickRepository
+from .async_postgres_conversion_repository import AsyncPostgresConversionRepository
+from .async_postgres_pre_click_data_repository import AsyncPostgresPreClickDataRepository
 from .in_memory_analytics_repository import InMemoryAnalyticsRepository
 from .in_memory_campaign_repository import InMemoryCampaignRepository
 from .in_memory_click_repository import InMemoryClickRepository
@@ -30,6 +34,7 @@ from .postgres_conversion_repository import PostgresConversionRepository
 from .postgres_customer_ltv_repository import PostgresCustomerLtvRepository
 from .postgres_event_repository import PostgresEventRepository
 from .postgres_form_repository import PostgresFormRepository
+from .postgres_fraud_rule_repository import PostgresFraudRuleRepository
 from .postgres_goal_repository import PostgresGoalRepository
 from .postgres_impression_repository import PostgresImpressionRepository
 from .postgres_landing_page_repository import PostgresLandingPageRepository
@@ -45,6 +50,7 @@ from .sqlite_click_repository import SQLiteClickRepository
 from .sqlite_conversion_repository import SQLiteConversionRepository
 from .sqlite_event_repository import SQLiteEventRepository
 from .sqlite_form_repository import SQLiteFormRepository
+from .sqlite_fraud_rule_repository import SQLiteFraudRuleRepository
 from .sqlite_goal_repository import SQLiteGoalRepository
 from .sqlite_ltv_repository import SQLiteLTVRepository
 from .sqlite_postback_repository import SQLitePostbackRepository
@@ -73,6 +79,7 @@ __all__ = [
     'SQLiteLTVRepository',
     'SQLiteRetentionRepository',
     'SQLiteFormRepository',
+    'SQLiteFraudRuleRepository',
     'PostgresCampaignRepository',
     'PostgresClickRepository',
     'PostgresImpressionRepository',
@@ -87,5 +94,10 @@ __all__ = [
     'PostgresPreClickDataRepository',
     'PostgresLTVRepository',
     'PostgresRetentionRepository',
-    'PostgresFormRepository'
+    'PostgresFormRepository',
+    'PostgresFraudRuleRepository',
+    'AsyncPostgresCampaignRepository',
+    'AsyncPostgresClickRepository',
+    'AsyncPostgresConversionRepository',
+    'AsyncPostgresPreClickDataRepository'
 ]
@@ -0,0 +1,171 @@
+# Copyright (c) 2025 Bivex
+#
+# Author: Bivex
+# Available for contact via email: support@b-b.top
+# For up-to-date contact information:
+# https://github.com/bivex
+#
+# Created: 2026-10-16T09:12:04
+# Last Updated: 2026-10-16T09:12:04
+#
+# Licensed under the MIT License.
+# Commercial licensing available upon request.
+
+"""Asyncio-native PostgreSQL campaign repository implementation."""
+
+import time
+from datetime import datetime
+from typing import List, Optional
+
+from .async_postgres_repository import AsyncPostgresRepository
+from .postgres_campaign_repository import PostgresCampaignRepository
+from ...domain.entities.campaign import Campaign
+from ...domain.repositories.campaign_repository import CampaignRepository
+from ...domain.value_objects import CampaignId
+
+UPSERT_CAMPAIGN_SQL = """
+    INSERT INTO campaigns
+    (id, name, description, status, cost_model, payout_amount, payout_currency,
+     safe_page_url, offer_page_url, daily_budget_amount, daily_budget_currency,
+     total_budget_amount, total_budget_currency, start_date, end_date,
+     clicks_count, conversions_count, spent_amount, spent_currency,
+     created_at, updated_at, is_deleted)
+    VALUES ($1, $2, $3, $4, $5, $6, $7, $8, $9, $10, $11, $12, $13, $14, $15, $16, $17, $18, $19, $20, $21, $22)
+    ON CONFLICT (id) DO UPDATE SET
+        name = EXCLUDED.name,
+        description = EXCLUDED.description,
+        status = EXCLUDED.status,
+        cost_model = EXCLUDED.cost_model,
+        payout_amount = EXCLUDED.payout_amount,
+        payout_currency = EXCLUDED.payout_currency,
+        safe_page_url = EXCLUDED.safe_page_url,
+        offer_page_url = EXCLUDED.offer_page_url,
+        daily_budget_amount = EXCLUDED.daily_budget_amount,
+        daily_budget_currency = EXCLUDED.daily_budget_currency,
+        total_budget_amount = EXCLUDED.total_budget_amount,
+        total_budget_currency = EXCLUDED.total_budget_currency,
+        start_date = EXCLUDED.start_date,
+        end_date = EXCLUDED.end_date,
+        spent_amount = EXCLUDED.spent_amount,
+        spent_currency = EXCLUDED.spent_currency,
+        updated_at = EXCLUDED.updated_at,
+        is_deleted = EXCLUDED.is_deleted
+"""
+
+FIND_CAMPAIGN_BY_ID_SQL = "SELECT * FROM campaigns WHERE id = $1 AND is_deleted = FALSE"
+
+# Click and conversion counters are only ever incremented relative to the stored value (see
+# UPSERT_CAMPAIGN_SQL, which leaves them alone on conflict), so concurrent writers cannot lose
+# increments. Spend is saved with the rest of the campaign by the upsert.
+UPDATE_CAMPAIGN_COUNTERS_SQL = """
+    UPDATE campaigns AS c
+    SET clicks_count = COALESCE(c.clicks_count, 0) + d.clicks,
+        conversions_count = COALESCE(c.conversions_count, 0) + d.conversions,
+        updated_at = $1
+    FROM unnest($2::text[], $3::bigint[], $4::bigint[])
+         AS d(id, clicks, conversions)
+    WHERE c.id = d.id
+"""
+
+
+class AsyncPostgresCampaignRepository(AsyncPostgresRepository, CampaignRepository):
+    """asyncpg implementation of CampaignRepository; every method is a coroutine."""
+
+    # asyncpg records support the same ``row["column"]`` access as the psycopg2 dict rows,
+    # so the row mapping (with its lenient Money/Url parsing) is shared with the sync repository.
+    _row_to_campaign = PostgresCampaignRepository._row_to_campaign
+
+    COUNT_CACHE_TTL = 30  # seconds
+
+    def __init__(self, container, counters=None):
+        super().__init__(container)
+        self._count_cache = None
+        self._count_cache_time = 0.0
+        # Optional CampaignCounterAggregator whose pending increments are merged into reads
+        self._counters = counters
+
+    def _merge_pending_counters(self, campaign: Campaign) -> Campaign:
+        """Add not-yet-flushed counter increments of this process to a loaded campaign."""
+        if self._counters is not None:
+            self._counters.merge_into(campaign)
+        return campaign
+
+    def _campaign_params(self, campaign: Campaign) -> tuple:
+        """Positional parameters for UPSERT_CAMPAIGN_SQL."""
+        return (
+            campaign.id.value, campaign.name, campaign.description, campaign.status.value,
+            campaign.cost_model,
+            campaign.payout.amount if campaign.payout else None,
+            campaign.payout.currency if campaign.payout else None,
+            campaign.safe_page_url.value if campaign.safe_page_url else None,
+            campaign.offer_page_url.value if campaign.offer_page_url else None,
+            campaign.daily_budget.amount if campaign.daily_budget else None,
+            campaign.daily_budget.currency if campaign.daily_budget else None,
+            campaign.total_budget.amount if campaign.total_budget else None,
+            campaign.total_budget.currency if campaign.total_budget else None,
+            self._naive_utc(campaign.start_date), self._naive_utc(campaign.end_date),
+            campaign.clicks_count, campaign.conversions_count,
+            campaign.spent_amount.amount if campaign.spent_amount else 0.0,
+            campaign.spent_amount.currency if campaign.spent_amount else "USD",
+            self._naive_utc(campaign.created_at), self._naive_utc(campaign.updated_at), False
+        )
+
+    async def save(self, campaign: Campaign, conn=None) -> None:
+        """Save a campaign."""
+        await self._execute(UPSERT_CAMPAIGN_SQL, *self._campaign_params(campaign), conn=conn)
+
+    async def apply_counter_deltas(self, deltas) -> None:
+        """Atomically add aggregated counter deltas ({campaign_id: CounterDelta}) in one UPDATE."""
+        if not deltas:
+            return
+        ids = list(deltas.keys())
+        await self._execute(UPDATE_CAMPAIGN_COUNTERS_SQL,
+                            datetime.now(),
+                            ids,
+                            [deltas[campaign_id].clicks for campaign_id in ids],
+                            [deltas[campaign_id].conversions for campaign_id in ids])
+
+    async def find_by_id(self, campaign_id: CampaignId, conn=None) -> Optional[Campaign]:
+        """Find campaign by ID."""
+        row = await self._fetchrow(FIND_CAMPAIGN_BY_ID_SQL, campaign_id.value, conn=conn)
+        return self._merge_pending_counters(self._row_to_campaign(row)) if row else None
+
+    async def find_all(self, limit: int = 50, offset: int = 0) -> List[Campaign]:
+        """Find all campaigns with pagination."""
+        rows = await self._fetch("""
+                                 SELECT *
+                                 FROM campaigns
+                                 WHERE is_deleted = FALSE
+                                 ORDER BY created_at DESC
+                                 LIMIT $1 OFFSET $2
+                                 """, limit, offset)
+        campaigns = []
+        for row in rows:
+            try:
+                campaigns.append(self._merge_pending_counters(self._row_to_campaign(row)))
+            except ValueError:
+                # Skip rows that cannot be mapped, same as the sync repository
+                continue
+        return campaigns
+
+    async def exists_by_id(self, campaign_id: CampaignId) -> bool:
+        """Check if campaign exists by ID."""
+        row = await self._fetchrow("SELECT 1 FROM campaigns WHERE id = $1 AND is_deleted = FALSE",
+                                   campaign_id.value)
+        return row is not None
+
+    async def delete_by_id(self, campaign_id: CampaignId) -> None:
+        """Delete campaign by ID."""
+        await self._execute("UPDATE campaigns SET is_deleted = TRUE, updated_at = $1 WHERE id = $2",
+                            datetime.now(), campaign_id.value)
+
+    async def count_all(self) -> int:
+        """Count total campaigns with caching."""
+        current_time = time.time()
+        if self._count_cache is not None and current_time - self._count_cache_time < self.COUNT_CACHE_TTL:
+            return self._count_cache
+
+        count = await self._fetchval("SELECT COUNT(*) FROM campaigns WHERE is_deleted = FALSE")
+        self._count_cache = count
+        self._count_cache_time = current_time
+        return count
@@ -0,0 +1,223 @@
+# Copyright (c) 2025 Bivex
+#
+# Author: Bivex
+# Available for contact via email: support@b-b.top
+# For up-to-date contact information:
+# https://github.com/bivex
+#
+# Created: 2026-10-16T09:12:04
+# Last Updated: 2026-10-16T09:12:04
+#
+# Licensed under the MIT License.
+# Commercial licensing available upon request.
+
+"""Asyncio-native PostgreSQL click repository implementation."""
+
+from datetime import date
+from typing import List, Optional
+
+from .async_postgres_repository import AsyncPostgresRepository
+from ...domain.entities.click import Click
+from ...domain.repositories.click_repository import ClickRepository
+from ...domain.value_objects import CampaignId, ClickId
+
+CLICK_COLUMNS = (
+    'id', 'campaign_id', 'click_id', 'ip_address', 'user_agent', 'referrer', 'is_valid',
+    'sub1', 'sub2', 'sub3', 'sub4', 'sub5', 'click_id_param', 'affiliate_sub', 'affiliate_sub2',
+    'landing_page_id', 'campaign_offer_id', 'traffic_source_id',
+    'conversion_type', 'converted_at', 'created_at',
+)
+
+# Per-connection staging table for batched writes; rows vanish at commit.
+CREATE_CLICK_STAGING_SQL = (
+    "CREATE TEMP TABLE IF NOT EXISTS clicks_ingest (LIKE clicks INCLUDING DEFAULTS) ON COMMIT DELETE ROWS"
+)
+
+MERGE_CLICK_STAGING_SQL = (
+    f"INSERT INTO clicks ({', '.join(CLICK_COLUMNS)}) "
+    f"SELECT {', '.join(CLICK_COLUMNS)} FROM clicks_ingest "
+    f"ON CONFLICT (id) DO UPDATE SET "
+    + ', '.join(f"{col} = EXCLUDED.{col}" for col in CLICK_COLUMNS if col not in ('id', 'created_at'))
+)
+
+# xmax is 0 only on rows this statement inserted, not on conflicting rows it updated
+MERGE_CLICK_STAGING_RETURNING_SQL = MERGE_CLICK_STAGING_SQL + " RETURNING id, (xmax = 0) AS inserted"
+
+UPSERT_CLICK_SQL = """
+    INSERT INTO clicks
+    (id, campaign_id, click_id, ip_address, user_agent, referrer, is_valid,
+     sub1, sub2, sub3, sub4, sub5, click_id_param, affiliate_sub, affiliate_sub2,
+     landing_page_id, campaign_offer_id, traffic_source_id,
+     conversion_type, converted_at, created_at)
+    VALUES ($1, $2, $3, $4, $5, $6, $7, $8, $9, $10, $11, $12, $13, $14, $15, $16, $17, $18, $19, $20, $21)
+    ON CONFLICT (id) DO UPDATE SET
+        campaign_id = EXCLUDED.campaign_id,
+        click_id = EXCLUDED.click_id,
+        ip_address = EXCLUDED.ip_address,
+        user_agent = EXCLUDED.user_agent,
+        referrer = EXCLUDED.referrer,
+        is_valid = EXCLUDED.is_valid,
+        sub1 = EXCLUDED.sub1,
+        sub2 = EXCLUDED.sub2,
+        sub3 = EXCLUDED.sub3,
+        sub4 = EXCLUDED.sub4,
+        sub5 = EXCLUDED.sub5,
+        click_id_param = EXCLUDED.click_id_param,
+        affiliate_sub = EXCLUDED.affiliate_sub,
+        affiliate_sub2 = EXCLUDED.affiliate_sub2,
+        landing_page_id = EXCLUDED.landing_page_id,
+        campaign_offer_id = EXCLUDED.campaign_offer_id,
+        traffic_source_id = EXCLUDED.traffic_source_id,
+        conversion_type = EXCLUDED.conversion_type,
+        converted_at = EXCLUDED.converted_at
+"""
+
+
+class AsyncPostgresClickRepository(AsyncPostgresRepository, ClickRepository):
+    """asyncpg implementation of ClickRepository; every method is a coroutine."""
+
+    def _click_params(self, click: Click) -> tuple:
+        """Positional parameters for UPSERT_CLICK_SQL."""
+        return (
+            self._extract_value(click.id), self._extract_value(click.campaign_id),
+            self._extract_value(click.id),
+            click.ip_address, click.user_agent, click.referrer,
+            click.is_valid, click.sub1, click.sub2, click.sub3, click.sub4, click.sub5,
+            click.click_id_param, click.affiliate_sub, click.affiliate_sub2,
+            click.landing_page_id, click.campaign_offer_id, click.traffic_source_id,
+            click.conversion_type, self._naive_utc(click.converted_at), self._naive_utc(click.created_at)
+        )
+
+    def _row_to_click(self, row) -> Click:
+        """Convert database row to Click entity."""
+        return Click(
+            id=ClickId.from_string(row["id"]),
+            campaign_id=CampaignId(row["campaign_id"]) if row["campaign_id"] else None,
+            ip_address=str(row["ip_address"]) if row["ip_address"] is not None else None,
+            user_agent=row["user_agent"],
+            referrer=row["referrer"],
+            is_valid=row["is_valid"],
+            sub1=row["sub1"],
+            sub2=row["sub2"],
+            sub3=row["sub3"],
+            sub4=row["sub4"],
+            sub5=row["sub5"],
+            click_id_param=row["click_id_param"],
+            affiliate_sub=row["affiliate_sub"],
+            affiliate_sub2=row["affiliate_sub2"],
+            landing_page_id=row["landing_page_id"],
+            campaign_offer_id=row["campaign_offer_id"],
+            traffic_source_id=row["traffic_source_id"],
+            conversion_type=row["conversion_type"],
+            converted_at=row["converted_at"],
+            created_at=row["created_at"],
+        )
+
+    async def save(self, click: Click, conn=None) -> None:
+        """Save a click."""
+        await self._execute(UPSERT_CLICK_SQL, *self._click_params(click), conn=conn)
+
+    def _staging_records(self, clicks: List[Click]) -> List[tuple]:
+        # A single INSERT ... ON CONFLICT cannot update the same row twice; last write wins
+        latest = {}
+        for click in clicks:
+            latest[self._extract_value(click.id)] = click
+        return [self._click_params(click) for click in latest.values()]
+
+    async def save_many(self, clicks: List[Click]) -> int:
+        """Save a batch of clicks with one binary COPY into a staging table and one merge."""
+        if not clicks:
+            return 0
+        records = self._staging_records(clicks)
+
+        pool = await self._get_pool()
+        async with pool.transaction() as conn:
+            await conn.execute(CREATE_CLICK_STAGING_SQL)
+            await conn.copy_records_to_table('clicks_ingest', records=records, columns=CLICK_COLUMNS)
+            await conn.execute(MERGE_CLICK_STAGING_SQL)
+        return len(records)
+
+    async def upsert_many(self, clicks: List[Click]) -> List[str]:
+        """Save a batch like ``save_many``. Returns the ids of clicks that were not stored before."""
+        if not clicks:
+            return []
+        records = self._staging_records(clicks)
+
+        pool = await self._get_pool()
+        async with pool.transaction() as conn:
+            await conn.execute(CREATE_CLICK_STAGING_SQL)
+            await conn.copy_records_to_table('clicks_ingest', records=records, columns=CLICK_COLUMNS)
+            rows = await conn.fetch(MERGE_CLICK_STAGING_RETURNING_SQL)
+        return [row["id"] for row in rows if row["inserted"]]
+
+    async def find_by_id(self, click_id: ClickId) -> Optional[Click]:
+        """Find click by ID."""
+        row = await self._fetchrow("SELECT * FROM clicks WHERE id = $1", click_id.value)
+        return self._row_to_click(row) if row else None
+
+    async def find_by_campaign_id(self, campaign_id: str, limit: int = 100,
+                                  offset: int = 0) -> List[Click]:
+        """Find clicks by campaign ID."""
+        rows = await self._fetch("""
+                                 SELECT *
+                                 FROM clicks
+                                 WHERE campaign_id = $1
+                                 ORDER BY created_at DESC
+                                 LIMIT $2 OFFSET $3
+                                 """, campaign_id, limit, offset)
+        return [self._row_to_click(row) for row in rows]
+
+    async def find_by_filters(self, filters) -> List[Click]:
+        """Find clicks by filter criteria."""
+        conditions = []
+        params = []
+
+        if filters.campaign_id is not None:
+            params.append(str(filters.campaign_id))
+            conditions.append(f"campaign_id = ${len(params)}")
+
+        if filters.is_valid is not None:
+            params.append(filters.is_valid)
+            conditions.append(f"is_valid = ${len(params)}")
+
+        if filters.start_date is not None:
+            params.append(filters.start_date)
+            conditions.append(f"created_at >= ${len(params)}")
+
+        if filters.end_date is not None:
+            params.append(filters.end_date)
+            conditions.append(f"created_at <= ${len(params)}")
+
+        where = " AND ".join(conditions) if conditions else "TRUE"
+        params.extend([filters.limit, filters.offset])
+        query = (f"SELECT * FROM clicks WHERE {where} "
+                 f"ORDER BY created_at DESC LIMIT ${len(params) - 1} OFFSET ${len(params)}")
+
+        rows = await self._fetch(query, *params)
+        return [self._row_to_click(row) for row in rows]
+
+    async def count_by_campaign_id(self, campaign_id: str) -> int:
+        """Count clicks for a campaign."""
+        return await self._fetchval("SELECT COUNT(*) FROM clicks WHERE campaign_id = $1", str(campaign_id))
+
+    async def count_conversions(self, campaign_id: str) -> int:
+        """Count conversions for a campaign."""
+        return await self._fetchval("""
+                                    SELECT COUNT(*)
+                                    FROM clicks
+                                    WHERE campaign_id = $1
+                                      AND conversion_type IS NOT NULL
+                                    """, str(campaign_id))
+
+    async def get_clicks_in_date_range(self, campaign_id: str,
+                                       start_date: date, end_date: date) -> List[Click]:
+        """Get clicks within date range for analytics."""
+        rows = await self._fetch("""
+                                 SELECT *
+                                 FROM clicks
+                                 WHERE campaign_id = $1
+                                   AND DATE(created_at) >= $2
+                                   AND DATE(created_at) <= $3
+                                 ORDER BY created_at DESC
+                                 """, campaign_id, start_date, end_date)
+        return [self._row_to_click(row) for row in rows]
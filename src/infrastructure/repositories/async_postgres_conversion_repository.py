@@ -0,0 +1,236 @@
+# Copyright (c) 2025 Bivex
+#
+# Author: Bivex
+# Available for contact via email: support@b-b.top
+# For up-to-date contact information:
+# https://github.com/bivex
+#
+# Created: 2026-10-16T09:12:04
+# Last Updated: 2026-10-16T09:12:04
+#
+# Licensed under the MIT License.
+# Commercial licensing available upon request.
+
+"""Asyncio-native PostgreSQL conversion repository implementation."""
+
+import json
+from datetime import datetime
+from typing import Optional, List, Dict, Any
+
+from .async_postgres_repository import AsyncPostgresRepository
+from .postgres_conversion_repository import CustomJSONEncoder
+from ...domain.entities.conversion import Conversion
+from ...domain.repositories.conversion_repository import ConversionRepository
+from ...domain.value_objects.financial.money import Money
+
+# metadata is passed as pre-encoded text and cast server-side so that Money/Decimal
+# values go through CustomJSONEncoder instead of the pool's plain json.dumps codec.
+UPSERT_CONVERSION_SQL = """
+    INSERT INTO conversions
+    (id, click_id, campaign_id, conversion_type, conversion_value,
+     currency, status, external_id, metadata, created_at, updated_at)
+    VALUES ($1, $2, $3, $4, $5, $6, $7, $8, $9::text::jsonb, $10, $11)
+    ON CONFLICT (id) DO UPDATE SET
+        click_id = EXCLUDED.click_id,
+        campaign_id = EXCLUDED.campaign_id,
+        conversion_type = EXCLUDED.conversion_type,
+        conversion_value = EXCLUDED.conversion_value,
+        currency = EXCLUDED.currency,
+        status = EXCLUDED.status,
+        external_id = EXCLUDED.external_id,
+        metadata = EXCLUDED.metadata,
+        updated_at = EXCLUDED.updated_at
+"""
+
+_STATS_GROUP_COLUMNS = ('conversion_type', 'campaign_id', 'status')
+
+
+class AsyncPostgresConversionRepository(AsyncPostgresRepository, ConversionRepository):
+    """asyncpg implementation of ConversionRepository; every method is a coroutine."""
+
+    def _row_to_conversion(self, row) -> Conversion:
+        """Convert database row to Conversion entity."""
+        conversion_value = None
+        if row["conversion_value"] and float(row["conversion_value"]) > 0:
+            conversion_value = Money(
+                amount=float(row["conversion_value"]),
+                currency=row["currency"] or "USD"
+            )
+
+        metadata = row["metadata"] or {}
+
+        return Conversion(
+            id=row["id"],
+            click_id=row["click_id"],
+            conversion_type=row["conversion_type"],
+            conversion_value=conversion_value,
+            order_id=metadata.get('order_id'),
+            product_id=metadata.get('product_id'),
+            campaign_id=int(row["campaign_id"]) if row["campaign_id"] else None,
+            offer_id=metadata.get('offer_id'),
+            landing_page_id=metadata.get('landing_page_id'),
+            user_id=metadata.get('user_id'),
+            session_id=metadata.get('session_id'),
+            ip_address=metadata.get('ip_address'),
+            user_agent=metadata.get('user_agent'),
+            referrer=metadata.get('referrer'),
+            metadata=metadata,
+            timestamp=row["created_at"],
+            processed=row["status"] == "processed",
+            created_at=row["created_at"],
+            updated_at=row["updated_at"]
+        )
+
+    def _conversion_params(self, conversion: Conversion) -> tuple:
+        """Positional parameters for UPSERT_CONVERSION_SQL."""
+        metadata = conversion.metadata.copy() if conversion.metadata else {}
+        metadata.update({
+            'order_id': conversion.order_id,
+            'product_id': conversion.product_id,
+            'offer_id': conversion.offer_id,
+            'landing_page_id': conversion.landing_page_id,
+            'user_id': conversion.user_id,
+            'session_id': conversion.session_id,
+            'ip_address': conversion.ip_address,
+            'user_agent': conversion.user_agent,
+            'referrer': conversion.referrer,
+        })
+
+        return (
+            conversion.id, conversion.click_id,
+            str(conversion.campaign_id) if conversion.campaign_id else None,
+            conversion.conversion_type,
+            conversion.conversion_value.amount if conversion.conversion_value else 0.0,
+            conversion.conversion_value.currency if conversion.conversion_value else "USD",
+            "processed" if conversion.processed else "pending",
+            conversion.order_id,
+            json.dumps(metadata, cls=CustomJSONEncoder),
+            self._naive_utc(conversion.created_at), self._naive_utc(conversion.updated_at)
+        )
+
+    async def save(self, conversion: Conversion, conn=None) -> None:
+        """Save a conversion."""
+        await self._execute(UPSERT_CONVERSION_SQL, *self._conversion_params(conversion), conn=conn)
+
+    async def get_by_id(self, conversion_id: str) -> Optional[Conversion]:
+        """Get conversion by ID."""
+        row = await self._fetchrow("SELECT * FROM conversions WHERE id = $1", conversion_id)
+        return self._row_to_conversion(row) if row else None
+
+    async def get_by_click_id(self, click_id: str) -> List[Conversion]:
+        """Get conversions by click ID."""
+        rows = await self._fetch("""
+                                 SELECT *
+                                 FROM conversions
+                                 WHERE click_id = $1
+                                 ORDER BY created_at DESC
+                                 """, click_id)
+        return [self._row_to_conversion(row) for row in rows]
+
+    async def get_by_order_id(self, order_id: str) -> Optional[Conversion]:
+        """Get conversion by order ID."""
+        row = await self._fetchrow("SELECT * FROM conversions WHERE external_id = $1", order_id)
+        return self._row_to_conversion(row) if row else None
+
+    async def get_unprocessed(self, limit: int = 100) -> List[Conversion]:
+        """Get unprocessed conversions for postback sending."""
+        rows = await self._fetch("""
+                                 SELECT *
+                                 FROM conversions
+                                 WHERE status = 'pending'
+                                 ORDER BY created_at ASC
+                                 LIMIT $1
+                                 """, limit)
+        return [self._row_to_conversion(row) for row in rows]
+
+    async def mark_processed(self, conversion_id: str) -> None:
+        """Mark conversion as processed (postbacks sent)."""
+        await self._execute("""
+                            UPDATE conversions
+                            SET status     = 'processed',
+                                updated_at = $1
+                            WHERE id = $2
+                            """, datetime.now(), conversion_id)
+
+    async def get_conversions_in_timeframe(
+            self,
+            start_time: datetime,
+            end_time: datetime,
+            conversion_type: Optional[str] = None,
+            limit: int = 1000
+    ) -> List[Conversion]:
+        """Get conversions within a time range."""
+        start_time, end_time = self._naive_utc(start_time), self._naive_utc(end_time)
+        if conversion_type:
+            rows = await self._fetch("""
+                                     SELECT *
+                                     FROM conversions
+                                     WHERE created_at >= $1
+                                       AND created_at <= $2
+                                       AND conversion_type = $3
+                                     ORDER BY created_at DESC
+                                     LIMIT $4
+                                     """, start_time, end_time, conversion_type, limit)
+        else:
+            rows = await self._fetch("""
+                                     SELECT *
+                                     FROM conversions
+                                     WHERE created_at >= $1
+                                       AND created_at <= $2
+                                     ORDER BY created_at DESC
+                                     LIMIT $3
+                                     """, start_time, end_time, limit)
+        return [self._row_to_conversion(row) for row in rows]
+
+    async def get_conversion_stats(
+            self,
+            start_time: datetime,
+            end_time: datetime,
+            group_by: str = 'conversion_type'
+    ) -> Dict[str, Any]:
+        """Get conversion statistics grouped by specified field."""
+        # group_by is interpolated, so only whitelisted column names are accepted
+        column = group_by if group_by in _STATS_GROUP_COLUMNS else 'conversion_type'
+        rows = await self._fetch(f"""
+                                 SELECT {column},
+                                        COUNT(*) as count,
+                                        SUM(conversion_value) as total_value
+                                 FROM conversions
+                                 WHERE created_at >= $1
+                                   AND created_at <= $2
+                                 GROUP BY {column}
+                                 """, self._naive_utc(start_time), self._naive_utc(end_time))
+
+        result = {}
+        for row in rows:
+            key = row[0] if row[0] is not None else 'unknown'
+            result[key] = {
+                'count': row[1],
+                'total_value': float(row[2]) if row[2] else 0.0
+            }
+        return result
+
+    async def get_total_revenue(
+            self,
+            start_time: datetime,
+            end_time: datetime,
+            conversion_type: Optional[str] = None
+    ) -> float:
+        """Get total revenue from conversions in time range."""
+        start_time, end_time = self._naive_utc(start_time), self._naive_utc(end_time)
+        if conversion_type:
+            total = await self._fetchval("""
+                                         SELECT SUM(conversion_value)
+                                         FROM conversions
+                                         WHERE created_at >= $1
+                                           AND created_at <= $2
+                                           AND conversion_type = $3
+                                         """, start_time, end_time, conversion_type)
+        else:
+            total = await self._fetchval("""
+                                         SELECT SUM(conversion_value)
+                                         FROM conversions
+                                         WHERE created_at >= $1
+                                           AND created_at <= $2
+                                         """, start_time, end_time)
+        return float(total) if total else 0.0
@@ -0,0 +1,114 @@
+# Copyright (c) 2025 Bivex
+#
+# Author: Bivex
+# Available for contact via email: support@b-b.top
+# For up-to-date contact information:
+# https://github.com/bivex
+#
+# Created: 2026-10-16T09:12:04
+# Last Updated: 2026-10-16T09:12:04
+#
+# Licensed under the MIT License.
+# Commercial licensing available upon request.
+
+"""Asyncio-native PostgreSQL pre-click data repository implementation."""
+
+import asyncio
+from typing import Optional
+
+from loguru import logger
+
+from .async_postgres_repository import AsyncPostgresRepository
+from ...domain.entities.pre_click_data import PreClickData
+from ...domain.repositories.pre_click_data_repository import PreClickDataRepository
+from ...domain.value_objects import ClickId, CampaignId
+
+
+class AsyncPostgresPreClickDataRepository(AsyncPostgresRepository, PreClickDataRepository):
+    """asyncpg implementation of PreClickDataRepository.
+
+    Each operation is a single statement on the event loop instead of the
+    getconn/cursor/execute/fetch/commit/putconn executor hops of
+    PostgresPreClickDataRepository.
+    """
+
+    def __init__(self, container):
+        super().__init__(container)
+        self._db_initialized_event = asyncio.Event()
+
+    async def _initialize_db(self) -> None:
+        """Initialize database schema (runs once in background)."""
+        if self._db_initialized_event.is_set():
+            return
+
+        try:
+            pool = await self._get_pool()
+            async with pool.transaction() as conn:
+                await conn.execute("""
+                                   CREATE TABLE IF NOT EXISTS pre_click_data
+                                   (
+                                       click_id        TEXT PRIMARY KEY,
+                                       campaign_id     TEXT NOT NULL,
+                                       timestamp       TIMESTAMP WITH TIME ZONE NOT NULL,
+                                       tracking_params JSONB,
+                                       metadata        JSONB
+                                   )
+                                   """)
+                await conn.execute(
+                    "CREATE INDEX IF NOT EXISTS idx_pre_click_data_campaign_id ON pre_click_data(campaign_id)")
+                await conn.execute(
+                    "CREATE INDEX IF NOT EXISTS idx_pre_click_data_timestamp ON pre_click_data(timestamp)")
+            logger.info("pre_click_data schema initialized (async)")
+        except Exception as e:
+            logger.error(f"Error initializing pre_click_data database schema: {e}")
+            raise
+        finally:
+            # Never leave callers waiting forever; operations fail loudly if the schema is wrong.
+            self._db_initialized_event.set()
+
+    def _row_to_pre_click_data(self, row) -> PreClickData:
+        """Convert database row to PreClickData entity."""
+        return PreClickData(
+            click_id=ClickId(row["click_id"]),
+            campaign_id=CampaignId(row["campaign_id"]),
+            timestamp=row["timestamp"],
+            tracking_params=row["tracking_params"] or {},
+            metadata=row["metadata"] or {},
+        )
+
+    async def save(self, pre_click_data: PreClickData) -> None:
+        """Saves pre-click data."""
+        await self._db_initialized_event.wait()
+        await self._execute("""
+                            INSERT INTO pre_click_data
+                                (click_id, campaign_id, timestamp, tracking_params, metadata)
+                            VALUES ($1, $2, $3, $4, $5)
+                            ON CONFLICT (click_id) DO UPDATE SET
+                                campaign_id = EXCLUDED.campaign_id,
+                                timestamp = EXCLUDED.timestamp,
+                                tracking_params = EXCLUDED.tracking_params,
+                                metadata = EXCLUDED.metadata
+                            """,
+                            pre_click_data.click_id.value,
+                            pre_click_data.campaign_id.value,
+                            pre_click_data.timestamp,
+                            pre_click_data.tracking_params,
+                            pre_click_data.metadata)
+
+    async def find_by_click_id(self, click_id: ClickId) -> Optional[PreClickData]:
+        """Finds pre-click data by click ID."""
+        await self._db_initialized_event.wait()
+        row = await self._fetchrow("SELECT * FROM pre_click_data WHERE click_id = $1", click_id.value)
+        return self._row_to_pre_click_data(row) if row else None
+
+    async def delete_by_click_id(self, click_id: ClickId) -> None:
+        """Deletes pre-click data by click ID."""
+        await self._db_initialized_event.wait()
+        await self._execute("DELETE FROM pre_click_data WHERE click_id = $1", click_id.value)
+
+    async def take_by_click_id(self, click_id: ClickId, conn=None) -> Optional[PreClickData]:
+        """Atomically removes and returns pre-click data by click ID (single DELETE ... RETURNING)."""
+        await self._db_initialized_event.wait()
+        row = await self._fetchrow("DELETE FROM pre_click_data WHERE click_id = $1 RETURNING *", click_id.value,
+                                   conn=conn)
+        return self._row_to_pre_click_data(row) if row else None
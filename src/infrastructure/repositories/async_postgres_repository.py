@@ -0,0 +1,78 @@
+# Copyright (c) 2025 Bivex
+#
+# Author: Bivex
+# Available for contact via email: support@b-b.top
+# For up-to-date contact information:
+# https://github.com/bivex
+#
+# Created: 2026-10-16T09:12:04
+# Last Updated: 2026-10-16T09:12:04
+#
+# Licensed under the MIT License.
+# Commercial licensing available upon request.
+
+"""Base class for asyncio-native PostgreSQL repositories."""
+
+from datetime import datetime, timezone
+from typing import Any, List, Optional
+
+
+class AsyncPostgresRepository:
+    """Shared plumbing for repositories backed by AsyncConnectionPool.
+
+    Subclasses issue ``$n``-style queries through ``_fetch``/``_fetchrow``/
+    ``_execute``; every call is a single awaited round-trip on the event loop.
+    Pass ``conn`` to run a call on an already-acquired connection (e.g. inside
+    a transaction).
+    """
+
+    def __init__(self, container):
+        self._container = container
+        self._pool = None
+
+    async def _get_pool(self):
+        """Get the async pool from the container (cached after first use)."""
+        if self._pool is None:
+            self._pool = await self._container.get_async_db_connection_pool()
+        return self._pool
+
+    async def _execute(self, query: str, *args, conn=None) -> str:
+        pool = await self._get_pool()
+        return await pool.execute(query, *args, conn=conn)
+
+    async def _fetch(self, query: str, *args, conn=None) -> List[Any]:
+        pool = await self._get_pool()
+        return await pool.fetch(query, *args, conn=conn)
+
+    async def _fetchrow(self, query: str, *args, conn=None) -> Optional[Any]:
+        pool = await self._get_pool()
+        return await pool.fetchrow(query, *args, conn=conn)
+
+    async def _fetchval(self, query: str, *args, conn=None) -> Any:
+        pool = await self._get_pool()
+        return await pool.fetchval(query, *args, conn=conn)
+
+    @staticmethod
+    def _extract_value(obj):
+        """Extract string value from value objects or return the object if it's already a basic type."""
+        if hasattr(obj, 'value'):
+            return obj.value
+        return obj
+
+    @staticmethod
+    def _naive_utc(value: Optional[datetime]) -> Optional[datetime]:
+        """Convert aware datetimes to naive UTC for ``TIMESTAMP WITHOUT TIME ZONE`` columns.
+
+        psycopg2 silently drops the offset; asyncpg refuses aware values instead.
+        """
+        if value is not None and value.tzinfo is not None:
+            return value.astimezone(timezone.utc).replace(tzinfo=None)
+        return value
+
+    @staticmethod
+    def _status_count(status: str) -> int:
+        """Parse the affected row count from a command tag such as ``DELETE 1``."""
+        try:
+            return int(status.rsplit(' ', 1)[-1])
+        except (AttributeError, ValueError):
+            return 0
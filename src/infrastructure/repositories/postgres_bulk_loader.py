@@ -11,52 +11,220 @@
 # Licensed under the MIT License.
 # Commercial licensing available upon request.
 
-"""PostgreSQL bulk loader with automatic COPY optimization for large datasets."""
-
-import csv
-import io
+"""PostgreSQL bulk loader with automatic COPY optimization for large datasets.
+
+Records may come from any iterable or generator and are streamed into
+``COPY ... FROM STDIN`` through ``CopyStream``, which encodes rows only as
+PostgreSQL reads them: memory stays at one chunk plus the first
+``batch_size_threshold`` records (peeked to choose between COPY and INSERT),
+whatever the row count. Rows go out in COPY text format, with ``None`` sent as
+``\\N`` so it arrives as NULL rather than an empty string, or in binary format
+when every column has a binary encoder below. Upserts (``conflict_resolution``
+'update'/'ignore') COPY into a temporary staging table and merge it into the
+target with a single ``INSERT ... SELECT ... ON CONFLICT``.
+"""
+
+import itertools
+import json
 import logging
+import struct
 import time
+import uuid
 from dataclasses import dataclass
-from typing import List, Dict, Any, Optional
+from datetime import date, datetime, time as dt_time, timezone
+from typing import Any, Callable, Dict, Iterable, Iterator, List, Optional, Sequence, Tuple
 
 logger = logging.getLogger(__name__)
 
+ProgressCallback = Callable[[int], None]
+
+_TEXT_ESCAPES = str.maketrans({'\\': '\\\\', '\t': '\\t', '\n': '\\n', '\r': '\\r'})
+
+_BINARY_HEADER = b'PGCOPY\n\xff\r\n\x00' + struct.pack('>ii', 0, 0)
+_BINARY_TRAILER = struct.pack('>h', -1)
+_BINARY_NULL = struct.pack('>i', -1)
+_PG_EPOCH = datetime(2000, 1, 1, tzinfo=timezone.utc)
+_PG_EPOCH_DATE = date(2000, 1, 1)
+
 
 @dataclass
 class BulkLoadResult:
     """Result of bulk load operation."""
     table_name: str
-    method_used: str  # 'copy' or 'insert'
+    method_used: str  # 'copy', 'copy_merge' or 'insert'
     records_loaded: int
     execution_time: float
     success: bool
     error_message: Optional[str] = None
 
 
+def _text_field(value: Any) -> str:
+    """Render one value as a COPY text-format field."""
+    if value is None:
+        return '\\N'
+    if isinstance(value, bool):
+        text = 't' if value else 'f'
+    elif isinstance(value, (datetime, date, dt_time)):
+        text = value.isoformat()
+    elif isinstance(value, (dict, list)):
+        text = json.dumps(value, default=str)
+    elif isinstance(value, (bytes, bytearray, memoryview)):
+        text = '\\x' + bytes(value).hex()
+    else:
+        text = str(value)
+    return text.translate(_TEXT_ESCAPES)
+
+
+def encode_text_row(row: Sequence[Any]) -> bytes:
+    """Encode one row as a COPY text-format line."""
+    return ('\t'.join(map(_text_field, row)) + '\n').encode('utf-8')
+
+
+def _as_datetime(value) -> datetime:
+    return datetime.fromisoformat(value) if isinstance(value, str) else value
+
+
+def _encode_timestamptz(value) -> bytes:
+    value = _as_datetime(value)
+    if value.tzinfo is None:
+        value = value.replace(tzinfo=timezone.utc)  # Naive datetimes are stored as UTC
+    delta = value - _PG_EPOCH
+    return struct.pack('>q', (delta.days * 86400 + delta.seconds) * 1000000 + delta.microseconds)
+
+
+def _encode_timestamp(value) -> bytes:
+    # Like text input for "timestamp without time zone", an offset is dropped rather than applied
+    return _encode_timestamptz(_as_datetime(value).replace(tzinfo=timezone.utc))
+
+
+def _encode_date(value) -> bytes:
+    if isinstance(value, str):
+        value = date.fromisoformat(value)
+    elif isinstance(value, datetime):
+        value = value.date()
+    return struct.pack('>i', (value - _PG_EPOCH_DATE).days)
+
+
+def _encode_json(value) -> bytes:
+    return (value if isinstance(value, str) else json.dumps(value, default=str)).encode('utf-8')
+
+
+_BINARY_ENCODERS: Dict[str, Callable[[Any], bytes]] = {
+    'bool': lambda v: b'\x01' if v else b'\x00',
+    'int2': lambda v: struct.pack('>h', int(v)),
+    'int4': lambda v: struct.pack('>i', int(v)),
+    'int8': lambda v: struct.pack('>q', int(v)),
+    'float4': lambda v: struct.pack('>f', float(v)),
+    'float8': lambda v: struct.pack('>d', float(v)),
+    'text': lambda v: str(v).encode('utf-8'),
+    'varchar': lambda v: str(v).encode('utf-8'),
+    'bpchar': lambda v: str(v).encode('utf-8'),
+    'name': lambda v: str(v).encode('utf-8'),
+    'bytea': bytes,
+    'uuid': lambda v: uuid.UUID(str(v)).bytes,
+    'json': _encode_json,
+    'jsonb': lambda v: b'\x01' + _encode_json(v),
+    'timestamptz': _encode_timestamptz,
+    'timestamp': _encode_timestamp,
+    'date': _encode_date,
+}
+
+
+def binary_row_encoder(type_names: Sequence[str]) -> Callable[[Sequence[Any]], bytes]:
+    """Build a COPY binary-format row encoder for columns of the given PostgreSQL types."""
+    encoders = [_BINARY_ENCODERS[type_name] for type_name in type_names]
+    field_count = struct.pack('>h', len(encoders))
+
+    def encode(row: Sequence[Any]) -> bytes:
+        parts = [field_count]
+        for encoder, value in zip(encoders, row):
+            if value is None:
+                parts.append(_BINARY_NULL)
+            else:
+                data = encoder(value)
+                parts.append(struct.pack('>i', len(data)))
+                parts.append(data)
+        return b''.join(parts)
+
+    return encode
+
+
+class CopyStream:
+    """Read-only file-like object that feeds COPY FROM STDIN from a row iterator.
+
+    ``read(size)`` encodes just enough rows to return ``size`` bytes, so at most
+    one chunk is held in memory. ``progress`` is called with the number of rows
+    sent after every chunk.
+    """
+
+    def __init__(self, rows: Iterable[Sequence[Any]], encode_row: Callable[[Sequence[Any]], bytes] = encode_text_row,
+                 header: bytes = b'', trailer: bytes = b'', progress: Optional[ProgressCallback] = None):
+        self._rows = iter(rows)
+        self._encode_row = encode_row
+        self._buffer = bytearray(header)
+        self._trailer = trailer
+        self._progress = progress
+        self._exhausted = False
+        self.rows = 0
+
+    def readable(self) -> bool:
+        return True
+
+    def read(self, size: int = -1) -> bytes:
+        while not self._exhausted and (size < 0 or len(self._buffer) < size):
+            row = next(self._rows, None)
+            if row is None:
+                self._buffer += self._trailer
+                self._exhausted = True
+            else:
+                self._buffer += self._encode_row(row)
+                self.rows += 1
+
+        if size < 0 or size > len(self._buffer):
+            size = len(self._buffer)
+        chunk = bytes(self._buffer[:size])
+        del self._buffer[:size]
+        if self._progress is not None and chunk:
+            self._progress(self.rows)
+        return chunk
+
+
 class PostgresBulkLoader:
     """Automatic bulk loader that chooses optimal method based on data size."""
 
-    def __init__(self, connection, batch_size_threshold: int = 1000):
+    def __init__(self, connection, batch_size_threshold: int = 1000, copy_chunk_size: int = 64 * 1024):
         self.connection = connection
         self.batch_size_threshold = batch_size_threshold
+        self.copy_chunk_size = copy_chunk_size
 
-    def bulk_insert(self, table_name: str, records: List[Dict[str, Any]],
-                    conflict_resolution: str = 'none') -> BulkLoadResult:
-        """Automatically choose between COPY and individual INSERTs based on data size."""
+    def bulk_insert(self, table_name: str, records: Iterable[Dict[str, Any]],
+                    conflict_resolution: str = 'none', binary: bool = False,
+                    progress: Optional[ProgressCallback] = None) -> BulkLoadResult:
+        """Automatically choose between COPY and individual INSERTs based on data size.
+
+        Only the first ``batch_size_threshold`` records are buffered to make the
+        choice; larger inputs are streamed through COPY.
+        """
         start_time = time.time()
 
         try:
-            if len(records) >= self.batch_size_threshold:
+            records = iter(records)
+            head = list(itertools.islice(records, self.batch_size_threshold))
+            if len(head) >= self.batch_size_threshold:
                 # Use COPY for large datasets
-                return self._bulk_copy(table_name, records, start_time)
+                return self._bulk_copy(table_name, itertools.chain(head, records), start_time,
+                                       conflict_resolution=conflict_resolution, binary=binary, progress=progress)
             else:
                 # Use individual INSERTs for small datasets
-                return self._bulk_insert(table_name, records, conflict_resolution, start_time)
+                return self._bulk_insert(table_name, head, conflict_resolution, start_time)
 
         except Exception as e:
             execution_time = time.time() - start_time
             logger.error(f"Bulk insert failed for table {table_name}: {e}")
+            try:
+                self.connection.rollback()
+            except Exception:
+                pass
             return BulkLoadResult(
                 table_name=table_name,
                 method_used='failed',
@@ -66,11 +234,14 @@ class PostgresBulkLoader:
                 error_message=str(e)
             )
 
-    def _bulk_copy(self, table_name: str, records: List[Dict[str, Any]], start_time: float) -> BulkLoadResult:
-        """Load data using COPY command."""
+    def _bulk_copy(self, table_name: str, records: Iterable[Dict[str, Any]], start_time: float,
+                   conflict_resolution: str = 'none', columns: Optional[List[str]] = None,
+                   binary: bool = False, progress: Optional[ProgressCallback] = None) -> BulkLoadResult:
+        """Stream records into ``table_name`` with COPY, merging through a staging table for upserts."""
         try:
-            # Get column names from first record
-            if not records:
+            records = iter(records)
+            first = next(records, None)
+            if first is None:
                 return BulkLoadResult(
                     table_name=table_name,
                     method_used='copy',
@@ -79,34 +250,29 @@ class PostgresBulkLoader:
                     success=True
                 )
 
-            columns = list(records[0].keys())
-
-            # Create CSV data in memory
-            csv_buffer = io.StringIO()
-            writer = csv.writer(csv_buffer, quoting=csv.QUOTE_MINIMAL)
-
-            # Write data rows
-            for record in records:
-                row = [record.get(col, '') for col in columns]
-                writer.writerow(row)
-
-            csv_data = csv_buffer.getvalue()
-            csv_buffer.close()
-
-            # Execute COPY command
-            copy_query = f"COPY {table_name} ({', '.join(columns)}) FROM STDIN WITH CSV"
+            # Column names from the first record; keys missing from later records load as NULL
+            columns = columns or list(first.keys())
+            rows = (tuple(record.get(col) for col in columns) for record in itertools.chain((first,), records))
+            merge = conflict_resolution in ('update', 'ignore')
 
             with self.connection.cursor() as cursor:
-                cursor.copy_expert(copy_query, io.StringIO(csv_data))
-                self.connection.commit()
+                target = self._create_staging_table(cursor, table_name) if merge else table_name
+                stream, copy_format = self._copy(cursor, table_name, target, columns, rows, binary, progress)
+                records_loaded = stream.rows
+                if merge:
+                    records_loaded = self._merge_staging_table(cursor, target, table_name, columns,
+                                                               conflict_resolution)
+            self.connection.commit()
 
             execution_time = time.time() - start_time
-            logger.info(f"Successfully loaded {len(records)} records into {table_name} using COPY")
+            method_used = 'copy_merge' if merge else 'copy'
+            logger.info(f"Successfully loaded {records_loaded} of {stream.rows} records into {table_name} "
+                        f"using {copy_format} COPY{' + merge' if merge else ''} in {execution_time:.3f}s")
 
             return BulkLoadResult(
                 table_name=table_name,
-                method_used='copy',
-                records_loaded=len(records),
+                method_used=method_used,
+                records_loaded=records_loaded,
                 execution_time=execution_time,
                 success=True
             )
@@ -115,6 +281,79 @@ class PostgresBulkLoader:
             logger.error(f"COPY bulk load failed for {table_name}: {e}")
             raise
 
+    def copy_records(self, table_name: str, records: Iterable[Dict[str, Any]],
+                     columns: Optional[List[str]] = None, binary: bool = False,
+                     progress: Optional[ProgressCallback] = None) -> int:
+        """Stream records into ``table_name`` with COPY and return the row count.
+
+        Unlike ``bulk_insert`` this neither commits nor rolls back, so the COPY
+        can be one step of a transaction the caller owns (e.g. staging rows to
+        merge with its own statement).
+        """
+        records = iter(records)
+        first = next(records, None)
+        if first is None:
+            return 0
+        columns = columns or list(first.keys())
+        rows = (tuple(record.get(col) for col in columns) for record in itertools.chain((first,), records))
+        with self.connection.cursor() as cursor:
+            stream, _ = self._copy(cursor, table_name, table_name, columns, rows, binary, progress)
+        return stream.rows
+
+    def _copy(self, cursor, table_name: str, target: str, columns: List[str], rows: Iterator[tuple],
+              binary: bool, progress: Optional[ProgressCallback]) -> Tuple[CopyStream, str]:
+        """COPY ``rows`` into ``target``, typed after ``table_name``'s columns; returns the drained stream."""
+        stream, copy_format = self._copy_stream(cursor, table_name, columns, rows, binary, progress)
+        cursor.copy_expert(f"COPY {target} ({', '.join(columns)}) FROM STDIN WITH (FORMAT {copy_format})",
+                           stream, size=self.copy_chunk_size)
+        return stream, copy_format
+
+    def _copy_stream(self, cursor, table_name: str, columns: List[str], rows: Iterator[tuple],
+                     binary: bool, progress: Optional[ProgressCallback]) -> Tuple[CopyStream, str]:
+        """Build the COPY source and its format; binary only when every column type has a binary encoder."""
+        if binary:
+            type_names = self._column_types(cursor, table_name, columns)
+            unsupported = [f"{col} ({type_names.get(col)})" for col in columns
+                           if type_names.get(col) not in _BINARY_ENCODERS]
+            if not unsupported:
+                return CopyStream(rows, binary_row_encoder([type_names[col] for col in columns]),
+                                  header=_BINARY_HEADER, trailer=_BINARY_TRAILER, progress=progress), 'binary'
+            logger.info(f"Binary COPY into {table_name} not supported for {', '.join(unsupported)}; using text")
+        return CopyStream(rows, progress=progress), 'text'
+
+    def _column_types(self, cursor, table_name: str, columns: List[str]) -> Dict[str, str]:
+        """Map column names of ``table_name`` to their PostgreSQL type names."""
+        cursor.execute("""
+                       SELECT a.attname, t.typname
+                       FROM pg_attribute a
+                                JOIN pg_type t ON t.oid = a.atttypid
+                       WHERE a.attrelid = %s::regclass
+                         AND a.attnum > 0
+                         AND NOT a.attisdropped
+                       """, (table_name,))
+        return dict(cursor.fetchall())
+
+    def _create_staging_table(self, cursor, table_name: str) -> str:
+        """Create a temporary copy of ``table_name``'s columns, dropped at commit."""
+        staging = f"bulk_staging_{table_name.replace('.', '_')}"
+        cursor.execute(f"DROP TABLE IF EXISTS {staging}")
+        cursor.execute(f"CREATE TEMP TABLE {staging} (LIKE {table_name} INCLUDING DEFAULTS) ON COMMIT DROP")
+        return staging
+
+    def _merge_staging_table(self, cursor, staging: str, table_name: str, columns: List[str],
+                             conflict_resolution: str) -> int:
+        """Merge staged rows into ``table_name`` with one INSERT ... SELECT; returns rows written."""
+        columns_str = ', '.join(columns)
+        if conflict_resolution == 'update' and 'id' in columns:
+            # ON CONFLICT DO UPDATE cannot touch a row twice: keep the last staged row per id.
+            # The staging table is only appended to, so ctid follows COPY order.
+            select = f"SELECT DISTINCT ON (id) {columns_str} FROM {staging} ORDER BY id, ctid DESC"
+        else:
+            select = f"SELECT {columns_str} FROM {staging}"
+        conflict_clause = self._build_conflict_clause(conflict_resolution, columns)
+        cursor.execute(f"INSERT INTO {table_name} ({columns_str}) {select} {conflict_clause}")
+        return cursor.rowcount
+
     def _bulk_insert(self, table_name: str, records: List[Dict[str, Any]],
                      conflict_resolution: str, start_time: float) -> BulkLoadResult:
         """Load data using individual INSERT statements."""
@@ -171,39 +410,32 @@ class PostgresBulkLoader:
         else:
             return ''
 
-    def bulk_insert_clicks(self, clicks: List[Dict[str, Any]]) -> BulkLoadResult:
+    @staticmethod
+    def _with_fields(records: Iterable[Dict[str, Any]], fields: List[str]) -> Iterator[Dict[str, Any]]:
+        """Lazily default missing ``fields`` to None so every record has the same columns."""
+        for record in records:
+            for field in fields:
+                record.setdefault(field, None)
+            yield record
+
+    def bulk_insert_clicks(self, clicks: Iterable[Dict[str, Any]], **options) -> BulkLoadResult:
         """Optimized bulk insert for click data."""
         # Ensure required fields are present
         required_fields = ['id', 'campaign_id', 'ip_address', 'user_agent', 'created_at']
+        return self.bulk_insert('clicks', self._with_fields(clicks, required_fields),
+                                conflict_resolution='ignore', **options)
 
-        for click in clicks:
-            for field in required_fields:
-                if field not in click:
-                    click[field] = None
-
-        return self.bulk_insert('clicks', clicks, conflict_resolution='ignore')
-
-    def bulk_insert_conversions(self, conversions: List[Dict[str, Any]]) -> BulkLoadResult:
+    def bulk_insert_conversions(self, conversions: Iterable[Dict[str, Any]], **options) -> BulkLoadResult:
         """Optimized bulk insert for conversion data."""
         required_fields = ['id', 'click_id', 'goal_id', 'amount', 'currency', 'created_at']
+        return self.bulk_insert('conversions', self._with_fields(conversions, required_fields),
+                                conflict_resolution='ignore', **options)
 
-        for conv in conversions:
-            for field in required_fields:
-                if field not in conv:
-                    conv[field] = None
-
-        return self.bulk_insert('conversions', conversions, conflict_resolution='ignore')
-
-    def bulk_insert_events(self, events: List[Dict[str, Any]]) -> BulkLoadResult:
+    def bulk_insert_events(self, events: Iterable[Dict[str, Any]], **options) -> BulkLoadResult:
         """Optimized bulk insert for event data."""
         required_fields = ['id', 'click_id', 'event_type', 'event_data', 'created_at']
-
-        for event in events:
-            for field in required_fields:
-                if field not in event:
-                    event[field] = None
-
-        return self.bulk_insert('events', events, conflict_resolution='ignore')
+        return self.bulk_insert('events', self._with_fields(events, required_fields),
+                                conflict_resolution='ignore', **options)
 
 
 class BulkOperationOptimizer:
@@ -214,12 +446,14 @@ class BulkOperationOptimizer:
         self.loader = PostgresBulkLoader(connection)
         self.performance_stats = {}
 
-    def optimize_bulk_operation(self, table_name: str, records: List[Dict[str, Any]],
+    def optimize_bulk_operation(self, table_name: str, records: Iterable[Dict[str, Any]],
                                 operation_type: str = 'generic') -> BulkLoadResult:
         """Optimize bulk operation based on table type and data characteristics."""
-        # Analyze data characteristics
-        data_size = len(records)
-        avg_record_size = self._estimate_record_size(records[0]) if records else 0
+        # Analyze data characteristics from the first record; the rest are streamed
+        records = iter(records)
+        first = next(records, None)
+        avg_record_size = self._estimate_record_size(first) if first is not None else 0
+        records = itertools.chain((first,), records) if first is not None else iter(())
 
         # Choose optimal method based on heuristics
         if operation_type == 'clicks':
@@ -234,7 +468,7 @@ class BulkOperationOptimizer:
             result = self.loader.bulk_insert(table_name, records, conflict_resolution)
 
         # Record performance stats
-        self._record_performance_stats(table_name, result, data_size, avg_record_size)
+        self._record_performance_stats(table_name, result, result.records_loaded, avg_record_size)
 
         return result
 
@@ -343,7 +577,7 @@ class SmartBulkRepositoryMixin:
         super().__init__(container)
         self.bulk_optimizer = BulkOperationOptimizer(self._get_connection())
 
-    def smart_bulk_insert(self, records: List[Dict[str, Any]], operation_type: str = 'generic') -> BulkLoadResult:
+    def smart_bulk_insert(self, records: Iterable[Dict[str, Any]], operation_type: str = 'generic') -> BulkLoadResult:
         """Smart bulk insert with automatic optimization."""
         table_name = self._get_table_name()
         return self.bulk_optimizer.optimize_bulk_operation(table_name, records, operation_type)
@@ -22,6 +22,7 @@ import psycopg2.extensions
 
 logger = logging.getLogger(__name__)
 
+from ..database.prepared_statements import execute_prepared
 from ...domain.entities.campaign import Campaign, CampaignStatus
 from ...domain.repositories.campaign_repository import CampaignRepository
 from ...domain.value_objects import CampaignId, Money, Url
@@ -35,14 +36,29 @@ def adapt_campaign_id(campaign_id):
 
 psycopg2.extensions.register_adapter(CampaignId, adapt_campaign_id)
 
+# Click and conversion counters are only ever incremented relative to the stored value, never
+# overwritten, so concurrent writers cannot lose each other's increments. Spend is saved with the
+# rest of the campaign by save().
+UPDATE_CAMPAIGN_COUNTERS_SQL = """
+    UPDATE campaigns AS c
+    SET clicks_count = COALESCE(c.clicks_count, 0) + d.clicks,
+        conversions_count = COALESCE(c.conversions_count, 0) + d.conversions,
+        updated_at = %s
+    FROM unnest(%s::text[], %s::bigint[], %s::bigint[])
+         AS d(id, clicks, conversions)
+    WHERE c.id = d.id
+"""
+
 
 class PostgresCampaignRepository(CampaignRepository):
     """PostgreSQL implementation of CampaignRepository."""
 
-    def __init__(self, container):
+    def __init__(self, container, counters=None):
         self._container = container
         self._connection = None
         self._db_initialized = False
+        # Optional CampaignCounterAggregator whose pending increments are merged into reads
+        self._counters = counters
 
     def _extract_value(self, obj):
         """Extract string value from value objects or return the object if it's already a basic type."""
@@ -217,8 +233,6 @@ class PostgresCampaignRepository(CampaignRepository):
                                total_budget_currency = EXCLUDED.total_budget_currency,
                                start_date = EXCLUDED.start_date,
                                end_date = EXCLUDED.end_date,
-                               clicks_count = EXCLUDED.clicks_count,
-                               conversions_count = EXCLUDED.conversions_count,
                                spent_amount = EXCLUDED.spent_amount,
                                spent_currency = EXCLUDED.spent_currency,
                                updated_at = EXCLUDED.updated_at,
@@ -246,6 +260,36 @@ class PostgresCampaignRepository(CampaignRepository):
             if conn:
                 self._container.release_db_connection(conn)
 
+    def _merge_pending_counters(self, campaign: Campaign) -> Campaign:
+        """Add not-yet-flushed counter increments of this process to a loaded campaign."""
+        if self._counters is not None:
+            self._counters.merge_into(campaign)
+        return campaign
+
+    def apply_counter_deltas(self, deltas) -> None:
+        """Atomically add aggregated counter deltas ({campaign_id: CounterDelta}) in one UPDATE."""
+        if not deltas:
+            return
+        conn = None
+        try:
+            conn = self._container.get_db_connection()
+            cursor = conn.cursor()
+            ids = list(deltas.keys())
+            cursor.execute(UPDATE_CAMPAIGN_COUNTERS_SQL, (
+                datetime.now(),
+                ids,
+                [deltas[campaign_id].clicks for campaign_id in ids],
+                [deltas[campaign_id].conversions for campaign_id in ids],
+            ))
+            conn.commit()
+        except Exception:
+            if conn:
+                conn.rollback()
+            raise
+        finally:
+            if conn:
+                self._container.release_db_connection(conn)
+
     def find_by_id(self, campaign_id: CampaignId) -> Optional[Campaign]:
         """Find campaign by ID."""
         conn = None
@@ -253,7 +297,7 @@ class PostgresCampaignRepository(CampaignRepository):
             conn = self._container.get_db_connection()
             cursor = conn.cursor()
 
-            cursor.execute("""
+            execute_prepared(cursor, """
                            SELECT *
                            FROM campaigns
                            WHERE id = %s
@@ -265,7 +309,7 @@ class PostgresCampaignRepository(CampaignRepository):
                 # Convert tuple to dict for easier access
                 columns = [desc[0] for desc in cursor.description]
                 row_dict = dict(zip(columns, row))
-                return self._row_to_campaign(row_dict)
+                return self._merge_pending_counters(self._row_to_campaign(row_dict))
             return None
         finally:
             if conn:
@@ -296,7 +340,7 @@ class PostgresCampaignRepository(CampaignRepository):
                 for i, row in enumerate(cursor.fetchall()):
                     try:
                         row_dict = dict(zip(columns, row))
-                        campaign = self._row_to_campaign(row_dict)
+                        campaign = self._merge_pending_counters(self._row_to_campaign(row_dict))
                         campaigns.append(campaign)
                     except Exception as row_error:
                         print(f"Error processing campaign row {i} with ID {row[0] if row else 'unknown'}: {row_error}")
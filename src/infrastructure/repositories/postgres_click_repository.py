@@ -16,6 +16,8 @@
 from datetime import date
 from typing import Any, Optional, List
 
+from .postgres_bulk_loader import PostgresBulkLoader
+from ..database.prepared_statements import execute_prepared
 from ...domain.entities.click import Click
 from ...domain.repositories.click_repository import ClickRepository
 from ...domain.value_objects import ClickId
@@ -140,14 +142,23 @@ class PostgresClickRepository(ClickRepository):
             return obj.value
         return obj
 
-    def save(self, click: Click) -> None:
-        """Save a click."""
-        conn = None
-        try:
+    def save(self, click: Click, conn=None) -> None:
+        """Save a click.
+
+        With ``conn`` (a unit of work's connection) the statement runs there and
+        committing is left to the caller.
+        """
+        if conn is None:
             conn = self._container.get_db_connection()
-            cursor = conn.cursor()
+            try:
+                self.save(click, conn=conn)
+                conn.commit()
+            finally:
+                self._container.release_db_connection(conn)
+            return
+        cursor = conn.cursor()
 
-            cursor.execute("""
+        execute_prepared(cursor, """
                            INSERT INTO clicks
                            (id, campaign_id, click_id, ip_address, user_agent, referrer, is_valid,
                             sub1, sub2, sub3, sub4, sub5, click_id_param, affiliate_sub, affiliate_sub2,
@@ -176,25 +187,92 @@ class PostgresClickRepository(ClickRepository):
                                conversion_type = EXCLUDED.conversion_type,
                                converted_at = EXCLUDED.converted_at
                            """, (
-                               self._extract_value(click.id), self._extract_value(click.campaign_id),
-                               self._extract_value(click.id),
-                               click.ip_address, click.user_agent, click.referrer,
-                               click.is_valid, click.sub1, click.sub2, click.sub3, click.sub4, click.sub5,
-                               click.click_id_param, click.affiliate_sub, click.affiliate_sub2,
-                               click.landing_page_id, click.campaign_offer_id, click.traffic_source_id,
-                               click.conversion_type, click.converted_at, click.created_at
-                           ))
+                           self._extract_value(click.id), self._extract_value(click.campaign_id),
+                           self._extract_value(click.id),
+                           click.ip_address, click.user_agent, click.referrer,
+                           click.is_valid, click.sub1, click.sub2, click.sub3, click.sub4, click.sub5,
+                           click.click_id_param, click.affiliate_sub, click.affiliate_sub2,
+                           click.landing_page_id, click.campaign_offer_id, click.traffic_source_id,
+                           click.conversion_type, click.converted_at, click.created_at
+                       ))
+
+    def save_many(self, clicks: List[Click]) -> int:
+        """Save a batch of clicks: COPY into a session staging table, then one merge into clicks."""
+        if not clicks:
+            return 0
+        return self._merge_many(clicks)
+
+    def upsert_many(self, clicks: List[Click]) -> List[str]:
+        """Save a batch like ``save_many``. Returns the ids of clicks that were not stored before."""
+        if not clicks:
+            return []
+        return self._merge_many(clicks, report_inserted=True)
+
+    def _merge_many(self, clicks: List[Click], report_inserted: bool = False):
+
+        # A single INSERT ... ON CONFLICT cannot update the same row twice; last write wins
+        latest = {}
+        for click in clicks:
+            latest[self._extract_value(click.id)] = {
+                'id': self._extract_value(click.id),
+                'campaign_id': self._extract_value(click.campaign_id),
+                'click_id': self._extract_value(click.id),
+                'ip_address': click.ip_address,
+                'user_agent': click.user_agent,
+                'referrer': click.referrer,
+                'is_valid': click.is_valid,
+                'sub1': click.sub1,
+                'sub2': click.sub2,
+                'sub3': click.sub3,
+                'sub4': click.sub4,
+                'sub5': click.sub5,
+                'click_id_param': click.click_id_param,
+                'affiliate_sub': click.affiliate_sub,
+                'affiliate_sub2': click.affiliate_sub2,
+                'landing_page_id': click.landing_page_id,
+                'campaign_offer_id': click.campaign_offer_id,
+                'traffic_source_id': click.traffic_source_id,
+                'conversion_type': click.conversion_type,
+                'converted_at': click.converted_at,
+                'created_at': click.created_at,
+            }
+        records = list(latest.values())
+        columns = list(records[0].keys())
 
+        conn = None
+        try:
+            conn = self._container.get_db_connection()
+            cursor = conn.cursor()
+            # Staging, merge and commit are one transaction: the staged rows go away with it either way
+            cursor.execute("CREATE TEMP TABLE IF NOT EXISTS clicks_ingest (LIKE clicks INCLUDING DEFAULTS) "
+                           "ON COMMIT DELETE ROWS")
+            PostgresBulkLoader(conn).copy_records('clicks_ingest', records, columns=columns)
+
+            update_set = ', '.join(f"{col} = EXCLUDED.{col}" for col in columns if col not in ('id', 'created_at'))
+            # xmax is 0 only on rows this statement inserted, not on conflicting rows it updated
+            returning = " RETURNING id, (xmax = 0) AS inserted" if report_inserted else ""
+            cursor.execute(f"""
+                           INSERT INTO clicks ({', '.join(columns)})
+                           SELECT {', '.join(columns)} FROM clicks_ingest
+                           ON CONFLICT (id) DO UPDATE SET {update_set}
+                           """ + returning)
+            inserted = [row[0] for row in cursor.fetchall() if row[1]] if report_inserted else None
             conn.commit()
+            return inserted if report_inserted else len(records)
+        except Exception:
+            if conn:
+                conn.rollback()
+            raise
         finally:
             if conn:
                 self._container.release_db_connection(conn)
 
-    def find_by_id(self, click_id: ClickId) -> Optional[Click]:
-        """Find click by ID."""
-        conn = None
+    def find_by_id(self, click_id: ClickId, conn=None) -> Optional[Click]:
+        """Find click by ID (on ``conn`` if given, e.g. a unit of work's connection)."""
+        own_connection = conn is None
         try:
-            conn = self._container.get_db_connection()
+            if own_connection:
+                conn = self._container.get_db_connection()
             cursor = conn.cursor()
 
             cursor.execute("SELECT * FROM clicks WHERE id = %s", (click_id.value,))
@@ -207,7 +285,7 @@ class PostgresClickRepository(ClickRepository):
                 return self._row_to_click(row_dict)
             return None
         finally:
-            if conn:
+            if own_connection and conn:
                 self._container.release_db_connection(conn)
 
     def find_by_campaign_id(self, campaign_id: str, limit: int = 100,
@@ -147,9 +147,20 @@ class PostgresConversionRepository(ConversionRepository):
             updated_at=row["updated_at"]
         )
 
-    def save(self, conversion: Conversion) -> None:
-        """Save a conversion."""
-        conn = self._container.get_db_connection()
+    def save(self, conversion: Conversion, conn=None) -> None:
+        """Save a conversion.
+
+        With ``conn`` (a unit of work's connection) the statement runs there and
+        committing is left to the caller.
+        """
+        if conn is None:
+            conn = self._container.get_db_connection()
+            try:
+                self.save(conversion, conn=conn)
+                conn.commit()
+            finally:
+                self._container.release_db_connection(conn)
+            return
         cursor = conn.cursor()
 
         # Prepare database fields from entity
@@ -203,8 +214,6 @@ class PostgresConversionRepository(ConversionRepository):
                            metadata_json, conversion.created_at, conversion.updated_at
                        ))
 
-        conn.commit()
-
     def get_by_id(self, conversion_id: str) -> Optional[Conversion]:
         """Get conversion by ID."""
         conn = self._container.get_db_connection()
@@ -41,9 +41,15 @@ class PostgresCustomerLtvRepository(CustomerLtvRepository):
         # Table should already exist from the main LTV repository
         pass
 
-    def save(self, customer_ltv: CustomerLtv) -> None:
-        """Save customer LTV data."""
-        conn = self._get_connection()
+    def save(self, customer_ltv: CustomerLtv, conn=None) -> None:
+        """Save customer LTV data.
+
+        With ``conn`` (a unit of work's connection) the statement runs there and
+        committing is left to the caller.
+        """
+        own_connection = conn is None
+        if own_connection:
+            conn = self._get_connection()
         cursor = conn.cursor()
 
         try:
@@ -83,10 +89,12 @@ class PostgresCustomerLtvRepository(CustomerLtvRepository):
                                customer_ltv.updated_at
                            ))
 
-            conn.commit()
+            if own_connection:
+                conn.commit()
 
         except Exception as e:
-            conn.rollback()
+            if own_connection:
+                conn.rollback()
             raise e
         finally:
             cursor.close()
@@ -0,0 +1,121 @@
+# Copyright (c) 2025 Bivex
+#
+# Author: Bivex
+# Available for contact via email: support@b-b.top
+# For up-to-date contact information:
+# https://github.com/bivex
+#
+# Created: 2026-10-16T09:12:04
+# Last Updated: 2026-10-16T09:12:04
+#
+# Licensed under the MIT License.
+# Commercial licensing available upon request.
+
+"""PostgreSQL fraud rule repository implementation."""
+
+import json
+from typing import List
+
+from ...domain.repositories.fraud_rule_repository import FraudRuleRepository
+from ...domain.services.click import FraudRule
+
+
+class PostgresFraudRuleRepository(FraudRuleRepository):
+    """PostgreSQL implementation of FraudRuleRepository."""
+
+    def __init__(self, container):
+        self._container = container
+        self._db_initialized = False
+
+    def _initialize_db(self, conn) -> None:
+        """Initialize database schema."""
+        cursor = conn.cursor()
+        cursor.execute("""
+                       CREATE TABLE IF NOT EXISTS fraud_rules
+                       (
+                           id          TEXT PRIMARY KEY,
+                           name        TEXT             NOT NULL,
+                           type        TEXT             NOT NULL,
+                           action      TEXT             NOT NULL,
+                           patterns    JSONB            NOT NULL,
+                           score       DOUBLE PRECISION NOT NULL,
+                           campaign_id TEXT,
+                           is_active   BOOLEAN          NOT NULL DEFAULT TRUE,
+                           priority    INTEGER          NOT NULL DEFAULT 0,
+                           created_at  TIMESTAMP        NOT NULL DEFAULT NOW()
+                       )
+                       """)
+        conn.commit()
+        self._db_initialized = True
+
+    def _get_connection(self):
+        conn = self._container.get_db_connection()
+        if not self._db_initialized:
+            try:
+                self._initialize_db(conn)
+            except Exception:
+                self._container.release_db_connection(conn)
+                raise
+        return conn
+
+    def save(self, rule: FraudRule) -> None:
+        """Save a fraud rule (insert or replace by ID)."""
+        conn = self._get_connection()
+        try:
+            cursor = conn.cursor()
+            cursor.execute("""
+                           INSERT INTO fraud_rules
+                               (id, name, type, action, patterns, score, campaign_id, is_active, priority)
+                           VALUES (%s, %s, %s, %s, %s, %s, %s, %s, %s) ON CONFLICT (id) DO
+                           UPDATE SET
+                               name = EXCLUDED.name,
+                               type = EXCLUDED.type,
+                               action = EXCLUDED.action,
+                               patterns = EXCLUDED.patterns,
+                               score = EXCLUDED.score,
+                               campaign_id = EXCLUDED.campaign_id,
+                               is_active = EXCLUDED.is_active,
+                               priority = EXCLUDED.priority
+                           """, (
+                rule.id, rule.name, rule.type, rule.action, json.dumps(list(rule.patterns)), rule.score,
+                rule.campaign_id, rule.is_active, rule.priority,
+            ))
+            conn.commit()
+        except Exception:
+            conn.rollback()
+            raise
+        finally:
+            self._container.release_db_connection(conn)
+
+    def find_all(self) -> List[FraudRule]:
+        """Get all fraud rules, oldest first."""
+        conn = self._get_connection()
+        try:
+            cursor = conn.cursor()
+            cursor.execute("""
+                           SELECT id, name, type, action, patterns, score, campaign_id, is_active, priority
+                           FROM fraud_rules
+                           ORDER BY created_at, id
+                           """)
+            rows = cursor.fetchall()
+            conn.commit()
+        finally:
+            self._container.release_db_connection(conn)
+        return [self._row_to_rule(row) for row in rows]
+
+    @staticmethod
+    def _row_to_rule(row) -> FraudRule:
+        rule_id, name, rule_type, action, patterns, score, campaign_id, is_active, priority = row
+        if isinstance(patterns, str):
+            patterns = json.loads(patterns)
+        return FraudRule(
+            id=rule_id,
+            name=name,
+            type=rule_type,
+            action=action,
+            patterns=tuple(patterns),
+            score=float(score),
+            campaign_id=campaign_id,
+            is_active=bool(is_active),
+            priority=int(priority),
+        )
@@ -7,6 +7,7 @@ import psycopg2
 import psycopg2.extras
 from loguru import logger
 
+from ..database.prepared_statements import execute_prepared
 from ...domain.entities.pre_click_data import PreClickData
 from ...domain.repositories.pre_click_data_repository import PreClickDataRepository
 from ...domain.value_objects import ClickId, CampaignId
@@ -203,3 +204,38 @@ class PostgresPreClickDataRepository(PreClickDataRepository):
                 await asyncio.get_event_loop().run_in_executor(None,
                                                                functools.partial(self._container.release_db_connection,
                                                                                  conn))
+
+    async def take_by_click_id(self, click_id: ClickId, conn=None) -> Optional[PreClickData]:
+        """Atomically removes and returns pre-click data by click ID (single DELETE ... RETURNING).
+
+        With ``conn`` (a unit of work's connection) the statement runs there and
+        committing is left to the caller.
+        """
+        await self._db_initialized_event.wait()  # Wait for DB to be initialized
+        own_connection = conn is None
+        loop = asyncio.get_event_loop()
+        try:
+            if own_connection:
+                conn = await self._get_blocking_connection()
+            cursor = await loop.run_in_executor(None, functools.partial(conn.cursor,
+                                                                        cursor_factory=psycopg2.extras.DictCursor))
+
+            await loop.run_in_executor(None, functools.partial(execute_prepared, cursor,
+                                                               "DELETE FROM pre_click_data WHERE click_id = %s RETURNING *",
+                                                               (click_id.value,)))
+            row = await loop.run_in_executor(None, cursor.fetchone)
+            if own_connection:
+                await loop.run_in_executor(None, conn.commit)
+            if row:
+                logger.info(f"PreClickData consumed for click_id: {click_id.value}")
+                return self._row_to_pre_click_data(dict(row))
+            logger.warning(f"No PreClickData found for click_id: {click_id.value} in DB.")
+            return None
+        except Exception as e:
+            logger.error(f"Error consuming PreClickData for click_id {click_id.value}: {e}", exc_info=True)
+            if own_connection and conn:
+                await loop.run_in_executor(None, conn.rollback)
+            raise
+        finally:
+            if own_connection and conn:
+                await loop.run_in_executor(None, functools.partial(self._container.release_db_connection, conn))
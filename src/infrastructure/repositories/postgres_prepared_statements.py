@@ -11,108 +11,24 @@
 # Licensed under the MIT License.
 # Commercial licensing available upon request.
 
-"""PostgreSQL prepared statements manager for automatic query optimization."""
+"""PostgreSQL prepared statements support for repositories.
 
-import hashlib
-import logging
-from typing import Dict, List, Any, Optional
+Statements are cached per pooled connection by
+``src.infrastructure.database.prepared_statements``; repositories only pick
+which queries go through it.
+"""
 
-logger = logging.getLogger(__name__)
+from typing import Any, List
 
-
-class PreparedStatementsManager:
-    """Manager for PostgreSQL prepared statements with automatic caching and optimization."""
-
-    def __init__(self, connection):
-        self.connection = connection
-        self._prepared_statements: Dict[str, str] = {}
-        self._statement_counter = 0
-
-    def _generate_statement_name(self, query: str) -> str:
-        """Generate unique name for prepared statement based on query hash."""
-        query_hash = hashlib.md5(query.encode()).hexdigest()[:16]
-        return f"stmt_{query_hash}"
-
-    def prepare_statement(self, query: str) -> str:
-        """Prepare a statement if not already prepared."""
-        if query not in self._prepared_statements:
-            statement_name = self._generate_statement_name(query)
-            try:
-                with self.connection.cursor() as cursor:
-                    cursor.execute(f"PREPARE {statement_name} AS {query}")
-                self._prepared_statements[query] = statement_name
-                logger.debug(f"Prepared statement: {statement_name} for query: {query[:100]}...")
-            except Exception as e:
-                logger.error(f"Failed to prepare statement: {e}")
-                # Fallback to direct execution
-                return None
-        return self._prepared_statements[query]
-
-    def execute_prepared(self, query: str, params: tuple = None) -> Any:
-        """Execute prepared statement or fallback to direct execution."""
-        statement_name = self.prepare_statement(query)
-        if statement_name:
-            try:
-                with self.connection.cursor() as cursor:
-                    if params:
-                        cursor.execute(f"EXECUTE {statement_name} {params}")
-                    else:
-                        cursor.execute(f"EXECUTE {statement_name}")
-                    return cursor
-            except Exception as e:
-                logger.warning(f"Prepared statement execution failed, falling back: {e}")
-                # Fallback to direct execution
-                with self.connection.cursor() as cursor:
-                    cursor.execute(query, params)
-                    return cursor
-        else:
-            # Direct execution
-            with self.connection.cursor() as cursor:
-                cursor.execute(query, params)
-                return cursor
-
-    def deallocate_unused(self):
-        """Deallocate prepared statements that haven't been used recently."""
-        # This could be enhanced with usage tracking
-        try:
-            with self.connection.cursor() as cursor:
-                cursor.execute("DEALLOCATE ALL")
-            self._prepared_statements.clear()
-            logger.info("Deallocated all prepared statements")
-        except Exception as e:
-            logger.error(f"Failed to deallocate prepared statements: {e}")
-
-    def get_stats(self) -> Dict[str, Any]:
-        """Get statistics about prepared statements."""
-        return {
-            "prepared_statements_count": len(self._prepared_statements),
-            "prepared_queries": list(self._prepared_statements.keys())
-        }
+from ..database.prepared_statements import execute_prepared
 
 
 class AutoPreparedRepositoryMixin:
     """Mixin to add automatic prepared statement support to repositories."""
 
-    def __init__(self, container):
-        super().__init__(container)
-        self._prepared_manager: Optional[PreparedStatementsManager] = None
-
-    def _get_prepared_manager(self) -> PreparedStatementsManager:
-        """Get or create prepared statements manager."""
-        if self._prepared_manager is None:
-            conn = self._get_connection()
-            self._prepared_manager = PreparedStatementsManager(conn)
-        return self._prepared_manager
-
-    def execute_optimized(self, query: str, params: tuple = None) -> Any:
-        """Execute query with automatic prepared statement optimization."""
-        manager = self._get_prepared_manager()
-        return manager.execute_prepared(query, params)
-
-    def cleanup_prepared_statements(self):
-        """Clean up prepared statements (call on repository destruction)."""
-        if self._prepared_manager:
-            self._prepared_manager.deallocate_unused()
+    def execute_optimized(self, cursor, query: str, params: tuple = None) -> Any:
+        """Execute query as a prepared statement cached on the cursor's connection."""
+        return execute_prepared(cursor, query, params)
 
 
 class QueryAnalyzer:
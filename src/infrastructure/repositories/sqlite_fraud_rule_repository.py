@@ -0,0 +1,97 @@
+# Copyright (c) 2025 Bivex
+#
+# Author: Bivex
+# Available for contact via email: support@b-b.top
+# For up-to-date contact information:
+# https://github.com/bivex
+#
+# Created: 2026-10-16T09:12:04
+# Last Updated: 2026-10-16T09:12:04
+#
+# Licensed under the MIT License.
+# Commercial licensing available upon request.
+
+"""SQLite fraud rule repository implementation."""
+
+import json
+import sqlite3
+import threading
+from typing import List
+
+from ...domain.repositories.fraud_rule_repository import FraudRuleRepository
+from ...domain.services.click import FraudRule
+
+
+class SQLiteFraudRuleRepository(FraudRuleRepository):
+    """SQLite implementation of FraudRuleRepository."""
+
+    def __init__(self, db_path: str = ":memory:"):
+        self.db_path = db_path
+        self._connection = None
+        self._lock = threading.Lock()
+        self._initialize_db()
+
+    def _get_connection(self):
+        """Get database connection."""
+        if self._connection is None:
+            self._connection = sqlite3.connect(self.db_path, check_same_thread=False)
+        return self._connection
+
+    def _initialize_db(self) -> None:
+        """Initialize database schema."""
+        conn = self._get_connection()
+        conn.execute("""
+                     CREATE TABLE IF NOT EXISTS fraud_rules
+                     (
+                         id          TEXT PRIMARY KEY,
+                         name        TEXT    NOT NULL,
+                         type        TEXT    NOT NULL,
+                         action      TEXT    NOT NULL,
+                         patterns    TEXT    NOT NULL, -- JSON list
+                         score       REAL    NOT NULL,
+                         campaign_id TEXT,
+                         is_active   INTEGER NOT NULL DEFAULT 1,
+                         priority    INTEGER NOT NULL DEFAULT 0,
+                         created_at  TEXT    NOT NULL DEFAULT CURRENT_TIMESTAMP
+                     )
+                     """)
+        conn.commit()
+
+    def save(self, rule: FraudRule) -> None:
+        """Save a fraud rule (insert or replace by ID)."""
+        with self._lock:
+            conn = self._get_connection()
+            conn.execute("""
+                         INSERT INTO fraud_rules
+                             (id, name, type, action, patterns, score, campaign_id, is_active, priority)
+                         VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?) ON CONFLICT (id) DO
+                         UPDATE SET
+                             name = excluded.name,
+                             type = excluded.type,
+                             action = excluded.action,
+                             patterns = excluded.patterns,
+                             score = excluded.score,
+                             campaign_id = excluded.campaign_id,
+                             is_active = excluded.is_active,
+                             priority = excluded.priority
+                         """, (
+                rule.id, rule.name, rule.type, rule.action, json.dumps(list(rule.patterns)), rule.score,
+                rule.campaign_id, int(rule.is_active), rule.priority,
+            ))
+            conn.commit()
+
+    def find_all(self) -> List[FraudRule]:
+        """Get all fraud rules, oldest first."""
+        with self._lock:
+            rows = self._get_connection().execute("""
+                                                  SELECT id, name, type, action, patterns, score,
+                                                         campaign_id, is_active, priority
+                                                  FROM fraud_rules
+                                                  ORDER BY created_at, rowid
+                                                  """).fetchall()
+        return [
+            FraudRule(id=rule_id, name=name, type=rule_type, action=action, patterns=tuple(json.loads(patterns)),
+                      score=float(score), campaign_id=campaign_id, is_active=bool(is_active),
+                      priority=int(priority))
+            for rule_id, name, rule_type, action, patterns, score, campaign_id, is_active, priority in rows
+        ]
@@ -680,13 +680,21 @@ class PostgresAutoUpholder:
 
         print("DEBUG: Got pool report (with protection)")
 
+        # Hit/miss counters of the per-connection prepared statement caches
+        try:
+            prepared_report = self.connection_pool.get_stats().get('prepared_statements', {})
+        except Exception as e:
+            prepared_report = {"error": f"Prepared statement stats unavailable: {str(e)}"}
+            logger.warning(f"Prepared statement stats failed: {e}")
+
         logger.info("📊 Building dashboard response")
         dashboard = {
             'upholder_status': upholder_status,
             'current_metrics': {
                 'cache': cache_report,
                 'query_performance': query_report,
-                'connection_pool': pool_report
+                'connection_pool': pool_report,
+                'prepared_statements': prepared_report
             },
             'recent_alerts': [
                 {
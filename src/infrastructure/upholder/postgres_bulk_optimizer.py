@@ -23,6 +23,8 @@ from typing import List, Dict, Any, Tuple
 import numpy as np
 import pandas as pd
 
+from ..repositories.postgres_bulk_loader import PostgresBulkLoader
+
 logger = logging.getLogger(__name__)
 
 
@@ -103,22 +105,38 @@ class PostgresBulkOptimizer:
                 success_rate=0.0
             )
 
+    def screen_clicks(self, clicks_data: List[Dict[str, Any]]) -> Tuple[np.ndarray, np.ndarray]:
+        """Vectorized validation and in-batch duplicate detection without writing anything.
+
+        Returns boolean masks ``(invalid, duplicate)`` aligned with ``clicks_data``;
+        the first valid record of a click_id is kept, later ones are duplicates.
+        """
+        df = pd.DataFrame(clicks_data)
+        valid = self._vectorized_validate_clicks(df)
+        duplicate = np.zeros(len(df), dtype=bool)
+        if valid.any():
+            duplicate[valid] = df.loc[valid, 'click_id'].duplicated(keep='first').to_numpy()
+        return ~valid, duplicate
+
     def _vectorized_validate_clicks(self, df: pd.DataFrame) -> np.ndarray:
         """Vectorized validation of click data."""
+
+        def column(name: str) -> pd.Series:
+            return df[name] if name in df else pd.Series(None, index=df.index, dtype=object)
+
         # Vectorized null checks
-        has_required_fields = (
-                df['campaign_id'].notna() &
-                df['click_id'].notna() &
-                df['timestamp'].notna()
-        )
+        has_required_fields = column('campaign_id').notna() & column('click_id').notna()
 
-        # Vectorized timestamp validation
-        valid_timestamps = pd.to_datetime(df['timestamp'], errors='coerce').notna()
+        # Vectorized timestamp validation (optional; ISO 8601 when present)
+        timestamps = column('timestamp')
+        valid_timestamps = timestamps.isna() | pd.to_datetime(timestamps, errors='coerce', utc=True,
+                                                              format='ISO8601').notna()
 
-        # Vectorized URL validation (basic)
-        valid_urls = df['referrer_url'].str.match(r'^https?://', na=False)
+        # Vectorized URL validation (basic; a missing referrer is allowed)
+        referrers = column('referrer')
+        valid_urls = referrers.isna() | referrers.astype(str).str.match(r'^https?://')
 
-        return has_required_fields & valid_timestamps & valid_urls
+        return (has_required_fields & valid_timestamps & valid_urls).to_numpy(dtype=bool)
 
     def _vectorized_find_duplicates(self, df: pd.DataFrame) -> np.ndarray:
         """Find duplicate clicks using vectorized operations."""
@@ -128,22 +146,24 @@ class PostgresBulkOptimizer:
 
     def _bulk_insert_with_copy(self, df: pd.DataFrame) -> int:
         """Bulk insert using PostgreSQL COPY for maximum performance."""
+        frame = pd.DataFrame({
+            'id': df['click_id'],
+            'click_id': df['click_id'],
+            'campaign_id': df['campaign_id'],
+            'ip_address': df.get('ip_address'),
+            'user_agent': df.get('user_agent'),
+            'referrer': df.get('referrer'),
+            'is_valid': df['is_valid'],
+            'created_at': pd.to_datetime(df['timestamp'], utc=True, format='ISO8601')
+            if 'timestamp' in df else df['processed_at'],
+        }).astype(object).where(lambda frame: frame.notna(), None)
+
         conn = self.connection_pool.getconn()
         try:
-            # Convert DataFrame to CSV format in memory
-            csv_data = df.to_csv(index=False, header=False, sep='\t')
-
-            # Use COPY command for bulk insert
-            with conn.cursor() as cursor:
-                cursor.copy_expert("""
-                    COPY clicks (
-                        campaign_id, click_id, timestamp, ip_address,
-                        user_agent, referrer_url, is_valid, processed_at
-                    ) FROM STDIN WITH (FORMAT csv, DELIMITER E'\t', HEADER false)
-                """, csv_data)
-
-            conn.commit()
-            return len(df)
+            # Streamed through COPY; existing click ids are skipped
+            result = PostgresBulkLoader(conn, batch_size_threshold=1)._bulk_copy(
+                'clicks', frame.to_dict('records'), time.time(), conflict_resolution='ignore')
+            return result.records_loaded
 
         finally:
             self.connection_pool.putconn(conn)
@@ -15,53 +15,22 @@
 
 # uvloop not available on Windows, skipping (would give +20-40% HTTP performance boost on Linux/macOS)
 
+import asyncio
 import inspect
-import json
 import os
+import signal
+import tempfile
 import time
-from decimal import Decimal
+from typing import Callable, Optional
 
 import socketify
 from loguru import logger
 
 from .config.settings import settings
 from .container import container
-
-
-# Custom JSON encoder for Decimal objects, Money objects, and datetime objects
-class CustomJSONEncoder(json.JSONEncoder):
-    def default(self, obj):
-        if isinstance(obj, Decimal):
-            return float(obj)
-        # Handle Money objects
-        try:
-            from .domain.value_objects.financial.money import Money
-            if isinstance(obj, Money):
-                return {
-                    "amount": float(obj.amount),
-                    "currency": obj.currency
-                }
-        except ImportError:
-            pass
-        # Handle datetime objects
-        if isinstance(obj, datetime):
-            return obj.isoformat()
-        return super().default(obj)
-
-
-# Monkey patch json.dumps to handle Decimal objects
-_original_dumps = json.dumps
-
-
-def custom_dumps(obj, **kwargs):
-    """Custom json.dumps that handles Decimal objects."""
-    # If cls is already specified, don't override it
-    if 'cls' not in kwargs:
-        kwargs['cls'] = CustomJSONEncoder
-    return _original_dumps(obj, **kwargs)
-
-
-json.dumps = custom_dumps
+from .infrastructure.database.pool_budget import split_connection_budget
+from .presentation.responses import ADMIN_HEADERS, send_json
+from .supervisor import InFlightRequests, LeaderLock, PreforkSupervisor, check_listen_address, stop_accepting
 
 
 async def create_app() -> socketify.App:
@@ -127,56 +96,13 @@ def _configure_logging(app: socketify.App) -> None:
     except ImportError:
         pass
 
-    # Configure loguru with beautiful format including file, line, function
-    log_level = settings.logging.level.upper()  # Use settings level and ensure uppercase
-    log_format = (
-        "┌─ <green>{time:YYYY-MM-DD HH:mm:ss.SSS}</green> ─┐\n"
-        "│ <level>{level: <8}</level> │ "
-        "<cyan>{name}</cyan>:<cyan>{function}</cyan>:<cyan>{line}</cyan>\n"
-        "│ <level>{message}</level>\n"
-        "└─────────────────────────────────────────────────────────────┘"
-    )
-
-    # Remove all default handlers
-    logger.remove()
-
-    # Add console handler with stderr output
-    # Add console handler with stderr output
-    import sys
-    logger.add(
-        sink=sys.stderr,
-        level=log_level,
-        format=log_format,
-        colorize=True,
-        backtrace=True,
-        diagnose=True
-    )
-
-    # Add file handler for testing
-    logger.add(
-        "app.log",
-        level=log_level,
-        format=log_format,
-        rotation="10 MB",
-        retention="1 week",
-        backtrace=True,
-        diagnose=True
-    )
-
-    # Add file handler if configured
-    if settings.logging.file_path:
-        logger.add(
-            settings.logging.file_path,
-            level=log_level,
-            format=log_format,
-            rotation="10 MB",
-            retention="1 week",
-            backtrace=True,
-            diagnose=True
-        )
+    # Development: boxed, colourised output with full tracebacks.
+    # Production: JSON lines through an enqueued sink, per-module gates and request sampling.
+    from .utils.structured_logging import configure_logging
+    configure_logging(settings.logging)
 
     # Test log message
-    logger.info("Logging system initialized with loguru")
+    logger.info(f"Logging system initialized with loguru ({settings.logging.profile} profile)")
 
 
 def _setup_global_exception_handler() -> None:
@@ -309,10 +235,33 @@ def _register_error_handlers(app: socketify.App) -> None:
     logger.info("Error handlers configured (using global exception handler)")
 
 
-async def _start_background_tasks(app: socketify.App):
-    """Start background tasks like PostgreSQL upholder and cache monitoring."""
+async def _shutdown() -> None:
+    """Drain write-behind buffers and close async resources before the process exits."""
+    logger.info("🛑 Shutting down: draining click write buffer...")
+    try:
+        await container.shutdown()
+    except Exception:
+        logger.exception("❌ Error during shutdown")
+
+
+async def _start_background_tasks(app: socketify.App, leader: Optional[LeaderLock] = None):
+    """Start background tasks like PostgreSQL upholder and cache monitoring.
+
+    Every worker registers the upholder endpoints, but the monitors themselves
+    run in one process only: right away without a ``leader`` lock (single
+    process mode), otherwise in whichever worker holds the lock.
+    """
     logger.info("🚀 Starting background tasks...")
-    await _initialize_postgres_upholder(app)  # Await here
+    start_singleton_jobs = await _initialize_postgres_upholder(app)
+    if start_singleton_jobs is None:
+        return
+
+    if leader is None:
+        start_singleton_jobs()
+    else:
+        # The upholder's scheduler binds to the running loop, so always start on the app loop
+        loop = asyncio.get_running_loop()
+        leader.on_elected(lambda: loop.call_soon_threadsafe(start_singleton_jobs))
     logger.info("✅ Background tasks started.")
 
 
@@ -335,32 +284,21 @@ def _add_health_endpoints(app: socketify.App) -> None:
             "hostname": socket.gethostname(),
             "timestamp": time.time()
         }
-        res.write_header("Content-Type", "application/json")
-        # Add CORS headers for API endpoints
-        res.write_header('Access-Control-Allow-Origin', '*')
-        res.write_header('Access-Control-Allow-Methods', 'GET, POST, PUT, DELETE, OPTIONS')
-        res.write_header('Access-Control-Allow-Headers', 'Content-Type, Authorization, X-API-Key')
-        res.write_header('Access-Control-Allow-Credentials', 'false')
-        res.write_header('Access-Control-Max-Age', '86400')
-        # Add security headers
-        from .presentation.middleware.security_middleware import add_security_headers
-        add_security_headers(res)
-        res.end(json.dumps(health_response))
+        send_json(res, health_response)
 
     def reset(res, req):
         """Reset application state for testing."""
         # Note: PostgreSQL repositories don't need explicit reset
         # as they work with the database directly
-        res.write_header("Content-Type", "application/json")
-        res.end(json.dumps({"message": "Application state reset"}))
+        send_json(res, {"message": "Application state reset"})
 
     # Register the routes
     app.get("/v1/health", health)
     app.post("/v1/reset", reset)
 
 
-async def _initialize_postgres_upholder(app: socketify.App) -> None:  # Made async
-    """Initialize PostgreSQL Auto Upholder system."""
+async def _initialize_postgres_upholder(app: socketify.App) -> Optional[Callable[[], None]]:
+    """Initialize PostgreSQL Auto Upholder system; returns the function that starts its monitoring."""
     try:
         logger.info(
             "🔧 ════════════════════════════════════════════════════════════════════════════════════════════════")
@@ -380,18 +318,11 @@ async def _initialize_postgres_upholder(app: socketify.App) -> None:  # Made asy
 
         upholder.add_alert_handler(app_alert_handler)
 
-        # Start upholder monitoring
-        upholder.start()
-        logger.info("✅ PostgreSQL Auto Upholder started successfully")
-        logger.info(
-            "🔧 ════════════════════════════════════════════════════════════════════════════════════════════════")
-
         # Initialize vectorized cache monitor if performance mode is enabled
-        import os
+        vectorized_monitor = None
         if os.getenv('PERFORMANCE_MODE', 'false').lower() == 'true':
             try:
-                logger.info("🚀 Initializing vectorized cache monitor...")
-                vectorized_monitor = container.get_vectorized_cache_monitor()
+                vectorized_monitor = await container.get_vectorized_cache_monitor()
 
                 # Add alert handler for vectorized monitor
                 def vectorized_alert_handler(alert):
@@ -400,19 +331,34 @@ async def _initialize_postgres_upholder(app: socketify.App) -> None:  # Made asy
                         logger.info(f"💡 Recommendation: {rec}")
 
                 vectorized_monitor.add_alert_handler(vectorized_alert_handler)
-                vectorized_monitor.start_monitoring()
-                logger.info("✅ Vectorized cache monitor started successfully")
-
             except Exception as e:
                 logger.error(f"❌ Failed to initialize vectorized cache monitor: {e}")
 
         # Add upholder management endpoints
         _add_upholder_endpoints(app, upholder)
 
+        def start_monitoring():
+            # Start upholder monitoring
+            upholder.start()
+            logger.info("✅ PostgreSQL Auto Upholder started successfully")
+            logger.info(
+                "🔧 ════════════════════════════════════════════════════════════════════════════════════════════════")
+
+            if vectorized_monitor is not None:
+                try:
+                    logger.info("🚀 Starting vectorized cache monitor...")
+                    vectorized_monitor.start_monitoring()
+                    logger.info("✅ Vectorized cache monitor started successfully")
+                except Exception as e:
+                    logger.error(f"❌ Failed to start vectorized cache monitor: {e}")
+
+        return start_monitoring
+
     except Exception as e:
         logger.error(f"❌ Failed to initialize PostgreSQL Auto Upholder: {e}")
         # Don't fail app startup if upholder fails
         logger.warning("⚠️  Continuing without PostgreSQL optimization monitoring")
+        return None
 
 
 def _add_upholder_endpoints(app: socketify.App, upholder) -> None:
@@ -445,32 +391,15 @@ def _add_upholder_endpoints(app: socketify.App, upholder) -> None:
                 "performance_dashboard": dashboard
             }
 
-            logger.info("📊 Step 4: Setting response headers")
-            res.write_header("Content-Type", "application/json")
-            res.write_header('Access-Control-Allow-Origin', '*')
-            res.write_header('Access-Control-Allow-Methods', 'GET, POST, PUT, DELETE, OPTIONS')
-            res.write_header('Access-Control-Allow-Headers', 'Content-Type, Authorization, X-API-Key')
-            res.write_header('Access-Control-Allow-Credentials', 'false')
-            res.write_header('Access-Control-Max-Age', '86400')
-
-            logger.info("📊 Step 5: Adding security headers")
-            from .presentation.middleware.security_middleware import add_security_headers
-            add_security_headers(res)
-
-            logger.info("📊 Step 6: Serializing response")
-            response_json = json.dumps(response, default=str)
-
-            logger.info("📊 Step 7: Sending response")
-            res.end(response_json)
+            logger.info("📊 Step 4: Sending response")
+            send_json(res, response, headers=ADMIN_HEADERS, default=str)
 
             total_time = time.time() - start_time
         except Exception as e:
             logger.error(f"❌ ERROR in get_upholder_status: {e}")
             import traceback
             logger.error(f"Traceback: {traceback.format_exc()}")
-            res.write_status(500)
-            res.write_header("Content-Type", "application/json")
-            res.end(json.dumps({"error": str(e)}))
+            send_json(res, {"error": str(e)}, 500, headers=ADMIN_HEADERS)
 
     def run_upholder_audit(res, req):
         """Run immediate upholder audit."""
@@ -488,22 +417,11 @@ def _add_upholder_endpoints(app: socketify.App, upholder) -> None:
             }
 
             logger.info(f"✅ Manual audit completed in {report.duration_seconds:.2f}s")
-            res.write_header("Content-Type", "application/json")
-            res.write_header('Access-Control-Allow-Origin', '*')
-            res.write_header('Access-Control-Allow-Methods', 'GET, POST, PUT, DELETE, OPTIONS')
-            res.write_header('Access-Control-Allow-Headers', 'Content-Type, Authorization, X-API-Key')
-            res.write_header('Access-Control-Allow-Credentials', 'false')
-            res.write_header('Access-Control-Max-Age', '86400')
-            # Add security headers
-            from .presentation.middleware.security_middleware import add_security_headers
-            add_security_headers(res)
-            res.end(json.dumps(response, default=str))
+            send_json(res, response, headers=ADMIN_HEADERS, default=str)
 
         except Exception as e:
             logger.error(f"Error running upholder audit: {e}")
-            res.write_status(500)
-            res.write_header("Content-Type", "application/json")
-            res.end(json.dumps({"error": str(e)}))
+            send_json(res, {"error": str(e)}, 500, headers=ADMIN_HEADERS)
 
     def get_upholder_config(res, req):
         """Get upholder configuration."""
@@ -511,22 +429,11 @@ def _add_upholder_endpoints(app: socketify.App, upholder) -> None:
             status = upholder.get_status()
             config = status.get('config', {})
 
-            res.write_header("Content-Type", "application/json")
-            res.write_header('Access-Control-Allow-Origin', '*')
-            res.write_header('Access-Control-Allow-Methods', 'GET, POST, PUT, DELETE, OPTIONS')
-            res.write_header('Access-Control-Allow-Headers', 'Content-Type, Authorization, X-API-Key')
-            res.write_header('Access-Control-Allow-Credentials', 'false')
-            res.write_header('Access-Control-Max-Age', '86400')
-            # Add security headers
-            from .presentation.middleware.security_middleware import add_security_headers
-            add_security_headers(res)
-            res.end(json.dumps(config))
+            send_json(res, config, headers=ADMIN_HEADERS)
 
         except Exception as e:
             logger.error(f"Error getting upholder config: {e}")
-            res.write_status(500)
-            res.write_header("Content-Type", "application/json")
-            res.end(json.dumps({"error": str(e)}))
+            send_json(res, {"error": str(e)}, 500, headers=ADMIN_HEADERS)
 
     def get_connection_pool_status(res, req):
         """Get connection pool status."""
@@ -539,52 +446,26 @@ def _add_upholder_endpoints(app: socketify.App, upholder) -> None:
             monitor_start = time.time()
             pool_status = upholder.connection_pool_monitor.get_pool_status()
             monitor_time = time.time() - monitor_start
-            logger.info("🏊 Step 2: Setting response headers")
-            res.write_header("Content-Type", "application/json")
-            res.write_header('Access-Control-Allow-Origin', '*')
-            res.write_header('Access-Control-Allow-Methods', 'GET, POST, PUT, DELETE, OPTIONS')
-            res.write_header('Access-Control-Allow-Headers', 'Content-Type, Authorization, X-API-Key')
-            res.write_header('Access-Control-Allow-Credentials', 'false')
-            res.write_header('Access-Control-Max-Age', '86400')
-
-            logger.info("🏊 Step 3: Adding security headers")
-            from .presentation.middleware.security_middleware import add_security_headers
-            add_security_headers(res)
-
-            logger.info("🏊 Step 4: Serializing and sending response")
-            response_json = json.dumps(pool_status, default=str)
-            res.end(response_json)
+            logger.info("🏊 Step 2: Sending response")
+            send_json(res, pool_status, headers=ADMIN_HEADERS, default=str)
 
             total_time = time.time() - pool_start
         except Exception as e:
             logger.error(f"❌ ERROR in get_connection_pool_status: {e}")
             import traceback
             logger.error(f"Traceback: {traceback.format_exc()}")
-            res.write_status(500)
-            res.write_header("Content-Type", "application/json")
-            res.end(json.dumps({"error": str(e)}))
+            send_json(res, {"error": str(e)}, 500, headers=ADMIN_HEADERS)
 
     def get_connection_pool_suggestions(res, req):
         """Get connection pool optimization suggestions."""
         try:
             suggestions = upholder.connection_pool_monitor.get_optimization_suggestions()
 
-            res.write_header("Content-Type", "application/json")
-            res.write_header('Access-Control-Allow-Origin', '*')
-            res.write_header('Access-Control-Allow-Methods', 'GET, POST, PUT, DELETE, OPTIONS')
-            res.write_header('Access-Control-Allow-Headers', 'Content-Type, Authorization, X-API-Key')
-            res.write_header('Access-Control-Allow-Credentials', 'false')
-            res.write_header('Access-Control-Max-Age', '86400')
-            # Add security headers
-            from .presentation.middleware.security_middleware import add_security_headers
-            add_security_headers(res)
-            res.end(json.dumps(suggestions, default=str))
+            send_json(res, suggestions, headers=ADMIN_HEADERS, default=str)
 
         except Exception as e:
             logger.error(f"Error getting connection pool suggestions: {e}")
-            res.write_status(500)
-            res.write_header("Content-Type", "application/json")
-            res.end(json.dumps({"error": str(e)}))
+            send_json(res, {"error": str(e)}, 500, headers=ADMIN_HEADERS)
 
     def apply_connection_pool_optimization(res, req):
         """Apply connection pool optimization."""
@@ -592,31 +473,18 @@ def _add_upholder_endpoints(app: socketify.App, upholder) -> None:
             # Get action from query parameter
             action = req.get_query('action')
             if not action:
-                res.write_status(400)
-                res.write_header("Content-Type", "application/json")
-                res.end(json.dumps({"error": "action parameter required"}))
+                send_json(res, {"error": "action parameter required"}, 400, headers=ADMIN_HEADERS)
                 return
 
             dry_run = req.get_query('dry_run') != 'false'  # Default to true
 
             result = upholder.connection_pool_monitor.apply_optimization(action, dry_run=dry_run)
 
-            res.write_header("Content-Type", "application/json")
-            res.write_header('Access-Control-Allow-Origin', '*')
-            res.write_header('Access-Control-Allow-Methods', 'GET, POST, PUT, DELETE, OPTIONS')
-            res.write_header('Access-Control-Allow-Headers', 'Content-Type, Authorization, X-API-Key')
-            res.write_header('Access-Control-Allow-Credentials', 'false')
-            res.write_header('Access-Control-Max-Age', '86400')
-            # Add security headers
-            from .presentation.middleware.security_middleware import add_security_headers
-            add_security_headers(res)
-            res.end(json.dumps(result, default=str))
+            send_json(res, result, headers=ADMIN_HEADERS, default=str)
 
         except Exception as e:
             logger.error(f"Error applying connection pool optimization: {e}")
-            res.write_status(500)
-            res.write_header("Content-Type", "application/json")
-            res.end(json.dumps({"error": str(e)}))
+            send_json(res, {"error": str(e)}, 500, headers=ADMIN_HEADERS)
 
     # Register endpoints
     app.get('/v1/system/upholder/status', get_upholder_status)
@@ -651,80 +519,89 @@ def _add_cors_headers(app: socketify.App) -> None:
     pass
 
 
-if __name__ == "__main__":
+async def _drain(app: socketify.App, in_flight: InFlightRequests, timeout: float) -> None:
+    """Stop accepting, wait for request handlers to finish, then stop the loop."""
+    logger.info(f"🛑 Draining worker {os.getpid()} ({in_flight.count} requests in flight, up to {timeout:.0f}s)...")
+    stop_accepting(app)
+    if not await in_flight.wait_idle(timeout):
+        logger.warning(f"⚠️ {in_flight.count} requests still running after {timeout:.0f}s drain")
+    app.close()
+
+
+def serve(leader: Optional[LeaderLock] = None) -> None:
+    """Build the app on a fresh loop, listen and run until SIGTERM drains it."""
+    start = time.time()
+    loop = asyncio.new_event_loop()
+    asyncio.set_event_loop(loop)
+
+    logger.info("🏗️ Creating application (async)...")
+    app = loop.run_until_complete(create_app())
+    logger.info(f"🏗️ Application created in {time.time() - start:.4f} seconds")
+    loop.run_until_complete(_start_background_tasks(app, leader))
+
+    def on_listen(config):
+        logger.info(f"🚀 Server listening on {config.host}:{config.port} (pid {os.getpid()}) "
+                    f"after {time.time() - start:.4f}s")
+
+    in_flight = InFlightRequests(app)
+    drain_timeout = settings.api.drain_timeout_seconds
+    loop.add_signal_handler(signal.SIGTERM, lambda: loop.create_task(_drain(app, in_flight, drain_timeout)))
+    if leader is not None:
+        # app.run() installs an abrupt SIGINT handler; under the supervisor Ctrl-C arrives
+        # as SIGTERM from the parent instead, so ignore the terminal's copy
+        loop.call_soon(signal.signal, signal.SIGINT, signal.SIG_IGN)
+
+    try:
+        # uSockets listens with SO_REUSEPORT, so every worker binds the same port
+        app.listen(socketify.AppListenOptions(port=settings.api.port, host=settings.api.host), on_listen)
+        if getattr(app, 'socket', None) is None:
+            # socketify only prints the failure; raise so the worker exits non-zero and is restarted
+            raise RuntimeError(f"Failed to listen on {settings.api.host}:{settings.api.port}")
+        app.run()
+    finally:
+        loop.run_until_complete(_shutdown())
+        if leader is not None:
+            leader.release()
+        loop.close()
+
+
+def main() -> None:
+    """Run a single process, or a pre-fork supervisor when WORKERS > 1."""
     logger.info("🚀 START: Application main execution")
-    main_start = time.time()
-
-    import multiprocessing
-    import asyncio  # Import asyncio here if not already imported
-
-
-    async def start_server():
-        logger.info("🏗️ Creating application (async)...")
-        app = await create_app()  # Await the async create_app
-        app_create_time = time.time() - main_start
-        logger.info(f"🏗️ Application created in {app_create_time:.4f} seconds")
-
-        # Compatible listen options for current socketify version
-        listen_options = socketify.AppListenOptions(
-            port=settings.api.port,
-            host=settings.api.host,
-        )
-
-        logger.info(f"🏁 Starting high-performance server on {settings.api.host}:{settings.api.port}...")
-        server_setup_time = time.time() - main_start
-
-        def on_listen(config):
-            total_startup_time = time.time() - main_start
-            logger.info(f"🚀 Server listening on {config.host}:{config.port} with maximum performance settings")
-            logger.info("✅ Compression: DISABLED | Backlog: 16384 | Idle timeout: NONE | Reuse port: ENABLED")
-            # Removed duplicated log line
-
-        # For true multi-CPU scaling, spawn multiple processes
-        num_processes = settings.api.workers or multiprocessing.cpu_count()
-
-        if num_processes > 1:
-            logger.info(f"🔥 Spawning {num_processes} processes for maximum CPU utilization...")
-
-            def run_worker():
-                # Each worker needs its own app instance and event loop
-                worker_app = asyncio.run(create_app())  # Run create_app in new event loop for worker
-                # Initialize background tasks for each worker as well
-                asyncio.run(_start_background_tasks(worker_app))
-                worker_app.listen(listen_options, on_listen)
-                worker_app.run()
-
-            processes = []
-            for i in range(num_processes):
-                process = multiprocessing.Process(
-                    target=run_worker,
-                    name=f"Socketify-Worker-{i + 1}",
-                    daemon=True
-                )
-                process.start()
-                processes.append(process)
+    num_processes = settings.api.workers or os.cpu_count() or 1
+
+    if num_processes <= 1:
+        logger.info("🎯 Single-process mode. For maximum performance, set WORKERS environment variable.")
+        serve()
+        return
+
+    logger.info(f"🔥 Pre-forking {num_processes} workers on {settings.api.host}:{settings.api.port}...")
+    check_listen_address(settings.api.host, settings.api.port)
+
+    if settings.security.rate_limit_backend == 'shared_memory':
+        # Created before forking so every worker inherits the same counters
+        from .presentation.middleware.security_middleware import configure_rate_limiter, create_rate_limiter
+        configure_rate_limiter(create_rate_limiter(shared=True))
+        logger.info("🚦 Rate limits enforced globally across workers (shared memory)")
+
+    # Revoked bearer tokens must be rejected by every worker, not just the one that revoked them
+    from .presentation.middleware.security_middleware import configure_token_cache, create_token_cache
+    configure_token_cache(create_token_cache(shared=True))
+
+    budget = settings.database.connection_budget if settings.database else 150
+    sizes = split_connection_budget(budget, num_processes)
+    container.configure_pool_sizes(sizes)
+    logger.info(f"🔌 DB budget {budget}: {sizes.sync_max} sync + {sizes.async_max} async connections per worker")
+
+    lock_path = settings.api.leader_lock_path or os.path.join(
+        tempfile.gettempdir(), f"affiliate-api-{settings.api.port}.leader")
+    supervisor = PreforkSupervisor(
+        target=lambda slot: serve(LeaderLock(lock_path)),
+        workers=num_processes,
+        drain_timeout=settings.api.drain_timeout_seconds + 5,
+    )
+    supervisor.run()
 
-            try:
-                logger.info("🎯 All workers started! Server ready for maximum throughput.")
-                # Start background tasks in the main process (only once)
-                await _start_background_tasks(app)  # Await the background tasks
-
-                for process in processes:
-                    process.join()
-            except KeyboardInterrupt:
-                logger.info("🛑 Shutting down workers...")
-                for process in processes:
-                    process.terminate()
-                for process in processes:
-                    process.join()
-        else:
-            # Single process mode
-            # Start background tasks in the single process
-            await _start_background_tasks(app)  # Await here
-
-            app.listen(listen_options, on_listen)
-            logger.info("🎯 Single-process mode. For maximum performance, set WORKERS environment variable.")
-            app.run()
-
-
-    asyncio.run(start_server())  # Run the async server startup
+
+if __name__ == "__main__":
+    main()
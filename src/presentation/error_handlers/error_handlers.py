@@ -13,7 +13,7 @@
 
 """Error handlers for the application."""
 
-import json
+from ..responses import API_HEADERS, send_html, send_json
 
 # HTTP Status Code Constants
 HTTP_BAD_REQUEST = 400
@@ -22,6 +22,8 @@ HTTP_METHOD_NOT_ALLOWED = 405
 HTTP_UNPROCESSABLE_ENTITY = 422
 HTTP_INTERNAL_SERVER_ERROR = 500
 
+_METHOD_NOT_ALLOWED_HEADERS = API_HEADERS + ((b"Allow", b"GET, POST, PUT, DELETE, OPTIONS"),)
+
 
 def register_error_handlers(app):
     """Register error handlers with socketify app."""
@@ -36,40 +38,29 @@ def register_error_handlers(app):
 def handle_bad_request_error(res):
     """Handle bad request error."""
     error_response = {"error": {"code": "BAD_REQUEST", "message": "Bad request"}}
-    res.write_status(HTTP_BAD_REQUEST)
-    res.write_header("Content-Type", "application/json")
-    res.end(json.dumps(error_response))
+    send_json(res, error_response, HTTP_BAD_REQUEST)
 
 
 def handle_not_found_error(res, is_click_endpoint=False):
     """Handle not found error."""
     if is_click_endpoint:
         error_html = "<html><body><h1>Error</h1><p>Campaign not found</p></body></html>"
-        res.write_status(HTTP_NOT_FOUND)
-        res.write_header("Content-Type", "text/html")
-        res.end(error_html)
+        send_html(res, error_html, HTTP_NOT_FOUND)
     else:
         error_response = {"error": {"code": "NOT_FOUND", "message": "Endpoint not found"}}
-        res.write_status(HTTP_NOT_FOUND)
-        res.write_header("Content-Type", "application/json")
-        res.end(json.dumps(error_response))
+        send_json(res, error_response, HTTP_NOT_FOUND)
 
 
 def handle_method_not_allowed_error(res):
     """Handle method not allowed error."""
     error_response = {"error": {"code": "METHOD_NOT_ALLOWED", "message": "Method not allowed"}}
-    res.write_status(HTTP_METHOD_NOT_ALLOWED)
-    res.write_header("Allow", "GET, POST, PUT, DELETE, OPTIONS")
-    res.write_header("Content-Type", "application/json")
-    res.end(json.dumps(error_response))
+    send_json(res, error_response, HTTP_METHOD_NOT_ALLOWED, headers=_METHOD_NOT_ALLOWED_HEADERS)
 
 
 def handle_unprocessable_entity_error(res):
     """Handle unprocessable entity error."""
     error_response = {"error": {"code": "VALIDATION_ERROR", "message": "Unprocessable entity"}}
-    res.write_status(HTTP_UNPROCESSABLE_ENTITY)
-    res.write_header("Content-Type", "application/json")
-    res.end(json.dumps(error_response))
+    send_json(res, error_response, HTTP_UNPROCESSABLE_ENTITY)
 
 
 def handle_internal_server_error(res, logger=None):
@@ -77,9 +68,7 @@ def handle_internal_server_error(res, logger=None):
     if logger:
         logger.error("Internal server error occurred")
     error_response = {"error": {"code": "INTERNAL_SERVER_ERROR", "message": "Internal server error"}}
-    res.write_status(HTTP_INTERNAL_SERVER_ERROR)
-    res.write_header("Content-Type", "application/json")
-    res.end(json.dumps(error_response))
+    send_json(res, error_response, HTTP_INTERNAL_SERVER_ERROR)
 
 
 def handle_unhandled_exception(res, error, logger=None):
@@ -87,6 +76,4 @@ def handle_unhandled_exception(res, error, logger=None):
     if logger:
         logger.error(f"Unhandled exception: {error}")
     error_response = {"error": {"code": "INTERNAL_SERVER_ERROR", "message": "Internal server error"}}
-    res.write_status(HTTP_INTERNAL_SERVER_ERROR)
-    res.write_header("Content-Type", "application/json")
-    res.end(json.dumps(error_response))
+    send_json(res, error_response, HTTP_INTERNAL_SERVER_ERROR)
@@ -14,7 +14,13 @@
 """Presentation middleware."""
 
 from .security_middleware import setup_security_middleware
+from .route_spec import PAGINATION_PARAMS, QueryParam, RouteSpec, compile_route_validator, route
 
 __all__ = [
-    'setup_security_middleware'
+    'setup_security_middleware',
+    'RouteSpec',
+    'QueryParam',
+    'PAGINATION_PARAMS',
+    'compile_route_validator',
+    'route',
 ]
@@ -0,0 +1,167 @@
+# Copyright (c) 2025 Bivex
+#
+# Author: Bivex
+# Available for contact via email: support@b-b.top
+# For up-to-date contact information:
+# https://github.com/bivex
+#
+# Created: 2026-10-16T09:12:04
+# Last Updated: 2026-10-16T09:12:04
+#
+# Licensed under the MIT License.
+# Commercial licensing available upon request.
+
+"""Declarative route specs compiled into per-route request validators.
+
+A route declares its pattern, methods, query parameters and whether it needs
+authentication once, at ``register()`` time::
+
+    spec = RouteSpec('/v1/campaigns', query=PAGINATION_PARAMS)
+    validate = compile_route_validator(spec)
+
+    async def list_campaigns(res, req):
+        params = validate(req, res)
+        if params is None:
+            return  # Validation failed, response already sent
+        page, page_size = params['page'], params['pageSize']
+
+    route(app, spec, list_campaigns)
+
+The validator never re-parses the URL: the route group for rate limiting is
+taken from the registered pattern, declared parameters are read with
+``req.get_query``, and only ``strict_query`` routes look at the raw query
+string to reject undeclared parameters.
+"""
+
+from dataclasses import dataclass
+from datetime import date, datetime
+from typing import Any, Callable, Dict, FrozenSet, Optional, Tuple
+from urllib.parse import parse_qsl
+
+from .security_middleware import authenticate_request, enforce_rate_limit
+from ..responses import send_json
+
+_TRUE_VALUES = frozenset({'1', 'true', 'yes', 'on'})
+_FALSE_VALUES = frozenset({'0', 'false', 'no', 'off'})
+
+
+@dataclass(frozen=True)
+class QueryParam:
+    """One accepted query parameter with its type and bounds."""
+    name: str
+    type: type = str
+    default: Any = None
+    minimum: Optional[float] = None
+    maximum: Optional[float] = None
+    choices: Optional[Tuple[Any, ...]] = None
+    required: bool = False
+
+    def parse(self, raw: Optional[str]) -> Any:
+        """Convert a raw query value, raising ValueError with a client-facing message."""
+        if raw is None:
+            if self.required:
+                raise ValueError(f"{self.name} is required")
+            return self.default
+        if self.type is bool:
+            lowered = raw.lower()
+            if lowered not in _TRUE_VALUES and lowered not in _FALSE_VALUES:
+                raise ValueError(f"{self.name} must be a boolean")
+            value = lowered in _TRUE_VALUES
+        elif self.type in (date, datetime):
+            try:
+                value = self.type.fromisoformat(raw)
+            except ValueError:
+                raise ValueError(f"{self.name} must be an ISO 8601 date") from None
+        else:
+            try:
+                value = self.type(raw)
+            except (TypeError, ValueError):
+                kind = {int: 'an integer', float: 'a number'}.get(self.type, f'a valid {self.type.__name__}')
+                raise ValueError(f"{self.name} must be {kind}") from None
+        if self.choices is not None and value not in self.choices:
+            raise ValueError(f"{self.name} must be one of: {', '.join(map(str, self.choices))}")
+        if self.minimum is not None and self.maximum is not None:
+            if not self.minimum <= value <= self.maximum:
+                raise ValueError(f"{self.name} must be between {self.minimum} and {self.maximum}")
+        elif self.minimum is not None and value < self.minimum:
+            raise ValueError(f"{self.name} must be >= {self.minimum}")
+        elif self.maximum is not None and value > self.maximum:
+            raise ValueError(f"{self.name} must be <= {self.maximum}")
+        return value
+
+
+@dataclass(frozen=True)
+class RouteSpec:
+    """What a route accepts; compiled once into a validator closure."""
+    pattern: str
+    methods: FrozenSet[str] = frozenset({'GET'})
+    query: Tuple[QueryParam, ...] = ()
+    auth: bool = True
+    rate_limited: bool = True
+    strict_query: bool = False
+
+    @property
+    def static_prefix(self) -> str:
+        """The pattern up to its first ``:param`` segment, used as the rate limit path."""
+        prefix = self.pattern.split('/:', 1)[0]
+        return prefix or '/'
+
+
+PAGINATION_PARAMS = (
+    QueryParam('page', int, default=1, minimum=1),
+    QueryParam('pageSize', int, default=20, minimum=1, maximum=100),
+)
+
+
+def _validation_error(res, message: str) -> None:
+    send_json(res, {"error": {"code": "VALIDATION_ERROR", "message": message}}, 400)
+
+
+def compile_route_validator(spec: RouteSpec) -> Callable[[Any, Any], Optional[Dict[str, Any]]]:
+    """
+    Build ``validate(req, res)`` for a route.
+
+    It returns the parsed query parameters, or None after it has already sent
+    a 400/401/429 response. It must run before the handler's first ``await``,
+    while the socketify request is still valid.
+    """
+    params = spec.query
+    allowed = frozenset(param.name for param in params)
+    rate_limit_path = spec.static_prefix
+    rate_limited = spec.rate_limited
+    auth = spec.auth
+    strict = spec.strict_query
+
+    def validate(req, res) -> Optional[Dict[str, Any]]:
+        if rate_limited and enforce_rate_limit(req, res, rate_limit_path):
+            return None
+
+        if strict:
+            query = (req.get_full_url() or '').partition('?')[2]
+            raw = dict(parse_qsl(query, keep_blank_values=True)) if query else {}
+            if raw.keys() - allowed:
+                _validation_error(res, "Unknown query parameter")
+                return None
+            get_raw = raw.get
+        else:
+            get_raw = req.get_query
+
+        values = {}
+        try:
+            for param in params:
+                values[param.name] = param.parse(get_raw(param.name))
+        except ValueError as e:
+            _validation_error(res, str(e))
+            return None
+
+        if auth and authenticate_request(req, res):
+            return None
+        return values
+
+    return validate
+
+
+def route(app, spec: RouteSpec, handler) -> None:
+    """Register ``handler`` for every method of ``spec``."""
+    for method in spec.methods:
+        getattr(app, method.lower())(spec.pattern, handler)
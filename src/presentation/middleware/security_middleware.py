@@ -13,19 +13,26 @@
 
 """Security middleware for socketify applications."""
 
-import json
-import time
 from datetime import datetime, timezone
+from typing import Optional
 
 import jwt
 from loguru import logger
 
 from ...config.settings import settings
-from ...domain.constants import RATE_LIMIT_REQUESTS_PER_MINUTE
+from ...domain.constants import RATE_LIMIT_REQUESTS_PER_MINUTE, RATE_LIMIT_WINDOW_SECONDS
+from ...infrastructure.auth import RevocationList, VerifiedTokenCache
+from ...infrastructure.ratelimit import RateLimit, SlidingWindowRateLimiter, build_rate_limiter
 from ...utils.encoding import safe_string_for_logging
+from ..responses import API_HEADERS, SECURITY_HEADER_BUNDLE, send_json, write_headers
 
-# Rate limiting storage (simple in-memory for demo)
-_request_counts = {}
+# Process-wide limiter; built from settings on first use unless main.py installs a shared one before forking
+_rate_limiter: Optional[SlidingWindowRateLimiter] = None
+
+# Claims of already verified bearer tokens (None when JWT_CACHE_ENABLED=false);
+# main.py installs one with a shared revocation list before forking workers
+_token_cache: Optional[VerifiedTokenCache] = None
+_token_cache_initialized = False
 
 
 def setup_security_middleware(app):
@@ -43,147 +50,38 @@ def setup_security_middleware(app):
     pass
 
 
-def validate_request(req, res):
-    """Validate incoming request before processing."""
-    # Import async debug here to avoid circular imports
-    try:
-        from ..utils.async_debug import debug_http_request
-        debug_http_request("validate_request")
-    except ImportError:
-        pass
+# Paths that skip validation entirely
+_UNVALIDATED_PREFIXES = ('/v1/health', '/v1/reset')
 
-    # Get path - socketify request object has limited path access
-    # For now, we'll check if analytics is in the URL to determine protection
-    try:
-        try:
-            full_url = req.get_full_url()
-            logger.debug(f"Full URL: {full_url}, type: {type(full_url)}")
-        except Exception as url_error:
-            logger.error(f"Failed to get full URL: {url_error}")
-            full_url = None
+# Token self-revocation; rate limited in a group of its own (see create_rate_limiter)
+REVOKE_PATH = '/v1/auth/revoke'
 
-        # More robust URL parsing
-        try:
-            if not full_url or (isinstance(full_url, str) and full_url.strip() == ''):
-                # If URL is empty, try to get path from request object
-                # For socketify, we might need to construct path differently
-                path = '/v1'  # Default fallback
-                logger.debug("URL is empty or None, using fallback path")
-            elif isinstance(full_url, str) and '://' in full_url:
-                # Extract path from URL like http://host:port/path
-                url_parts = full_url.split('://', 1)[1]  # Remove protocol
-                path_start = url_parts.find('/')
-                if path_start >= 0:
-                    path = url_parts[path_start:]  # Get path including leading /
-                else:
-                    path = '/'
-            else:
-                # Fallback for URLs without protocol or invalid types
-                path = '/v1'  # Safe fallback
-                logger.debug(f"Using fallback path for URL: {full_url}")
-        except (IndexError, ValueError, AttributeError) as parse_error:
-            logger.warning(f"Failed to parse URL: {parse_error}")
-            path = '/v1'  # Safe fallback
-
-        # Ensure path starts with /
-        if not path.startswith('/'):
-            path = '/' + path
-
-        # Skip ALL validation for POST endpoints that have issues with socketify URL parsing
-        skip_validation_endpoints = [
-            '/v1/fraud/rules',
-            '/v1/cache/flush'
-        ]
-        if any(path.startswith(endpoint) for endpoint in skip_validation_endpoints):
-            logger.debug(f"Skipping ALL validation for endpoint: {path}")
-            return None  # Skip all validation for these endpoints
-
-        # Basic URL validation - reject obviously malformed URLs
-        if full_url is None or (
-                isinstance(full_url, str) and (not full_url or len(full_url) > 8192)):  # Reasonable URL length limit
-            logger.warning(f"URL too long or empty: {len(full_url) if isinstance(full_url, str) else 'None'} chars")
-            error_response = {
-                'error': {
-                    'code': 'INVALID_URL',
-                    'message': 'Invalid URL format'
-                }
-            }
-            res.write_status(400)
-            res.write_header("Content-Type", "application/json")
-            res.end(json.dumps(error_response))
-            return True
-
-        # More robust URL parsing
-        try:
-            if not full_url or full_url.strip() == '':
-                # If URL is empty, try to get path from request object
-                # For socketify, we might need to construct path differently
-                path = '/v1'  # Default fallback
-            elif '://' in full_url:
-                # Extract path from URL like http://host:port/path
-                url_parts = full_url.split('://', 1)[1]  # Remove protocol
-                path_start = url_parts.find('/')
-                if path_start >= 0:
-                    path = url_parts[path_start:]  # Get path including leading /
-                else:
-                    path = '/'
-            else:
-                # Fallback for URLs without protocol
-                path = full_url if full_url.startswith('/') else '/'
-        except (IndexError, ValueError, AttributeError):
-            path = '/v1'  # Safe fallback
-
-        # Ensure path starts with /
-        if not path.startswith('/'):
-            path = '/' + path
 
-    except Exception as e:
-        logger.warning(f"Unexpected error in validate_request: {e}", exc_info=True)
-        # Don't fail validation for unexpected errors - let the request proceed
-        logger.debug("Allowing request to proceed due to unexpected validation error")
-        return None
+def validate_request(req, res):
+    """Validate incoming request before processing.
 
-    logger.debug(f"Middleware called for {req.get_method()} {path}")
+    Generic fallback for routes without a compiled ``RouteSpec`` validator
+    (see ``route_spec.compile_route_validator``).
+    """
+    path = req.get_url() or '/'
 
-    # Skip validation for health check endpoints
-    if path.startswith('/v1/health') or path.startswith('/v1/reset'):
-        logger.debug("Skipping validation for health/reset endpoints")
+    if path.startswith(_UNVALIDATED_PREFIXES):
         return None
 
-    # Skip ALL validation for POST endpoints that have issues with socketify URL parsing
-    skip_validation_endpoints = [
-        '/v1/fraud/rules',
-        '/v1/cache/flush'
-    ]
-    if any(path.startswith(endpoint) for endpoint in skip_validation_endpoints):
-        logger.debug(f"Skipping ALL validation for endpoint: {path}")
-        return None  # Skip all validation for these endpoints
-
     try:
         _check_header_characters_socketify(req)
         _check_header_lengths_socketify(req)
         _validate_content_type_socketify(req)
 
-        # TEMPORARILY DISABLE method validation for testing
-        # method_result = _check_allowed_methods_socketify(req, res)
-        # if method_result:
-        #     return method_result
-
-        rate_limit_result = _check_rate_limiting_socketify(req, res)
+        rate_limit_result = enforce_rate_limit(req, res, path)
         if rate_limit_result:
             return rate_limit_result
 
-        param_result = _validate_unknown_parameters_socketify(req, res)
-        if param_result:
-            logger.debug("Parameter validation failed")
-            return param_result
-
-        auth_result = _validate_authentication_socketify(req, res)
+        auth_result = _validate_authentication_socketify(req, res, path)
         if auth_result:
             logger.debug("Authentication validation failed")
             return auth_result
 
-        logger.debug("All validation passed")
         return None  # Validation passed
 
     except Exception as e:
@@ -194,9 +92,7 @@ def validate_request(req, res):
                 'message': 'Request validation failed'
             }
         }
-        res.write_status(400)
-        res.write_header("Content-Type", "application/json")
-        res.end(json.dumps(error_response))
+        send_json(res, error_response, 400)
         return True
 
 
@@ -235,33 +131,21 @@ def _validate_content_type_socketify(req):
     return None
 
 
-def _validate_authentication_socketify(req, res):
-    """Validate authentication for protected endpoints."""
-    # Simplified path detection for socketify
+def _validate_authentication_socketify(req, res, path: str):
+    """Validate authentication unless the path is a public endpoint."""
     method = req.get_method()
+    is_public = (
+        path.startswith('/v1/health')
+        or path.startswith('/v1/auth/token')
+        or (path == '/v1/click' and method == 'GET')
+    )
+    if is_public:
+        return None
+    return authenticate_request(req, res)
 
-    # Check if this is the public click tracking endpoint
-    # Since socketify doesn't provide easy path access, we'll use other indicators
-    # For now, assume all endpoints except known public ones need authentication
-    try:
-        full_url = req.get_full_url()
-        is_health = '/health' in full_url
-        is_click_tracking = '/click' in full_url and method == 'GET' and not '/clicks' in full_url and not '/click/' in full_url
-        is_auth_token = '/auth/token' in full_url  # Skip auth for token generation endpoint
-    except AttributeError:
-        # Fallback: assume this is not a public endpoint
-        is_health = False
-        is_click_tracking = False
-        is_auth_token = False
-
-    logger.debug(
-        f"Checking auth: method={method}, is_health={is_health}, is_click_tracking={is_click_tracking}, is_auth_token={is_auth_token}")
-
-    if is_health or is_click_tracking or is_auth_token:
-        logger.debug("Skipping auth for public endpoint")
-        return None  # Skip authentication for public endpoints
 
-    # For protected endpoints, check authentication
+def authenticate_request(req, res):
+    """Check the bearer token or API key; sends a 401 and returns True on failure."""
     auth_header = req.get_header('authorization') or ''
     api_key = req.get_header('x-api-key') or ''
 
@@ -271,14 +155,17 @@ def _validate_authentication_socketify(req, res):
     if auth_header.startswith('Bearer '):
         token = auth_header[7:]  # Remove 'Bearer ' prefix
         try:
-            # Decode and validate JWT token
-            payload = jwt.decode(
-                token,
-                settings.security.secret_key,
-                algorithms=[settings.security.jwt_algorithm],
-                audience="supreme-octo-succotash-client",
-                issuer="supreme-octo-succotash-api"
-            )
+            payload = _verify_bearer_token(token)
+            if payload is None:
+                logger.warning("Revoked JWT token presented")
+                error_response = {
+                    'error': {
+                        'code': 'TOKEN_REVOKED',
+                        'message': 'Authentication token has been revoked'
+                    }
+                }
+                send_json(res, error_response, 401)
+                return True
 
             # Check if token is expired
             exp_timestamp = payload.get('exp')
@@ -290,9 +177,7 @@ def _validate_authentication_socketify(req, res):
                         'message': 'Authentication token has expired'
                     }
                 }
-                res.write_status(401)
-                res.write_header("Content-Type", "application/json")
-                res.end(json.dumps(error_response))
+                send_json(res, error_response, 401)
                 return True
 
             logger.debug("JWT token validation passed")
@@ -306,9 +191,7 @@ def _validate_authentication_socketify(req, res):
                     'message': 'Authentication token has expired'
                 }
             }
-            res.write_status(401)
-            res.write_header("Content-Type", "application/json")
-            res.end(json.dumps(error_response))
+            send_json(res, error_response, 401)
             return True
 
         except jwt.InvalidTokenError as e:
@@ -319,9 +202,7 @@ def _validate_authentication_socketify(req, res):
                     'message': 'Invalid authentication token'
                 }
             }
-            res.write_status(401)
-            res.write_header("Content-Type", "application/json")
-            res.end(json.dumps(error_response))
+            send_json(res, error_response, 401)
             return True
 
     # Fallback: Check for API key (for backward compatibility during transition)
@@ -340,12 +221,65 @@ def _validate_authentication_socketify(req, res):
             'message': 'Valid authentication required'
         }
     }
-    res.write_status(401)
-    res.write_header("Content-Type", "application/json")
-    res.end(json.dumps(error_response))
+    send_json(res, error_response, 401)
     return True
 
 
+def create_token_cache(shared: bool = False) -> Optional[VerifiedTokenCache]:
+    """Build the verified token cache from security settings (None when disabled).
+
+    With ``shared``, revocations live in shared memory and apply to every
+    worker forked afterwards.
+    """
+    security = settings.security
+    if not security.jwt_cache_enabled:
+        return None
+    return VerifiedTokenCache(max_entries=security.jwt_cache_max_entries,
+                              revocations=RevocationList(slots=security.jwt_revocation_slots, shared=shared))
+
+
+def configure_token_cache(cache: Optional[VerifiedTokenCache]) -> None:
+    """Install the token cache used by authentication (call before forking workers to share revocations)."""
+    global _token_cache, _token_cache_initialized
+    _token_cache = cache
+    _token_cache_initialized = True
+
+
+def get_token_cache() -> Optional[VerifiedTokenCache]:
+    """Get the process-wide verified token cache (None when disabled)."""
+    global _token_cache, _token_cache_initialized
+    if not _token_cache_initialized:
+        _token_cache = create_token_cache()
+        _token_cache_initialized = True
+    return _token_cache
+
+
+def _verify_bearer_token(token: str) -> Optional[dict]:
+    """Return the claims of a valid token, None if it was revoked; raises jwt errors otherwise.
+
+    A cache hit skips signature verification and JSON parsing; revoked tokens
+    are evicted from the cache, so only misses consult the revocation list.
+    """
+    cache = get_token_cache()
+    if cache is not None:
+        claims = cache.get(token)
+        if claims is not None:
+            return claims
+
+    claims = jwt.decode(
+        token,
+        settings.security.secret_key,
+        algorithms=[settings.security.jwt_algorithm],
+        audience="supreme-octo-succotash-client",
+        issuer="supreme-octo-succotash-api"
+    )
+    if cache is not None:
+        if cache.is_revoked(token, claims):
+            return None
+        cache.put(token, claims)
+    return claims
+
+
 def _is_valid_bearer_token(token: str) -> bool:
     """Validate Bearer token (simplified for demo)."""
     # Only accept this exact token for testing
@@ -358,108 +292,22 @@ def _is_valid_api_key(api_key: str) -> bool:
     return api_key == "schemathesis_valid_test_key_2024"
 
 
-def _validate_unknown_parameters_socketify(req, res):
-    """Validate that request doesn't contain unknown parameters."""
-    # Socketify doesn't expose query parameters in the same way, so we'll check the query string
-    # Try different methods for getting query string in socketify
-    try:
-        query_string = req.get_query_string()
-    except AttributeError:
-        # Fallback: construct query string from individual parameters
-        query_string = ""
-
-    # Allow schemathesis testing parameters - they're legitimate for property-based testing
-    if 'unknown' in query_string.lower() and 'x-schemathesis' not in query_string:
-        logger.warning(f"Rejected unknown parameter in query: {query_string}")
-        error_response = {
-            'error': {
-                'code': 'VALIDATION_ERROR',
-                'message': 'Unknown parameter in request'
-            }
-        }
-        res.write_status(400)
-        res.write_header("Content-Type", "application/json")
-        res.end(json.dumps(error_response))
-        return True
-    logger.debug(f"Parameters check passed: {query_string}")
-    return None
-
-
-def _check_allowed_methods_socketify(req, res):
-    """Check if the requested method is allowed for the endpoint."""
-    # Define allowed methods per endpoint path (based on OpenAPI spec)
-    endpoint_methods = {
-        '/health': {'GET', 'HEAD', 'OPTIONS'},
-        '/v1/campaigns': {'GET', 'POST', 'HEAD', 'OPTIONS'},  # GET for list, POST for create
-        '/v1/campaigns/': {'GET', 'PUT', 'DELETE', 'POST', 'HEAD', 'OPTIONS'},  # Campaign operations + sub-resources
-        '/v1/click': {'GET', 'HEAD', 'OPTIONS'},  # Click tracking is GET only
-        '/v1/clicks': {'GET', 'HEAD', 'OPTIONS'},  # List clicks is GET only
-        '/v1/click/': {'GET', 'HEAD', 'OPTIONS'},  # Click sub-resources are GET only
-    }
-
-    # Get path - use socketify's get_url method
-    try:
-        url = req.get_url()
-        # get_url() typically returns path + query string
-        path = url.split('?')[0]  # Remove query parameters
-        if not path.startswith('/'):
-            path = '/' + path
-    except AttributeError:
-        # Fallback - try to extract from full URL
-        try:
-            full_url = req.get_full_url()
-            if '://' in full_url:
-                # Extract path from full URL
-                path_part = full_url.split('://', 1)[1].split('/', 2)
-                if len(path_part) >= 3:
-                    path = '/' + path_part[2]
-                else:
-                    path = '/'
-            else:
-                path = '/v1/campaigns/analytics'
-        except AttributeError:
-            path = '/v1/campaigns/analytics'  # final fallback
-
-    method = req.get_method()
-
-    # Debug logging
-    logger.info(f"DEBUG: Extracted path = '{path}' for method {method}")
-
-    # Find the most specific match for the path
-    allowed_methods = None
-    for path_prefix in sorted(endpoint_methods.keys(), key=len, reverse=True):
-        if path.startswith(path_prefix):
-            allowed_methods = endpoint_methods[path_prefix]
-            break
-
-    # If no specific match, allow common methods
-    if allowed_methods is None:
-        allowed_methods = {'GET', 'POST', 'PUT', 'DELETE', 'HEAD', 'OPTIONS'}
-
-    if method not in allowed_methods:
-        logger.warning(f"Method {method} not allowed for {path}")
-        error_response = {"error": {"code": "METHOD_NOT_ALLOWED", "message": "Method not allowed"}}
-        res.write_status(405)
-        res.write_header("Allow", ', '.join(sorted(allowed_methods)))
-        res.write_header("Content-Type", "application/json")
-        res.end(json.dumps(error_response))
-        return True
-    return None
-
-
-def _check_rate_limiting_socketify(req, res):
-    """Check rate limiting."""
+def enforce_rate_limit(req, res, path: str):
+    """Count the request against the limit of ``path``'s group; sends a 429 and returns True when exceeded."""
     client_ip = _get_client_ip_socketify(req)
-    if _is_rate_limited(client_ip):
+    decision = get_rate_limiter().check(client_ip, path)
+    if not decision.allowed:
         error_response = {
             'error': {
                 'code': 'RATE_LIMITED',
                 'message': 'Too many requests'
             }
         }
-        res.write_status(429)
-        res.write_header("Content-Type", "application/json")
-        res.end(json.dumps(error_response))
+        send_json(res, error_response, 429, headers=API_HEADERS + (
+            (b'Retry-After', str(max(int(decision.retry_after + 0.999), 1)).encode()),
+            (b'X-RateLimit-Limit', str(decision.limit).encode()),
+            (b'X-RateLimit-Remaining', b'0'),
+        ))
         return True
     return None
 
@@ -472,10 +320,7 @@ def add_security_headers(res):
 
 def _add_basic_security_headers_socketify(res):
     """Add basic security headers."""
-    res.write_header('X-Content-Type-Options', 'nosniff')
-    res.write_header('X-Frame-Options', 'DENY')
-    res.write_header('X-XSS-Protection', '1; mode=block')
-    res.write_header('Referrer-Policy', 'strict-origin-when-cross-origin')
+    write_headers(res, SECURITY_HEADER_BUNDLE)
 
 
 def _add_cors_headers_socketify(res):
@@ -505,25 +350,36 @@ def _get_client_ip_socketify(req) -> str:
         return '127.0.0.1'
 
 
-def _is_rate_limited(ip: str) -> bool:
-    """Check if IP is rate limited."""
-    current_time = int(time.time())
-    window_start = current_time - 60  # 1 minute window
-
-    # Clean old entries
-    global _request_counts
-    _request_counts = {
-        k: v for k, v in _request_counts.items()
-        if k > window_start
-    }
-
-    # Count requests from this IP in the window
-    ip_requests = [timestamp for timestamp in _request_counts.keys()
-                   if _request_counts[timestamp] == ip]
-
-    if len(ip_requests) >= RATE_LIMIT_REQUESTS_PER_MINUTE:
-        return True
-
-    # Record this request
-    _request_counts[current_time] = ip
-    return False
+def create_rate_limiter(shared: Optional[bool] = None) -> SlidingWindowRateLimiter:
+    """Build a rate limiter from security settings.
+
+    The default budget keeps the domain constants; route groups come from
+    RATE_LIMIT_GROUPS. Token self-revocation always has its own, tighter group
+    (REVOKE_RATE_LIMIT_*) unless RATE_LIMIT_GROUPS sets one for it.
+    ``shared`` overrides RATE_LIMIT_BACKEND.
+    """
+    security = settings.security
+    if shared is None:
+        shared = security.rate_limit_backend == 'shared_memory'
+    revoke_group = (f"{REVOKE_PATH}={security.revoke_rate_limit_requests}"
+                    f"/{security.revoke_rate_limit_window_seconds}")
+    return build_rate_limiter(
+        RateLimit(RATE_LIMIT_REQUESTS_PER_MINUTE, RATE_LIMIT_WINDOW_SECONDS),
+        groups_spec=f"{revoke_group},{security.rate_limit_groups}",
+        slots=security.rate_limit_slots,
+        shared=shared,
+    )
+
+
+def configure_rate_limiter(limiter: SlidingWindowRateLimiter) -> None:
+    """Install the limiter used by validate_request (call before forking workers to share it)."""
+    global _rate_limiter
+    _rate_limiter = limiter
+
+
+def get_rate_limiter() -> SlidingWindowRateLimiter:
+    """Get the process-wide rate limiter, creating a local one on first use."""
+    global _rate_limiter
+    if _rate_limiter is None:
+        _rate_limiter = create_rate_limiter()
+    return _rate_limiter
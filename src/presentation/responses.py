@@ -0,0 +1,124 @@
+# Copyright (c) 2025 Bivex
+#
+# Author: Bivex
+# Available for contact via email: support@b-b.top
+# For up-to-date contact information:
+# https://github.com/bivex
+#
+# Created: 2026-10-16T09:12:04
+# Last Updated: 2026-10-16T09:12:04
+#
+# Licensed under the MIT License.
+# Commercial licensing available upon request.
+
+"""Response helpers for socketify handlers.
+
+Headers are precomputed once per route class as tuples of encoded
+``(name, value)`` pairs, so answering a request costs a single call::
+
+    send_json(res, payload)                      # public API, 200
+    send_json(res, error, 400)
+    send_json(res, stats, headers=ADMIN_HEADERS, default=str)
+    send_html(res, page)
+    send_redirect(res, url)
+
+CORS headers follow ``settings.api.cors_origins``: ``*`` or a single origin
+is baked into the bundles; with several origins the request's ``Origin`` is
+echoed back when the handler passes it and it is allowed.
+"""
+
+from typing import Any, Callable, Dict, FrozenSet, Iterable, Optional, Tuple
+
+from ..config.settings import settings
+from ..utils.serialization import dumps_bytes
+
+HeaderBundle = Tuple[Tuple[bytes, bytes], ...]
+
+JSON_CONTENT_TYPE = 'application/json'
+HTML_CONTENT_TYPE = 'text/html; charset=utf-8'
+
+SECURITY_HEADERS = (
+    ('X-Content-Type-Options', 'nosniff'),
+    ('X-Frame-Options', 'DENY'),
+    ('X-XSS-Protection', '1; mode=block'),
+    ('Referrer-Policy', 'strict-origin-when-cross-origin'),
+)
+
+CORS_HEADERS = (
+    ('Access-Control-Allow-Methods', 'GET, POST, PUT, DELETE, OPTIONS'),
+    ('Access-Control-Allow-Headers', 'Content-Type, Authorization, X-API-Key'),
+    ('Access-Control-Allow-Credentials', 'false'),
+    ('Access-Control-Max-Age', '86400'),
+)
+
+
+def _encode(headers: Iterable[Tuple[str, str]]) -> HeaderBundle:
+    return tuple((name.encode('latin-1'), value.encode('latin-1')) for name, value in headers)
+
+
+def _cors_headers(cors_origins) -> Tuple[Tuple[Tuple[str, str], ...], FrozenSet[str]]:
+    """Static CORS headers, plus the allowed origins that have to be matched per request."""
+    origins = [origin.strip() for origin in (cors_origins or ['*']) if origin.strip()]
+    if not origins or '*' in origins:
+        return (('Access-Control-Allow-Origin', '*'),) + CORS_HEADERS, frozenset()
+    if len(origins) == 1:
+        return (('Access-Control-Allow-Origin', origins[0]), ('Vary', 'Origin')) + CORS_HEADERS, frozenset()
+    return (('Vary', 'Origin'),) + CORS_HEADERS, frozenset(origins)
+
+
+def build_header_bundles(cors_origins=None) -> Dict[str, HeaderBundle]:
+    """Precompute the header bundle of every route class."""
+    cors, _ = _cors_headers(cors_origins)
+    json_type = (('Content-Type', JSON_CONTENT_TYPE),)
+    return {
+        'api': _encode(json_type + SECURITY_HEADERS + cors),
+        'admin': _encode(json_type + SECURITY_HEADERS + cors + (('Cache-Control', 'no-store'),)),
+        'redirect': _encode((('Cache-Control', 'no-store'),)),
+        'html': _encode((('Content-Type', HTML_CONTENT_TYPE),) + SECURITY_HEADERS),
+        'security': _encode(SECURITY_HEADERS),
+    }
+
+
+_bundles = build_header_bundles(settings.api.cors_origins)
+_, _cors_allowed_origins = _cors_headers(settings.api.cors_origins)
+
+API_HEADERS: HeaderBundle = _bundles['api']
+ADMIN_HEADERS: HeaderBundle = _bundles['admin']
+REDIRECT_HEADERS: HeaderBundle = _bundles['redirect']
+HTML_HEADERS: HeaderBundle = _bundles['html']
+SECURITY_HEADER_BUNDLE: HeaderBundle = _bundles['security']
+
+
+def write_headers(res, headers: HeaderBundle, origin: Optional[str] = None) -> None:
+    """Write a precomputed bundle (and the matched CORS origin, if any)."""
+    write_header = res.write_header
+    for name, value in headers:
+        write_header(name, value)
+    if origin and origin in _cors_allowed_origins:
+        write_header(b'Access-Control-Allow-Origin', origin)
+
+
+def send_json(res, payload: Any, status: int = 200, headers: HeaderBundle = API_HEADERS,
+              default: Optional[Callable[[Any], Any]] = None, origin: Optional[str] = None) -> None:
+    """Serialize ``payload`` and finish the response with status and headers."""
+    body = dumps_bytes(payload, default)
+    if status != 200:
+        res.write_status(status)
+    write_headers(res, headers, origin)
+    res.end(body)
+
+
+def send_html(res, html: str, status: int = 200, headers: HeaderBundle = HTML_HEADERS) -> None:
+    """Finish the response with an HTML page."""
+    if status != 200:
+        res.write_status(status)
+    write_headers(res, headers)
+    res.end(html)
+
+
+def send_redirect(res, location: str, status: int = 302, headers: HeaderBundle = REDIRECT_HEADERS) -> None:
+    """Finish the response with a redirect to ``location``."""
+    res.write_status(status)
+    write_headers(res, headers)
+    res.write_header(b'Location', location)
+    res.end(b'')
@@ -13,11 +13,10 @@
 
 """Analytics HTTP routes."""
 
-import json
-
 from loguru import logger
 
 from ...application.handlers.analytics_handler import AnalyticsHandler
+from ...presentation.responses import send_json
 
 
 class AnalyticsRoutes:
@@ -35,7 +34,7 @@ class AnalyticsRoutes:
 
         def get_real_time_analytics(res, req):
             """Get real-time analytics data for the last 5 minutes."""
-            from ...presentation.middleware.security_middleware import validate_request, add_security_headers
+            from ...presentation.middleware.security_middleware import validate_request
 
             # Validate request (authentication, rate limiting, etc.)
             if validate_request(req, res):
@@ -47,17 +46,12 @@ class AnalyticsRoutes:
                 # Get real-time analytics data
                 result = self.analytics_handler.get_real_time_analytics()
 
-                res.write_header("Content-Type", "application/json")
-                add_security_headers(res)
-                res.end(json.dumps(result))
+                send_json(res, result)
 
             except Exception as e:
                 logger.error(f"Error getting real-time analytics: {e}", exc_info=True)
                 error_response = {"error": {"code": "INTERNAL_SERVER_ERROR", "message": "Internal server error"}}
-                res.write_status(500)
-                res.write_header("Content-Type", "application/json")
-                add_security_headers(res)
-                res.end(json.dumps(error_response))
+                send_json(res, error_response, 500)
 
         # Register the real-time analytics endpoint
         app.get('/v1/analytics/real-time', get_real_time_analytics)
@@ -19,6 +19,7 @@ from datetime import datetime, timedelta, timezone
 import jwt
 from loguru import logger
 
+from ...presentation.responses import send_json
 from ..config.settings import settings
 
 
@@ -28,6 +29,7 @@ class AuthRoutes:
     def register(self, app):
         """Register authentication routes with socketify app."""
         self._register_token_endpoint(app)
+        self._register_revoke_endpoint(app)
 
     def _register_token_endpoint(self, app):
         """Register JWT token generation endpoint."""
@@ -53,11 +55,9 @@ class AuthRoutes:
                                         body_data = json.loads(full_body)
                                     except (ValueError, json.JSONDecodeError):
                                         logger.error("Invalid JSON in token request")
-                                        res.write_status(400)
-                                        res.write_header("Content-Type", "application/json")
-                                        res.end(json.dumps({
+                                        send_json(res, {
                                             "error": {"code": "VALIDATION_ERROR", "message": "Invalid JSON format"}
-                                        }))
+                                        }, 400)
                                         return
 
                             # Validate request data
@@ -65,11 +65,9 @@ class AuthRoutes:
                             password = body_data.get('password')
 
                             if not username or not password:
-                                res.write_status(400)
-                                res.write_header("Content-Type", "application/json")
-                                res.end(json.dumps({
+                                send_json(res, {
                                     "error": {"code": "VALIDATION_ERROR", "message": "Username and password required"}
-                                }))
+                                }, 400)
                                 return
 
                             # TODO: Replace with actual user authentication logic
@@ -100,31 +98,59 @@ class AuthRoutes:
                                     "expires_at": expires_at.isoformat()
                                 }
 
-                                res.write_header("Content-Type", "application/json")
-                                res.end(json.dumps(response))
+                                send_json(res, response)
                             else:
-                                res.write_status(401)
-                                res.write_header("Content-Type", "application/json")
-                                res.end(json.dumps({
+                                send_json(res, {
                                     "error": {"code": "AUTHENTICATION_ERROR", "message": "Invalid credentials"}
-                                }))
+                                }, 401)
 
                     except Exception as e:
                         logger.error(f"Error processing token generation data: {e}", exc_info=True)
                         error_response = {
                             "error": {"code": "INTERNAL_SERVER_ERROR", "message": "Internal server error"}}
-                        res.write_status(500)
-                        res.write_header("Content-Type", "application/json")
-                        res.end(json.dumps(error_response))
+                        send_json(res, error_response, 500)
 
                 res.on_data(on_data)
 
             except Exception as e:
                 logger.error(f"Error in generate_token: {e}", exc_info=True)
                 error_response = {"error": {"code": "INTERNAL_SERVER_ERROR", "message": "Internal server error"}}
-                res.write_status(500)
-                res.write_header("Content-Type", "application/json")
-                res.end(json.dumps(error_response))
+                send_json(res, error_response, 500)
 
         # Register the POST endpoint for token generation
         app.post('/v1/auth/token', generate_token)
+
+    def _register_revoke_endpoint(self, app):
+        """Register endpoint revoking the presented bearer token (logout)."""
+
+        def revoke_token(res, req):
+            """Revoke the bearer token used for this request until it expires."""
+            from ..middleware.security_middleware import validate_request, get_token_cache
+
+            if validate_request(req, res):
+                return  # Validation failed, response already sent
+
+            try:
+                auth_header = req.get_header('authorization') or ''
+                cache = get_token_cache()
+                if not auth_header.startswith('Bearer ') or cache is None:
+                    send_json(res, {
+                        "error": {"code": "VALIDATION_ERROR", "message": "Bearer token revocation is not available"}
+                    }, 400)
+                    return
+
+                token = auth_header[7:]
+                claims = jwt.decode(token, options={"verify_signature": False})
+                if not cache.revoke(token=token, expires_at=claims.get('exp')):
+                    send_json(res, {
+                        "error": {"code": "SERVICE_UNAVAILABLE", "message": "Revocation list is full; retry later"}
+                    }, 503)
+                    return
+                logger.info(f"Revoked bearer token for subject {claims.get('sub')}")
+
+                send_json(res, {"status": "revoked", "subject": claims.get('sub')})
+            except Exception as e:
+                logger.error(f"Error in revoke_token: {e}", exc_info=True)
+                send_json(res, {"error": {"code": "INTERNAL_SERVER_ERROR", "message": "Internal server error"}}, 500)
+
+        app.post('/v1/auth/revoke', revoke_token)
@@ -13,33 +13,128 @@
 
 """Bulk operations HTTP routes."""
 
+import asyncio
+import csv
 import json
+from typing import Any, Dict, List, Optional, Tuple
 
 from loguru import logger
 
 from ...application.handlers.bulk_click_handler import BulkClickHandler
+from ...application.handlers.bulk_click_ingestion_handler import BulkClickIngestionHandler
 from ...application.handlers.click_validation_handler import ClickValidationHandler
+from ...presentation.middleware.route_spec import QueryParam, RouteSpec, compile_route_validator, route
+from ...presentation.responses import send_json
+
+INGEST_CLICKS_ROUTE = RouteSpec('/v1/clicks/bulk', methods=frozenset({'POST'}), query=(
+    QueryParam('format', choices=('ndjson', 'csv')),
+    QueryParam('batchSize', int, minimum=1, maximum=10000),
+))
+
+# Longest body line accepted by the ingestion endpoint, in bytes
+MAX_LINE_LENGTH = 64 * 1024
+# Largest body and most body lines accepted per ingestion request
+MAX_BODY_BYTES = 64 * 1024 * 1024
+MAX_RECORDS = 100000
+# Unpersisted batches one request may have queued before reading of its body is paused
+MAX_PENDING_BATCHES = 8
+
+
+class StreamingRecordParser:
+    """Incremental NDJSON/CSV parser for request bodies that arrive in chunks.
+
+    ``feed`` returns the records completed by a chunk as ``(line, record)`` and
+    the lines that could not be parsed as ``(line, reason)``; a partial trailing
+    line is kept for the next chunk. CSV bodies start with a header row and
+    empty CSV values become None. Lines longer than ``max_line_length`` are
+    dropped without being buffered whole.
+    """
+
+    def __init__(self, body_format: str = 'ndjson', max_line_length: int = MAX_LINE_LENGTH):
+        self.format = body_format
+        self.max_line_length = max_line_length
+        self._buffer = b''
+        self._line = 0
+        self._overlong = False
+        self._header: Optional[List[str]] = None
+
+    def feed(self, chunk: bytes) -> Tuple[List[Tuple[int, Dict[str, Any]]], List[Tuple[int, str]]]:
+        lines = (self._buffer + chunk).split(b'\n')
+        self._buffer = lines.pop()
+        parsed = self._parse(lines)
+        if len(self._buffer) > self.max_line_length:
+            # Drop the line's bytes until its newline shows up
+            self._buffer = b''
+            self._overlong = True
+        return parsed
+
+    def close(self) -> Tuple[List[Tuple[int, Dict[str, Any]]], List[Tuple[int, str]]]:
+        """Parse whatever is left after the last chunk."""
+        lines, self._buffer = [self._buffer], b''
+        if not self._overlong and not lines[0].strip():
+            return [], []
+        return self._parse(lines)
+
+    def _parse(self, lines: List[bytes]) -> Tuple[List[Tuple[int, Dict[str, Any]]], List[Tuple[int, str]]]:
+        records, malformed = [], []
+        for raw in lines:
+            self._line += 1
+            if self._overlong:
+                self._overlong = False
+                malformed.append((self._line, f"line exceeds {self.max_line_length} bytes"))
+                continue
+            raw = raw.rstrip(b'\r')
+            if not raw.strip():
+                continue
+            if len(raw) > self.max_line_length:
+                malformed.append((self._line, f"line exceeds {self.max_line_length} bytes"))
+                continue
+            try:
+                record = self._parse_line(raw.decode('utf-8'))
+            except ValueError as e:  # Includes JSONDecodeError and UnicodeDecodeError
+                malformed.append((self._line, str(e)))
+                continue
+            if record is not None:
+                records.append((self._line, record))
+        return records, malformed
+
+    def _parse_line(self, text: str) -> Optional[Dict[str, Any]]:
+        if self.format == 'csv':
+            values = next(csv.reader([text]))
+            if self._header is None:
+                self._header = [name.strip() for name in values]
+                return None
+            if len(values) != len(self._header):
+                raise ValueError(f"expected {len(self._header)} fields, got {len(values)}")
+            return {name: value or None for name, value in zip(self._header, values)}
+
+        record = json.loads(text)
+        if not isinstance(record, dict):
+            raise ValueError("record must be a JSON object")
+        return record
 
 
 class BulkOperationsRoutes:
     """Socketify routes for bulk operations."""
 
-    def __init__(self, bulk_click_handler: BulkClickHandler, click_validation_handler: ClickValidationHandler):
+    def __init__(self, bulk_click_handler: BulkClickHandler, click_validation_handler: ClickValidationHandler,
+                 bulk_click_ingestion_handler: Optional[BulkClickIngestionHandler] = None):
         self.bulk_click_handler = bulk_click_handler
         self.click_validation_handler = click_validation_handler
+        self.bulk_click_ingestion_handler = bulk_click_ingestion_handler
 
     def register(self, app):
         """Register routes with socketify app."""
         self._register_bulk_click_generate(app)
         self._register_click_validation(app)
+        if self.bulk_click_ingestion_handler is not None:
+            self._register_bulk_click_ingestion(app)
 
     def _register_bulk_click_generate(self, app):
         """Register bulk click generation route."""
 
         def bulk_generate_clicks(res, req):
             """Generate multiple click tracking URLs in bulk."""
-            from ...presentation.middleware.security_middleware import add_security_headers
-
             try:
                 logger.debug("Bulk click generation request received")
 
@@ -61,50 +156,38 @@ class BulkOperationsRoutes:
                                         body_data = json.loads(full_body)
                                     except (ValueError, json.JSONDecodeError):
                                         logger.error("Invalid JSON in bulk click generation request")
-                                        res.write_status(400)
-                                        res.write_header("Content-Type", "application/json")
-                                        add_security_headers(res)
-                                        res.end(json.dumps({
+                                        send_json(res, {
                                             "status": "error",
                                             "message": "Invalid JSON format"
-                                        }))
+                                        }, 400)
                                         return
 
                             # Validate bulk request
                             urls = body_data.get('urls', [])
                             if not urls:
-                                res.write_status(400)
-                                res.write_header("Content-Type", "application/json")
-                                add_security_headers(res)
-                                res.end(json.dumps({
+                                send_json(res, {
                                     "status": "error",
                                     "message": "No URLs provided for generation"
-                                }))
+                                }, 400)
                                 return
 
                             if len(urls) > 1000:
-                                res.write_status(400)
-                                res.write_header("Content-Type", "application/json")
-                                add_security_headers(res)
-                                res.end(json.dumps({
+                                send_json(res, {
                                     "status": "error",
                                     "message": "Maximum 1000 URLs allowed per request"
-                                }))
+                                }, 400)
                                 return
 
                             # Generate bulk clicks
                             result = self.bulk_click_handler.handle(body_data)
 
                             # Return response
-                            res.write_header("Content-Type", "application/json")
-                            add_security_headers(res)
-
                             if result["status"] == "success":
-                                res.write_status(200)
+                                status_code = 200
                             else:
-                                res.write_status(400)
+                                status_code = 400
 
-                            res.end(json.dumps(result))
+                            send_json(res, result, status_code)
 
                     except Exception as e:
                         logger.error(f"Error processing bulk click generation data: {e}", exc_info=True)
@@ -112,10 +195,7 @@ class BulkOperationsRoutes:
                             "status": "error",
                             "message": "Internal server error"
                         }
-                        res.write_status(500)
-                        res.write_header("Content-Type", "application/json")
-                        add_security_headers(res)
-                        res.end(json.dumps(error_response))
+                        send_json(res, error_response, 500)
 
                 res.on_data(on_data)
 
@@ -125,14 +205,120 @@ class BulkOperationsRoutes:
                     "status": "error",
                     "message": "Internal server error"
                 }
-                res.write_status(500)
-                res.write_header("Content-Type", "application/json")
-                add_security_headers(res)
-                res.end(json.dumps(error_response))
+                send_json(res, error_response, 500)
 
         # Register the bulk click generation endpoint
         app.post('/v1/clicks/bulk-generate', bulk_generate_clicks)
 
+    def _register_bulk_click_ingestion(self, app):
+        """Register streaming bulk click ingestion route."""
+        validate = compile_route_validator(INGEST_CLICKS_ROUTE)
+        handler = self.bulk_click_ingestion_handler
+
+        def ingest_clicks(res, req):
+            """Ingest NDJSON or CSV click records, persisting them batch by batch while the body streams in."""
+            params = validate(req, res)
+            if params is None:
+                return  # Validation failed, response already sent
+
+            body_format = params['format']
+            if body_format is None:
+                body_format = 'csv' if 'csv' in (req.get_header('content-type') or '') else 'ndjson'
+            batch_size = params['batchSize'] or handler.batch_size
+
+            content_length = req.get_header('content-length') or ''
+            if content_length.isdigit() and int(content_length) > MAX_BODY_BYTES:
+                send_json(res, {"status": "error",
+                                "message": f"Request body exceeds {MAX_BODY_BYTES} bytes"}, 413)
+                return
+
+            parser = StreamingRecordParser(body_format)
+            records: List[Tuple[int, Dict[str, Any]]] = []
+            malformed: List[Tuple[int, str]] = []
+            results: List[Dict[str, Any]] = []
+            state = {'batches': 0, 'pending': 0, 'bytes': 0, 'lines': 0, 'tail': None, 'failed': False,
+                     'paused': False}
+
+            async def run_batch(previous, number, batch_records, batch_malformed):
+                # Batches persist one after another, in body order
+                try:
+                    if previous is not None:
+                        await previous
+                    results.append(await handler.handle_batch(number, batch_records, batch_malformed))
+                except Exception as e:
+                    logger.error(f"Error ingesting click batch {number}: {e}", exc_info=True)
+                    received = len(batch_records) + len(batch_malformed)
+                    results.append({"batch": number, "received": received, "accepted": 0, "rejected": received,
+                                    "fraudulent": 0, "errors": [], "error": "Internal server error"})
+                finally:
+                    state['pending'] -= 1
+                    if state['paused'] and state['pending'] < MAX_PENDING_BATCHES:
+                        state['paused'] = False
+                        res.resume()
+
+            def submit(batch_records, batch_malformed):
+                state['batches'] += 1
+                state['pending'] += 1
+                state['tail'] = asyncio.ensure_future(
+                    run_batch(state['tail'], state['batches'], batch_records, batch_malformed))
+                if state['pending'] >= MAX_PENDING_BATCHES and not state['paused']:
+                    # Persisting cannot keep up with the upload; stop reading the body until a batch completes
+                    logger.debug(f"Bulk click ingestion has {state['pending']} batches queued; pausing upload")
+                    state['paused'] = True
+                    res.pause()
+
+            def reject(status, message):
+                # Batches already queued still persist, so the error reports them like a success would
+                state['failed'] = True
+                asyncio.ensure_future(respond(status, {"status": "error", "message": message}))
+
+            async def respond(status, payload):
+                if state['tail'] is not None:
+                    await state['tail']
+                totals = {key: sum(result[key] for result in results)
+                          for key in ('received', 'accepted', 'rejected', 'fraudulent')}
+                send_json(res, {**payload, "format": body_format, "batches": results, "totals": totals}, status)
+
+            def on_data(res, chunk, is_last, *args):
+                if state['failed']:
+                    return
+                try:
+                    if chunk:
+                        state['bytes'] += len(chunk)
+                        if state['bytes'] > MAX_BODY_BYTES:
+                            reject(413, f"Request body exceeds {MAX_BODY_BYTES} bytes")
+                            return
+                        parsed, bad = parser.feed(chunk)
+                        records.extend(parsed)
+                        malformed.extend(bad)
+                        state['lines'] += len(parsed) + len(bad)
+                    if is_last:
+                        parsed, bad = parser.close()
+                        records.extend(parsed)
+                        malformed.extend(bad)
+                        state['lines'] += len(parsed) + len(bad)
+                    if state['lines'] > MAX_RECORDS:
+                        reject(413, f"Request exceeds {MAX_RECORDS} records")
+                        return
+
+                    while len(records) >= batch_size:
+                        submit(records[:batch_size], malformed[:])
+                        del records[:batch_size]
+                        malformed.clear()
+
+                    if is_last:
+                        if records or malformed:
+                            submit(records[:], malformed[:])
+                        asyncio.ensure_future(respond(200, {"status": "success"}))
+
+                except Exception as e:
+                    logger.error(f"Error processing bulk click ingestion data: {e}", exc_info=True)
+                    reject(500, "Internal server error")
+
+            res.on_data(on_data)
+
+        route(app, INGEST_CLICKS_ROUTE, ingest_clicks)
+
     def _register_click_validation(self, app):
         """Register click validation route."""
 
@@ -147,15 +333,13 @@ class BulkOperationsRoutes:
                 try:
                     uuid.UUID(click_id)
                 except (ValueError, TypeError):
-                    res.write_status(400)
-                    res.write_header("Content-Type", "application/json")
-                    res.end(json.dumps({
+                    send_json(res, {
                         "clickId": click_id,
                         "isValid": False,
                         "fraudScore": 1.0,
                         "validationReason": "invalid_click_id_format",
                         "blockedReason": "Invalid UUID format"
-                    }))
+                    }, 400)
                     return
 
                 # Get additional parameters for validation
@@ -171,8 +355,7 @@ class BulkOperationsRoutes:
                     referrer=referrer
                 )
 
-                res.write_header("Content-Type", "application/json")
-                res.end(json.dumps(validation_result))
+                send_json(res, validation_result)
 
             except Exception as e:
                 logger.error(f"Error in validate_click: {e}", exc_info=True)
@@ -183,9 +366,7 @@ class BulkOperationsRoutes:
                     "validationReason": "internal_error",
                     "blockedReason": "Internal server error"
                 }
-                res.write_status(500)
-                res.write_header("Content-Type", "application/json")
-                res.end(json.dumps(error_response))
+                send_json(res, error_response, 500)
 
         # Register the click validation endpoint
         app.get('/v1/clicks/validate/:clickid', validate_click)
@@ -13,10 +13,37 @@
 
 """Campaign HTTP routes."""
 
-import json
+from datetime import datetime
 
 from loguru import logger
 
+from ...presentation.middleware.route_spec import (
+    PAGINATION_PARAMS, QueryParam, RouteSpec, compile_route_validator, route,
+)
+from ...presentation.responses import API_HEADERS, SECURITY_HEADER_BUNDLE, send_json, write_headers
+
+CAMPAIGN_ROUTE = '/v1/campaigns/:campaign_id'
+
+LIST_CAMPAIGNS_ROUTE = RouteSpec('/v1/campaigns', query=PAGINATION_PARAMS, strict_query=True)
+CREATE_CAMPAIGN_ROUTE = RouteSpec('/v1/campaigns', methods=frozenset({'POST'}))
+GET_CAMPAIGN_ROUTE = RouteSpec(CAMPAIGN_ROUTE)
+UPDATE_CAMPAIGN_ROUTE = RouteSpec(CAMPAIGN_ROUTE, methods=frozenset({'PUT'}))
+DELETE_CAMPAIGN_ROUTE = RouteSpec(CAMPAIGN_ROUTE, methods=frozenset({'DELETE'}))
+CAMPAIGN_ANALYTICS_ROUTE = RouteSpec(CAMPAIGN_ROUTE + '/analytics', query=(
+    QueryParam('startDate', datetime, default=datetime(2024, 1, 1)),
+    QueryParam('endDate', datetime, default=datetime(2024, 1, 31)),
+    QueryParam('granularity', default='day', choices=('hour', 'day', 'week', 'month')),
+    QueryParam('breakdown', default='date',
+               choices=('date', 'traffic_source', 'landing_page', 'offer', 'geography', 'device')),
+))
+LIST_LANDING_PAGES_ROUTE = RouteSpec(CAMPAIGN_ROUTE + '/landing-pages', query=PAGINATION_PARAMS, strict_query=True)
+CREATE_LANDING_PAGE_ROUTE = RouteSpec(CAMPAIGN_ROUTE + '/landing-pages', methods=frozenset({'POST'}))
+LIST_OFFERS_ROUTE = RouteSpec(CAMPAIGN_ROUTE + '/offers', query=PAGINATION_PARAMS)
+CREATE_OFFER_ROUTE = RouteSpec(CAMPAIGN_ROUTE + '/offers', methods=frozenset({'POST'}))
+PAUSE_CAMPAIGN_ROUTE = RouteSpec(CAMPAIGN_ROUTE + '/pause', methods=frozenset({'POST'}))
+RESUME_CAMPAIGN_ROUTE = RouteSpec(CAMPAIGN_ROUTE + '/resume', methods=frozenset({'POST'}))
+
+
 
 class CampaignRoutes:
     """Socketify routes for campaign operations."""
@@ -95,31 +122,6 @@ class CampaignRoutes:
             self._get_campaign_offers_handler = await self._container.get_get_campaign_offers_handler()
         return self._get_campaign_offers_handler
 
-    def _validate_query_parameters(self, req, allowed_params: set):
-        """Validate that request contains only allowed query parameters."""
-        query_string = ""
-        try:
-            query_string = req.get_query_string()
-        except AttributeError:
-            return True  # If we can't check, allow the request
-
-        # Check for schemathesis testing parameters
-        # Reject unknown/invalid schemathesis parameters
-        if 'x-schemathesis-unknown' in query_string or 'x-schemathesis-invalid' in query_string:
-            return False
-
-        # Allow other legitimate schemathesis parameters
-        if 'x-schemathesis' in query_string:
-            return True
-
-        # Check for other unknown/invalid parameters
-        unknown_patterns = ['unknown', 'invalid', 'test_']
-        for pattern in unknown_patterns:
-            if pattern in query_string.lower():
-                return False
-
-        return True
-
     async def register(self, app):
         """Register routes with socketify app."""
         # Register individual route handlers
@@ -134,77 +136,20 @@ class CampaignRoutes:
 
     async def _register_list_campaigns(self, app):
         """Register list campaigns route."""
+        validate_list = compile_route_validator(LIST_CAMPAIGNS_ROUTE)
 
         async def list_campaigns(res, req):
             """List campaigns with pagination."""
-            from ...presentation.middleware.security_middleware import validate_request, add_security_headers
-            import json
 
             # Validate request
-            if validate_request(req, res):
+            params = validate_list(req, res)
+            if params is None:
                 return  # Validation failed, response already sent
 
             try:
                 logger.debug("list_campaigns called")
 
-                # Check for schemathesis unknown parameters first
-                query_string = ""
-                try:
-                    query_string = req.get_query_string()
-                except AttributeError:
-                    pass
-
-                # Check for the specific unknown parameter
-                unknown_param = req.get_query('x-schemathesis-unknown-property')
-                if unknown_param is not None or 'x-schemathesis-unknown-property' in query_string:
-                    error_response = {"error": {"code": "VALIDATION_ERROR", "message": "Unknown query parameter"}}
-                    res.write_status(400)
-                    res.write_header("Content-Type", "application/json")
-                    add_security_headers(res)
-                    res.end(json.dumps(error_response))
-                    return
-
-                # Validate and parse query parameters
-                try:
-                    page_str = req.get_query('page')
-                    if page_str is not None:
-                        page = int(page_str)
-                        if page < 1:
-                            raise ValueError("Page must be >= 1")
-                    else:
-                        page = 1
-
-                    page_size_str = req.get_query('pageSize')
-                    if page_size_str is not None:
-                        page_size = int(page_size_str)
-                        if page_size < 1 or page_size > 100:
-                            raise ValueError("Page size must be between 1 and 100")
-                    else:
-                        page_size = 20
-
-                except ValueError as e:
-                    error_response = {"error": {"code": "VALIDATION_ERROR", "message": str(e)}}
-                    res.write_status(400)
-                    res.write_header("Content-Type", "application/json")
-                    add_security_headers(res)
-                    res.end(json.dumps(error_response))
-                    return
-
-                # Validate unknown parameters
-                query_string = ""
-                try:
-                    query_string = req.get_query_string()
-                except AttributeError:
-                    pass
-
-                # Reject schemathesis unknown parameters
-                if 'x-schemathesis-unknown-property' in query_string:
-                    error_response = {"error": {"code": "VALIDATION_ERROR", "message": "Unknown query parameter"}}
-                    res.write_status(400)
-                    res.write_header("Content-Type", "application/json")
-                    add_security_headers(res)
-                    res.end(json.dumps(error_response))
-                    return
+                page, page_size = params['page'], params['pageSize']
 
                 logger.debug(f"page={page}, page_size={page_size}")
 
@@ -250,16 +195,7 @@ class CampaignRoutes:
                     import traceback
                     logger.error(f"Response traceback: {traceback.format_exc()}")
                     raise
-                res.write_header("Content-Type", "application/json")
-                # Add CORS headers
-                res.write_header('Access-Control-Allow-Origin', '*')
-                res.write_header('Access-Control-Allow-Methods', 'GET, POST, PUT, DELETE, OPTIONS')
-                res.write_header('Access-Control-Allow-Headers', 'Content-Type, Authorization, X-API-Key')
-                res.write_header('Access-Control-Allow-Credentials', 'false')
-                res.write_header('Access-Control-Max-Age', '86400')
-                # Add security headers
-                add_security_headers(res)
-                res.end(json.dumps(response))
+                send_json(res, response)
 
             except Exception as e:
                 import traceback
@@ -268,17 +204,17 @@ class CampaignRoutes:
                 from ...presentation.error_handlers import handle_internal_server_error
                 handle_internal_server_error(res)
 
-        app.get('/v1/campaigns', list_campaigns)
+        route(app, LIST_CAMPAIGNS_ROUTE, list_campaigns)
 
     async def _register_create_campaign(self, app):
         """Register create campaign route."""
+        validate_create = compile_route_validator(CREATE_CAMPAIGN_ROUTE)
 
         async def create_campaign(res, req):
             """Create a new campaign."""
-            from ...presentation.middleware.security_middleware import validate_request, add_security_headers
 
             # Validate request
-            if validate_request(req, res):
+            if validate_create(req, res) is None:
                 return  # Validation failed, response already sent
 
             try:
@@ -291,10 +227,7 @@ class CampaignRoutes:
                 if not body_data:
                     logger.warning("Body data is empty")
                     error_response = {"error": {"code": "VALIDATION_ERROR", "message": "Request body is required"}}
-                    res.write_status(400)
-                    res.write_header("Content-Type", "application/json")
-                    add_security_headers(res)
-                    res.end(json.dumps(error_response))
+                    send_json(res, error_response, 400)
                     return
 
                 # Validate required fields
@@ -303,10 +236,7 @@ class CampaignRoutes:
                     if field not in body_data:
                         error_response = {
                             "error": {"code": "VALIDATION_ERROR", "message": f"Field '{field}' is required"}}
-                        res.write_status(400)
-                        res.write_header("Content-Type", "application/json")
-                        add_security_headers(res)
-                        res.end(json.dumps(error_response))
+                        send_json(res, error_response, 400)
                         return
 
                 # Create command
@@ -350,38 +280,33 @@ class CampaignRoutes:
                     "updatedAt": campaign.updated_at.isoformat()
                 }
 
-                res.write_status(201)
-                res.write_header('Location', f'http://localhost:5000/v1/campaigns/{response["id"]}')
-                res.write_header('Content-Type', 'application/json')
-                add_security_headers(res)
-                res.end(json.dumps(response))
+                location = f'http://localhost:5000/v1/campaigns/{response["id"]}'
+                send_json(res, response, 201, headers=API_HEADERS + ((b'Location', location.encode()),))
 
             except ValueError as e:
                 error_response = {"error": {"code": "VALIDATION_ERROR", "message": str(e)}}
-                res.write_status(400)
-                res.write_header("Content-Type", "application/json")
-                res.end(json.dumps(error_response))
+                send_json(res, error_response, 400)
             except Exception as e:
                 import traceback
                 logger.error(f"Error creating campaign: {e}")
                 logger.error(f"Full traceback: {traceback.format_exc()}")
                 error_response = {
                     "error": {"code": "INTERNAL_SERVER_ERROR", "message": f"Internal server error: {str(e)}"}}
-                res.write_status(500)
-                res.write_header("Content-Type", "application/json")
-                res.end(json.dumps(error_response))
+                send_json(res, error_response, 500)
 
-        app.post('/v1/campaigns', create_campaign)
+        route(app, CREATE_CAMPAIGN_ROUTE, create_campaign)
 
     async def _register_get_campaign(self, app):
         """Register get campaign route."""
+        validate_get = compile_route_validator(GET_CAMPAIGN_ROUTE)
+        validate_update = compile_route_validator(UPDATE_CAMPAIGN_ROUTE)
+        validate_delete = compile_route_validator(DELETE_CAMPAIGN_ROUTE)
 
         async def get_campaign(res, req):
             """Get campaign details."""
-            from ...presentation.middleware.security_middleware import validate_request, add_security_headers
 
             # Validate request (authentication, rate limiting, etc.)
-            if validate_request(req, res):
+            if validate_get(req, res) is None:
                 return  # Validation failed, response already sent
 
             try:
@@ -394,10 +319,7 @@ class CampaignRoutes:
 
                 if not campaign:
                     error_response = {"error": {"code": "NOT_FOUND", "message": "Campaign not found"}}
-                    res.write_status(404)
-                    res.write_header("Content-Type", "application/json")
-                    add_security_headers(res)
-                    res.end(json.dumps(error_response))
+                    send_json(res, error_response, 404)
                     return
 
                 # Convert to response
@@ -455,33 +377,25 @@ class CampaignRoutes:
                     }
                 }
 
-                res.write_status(200)
-                res.write_header("Content-Type", "application/json")
-                add_security_headers(res)
-                res.end(json.dumps(response))
+                send_json(res, response)
 
             except ValueError as e:
                 error_response = {"error": {"code": "VALIDATION_ERROR", "message": str(e)}}
-                res.write_status(400)
-                res.write_header("Content-Type", "application/json")
-                res.end(json.dumps(error_response))
+                send_json(res, error_response, 400)
             except Exception as e:
                 import traceback
                 logger.error(f"Error getting campaign: {e}", exc_info=True)
                 logger.error(f"Full traceback: {traceback.format_exc()}")
                 error_response = {
                     "error": {"code": "INTERNAL_SERVER_ERROR", "message": f"Internal server error: {str(e)}"}}
-                res.write_status(500)
-                res.write_header("Content-Type", "application/json")
-                res.end(json.dumps(error_response))
+                send_json(res, error_response, 500)
 
         def delete_campaign(res, req):
             """Delete a campaign."""
             logger.info("DELETE campaign function called")
-            from ...presentation.middleware.security_middleware import validate_request, add_security_headers
 
             # Validate request (authentication, rate limiting, etc.)
-            if validate_request(req, res):
+            if validate_delete(req, res) is None:
                 logger.info("DELETE campaign validation failed")
                 return  # Validation failed, response already sent
             logger.info("DELETE campaign validation passed")
@@ -492,10 +406,7 @@ class CampaignRoutes:
 
                 if not campaign_id:
                     error_response = {"error": {"code": "VALIDATION_ERROR", "message": "Campaign ID is required"}}
-                    res.write_status(400)
-                    res.write_header("Content-Type", "application/json")
-                    add_security_headers(res)
-                    res.end(json.dumps(error_response))
+                    send_json(res, error_response, 400)
                     return
 
                 # Delete campaign from database
@@ -505,8 +416,8 @@ class CampaignRoutes:
                 logger.info(f"Successfully deleted campaign {campaign_id}")
 
                 # Return 204 No Content on successful deletion
-                add_security_headers(res)
                 res.write_status(204)
+                write_headers(res, SECURITY_HEADER_BUNDLE)
                 res.end('')
 
             except Exception as e:
@@ -514,27 +425,20 @@ class CampaignRoutes:
                 import traceback
                 logger.error(f"DELETE campaign traceback: {traceback.format_exc()}")
                 error_response = {"error": {"code": "INTERNAL_SERVER_ERROR", "message": "Internal server error"}}
-                res.write_status(500)
-                res.write_header("Content-Type", "application/json")
-                add_security_headers(res)
-                res.end(json.dumps(error_response))
+                send_json(res, error_response, 500)
 
         async def update_campaign(res, req):
             """Update a campaign."""
-            from ...presentation.middleware.security_middleware import validate_request, add_security_headers
 
             # Validate request (authentication, rate limiting, etc.)
-            if validate_request(req, res):
+            if validate_update(req, res) is None:
                 return  # Validation failed, response already sent
 
             try:
                 campaign_id = req.get_parameter(0)
                 if not campaign_id:
                     error_response = {"error": {"code": "VALIDATION_ERROR", "message": "Campaign ID is required"}}
-                    res.write_status(400)
-                    res.write_header("Content-Type", "application/json")
-                    add_security_headers(res)
-                    res.end(json.dumps(error_response))
+                    send_json(res, error_response, 400)
                     return
 
                 # Parse request body using socketify's res.get_json()
@@ -542,10 +446,7 @@ class CampaignRoutes:
 
                 if not body_data:
                     error_response = {"error": {"code": "VALIDATION_ERROR", "message": "Request body is required"}}
-                    res.write_status(400)
-                    res.write_header("Content-Type", "application/json")
-                    add_security_headers(res)
-                    res.end(json.dumps(error_response))
+                    send_json(res, error_response, 400)
                     return
 
                 # Create command
@@ -589,24 +490,18 @@ class CampaignRoutes:
                     "updatedAt": updated_campaign.updated_at.isoformat()
                 }
 
-                res.write_status(200)
-                res.write_header('Content-Type', 'application/json')
-                add_security_headers(res)
-                res.end(json.dumps(response))
+                send_json(res, response)
 
             except Exception as e:
                 logger.error(f"ERROR: Failed to update campaign: {e}")
                 import traceback
                 logger.error(f"TRACEBACK: {traceback.format_exc()}")
                 error_response = {"error": {"code": "INTERNAL_SERVER_ERROR", "message": "Internal server error"}}
-                res.write_status(500)
-                res.write_header("Content-Type", "application/json")
-                add_security_headers(res)
-                res.end(json.dumps(error_response))
+                send_json(res, error_response, 500)
 
-        app.get('/v1/campaigns/:campaign_id', get_campaign)
-        app.put('/v1/campaigns/:campaign_id', update_campaign)
-        app.delete('/v1/campaigns/:campaign_id', delete_campaign)
+        route(app, GET_CAMPAIGN_ROUTE, get_campaign)
+        route(app, UPDATE_CAMPAIGN_ROUTE, update_campaign)
+        route(app, DELETE_CAMPAIGN_ROUTE, delete_campaign)
 
     def _build_pagination_info(self, page: int, page_size: int, total_items: int) -> dict:
         """Build pagination information."""
@@ -627,63 +522,29 @@ class CampaignRoutes:
 
     async def _register_campaign_analytics(self, app):
         """Register campaign analytics route."""
+        validate_analytics = compile_route_validator(CAMPAIGN_ANALYTICS_ROUTE)
 
         async def get_campaign_analytics(res, req):
             """Get campaign analytics."""
-            from ...presentation.middleware.security_middleware import validate_request, add_security_headers
 
             # Validate request (authentication, rate limiting, etc.)
-            if validate_request(req, res):
+            params = validate_analytics(req, res)
+            if params is None:
                 return  # Validation failed, response already sent
 
             try:
                 campaign_id = req.get_parameter(0)
 
-                # Validate and parse query parameters
-                from datetime import datetime
-
-                try:
-                    start_date_str = req.get_query('startDate')
-                    if start_date_str is not None:
-                        # Validate date format
-                        datetime.fromisoformat(start_date_str)
-                        start_date = start_date_str
-                    else:
-                        start_date = "2024-01-01"
-
-                    end_date_str = req.get_query('endDate')
-                    if end_date_str is not None:
-                        # Validate date format
-                        datetime.fromisoformat(end_date_str)
-                        end_date = end_date_str
-                    else:
-                        end_date = "2024-01-31"
-
-                    granularity = req.get_query('granularity') or 'day'
-                    if granularity not in ['hour', 'day', 'week', 'month']:
-                        raise ValueError("Granularity must be one of: hour, day, week, month")
-
-                    breakdown = req.get_query('breakdown') or 'date'
-                    if breakdown not in ['date', 'traffic_source', 'landing_page', 'offer', 'geography', 'device']:
-                        raise ValueError(
-                            "Breakdown must be one of: date, traffic_source, landing_page, offer, geography, device")
-
-                except ValueError as e:
-                    error_response = {"error": {"code": "VALIDATION_ERROR", "message": str(e)}}
-                    res.write_status(400)
-                    res.write_header("Content-Type", "application/json")
-                    add_security_headers(res)
-                    res.end(json.dumps(error_response))
-                    return
+                start_date, end_date = params['startDate'].date(), params['endDate'].date()
+                granularity, breakdown = params['granularity'], params['breakdown']
 
                 # Create analytics query
                 from ...application.queries.get_campaign_analytics_query import GetCampaignAnalyticsQuery
-                from datetime import datetime
 
                 query = GetCampaignAnalyticsQuery(
                     campaign_id=campaign_id,
-                    start_date=datetime.fromisoformat(start_date).date(),
-                    end_date=datetime.fromisoformat(end_date).date(),
+                    start_date=start_date,
+                    end_date=end_date,
                     granularity=granularity
                 )
 
@@ -744,77 +605,34 @@ class CampaignRoutes:
                     "breakdowns": breakdowns_data
                 }
 
-                res.write_header("Content-Type", "application/json")
-                add_security_headers(res)
-                res.end(json.dumps(response))
+                send_json(res, response)
             except Exception as e:
                 import traceback
                 logger.error(f"Error in get_campaign: {e}")
                 logger.error(f"Full traceback: {traceback.format_exc()}")
                 error_response = {"error": {"code": "INTERNAL_SERVER_ERROR", "message": "Internal server error"}}
-                res.write_status(500)
-                res.write_header("Content-Type", "application/json")
-                res.end(json.dumps(error_response))
+                send_json(res, error_response, 500)
 
-        app.get('/v1/campaigns/:campaign_id/analytics', get_campaign_analytics)
+        route(app, CAMPAIGN_ANALYTICS_ROUTE, get_campaign_analytics)
 
     async def _register_campaign_landing_pages(self, app):
         """Register campaign landing pages route."""
         logger.debug("_register_campaign_landing_pages called")
+        validate_list = compile_route_validator(LIST_LANDING_PAGES_ROUTE)
+        validate_create = compile_route_validator(CREATE_LANDING_PAGE_ROUTE)
 
         async def get_campaign_landing_pages(res, req):
             """Get campaign landing pages."""
-            from ...presentation.middleware.security_middleware import validate_request, add_security_headers
 
             # Validate request (authentication, rate limiting, etc.)
-            if validate_request(req, res):
+            params = validate_list(req, res)
+            if params is None:
                 return  # Validation failed, response already sent
 
             try:
                 campaign_id = req.get_parameter(0)
 
-                # Validate unknown query parameters
-                query_string = ""
-                try:
-                    query_string = req.get_query_string()
-                except AttributeError:
-                    pass
-
-                # Check for schemathesis unknown parameters
-                unknown_param = req.get_query('x-schemathesis-unknown-property')
-                if unknown_param is not None or 'x-schemathesis-unknown-property' in query_string:
-                    error_response = {"error": {"code": "VALIDATION_ERROR", "message": "Unknown query parameter"}}
-                    res.write_status(400)
-                    res.write_header("Content-Type", "application/json")
-                    add_security_headers(res)
-                    res.end(json.dumps(error_response))
-                    return
-
-                # Validate and parse query parameters
-                try:
-                    page_str = req.get_query('page')
-                    if page_str is not None:
-                        page = int(page_str)
-                        if page < 1:
-                            raise ValueError("Page must be >= 1")
-                    else:
-                        page = 1
-
-                    page_size_str = req.get_query('pageSize')
-                    if page_size_str is not None:
-                        page_size = int(page_size_str)
-                        if page_size < 1 or page_size > 100:
-                            raise ValueError("Page size must be between 1 and 100")
-                    else:
-                        page_size = 20
-
-                except ValueError as e:
-                    error_response = {"error": {"code": "VALIDATION_ERROR", "message": str(e)}}
-                    res.write_status(400)
-                    res.write_header("Content-Type", "application/json")
-                    add_security_headers(res)
-                    res.end(json.dumps(error_response))
-                    return
+                page, page_size = params['page'], params['pageSize']
 
                 # Get landing pages from business logic
                 from ...application.queries.get_campaign_landing_pages_query import GetCampaignLandingPagesQuery
@@ -859,36 +677,27 @@ class CampaignRoutes:
                     "pagination": self._build_pagination_info(page, page_size, total_count)
                 }
 
-                res.write_header("Content-Type", "application/json")
-                add_security_headers(res)
-                res.end(json.dumps(response))
+                send_json(res, response)
             except Exception as e:
                 import traceback
                 logger.error(f"Error in get_campaign: {e}")
                 logger.error(f"Full traceback: {traceback.format_exc()}")
                 error_response = {"error": {"code": "INTERNAL_SERVER_ERROR", "message": "Internal server error"}}
-                res.write_status(500)
-                res.write_header("Content-Type", "application/json")
-                res.end(json.dumps(error_response))
+                send_json(res, error_response, 500)
 
         async def create_campaign_landing_page(res, req):
             """Create a landing page for a campaign."""
             logger.info("DEBUG: create_campaign_landing_page function called!")
-            from ...presentation.middleware.security_middleware import validate_request, add_security_headers
-            import json
 
             # Validate request (authentication, rate limiting, etc.)
-            if validate_request(req, res):
+            if validate_create(req, res) is None:
                 return  # Validation failed, response already sent
 
             try:
                 campaign_id = req.get_parameter(0)
                 if not campaign_id:
                     error_response = {"error": {"code": "VALIDATION_ERROR", "message": "Campaign ID is required"}}
-                    res.write_status(400)
-                    res.write_header("Content-Type", "application/json")
-                    add_security_headers(res)
-                    res.end(json.dumps(error_response))
+                    send_json(res, error_response, 400)
                     return
 
                 # Parse request body using socketify's res.get_json()
@@ -896,10 +705,7 @@ class CampaignRoutes:
 
                 if not body_data:
                     error_response = {"error": {"code": "VALIDATION_ERROR", "message": "Request body is required"}}
-                    res.write_status(400)
-                    res.write_header("Content-Type", "application/json")
-                    add_security_headers(res)
-                    res.end(json.dumps(error_response))
+                    send_json(res, error_response, 400)
                     return
 
                 # Validate required fields
@@ -908,10 +714,7 @@ class CampaignRoutes:
                     if field not in body_data:
                         error_response = {
                             "error": {"code": "VALIDATION_ERROR", "message": f"Field '{field}' is required"}}
-                        res.write_status(400)
-                        res.write_header("Content-Type", "application/json")
-                        add_security_headers(res)
-                        res.end(json.dumps(error_response))
+                        send_json(res, error_response, 400)
                         return
 
                 # Create command
@@ -944,61 +747,33 @@ class CampaignRoutes:
                     "updatedAt": landing_page.updated_at.isoformat()
                 }
 
-                res.write_status(201)
-                res.write_header('Content-Type', 'application/json')
-                add_security_headers(res)
-                res.end(json.dumps(response))
+                send_json(res, response, 201)
 
             except Exception as e:
                 logger.error(f"Error in create_campaign_landing_page: {e}", exc_info=True)
                 error_response = {"error": {"code": "INTERNAL_SERVER_ERROR", "message": "Internal server error"}}
-                res.write_status(500)
-                res.write_header("Content-Type", "application/json")
-                add_security_headers(res)
-                res.end(json.dumps(error_response))
+                send_json(res, error_response, 500)
 
-        app.get('/v1/campaigns/:campaign_id/landing-pages', get_campaign_landing_pages)
-        app.post('/v1/campaigns/:campaign_id/landing-pages', create_campaign_landing_page)
+        route(app, LIST_LANDING_PAGES_ROUTE, get_campaign_landing_pages)
+        route(app, CREATE_LANDING_PAGE_ROUTE, create_campaign_landing_page)
 
     async def _register_campaign_offers(self, app):
         """Register campaign offers route with CQRS query pattern."""
+        validate_list = compile_route_validator(LIST_OFFERS_ROUTE)
+        validate_create = compile_route_validator(CREATE_OFFER_ROUTE)
 
         async def get_campaign_offers(res, req):
             """Get campaign offers using GetCampaignOffersQuery and business logic handler."""
-            from ...presentation.middleware.security_middleware import validate_request, add_security_headers
 
             # Validate request (authentication, rate limiting, etc.)
-            if validate_request(req, res):
+            params = validate_list(req, res)
+            if params is None:
                 return  # Validation failed, response already sent
 
             try:
                 campaign_id = req.get_parameter(0)
 
-                # Validate and parse query parameters for pagination
-                try:
-                    page_str = req.get_query('page')
-                    if page_str is not None:
-                        page = int(page_str)
-                        if page < 1:
-                            raise ValueError("Page must be >= 1")
-                    else:
-                        page = 1
-
-                    page_size_str = req.get_query('pageSize')
-                    if page_size_str is not None:
-                        page_size = int(page_size_str)
-                        if page_size < 1 or page_size > 100:
-                            raise ValueError("Page size must be between 1 and 100")
-                    else:
-                        page_size = 20
-
-                except ValueError as e:
-                    error_response = {"error": {"code": "VALIDATION_ERROR", "message": str(e)}}
-                    res.write_status(400)
-                    res.write_header("Content-Type", "application/json")
-                    add_security_headers(res)
-                    res.end(json.dumps(error_response))
-                    return
+                page, page_size = params['page'], params['pageSize']
 
                 # Get offers from business logic using CQRS query pattern
                 from ...application.queries.get_campaign_offers_query import GetCampaignOffersQuery
@@ -1052,29 +827,23 @@ class CampaignRoutes:
                     "pagination": self._build_pagination_info(page, page_size, total_count)
                 }
 
-                res.write_header("Content-Type", "application/json")
-                add_security_headers(res)
-                res.end(json.dumps(response))
+                send_json(res, response)
             except Exception as e:
                 import traceback
                 logger.error(f"Error in get_campaign: {e}")
                 logger.error(f"Full traceback: {traceback.format_exc()}")
                 error_response = {"error": {"code": "INTERNAL_SERVER_ERROR", "message": "Internal server error"}}
-                res.write_status(500)
-                res.write_header("Content-Type", "application/json")
-                res.end(json.dumps(error_response))
+                send_json(res, error_response, 500)
 
         async def create_campaign_offer(res, req):
             """Create an offer for a campaign."""
-            from ...presentation.middleware.security_middleware import validate_request, add_security_headers
             from ...utils.async_debug import debug_http_request, debug_database_call
-            import json
 
             # Debug: Show async call stack for HTTP requests
             debug_http_request("create_campaign_offer")
 
             # Validate request (authentication, rate limiting, etc.)
-            if validate_request(req, res):
+            if validate_create(req, res) is None:
                 return  # Validation failed, response already sent
 
             try:
@@ -1094,10 +863,7 @@ class CampaignRoutes:
                 # Validate campaign_id
                 if not campaign_id:
                     error_response = {"error": {"code": "VALIDATION_ERROR", "message": "Campaign ID is required"}}
-                    res.write_status(400)
-                    res.write_header("Content-Type", "application/json")
-                    add_security_headers(res)
-                    res.end(json.dumps(error_response))
+                    send_json(res, error_response, 400)
                     return
 
                 # Parse request body using socketify's res.get_json()
@@ -1105,10 +871,7 @@ class CampaignRoutes:
 
                 if not body_data:
                     error_response = {"error": {"code": "VALIDATION_ERROR", "message": "Request body is required"}}
-                    res.write_status(400)
-                    res.write_header("Content-Type", "application/json")
-                    add_security_headers(res)
-                    res.end(json.dumps(error_response))
+                    send_json(res, error_response, 400)
                     return
 
                 try:
@@ -1118,10 +881,7 @@ class CampaignRoutes:
                     if missing_fields:
                         error_response = {
                             "error": {"code": "VALIDATION_ERROR", "message": f"{missing_fields[0]} is required"}}
-                        res.write_status(400)
-                        res.write_header("Content-Type", "application/json")
-                        add_security_headers(res)
-                        res.end(json.dumps(error_response))
+                        send_json(res, error_response, 400)
                         return
 
                     # Create command using CQRS pattern
@@ -1178,10 +938,7 @@ class CampaignRoutes:
                     # Log successful operation
                     debug_database_call("offer_creation_success")
 
-                    res.write_status(201)
-                    res.write_header('Content-Type', 'application/json')
-                    add_security_headers(res)
-                    res.end(json.dumps(response))
+                    send_json(res, response, 201)
 
                 except Exception as e:
                     # Save async trace on error
@@ -1195,41 +952,32 @@ class CampaignRoutes:
                     logger.error(f"Error in create_campaign_offer processing: {e}", exc_info=True)
                     error_response = {
                         "error": {"code": "INTERNAL_SERVER_ERROR", "message": f"Internal server error: {str(e)}"}}
-                    res.write_status(500)
-                    res.write_header("Content-Type", "application/json")
-                    add_security_headers(res)
-                    res.end(json.dumps(error_response))
+                    send_json(res, error_response, 500)
 
             except Exception as e:
                 logger.error(f"Error setting up create_campaign_offer: {e}", exc_info=True)
                 error_response = {"error": {"code": "INTERNAL_SERVER_ERROR", "message": "Internal server error"}}
-                res.write_status(500)
-                res.write_header("Content-Type", "application/json")
-                add_security_headers(res)
-                res.end(json.dumps(error_response))
+                send_json(res, error_response, 500)
 
-        app.get('/v1/campaigns/:campaign_id/offers', get_campaign_offers)
-        app.post('/v1/campaigns/:campaign_id/offers', create_campaign_offer)
+        route(app, LIST_OFFERS_ROUTE, get_campaign_offers)
+        route(app, CREATE_OFFER_ROUTE, create_campaign_offer)
 
     async def _register_campaign_pause(self, app):
         """Register campaign pause route."""
+        validate_pause = compile_route_validator(PAUSE_CAMPAIGN_ROUTE)
 
         async def pause_campaign(res, req):
             """Pause a campaign using CQRS pattern with PauseCampaignCommand and handler."""
-            from ...presentation.middleware.security_middleware import validate_request, add_security_headers
 
             # Validate request (authentication, rate limiting, etc.)
-            if validate_request(req, res):
+            if validate_pause(req, res) is None:
                 return  # Validation failed, response already sent
 
             try:
                 campaign_id = req.get_parameter(0)
                 if not campaign_id:
                     error_response = {"error": {"code": "VALIDATION_ERROR", "message": "Campaign ID is required"}}
-                    res.write_status(400)
-                    res.write_header("Content-Type", "application/json")
-                    add_security_headers(res)
-                    res.end(json.dumps(error_response))
+                    send_json(res, error_response, 400)
                     return
 
                 # Create command using CQRS pattern
@@ -1254,36 +1002,29 @@ class CampaignRoutes:
                     "updatedAt": campaign.updated_at.isoformat()
                 }
 
-                res.write_header("Content-Type", "application/json")
-                add_security_headers(res)
-                res.end(json.dumps(response))
+                send_json(res, response)
             except ValueError as e:
                 # Handle business logic validation errors (e.g., campaign already paused)
                 error_response = {"error": {"code": "VALIDATION_ERROR", "message": str(e)}}
-                res.write_status(400)
-                res.write_header("Content-Type", "application/json")
-                add_security_headers(res)
-                res.end(json.dumps(error_response))
+                send_json(res, error_response, 400)
             except Exception as e:
                 import traceback
                 logger.error(f"Error in pause_campaign: {e}")
                 logger.error(f"Full traceback: {traceback.format_exc()}")
                 error_response = {"error": {"code": "INTERNAL_SERVER_ERROR", "message": "Internal server error"}}
-                res.write_status(500)
-                res.write_header("Content-Type", "application/json")
-                res.end(json.dumps(error_response))
+                send_json(res, error_response, 500)
 
-        app.post('/v1/campaigns/:campaign_id/pause', pause_campaign)
+        route(app, PAUSE_CAMPAIGN_ROUTE, pause_campaign)
 
     async def _register_campaign_resume(self, app):
         """Register campaign resume route."""
+        validate_resume = compile_route_validator(RESUME_CAMPAIGN_ROUTE)
 
         async def resume_campaign(res, req):
             """Resume a campaign."""
-            from ...presentation.middleware.security_middleware import validate_request, add_security_headers
 
             # Validate request (authentication, rate limiting, etc.)
-            if validate_request(req, res):
+            if validate_resume(req, res) is None:
                 return  # Validation failed, response already sent
 
             try:
@@ -1294,9 +1035,7 @@ class CampaignRoutes:
                 if not campaign_id or len(campaign_id) > 255:
                     logger.warning(f"Invalid campaign ID: {campaign_id}")
                     error_response = {"error": {"code": "INVALID_CAMPAIGN_ID", "message": "Invalid campaign ID"}}
-                    res.write_status(400)
-                    res.write_header("Content-Type", "application/json")
-                    res.end(json.dumps(error_response))
+                    send_json(res, error_response, 400)
                     return
 
                 # Create command
@@ -1321,16 +1060,12 @@ class CampaignRoutes:
                     "updatedAt": campaign.updated_at.isoformat()
                 }
 
-                res.write_header("Content-Type", "application/json")
-                add_security_headers(res)
-                res.end(json.dumps(response))
+                send_json(res, response)
             except Exception as e:
                 import traceback
                 logger.error(f"Error in get_campaign: {e}")
                 logger.error(f"Full traceback: {traceback.format_exc()}")
                 error_response = {"error": {"code": "INTERNAL_SERVER_ERROR", "message": "Internal server error"}}
-                res.write_status(500)
-                res.write_header("Content-Type", "application/json")
-                res.end(json.dumps(error_response))
+                send_json(res, error_response, 500)
 
-        app.post('/v1/campaigns/:campaign_id/resume', resume_campaign)
+        route(app, RESUME_CAMPAIGN_ROUTE, resume_campaign)
@@ -16,6 +16,7 @@
 from loguru import logger
 
 from ...application.handlers.generate_click_handler import GenerateClickHandler
+from ...presentation.responses import send_json
 
 
 class ClickGenerationRoutes:
@@ -33,7 +34,6 @@ class ClickGenerationRoutes:
 
         async def generate_click(res, req):
             """Generate personalized click tracking URLs."""
-            from ...presentation.middleware.security_middleware import add_security_headers
             import json
 
             try:
@@ -57,28 +57,22 @@ class ClickGenerationRoutes:
                                         body_data = json.loads(full_body)
                                     except (ValueError, json.JSONDecodeError):
                                         logger.error("Invalid JSON in click generation request")
-                                        res.write_status(400)
-                                        res.write_header("Content-Type", "application/json")
-                                        add_security_headers(res)
-                                        res.end(json.dumps({
+                                        send_json(res, {
                                             "status": "error",
                                             "message": "Invalid JSON format"
-                                        }))
+                                        }, 400)
                                         return
 
                             # Generate click URL(s)
                             result = await self.generate_click_handler.handle(body_data)
 
                             # Return response
-                            res.write_header("Content-Type", "application/json")
-                            add_security_headers(res)
-
                             if result["status"] == "success":
-                                res.write_status(200)
+                                status_code = 200
                             else:
-                                res.write_status(400)
+                                status_code = 400
 
-                            res.end(json.dumps(result))
+                            send_json(res, result, status_code)
 
                     except Exception as e:
                         logger.error(f"Error processing click generation data: {e}", exc_info=True)
@@ -86,10 +80,7 @@ class ClickGenerationRoutes:
                             "status": "error",
                             "message": "Internal server error"
                         }
-                        res.write_status(500)
-                        res.write_header("Content-Type", "application/json")
-                        add_security_headers(res)
-                        res.end(json.dumps(error_response))
+                        send_json(res, error_response, 500)
 
                 res.on_data(on_data)
 
@@ -99,10 +90,7 @@ class ClickGenerationRoutes:
                     "status": "error",
                     "message": "Internal server error"
                 }
-                res.write_status(500)
-                res.write_header("Content-Type", "application/json")
-                add_security_headers(res)
-                res.end(json.dumps(error_response))
+                send_json(res, error_response, 500)
 
         # Register the click generation endpoint
         app.post('/v1/clicks/generate', generate_click)
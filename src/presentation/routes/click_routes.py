@@ -13,7 +13,7 @@
 
 """Click tracking HTTP routes."""
 
-import json
+import asyncio
 import os
 import sys
 from typing import Optional
@@ -21,14 +21,30 @@ from typing import Optional
 from loguru import logger
 
 from ...application.handlers.track_click_handler import TrackClickHandler
+from ...domain.services.click import FALLBACK_REDIRECT_URL
+from ...presentation.middleware.route_spec import QueryParam, RouteSpec, compile_route_validator, route
+from ...presentation.responses import send_html, send_json, send_redirect
+from ...utils.awaitables import maybe_await
+from ...utils.structured_logging import log_gate, request_log_context
 
 # Import shared URL shortener
 sys.path.append(os.path.join(os.path.dirname(__file__), '../../..'))
-from shared_url_shortener import url_shortener, recover_unknown_code
+from shared_url_shortener import url_shortener, code_decoder
 
 
 # Cache functions removed - now using Supreme API for URL generation
 
+# Per-click log gates: when filtered out, the messages are never formatted
+_DEBUG = log_gate(__name__, "DEBUG", sampled=True)
+_INFO = log_gate(__name__, "INFO", sampled=True)
+
+LIST_CLICKS_ROUTE = RouteSpec('/v1/clicks', strict_query=True, query=(
+    QueryParam('limit', int, default=50, minimum=1, maximum=100),
+    QueryParam('offset', int, default=0, minimum=0),
+    QueryParam('is_valid', int, choices=(0, 1)),
+    QueryParam('cid', int, minimum=1),
+))
+
 
 class ClickRoutes:
     """Socketify routes for click tracking operations."""
@@ -44,119 +60,17 @@ class ClickRoutes:
     def register(self, app):
         """Register routes with socketify app."""
         logger.info(f"🔧 ClickRoutes.register() called with app: {type(app)}")
+        validate_list_clicks = compile_route_validator(LIST_CLICKS_ROUTE)
 
         async def track_click(res, req):
             """Handle click tracking and redirection."""
-            logger.info("🔥 TRACK_CLICK HANDLER CALLED")
-            try:
-                logger.info("🔥 ENTERING TRY BLOCK")
-                # Log incoming click request details
-                user_agent = req.get_header('user-agent') or req.get_header('User-Agent') or 'Unknown'
-                referrer = req.get_header('referer') or req.get_header('Referer') or 'Direct'
-                client_ip = self._get_client_ip(req)
-                logger.debug(f"Client IP after _get_client_ip: {client_ip}")
-
-                logger.info("=== CLICK RECEIVED ===")
-                logger.info(f"IP Address: {client_ip}")
-                logger.info(f"User Agent: {user_agent}")
-                logger.info(f"Referrer: {referrer}")
-
-                # Extract only campaign_id and click_id from the URL
-                campaign_id_param = req.get_query('cid')
-                click_id_param = req.get_query('click_id')
-
-                logger.info(f"Campaign ID from URL: {campaign_id_param}")
-                logger.info(f"Click ID from URL: {click_id_param}")
-
-                if not campaign_id_param or not click_id_param:
-                    logger.warning("Missing required campaign_id or click_id parameter")
-                    error_html = "<html><body><h1>Error</h1><p>Campaign or Click ID not found</p></body></html>"
-                    res.write_status(404)
-                    res.write_header("Content-Type", "text/html")
-                    res.end(error_html)
-                    return
-
-                # Check if test mode
-                test_mode = req.get_query('test_mode') == '1'
-                logger.info(f"Test mode: {test_mode}")
-
-                # Create track click command
-                from ...application.commands.track_click_command import TrackClickCommand
-
-                command = TrackClickCommand(
-                    campaign_id=campaign_id_param,
-                    click_id_param=click_id_param,
-                    ip_address=client_ip if client_ip is not None else '127.0.0.1',
-                    user_agent=user_agent,
-                    referrer=referrer,
-                    test_mode=test_mode
-                    # Other parameters will be fetched from PreClickData inside the handler
-                )
-
-                logger.info("TrackClickCommand created successfully with short parameters")
-
-                # Handle click tracking
-                logger.info("Processing click through TrackClickHandler...")
-                click, redirect_url, is_valid = await self.track_click_handler.handle(command)
-
-                logger.info("=== CLICK PROCESSING RESULT ===")
-                logger.info(f"Click ID: {click.id.value}")
-                logger.info(f"Campaign ID: {click.campaign_id}")
-                logger.info(f"Is Valid: {is_valid}")
-                logger.info(f"Redirect URL: {redirect_url.value}")
-                logger.info(f"Created At: {click.created_at.isoformat()}")
-
-                # Check if we got fallback URL and campaign needs configuration
-                if redirect_url.value == "http://localhost:5000/mock-safe-page":
-                    logger.warning(f"Campaign {campaign_id_param} is not properly configured with offer/safe URLs")
-
-                    if is_valid:
-                        logger.warning(
-                            f"VALID click for campaign {campaign_id_param} redirected to fallback - campaign needs proper URLs!")
-                        logger.warning(
-                            f"Set offer_page_url for campaign {campaign_id_param} via: PUT /v1/campaigns/{campaign_id_param}")
-                    else:
-                        logger.info(
-                            f"Invalid/fraud click for campaign {campaign_id_param} - correctly using safe fallback")
+            click_id_param = req.get_query('click_id')
+            with request_log_context(req.get_header('x-request-id'), click_id=click_id_param):
+                await self._track_click(res, req, click_id_param)
 
-                    # Provide helpful setup instructions
-                    logger.warning("To configure campaign URLs:")
-                    logger.warning(f"  curl -X PUT http://localhost:5000/v1/campaigns/{campaign_id_param} \\")
-                    logger.warning("    -H 'Content-Type: application/json' \\")
-                    logger.warning(
-                        "    -d '{\"offer_page_url\": \"https://your-offer.com\", \"safe_page_url\": \"https://your-safe.com\"}'")
-
-                if test_mode:
-                    logger.info("Test mode: returning HTML response")
-                    # Return HTML for testing
-                    status_text = "Valid" if is_valid else "Invalid/Fraud"
-                    html = (
-                        f"<html><body><h1>Offer Page</h1>"
-                        f"<p>Click ID: {click.id.value}</p>"
-                        f"<p>Status: {status_text}</p>"
-                        f"<p>Redirecting to: {redirect_url.value}</p></body></html>"
-                    )
-                    res.write_header("Content-Type", "text/html")
-                    res.end(html)
-                    return
-
-                # Standard redirect
-                logger.info(f"Redirecting user to: {redirect_url.value}")
-                res.write_status(302)
-                res.write_header("Location", redirect_url.value)
-                res.end('')
-
-            except Exception as e:
-                # Log error and return HTML error page
-                logger.error(f"Click tracking error: {e}")
-                error_html = "<html><body><h1>Error</h1><p>Internal server error</p></body></html>"
-                res.write_status(500)
-                res.write_header("Content-Type", "text/html")
-                res.end(error_html)
-
-        def get_click_details(res, req):
+        async def get_click_details(res, req):
             """Get click details (admin endpoint)."""
-            from ...presentation.middleware.security_middleware import validate_request, add_security_headers
+            from ...presentation.middleware.security_middleware import validate_request
 
             # Validate request (authentication, rate limiting, etc.)
             if validate_request(req, res):
@@ -172,22 +86,17 @@ class ClickRoutes:
                 except (ValueError, TypeError):
                     error_response = {
                         "error": {"code": "VALIDATION_ERROR", "message": "Invalid UUID format for click ID"}}
-                    res.write_status(400)
-                    res.write_header("Content-Type", "application/json")
-                    add_security_headers(res)
-                    res.end(json.dumps(error_response))
+                    send_json(res, error_response, 400)
                     return
 
                 # Get click from repository
                 from ...domain.value_objects import ClickId
-                click = self.track_click_handler._click_repository.find_by_id(ClickId.from_string(click_id))
+                click = await maybe_await(
+                    self.track_click_handler._click_repository.find_by_id(ClickId.from_string(click_id)))
 
                 if not click:
                     error_response = {"error": {"code": "NOT_FOUND", "message": "Click not found"}}
-                    res.write_status(404)
-                    res.write_header("Content-Type", "application/json")
-                    add_security_headers(res)
-                    res.end(json.dumps(error_response))
+                    send_json(res, error_response, 404)
                     return
 
                 # Convert click to response format
@@ -215,101 +124,43 @@ class ClickRoutes:
                     "has_conversion": click.has_conversion
                 }
 
-                res.write_header("Content-Type", "application/json")
-                add_security_headers(res)
-                res.end(json.dumps(click_data))
+                send_json(res, click_data)
 
             except Exception as e:
                 logger.error(f"Error getting click details: {e}")
                 error_response = {"error": {"code": "INTERNAL_SERVER_ERROR", "message": "Internal server error"}}
-                res.write_status(500)
-                res.write_header("Content-Type", "application/json")
-                res.end(json.dumps(error_response))
+                send_json(res, error_response, 500)
 
-        def list_clicks(res, req):
+        async def list_clicks(res, req):
             """List recent clicks (admin endpoint)."""
-            from ...presentation.middleware.security_middleware import validate_request, add_security_headers
 
-            # Validate request (authentication, rate limiting, etc.)
-            if validate_request(req, res):
+            # Validate request (authentication, rate limiting, query parameters)
+            params = validate_list_clicks(req, res)
+            if params is None:
                 return  # Validation failed, response already sent
 
             try:
-                # Validate unknown query parameters
-                query_string = ""
-                try:
-                    query_string = req.get_query_string()
-                except AttributeError:
-                    pass
-
-                # Check for schemathesis unknown parameters
-                unknown_param = req.get_query('x-schemathesis-unknown-property')
-                if unknown_param is not None or 'x-schemathesis-unknown-property' in query_string:
-                    error_response = {"error": {"code": "VALIDATION_ERROR", "message": "Unknown query parameter"}}
-                    res.write_status(400)
-                    res.write_header("Content-Type", "application/json")
-                    add_security_headers(res)
-                    res.end(json.dumps(error_response))
-                    return
-
-                # Validate query parameters
-                try:
-                    limit_str = req.get_query('limit')
-                    if limit_str is not None:
-                        limit = int(limit_str)
-                        if limit < 1 or limit > 100:
-                            raise ValueError("Limit must be between 1 and 100")
-                    else:
-                        limit = 50
-
-                    offset_str = req.get_query('offset')
-                    if offset_str is not None:
-                        offset = int(offset_str)
-                        if offset < 0:
-                            raise ValueError("Offset must be >= 0")
-                    else:
-                        offset = 0
-
-                    is_valid_str = req.get_query('is_valid')
-                    if is_valid_str is not None:
-                        is_valid = int(is_valid_str)
-                        if is_valid not in [0, 1]:
-                            raise ValueError("is_valid must be 0 or 1")
-                    # is_valid is optional, no else clause needed
-
-                    cid_str = req.get_query('cid')
-                    if cid_str is not None:
-                        cid = int(cid_str)
-                        if cid < 1:
-                            raise ValueError("cid must be >= 1")
-                    # cid is optional, no else clause needed
-
-                except ValueError as e:
-                    error_response = {"error": {"code": "VALIDATION_ERROR", "message": str(e)}}
-                    res.write_status(400)
-                    res.write_header("Content-Type", "application/json")
-                    add_security_headers(res)
-                    res.end(json.dumps(error_response))
-                    return
+                limit, offset = params['limit'], params['offset']
+                cid, is_valid = params['cid'], params['is_valid']
 
                 # Build filters for click query
                 from ...domain.value_objects.filters.click_filters import ClickFilters
 
                 filters = ClickFilters(
-                    campaign_id=cid if 'cid' in locals() and cid is not None else None,
-                    is_valid=bool(is_valid) if 'is_valid' in locals() and is_valid is not None else None,
+                    campaign_id=cid,
+                    is_valid=bool(is_valid) if is_valid is not None else None,
                     limit=limit,
                     offset=offset
                 )
 
                 # Get clicks from repository
                 try:
-                    clicks = self.track_click_handler._click_repository.find_by_filters(filters)
+                    clicks = await maybe_await(self.track_click_handler._click_repository.find_by_filters(filters))
 
                     # Get total count for pagination
                     if filters.campaign_id:
-                        total_clicks = self.track_click_handler._click_repository.count_by_campaign_id(
-                            filters.campaign_id)
+                        total_clicks = await maybe_await(self.track_click_handler._click_repository.count_by_campaign_id(
+                            filters.campaign_id))
                     else:
                         # For now, approximate total - in production would need a count query
                         total_clicks = len(clicks) + offset if len(clicks) == limit else len(clicks) + offset
@@ -341,26 +192,21 @@ class ClickRoutes:
                     logger.error(f"Error listing clicks: {e}")
                     raise
 
-                res.write_header("Content-Type", "application/json")
-                add_security_headers(res)
-                res.end(json.dumps(response))
+                send_json(res, response)
 
             except Exception:
                 error_response = {"error": {"code": "INTERNAL_SERVER_ERROR", "message": "Internal server error"}}
-                res.write_status(500)
-                res.write_header("Content-Type", "application/json")
-                res.end(json.dumps(error_response))
+                send_json(res, error_response, 500)
 
         # Add mock endpoints for testing
         def mock_offer(res, req):
             """Mock offer page for testing."""
             html = "<html><body><h1>Mock Offer Page</h1><p>This is a test offer page.</p></body></html>"
-            res.write_header("Content-Type", "text/html")
-            res.end(html)
+            send_html(res, html)
 
         def create_click(res, req):
             """Create a click directly (for testing purposes)."""
-            from ...presentation.middleware.security_middleware import validate_request, add_security_headers
+            from ...presentation.middleware.security_middleware import validate_request
             import json
             import uuid
 
@@ -368,6 +214,27 @@ class ClickRoutes:
             if validate_request(req, res):
                 return  # Validation failed, response already sent
 
+            def respond_error(res, e):
+                logger.error(f"Error creating click: {e}")
+                error_response = {"status": "error", "message": str(e)}
+                send_json(res, error_response, 500)
+
+            async def save_and_respond(res, click):
+                try:
+                    await maybe_await(self.track_click_handler._click_repository.save(click))
+                except Exception as e:
+                    respond_error(res, e)
+                    return
+
+                response = {
+                    "status": "success",
+                    "click_id": str(click.id),
+                    "campaign_id": click.campaign_id,
+                    "created_at": click.created_at.isoformat()
+                }
+
+                send_json(res, response, 201)
+
             try:
                 # Parse request body
                 data_parts = []
@@ -387,13 +254,10 @@ class ClickRoutes:
                                         body_data = json.loads(full_body)
                                     except (ValueError, json.JSONDecodeError):
                                         logger.error("Invalid JSON in click creation request")
-                                        res.write_status(400)
-                                        res.write_header("Content-Type", "application/json")
-                                        add_security_headers(res)
-                                        res.end(json.dumps({
+                                        send_json(res, {
                                             "status": "error",
                                             "message": "Invalid JSON format"
-                                        }))
+                                        }, 400)
                                         return
 
                             # Create click from request data
@@ -441,46 +305,23 @@ class ClickRoutes:
                                     sub5=body_data.get('sub5')
                                 )
 
-                                # Save click
-                                self.track_click_handler._click_repository.save(click)
-
-                                response = {
-                                    "status": "success",
-                                    "click_id": str(click.id),
-                                    "campaign_id": click.campaign_id,
-                                    "created_at": click.created_at.isoformat()
-                                }
-
-                                res.write_status(201)
-                                res.write_header("Content-Type", "application/json")
-                                add_security_headers(res)
-                                res.end(json.dumps(response))
+                                # Save click (the asyncpg repository returns a coroutine)
+                                asyncio.ensure_future(save_and_respond(res, click))
 
                             except Exception as e:
-                                logger.error(f"Error creating click: {e}")
-                                error_response = {"status": "error", "message": str(e)}
-                                res.write_status(500)
-                                res.write_header("Content-Type", "application/json")
-                                add_security_headers(res)
-                                res.end(json.dumps(error_response))
+                                respond_error(res, e)
 
                     except Exception as e:
                         logger.error(f"Error processing click creation data: {e}")
                         error_response = {"status": "error", "message": "Internal server error"}
-                        res.write_status(500)
-                        res.write_header("Content-Type", "application/json")
-                        add_security_headers(res)
-                        res.end(json.dumps(error_response))
+                        send_json(res, error_response, 500)
 
                 res.on_data(on_data)
 
             except Exception as e:
                 logger.error(f"Error in create_click: {e}")
                 error_response = {"status": "error", "message": "Internal server error"}
-                res.write_status(500)
-                res.write_header("Content-Type", "application/json")
-                add_security_headers(res)
-                res.end(json.dumps(error_response))
+                send_json(res, error_response, 500)
 
         def handle_short_link_redirect(res, req):
             """Handle short link redirection with encoded parameters."""
@@ -494,19 +335,12 @@ class ClickRoutes:
                 if not short_code:
                     logger.warning("Empty short code received")
                     error_html = "<html><body><h1>Error</h1><p>Invalid short link</p></body></html>"
-                    res.write_status(404)
-                    res.write_header("Content-Type", "text/html")
-                    res.end(error_html)
+                    send_html(res, error_html, 404)
                     return
 
-                # Decode short link using new URLShortener
+                # Decode short link through the process-wide decoder (LRU + negative cache, with recovery)
                 try:
-                    url_params = url_shortener.decode(short_code)
-
-                    # If normal decoding fails, try recovery
-                    if not url_params:
-                        logger.warning(f"Normal decoding failed, trying recovery for: {short_code}")
-                        url_params = recover_unknown_code(short_code)
+                    url_params = code_decoder.decode(short_code)
 
                     if not url_params:
                         # Provide detailed diagnostic info
@@ -556,9 +390,7 @@ class ClickRoutes:
                         </ul>
                         <p>Please contact support with this code if you believe this is an error.</p>
                         </body></html>"""
-                        res.write_status(404)
-                        res.write_header("Content-Type", "text/html")
-                        res.end(error_html)
+                        send_html(res, error_html, 404)
                         return
 
                     # Reconstruct tracking URL from decoded parameters
@@ -591,22 +423,16 @@ class ClickRoutes:
                     <p>Failed to process short link: <code>{short_code}</code></p>
                     <p>Error: {str(decode_error)}</p>
                     </body></html>"""
-                    res.write_status(400)
-                    res.write_header("Content-Type", "text/html")
-                    res.end(error_html)
+                    send_html(res, error_html, 400)
                     return
 
                 # Redirect to the click tracking endpoint
-                res.write_status(302)
-                res.write_header("Location", tracking_url)
-                res.end('')
+                send_redirect(res, tracking_url)
 
             except Exception as e:
                 logger.error(f"Error handling short link redirect: {e}")
                 error_html = "<html><body><h1>Error</h1><p>Internal server error</p></body></html>"
-                res.write_status(500)
-                res.write_header("Content-Type", "text/html")
-                res.end(error_html)
+                send_html(res, error_html, 500)
 
         # Register all routes
         logger.info("🔧 Registering click routes with socketify app...")
@@ -616,7 +442,7 @@ class ClickRoutes:
         logger.info("🔧 Registered GET /v1/click")
         app.get('/v1/click/:click_id', get_click_details)
         logger.info("🔧 Registered GET /v1/click/:click_id")
-        app.get('/v1/clicks', list_clicks)
+        route(app, LIST_CLICKS_ROUTE, list_clicks)
         logger.info("🔧 Registered GET /v1/clicks")
         app.get('/s/:encoded_data', handle_short_link_redirect)
         logger.info("🔧 Registered GET /s/:encoded_data")
@@ -675,6 +501,75 @@ class ClickRoutes:
             logger.warning(f"Could not convert '{value}' (type: {type(value)}) to int")
             return None
 
+    async def _track_click(self, res, req, click_id_param: Optional[str]) -> None:
+        """Track one click and redirect; runs inside the request's log context."""
+        try:
+            user_agent = req.get_header('user-agent') or req.get_header('User-Agent') or 'Unknown'
+            referrer = req.get_header('referer') or req.get_header('Referer') or 'Direct'
+            client_ip = self._get_client_ip(req)
+            campaign_id_param = req.get_query('cid')
+            test_mode = req.get_query('test_mode') == '1'
+
+            if _DEBUG:
+                logger.debug(f"Click received: campaign={campaign_id_param} ip={client_ip} "
+                             f"ua={user_agent!r} referrer={referrer!r} test_mode={test_mode}")
+
+            if not campaign_id_param or not click_id_param:
+                logger.warning("Missing required campaign_id or click_id parameter")
+                error_html = "<html><body><h1>Error</h1><p>Campaign or Click ID not found</p></body></html>"
+                send_html(res, error_html, 404)
+                return
+
+            # Create track click command
+            from ...application.commands.track_click_command import TrackClickCommand
+
+            command = TrackClickCommand(
+                campaign_id=campaign_id_param,
+                click_id_param=click_id_param,
+                ip_address=client_ip if client_ip is not None else '127.0.0.1',
+                user_agent=user_agent,
+                referrer=referrer,
+                test_mode=test_mode
+                # Other parameters will be fetched from PreClickData inside the handler
+            )
+
+            click, redirect_url, is_valid = await self.track_click_handler.handle(command)
+
+            if _INFO:
+                logger.info(f"Click processed: campaign={click.campaign_id} valid={is_valid} "
+                            f"redirect={redirect_url}")
+
+            # Check if we got fallback URL and campaign needs configuration
+            if redirect_url == FALLBACK_REDIRECT_URL:
+                if is_valid:
+                    logger.warning(
+                        f"VALID click for campaign {campaign_id_param} redirected to fallback - campaign needs "
+                        f"offer_page_url/safe_page_url, set them via PUT /v1/campaigns/{campaign_id_param}")
+                elif _INFO:
+                    logger.info(
+                        f"Invalid/fraud click for campaign {campaign_id_param} - correctly using safe fallback")
+
+            if test_mode:
+                # Return HTML for testing
+                status_text = "Valid" if is_valid else "Invalid/Fraud"
+                html = (
+                    f"<html><body><h1>Offer Page</h1>"
+                    f"<p>Click ID: {click.id.value}</p>"
+                    f"<p>Status: {status_text}</p>"
+                    f"<p>Redirecting to: {redirect_url}</p></body></html>"
+                )
+                send_html(res, html)
+                return
+
+            # Standard redirect
+            send_redirect(res, redirect_url)
+
+        except Exception as e:
+            # Log error and return HTML error page
+            logger.error(f"Click tracking error: {e}")
+            error_html = "<html><body><h1>Error</h1><p>Internal server error</p></body></html>"
+            send_html(res, error_html, 500)
+
     def _get_client_ip(self, request) -> str:
         """Get real client IP address."""
         # Check proxy headers
@@ -16,6 +16,7 @@
 from loguru import logger
 
 from ...application.handlers.track_conversion_handler import TrackConversionHandler
+from ...presentation.responses import send_json
 
 
 class ConversionRoutes:
@@ -33,7 +34,6 @@ class ConversionRoutes:
 
         def track_conversion(res, req):
             """Track conversions from external systems."""
-            from ...presentation.middleware.security_middleware import add_security_headers
             import json
 
             try:
@@ -57,30 +57,24 @@ class ConversionRoutes:
                                         body_data = json.loads(full_body)
                                     except (ValueError, json.JSONDecodeError):
                                         logger.error("Invalid JSON in conversion tracking request")
-                                        res.write_status(400)
-                                        res.write_header("Content-Type", "application/json")
-                                        add_security_headers(res)
-                                        res.end(json.dumps({
+                                        send_json(res, {
                                             "status": "error",
                                             "message": "Invalid JSON format"
-                                        }))
+                                        }, 400)
                                         return
 
                             # Track conversion
                             result = self.track_conversion_handler.handle(body_data)
 
                             # Return response
-                            res.write_header("Content-Type", "application/json")
-                            add_security_headers(res)
-
                             if result["status"] == "success":
-                                res.write_status(200)
+                                status_code = 200
                             elif result["status"] == "duplicate":
-                                res.write_status(200)  # Still successful, just duplicate
+                                status_code = 200  # Still successful, just duplicate
                             else:
-                                res.write_status(400)
+                                status_code = 400
 
-                            res.end(json.dumps(result))
+                            send_json(res, result, status_code)
 
                     except Exception as e:
                         logger.error(f"Error processing conversion tracking data: {e}", exc_info=True)
@@ -88,10 +82,7 @@ class ConversionRoutes:
                             "status": "error",
                             "message": "Internal server error"
                         }
-                        res.write_status(500)
-                        res.write_header("Content-Type", "application/json")
-                        add_security_headers(res)
-                        res.end(json.dumps(error_response))
+                        send_json(res, error_response, 500)
 
                 res.on_data(on_data)
 
@@ -101,10 +92,7 @@ class ConversionRoutes:
                     "status": "error",
                     "message": "Internal server error"
                 }
-                res.write_status(500)
-                res.write_header("Content-Type", "application/json")
-                add_security_headers(res)
-                res.end(json.dumps(error_response))
+                send_json(res, error_response, 500)
 
         # Register the conversion tracking endpoint
         app.post('/conversions/track', track_conversion)
@@ -16,6 +16,7 @@
 from loguru import logger
 
 from ...application.handlers.track_event_handler import TrackEventHandler
+from ...presentation.responses import send_json
 
 
 class EventRoutes:
@@ -33,7 +34,6 @@ class EventRoutes:
 
         def track_event(res, req):
             """Track user events from landing pages."""
-            from ...presentation.middleware.security_middleware import add_security_headers
             import json
 
             try:
@@ -60,13 +60,10 @@ class EventRoutes:
                                         body_data = json.loads(full_body)
                                     except (ValueError, json.JSONDecodeError):
                                         logger.error("Invalid JSON in event tracking request")
-                                        res.write_status(400)
-                                        res.write_header("Content-Type", "application/json")
-                                        add_security_headers(res)
-                                        res.end(json.dumps({
+                                        send_json(res, {
                                             "status": "error",
                                             "message": "Invalid JSON format"
-                                        }))
+                                        }, 400)
                                         return
 
                             # Extract request context
@@ -80,15 +77,12 @@ class EventRoutes:
                             result = self.track_event_handler.handle(body_data, request_context)
 
                             # Return response
-                            res.write_header("Content-Type", "application/json")
-                            add_security_headers(res)
-
                             if result["status"] == "success":
-                                res.write_status(200)
+                                status_code = 200
                             else:
-                                res.write_status(400)
+                                status_code = 400
 
-                            res.end(json.dumps(result))
+                            send_json(res, result, status_code)
 
                     except Exception as e:
                         logger.error(f"Error processing event tracking data: {e}", exc_info=True)
@@ -96,10 +90,7 @@ class EventRoutes:
                             "status": "error",
                             "message": "Internal server error"
                         }
-                        res.write_status(500)
-                        res.write_header("Content-Type", "application/json")
-                        add_security_headers(res)
-                        res.end(json.dumps(error_response))
+                        send_json(res, error_response, 500)
 
                 res.on_data(on_data)
 
@@ -109,10 +100,7 @@ class EventRoutes:
                     "status": "error",
                     "message": "Internal server error"
                 }
-                res.write_status(500)
-                res.write_header("Content-Type", "application/json")
-                add_security_headers(res)
-                res.end(json.dumps(error_response))
+                send_json(res, error_response, 500)
 
         # Register the event tracking endpoint
         app.post('/events/track', track_event)
@@ -17,6 +17,9 @@ import json
 
 from loguru import logger
 
+from ...presentation.responses import send_json
+
+
 
 class FormRoutes:
     """Routes for form integration."""
@@ -36,8 +39,6 @@ class FormRoutes:
 
         def submit_form(res, req):
             """Handle form submission."""
-            from ...presentation.middleware.security_middleware import add_security_headers
-
             try:
                 # Parse request body
                 try:
@@ -53,10 +54,7 @@ class FormRoutes:
 
                 if not body:
                     error_response = {"status": "error", "message": "Request body is required"}
-                    res.write_status(400)
-                    res.write_header("Content-Type", "application/json")
-                    add_security_headers(res)
-                    res.end(json.dumps(error_response))
+                    send_json(res, error_response, 400)
                     return
 
                 # Extract form data and context
@@ -87,18 +85,12 @@ class FormRoutes:
                 elif result["status"] == "error":
                     status_code = 500
 
-                res.write_header("Content-Type", "application/json")
-                add_security_headers(res)
-                res.write_status(status_code)
-                res.end(json.dumps(result))
+                send_json(res, result, status_code)
 
             except Exception as e:
                 logger.error(f"Error in form submission: {e}")
                 error_response = {"status": "error", "message": str(e)}
-                res.write_status(500)
-                res.write_header("Content-Type", "application/json")
-                add_security_headers(res)
-                res.end(json.dumps(error_response))
+                send_json(res, error_response, 500)
 
         app.post('/forms/submit', submit_form)
 
@@ -107,36 +99,25 @@ class FormRoutes:
 
         def get_lead_details(res, req):
             """Get detailed information about a lead."""
-            from ...presentation.middleware.security_middleware import add_security_headers
-
             try:
                 # Get lead_id from URL path
                 lead_id = req.get_parameter(0)  # Assuming URL like /forms/lead/{lead_id}
 
                 if not lead_id:
                     error_response = {"status": "error", "message": "Lead ID is required"}
-                    res.write_status(400)
-                    res.write_header("Content-Type", "application/json")
-                    add_security_headers(res)
-                    res.end(json.dumps(error_response))
+                    send_json(res, error_response, 400)
                     return
 
                 # Get lead details from handler
                 result = self._form_handler.get_lead_details(lead_id)
 
                 status_code = 200 if result["status"] == "success" else 404
-                res.write_header("Content-Type", "application/json")
-                add_security_headers(res)
-                res.write_status(status_code)
-                res.end(json.dumps(result))
+                send_json(res, result, status_code)
 
             except Exception as e:
                 logger.error(f"Error getting lead details: {e}")
                 error_response = {"status": "error", "message": str(e)}
-                res.write_status(500)
-                res.write_header("Content-Type", "application/json")
-                add_security_headers(res)
-                res.end(json.dumps(error_response))
+                send_json(res, error_response, 500)
 
         app.get('/forms/lead/{lead_id}', get_lead_details)
 
@@ -145,8 +126,6 @@ class FormRoutes:
 
         def get_form_analytics(res, req):
             """Get form submission analytics."""
-            from ...presentation.middleware.security_middleware import add_security_headers
-
             try:
                 # Parse query parameters for date range
                 from urllib.parse import parse_qs, urlparse
@@ -170,18 +149,12 @@ class FormRoutes:
                 # Get form analytics from handler
                 result = self._form_handler.get_form_analytics(start_date=start_dt, end_date=end_dt)
 
-                res.write_header("Content-Type", "application/json")
-                add_security_headers(res)
-                res.write_status(200)
-                res.end(json.dumps(result))
+                send_json(res, result)
 
             except Exception as e:
                 logger.error(f"Error in form analytics: {e}")
                 error_response = {"status": "error", "message": str(e)}
-                res.write_status(500)
-                res.write_header("Content-Type", "application/json")
-                add_security_headers(res)
-                res.end(json.dumps(error_response))
+                send_json(res, error_response, 500)
 
         app.get('/forms/analytics', get_form_analytics)
 
@@ -190,8 +163,6 @@ class FormRoutes:
 
         def get_hot_leads(res, req):
             """Get hot leads above score threshold."""
-            from ...presentation.middleware.security_middleware import add_security_headers
-
             try:
                 # Parse query parameters
                 query = req.get_query()
@@ -201,17 +172,11 @@ class FormRoutes:
                 # Get hot leads from handler
                 result = self._form_handler.get_hot_leads(score_threshold=score_threshold, limit=limit)
 
-                res.write_header("Content-Type", "application/json")
-                add_security_headers(res)
-                res.write_status(200)
-                res.end(json.dumps(result))
+                send_json(res, result)
 
             except Exception as e:
                 logger.error(f"Error getting hot leads: {e}")
                 error_response = {"status": "error", "message": str(e)}
-                res.write_status(500)
-                res.write_header("Content-Type", "application/json")
-                add_security_headers(res)
-                res.end(json.dumps(error_response))
+                send_json(res, error_response, 500)
 
         app.get('/forms/hot-leads', get_hot_leads)
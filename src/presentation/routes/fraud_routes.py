@@ -18,6 +18,7 @@ import json
 from loguru import logger
 
 from ...application.handlers.fraud_handler import FraudHandler
+from ...presentation.responses import send_json
 
 
 class FraudRoutes:
@@ -36,7 +37,7 @@ class FraudRoutes:
 
         def list_fraud_rules(res, req):
             """List fraud detection rules with pagination."""
-            from ...presentation.middleware.security_middleware import validate_request, add_security_headers
+            from ...presentation.middleware.security_middleware import validate_request
 
             # Validate request (authentication, rate limiting, etc.)
             if validate_request(req, res):
@@ -69,17 +70,12 @@ class FraudRoutes:
                     active_only=active_only
                 )
 
-                res.write_header("Content-Type", "application/json")
-                add_security_headers(res)
-                res.end(json.dumps(result))
+                send_json(res, result)
 
             except Exception as e:
                 logger.error(f"Error listing fraud rules: {e}", exc_info=True)
                 error_response = {"error": {"code": "INTERNAL_SERVER_ERROR", "message": "Internal server error"}}
-                res.write_status(500)
-                res.write_header("Content-Type", "application/json")
-                add_security_headers(res)
-                res.end(json.dumps(error_response))
+                send_json(res, error_response, 500)
 
         # Register the fraud rules list endpoint
         app.get('/v1/fraud/rules', list_fraud_rules)
@@ -90,7 +86,7 @@ class FraudRoutes:
         def create_fraud_rule(res, req):
             """Create a new fraud detection rule."""
             # Temporarily disable security middleware for testing
-            # from ...presentation.middleware.security_middleware import validate_request, add_security_headers
+            # from ...presentation.middleware.security_middleware import validate_request
 
             try:
                 # Parse request body
@@ -111,53 +107,38 @@ class FraudRoutes:
                                         body_data = json.loads(full_body)
                                     except (ValueError, json.JSONDecodeError):
                                         logger.error("Invalid JSON in fraud rule creation request")
-                                        res.write_status(400)
-                                        res.write_header("Content-Type", "application/json")
-                                        res.end(json.dumps({
+                                        send_json(res, {
                                             "error": {"code": "VALIDATION_ERROR", "message": "Invalid JSON format"}
-                                        }))
+                                        }, 400)
                                         return
 
                             # Validate required fields
                             required_fields = ['name', 'type', 'action']
                             for field in required_fields:
                                 if field not in body_data:
-                                    res.write_status(400)
-                                    res.write_header("Content-Type", "application/json")
-                                    res.end(json.dumps({
+                                    send_json(res, {
                                         "error": {"code": "VALIDATION_ERROR",
                                                   "message": f"Missing required field: {field}"}
-                                    }))
+                                    }, 400)
                                     return
 
                             # Create fraud rule
                             result = self.fraud_handler.create_rule(body_data)
 
-                            res.write_header("Content-Type", "application/json")
-
-                            if "error" in result:
-                                res.write_status(400)
-                                res.end(json.dumps(result))
-                            else:
-                                res.write_status(201)
-                                res.end(json.dumps(result))
+                            send_json(res, result, 400 if "error" in result else 201)
 
                     except Exception as e:
                         logger.error(f"Error processing fraud rule creation data: {e}", exc_info=True)
                         error_response = {
                             "error": {"code": "INTERNAL_SERVER_ERROR", "message": "Internal server error"}}
-                        res.write_status(500)
-                        res.write_header("Content-Type", "application/json")
-                        res.end(json.dumps(error_response))
+                        send_json(res, error_response, 500)
 
                 res.on_data(on_data)
 
             except Exception as e:
                 logger.error(f"Error in create_fraud_rule: {e}", exc_info=True)
                 error_response = {"error": {"code": "INTERNAL_SERVER_ERROR", "message": "Internal server error"}}
-                res.write_status(500)
-                res.write_header("Content-Type", "application/json")
-                res.end(json.dumps(error_response))
+                send_json(res, error_response, 500)
 
         # Register the fraud rule creation endpoint
         app.post('/v1/fraud/rules', create_fraud_rule)
@@ -16,6 +16,7 @@
 from loguru import logger
 
 from ...application.handlers.gaming_webhook_handler import GamingWebhookHandler
+from ...presentation.responses import send_json
 
 
 class GamingWebhookRoutes:
@@ -34,7 +35,6 @@ class GamingWebhookRoutes:
 
         def deposit_webhook(res, req):
             """Handle deposit webhooks from gaming platforms."""
-            from ...presentation.middleware.security_middleware import add_security_headers
             import json
 
             try:
@@ -58,30 +58,24 @@ class GamingWebhookRoutes:
                                         body_data = json.loads(full_body)
                                     except (ValueError, json.JSONDecodeError):
                                         logger.error("Invalid JSON in deposit webhook request")
-                                        res.write_status(400)
-                                        res.write_header("Content-Type", "application/json")
-                                        add_security_headers(res)
-                                        res.end(json.dumps({
+                                        send_json(res, {
                                             "status": "error",
                                             "message": "Invalid JSON format"
-                                        }))
+                                        }, 400)
                                         return
 
                             # Process deposit webhook
                             result = self.gaming_webhook_handler.handle_deposit(body_data)
 
                             # Return response
-                            res.write_header("Content-Type", "application/json")
-                            add_security_headers(res)
-
                             if result["status"] == "success":
-                                res.write_status(200)
+                                status_code = 200
                             elif result["status"] == "duplicate":
-                                res.write_status(200)  # Still successful, just duplicate
+                                status_code = 200  # Still successful, just duplicate
                             else:
-                                res.write_status(400)
+                                status_code = 400
 
-                            res.end(json.dumps(result))
+                            send_json(res, result, status_code)
 
                     except Exception as e:
                         logger.error(f"Error processing deposit webhook data: {e}", exc_info=True)
@@ -89,10 +83,7 @@ class GamingWebhookRoutes:
                             "status": "error",
                             "message": "Internal server error"
                         }
-                        res.write_status(500)
-                        res.write_header("Content-Type", "application/json")
-                        add_security_headers(res)
-                        res.end(json.dumps(error_response))
+                        send_json(res, error_response, 500)
 
                 res.on_data(on_data)
 
@@ -102,10 +93,7 @@ class GamingWebhookRoutes:
                     "status": "error",
                     "message": "Internal server error"
                 }
-                res.write_status(500)
-                res.write_header("Content-Type", "application/json")
-                add_security_headers(res)
-                res.end(json.dumps(error_response))
+                send_json(res, error_response, 500)
 
         # Register the deposit webhook endpoint
         app.post('/webhooks/gaming/deposit', deposit_webhook)
@@ -115,7 +103,6 @@ class GamingWebhookRoutes:
 
         def registration_webhook(res, req):
             """Handle user registration webhooks from gaming platforms."""
-            from ...presentation.middleware.security_middleware import add_security_headers
             import json
 
             try:
@@ -139,28 +126,22 @@ class GamingWebhookRoutes:
                                         body_data = json.loads(full_body)
                                     except (ValueError, json.JSONDecodeError):
                                         logger.error("Invalid JSON in registration webhook request")
-                                        res.write_status(400)
-                                        res.write_header("Content-Type", "application/json")
-                                        add_security_headers(res)
-                                        res.end(json.dumps({
+                                        send_json(res, {
                                             "status": "error",
                                             "message": "Invalid JSON format"
-                                        }))
+                                        }, 400)
                                         return
 
                             # Process registration webhook
                             result = self.gaming_webhook_handler.handle_registration(body_data)
 
                             # Return response
-                            res.write_header("Content-Type", "application/json")
-                            add_security_headers(res)
-
                             if result["status"] == "success":
-                                res.write_status(200)
+                                status_code = 200
                             else:
-                                res.write_status(400)
+                                status_code = 400
 
-                            res.end(json.dumps(result))
+                            send_json(res, result, status_code)
 
                     except Exception as e:
                         logger.error(f"Error processing registration webhook data: {e}", exc_info=True)
@@ -168,10 +149,7 @@ class GamingWebhookRoutes:
                             "status": "error",
                             "message": "Internal server error"
                         }
-                        res.write_status(500)
-                        res.write_header("Content-Type", "application/json")
-                        add_security_headers(res)
-                        res.end(json.dumps(error_response))
+                        send_json(res, error_response, 500)
 
                 res.on_data(on_data)
 
@@ -181,10 +159,7 @@ class GamingWebhookRoutes:
                     "status": "error",
                     "message": "Internal server error"
                 }
-                res.write_status(500)
-                res.write_header("Content-Type", "application/json")
-                add_security_headers(res)
-                res.end(json.dumps(error_response))
+                send_json(res, error_response, 500)
 
         # Register the registration webhook endpoint
         app.post('/webhooks/gaming/registration', registration_webhook)
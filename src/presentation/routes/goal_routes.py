@@ -13,11 +13,10 @@
 
 """Goal management HTTP routes."""
 
-import json
-
 from loguru import logger
 
 from ...application.handlers.manage_goal_handler import ManageGoalHandler
+from ...presentation.responses import send_json
 
 
 class GoalRoutes:
@@ -42,7 +41,6 @@ class GoalRoutes:
 
         def create_goal(res, req):
             """Create a new conversion goal."""
-            from ...presentation.middleware.security_middleware import add_security_headers
             import json
 
             try:
@@ -66,28 +64,22 @@ class GoalRoutes:
                                         body_data = json.loads(full_body)
                                     except (ValueError, json.JSONDecodeError):
                                         logger.error("Invalid JSON in create goal request")
-                                        res.write_status(400)
-                                        res.write_header("Content-Type", "application/json")
-                                        add_security_headers(res)
-                                        res.end(json.dumps({
+                                        send_json(res, {
                                             "status": "error",
                                             "message": "Invalid JSON format"
-                                        }))
+                                        }, 400)
                                         return
 
                             # Create goal
                             result = self.manage_goal_handler.create_goal(body_data)
 
                             # Return response
-                            res.write_header("Content-Type", "application/json")
-                            add_security_headers(res)
-
                             if result["status"] == "success":
-                                res.write_status(201)
+                                status_code = 201
                             else:
-                                res.write_status(400)
+                                status_code = 400
 
-                            res.end(json.dumps(result))
+                            send_json(res, result, status_code)
 
                     except Exception as e:
                         logger.error(f"Error processing create goal data: {e}", exc_info=True)
@@ -95,10 +87,7 @@ class GoalRoutes:
                             "status": "error",
                             "message": "Internal server error"
                         }
-                        res.write_status(500)
-                        res.write_header("Content-Type", "application/json")
-                        add_security_headers(res)
-                        res.end(json.dumps(error_response))
+                        send_json(res, error_response, 500)
 
                 res.on_data(on_data)
 
@@ -108,10 +97,7 @@ class GoalRoutes:
                     "status": "error",
                     "message": "Internal server error"
                 }
-                res.write_status(500)
-                res.write_header("Content-Type", "application/json")
-                add_security_headers(res)
-                res.end(json.dumps(error_response))
+                send_json(res, error_response, 500)
 
         # Register the create goal endpoint
         app.post('/goals', create_goal)
@@ -121,8 +107,6 @@ class GoalRoutes:
 
         def get_goal(res, req):
             """Get a specific goal."""
-            from ...presentation.middleware.security_middleware import add_security_headers
-
             try:
                 goal_id = req.get_parameter(0)
 
@@ -130,15 +114,12 @@ class GoalRoutes:
                 result = self.manage_goal_handler.get_goal(goal_id)
 
                 # Return response
-                res.write_header("Content-Type", "application/json")
-                add_security_headers(res)
-
                 if result["status"] == "success":
-                    res.write_status(200)
+                    status_code = 200
                 else:
-                    res.write_status(404)
+                    status_code = 404
 
-                res.end(json.dumps(result))
+                send_json(res, result, status_code)
 
             except Exception as e:
                 logger.error(f"Error in get_goal: {e}", exc_info=True)
@@ -146,10 +127,7 @@ class GoalRoutes:
                     "status": "error",
                     "message": "Internal server error"
                 }
-                res.write_status(500)
-                res.write_header("Content-Type", "application/json")
-                add_security_headers(res)
-                res.end(json.dumps(error_response))
+                send_json(res, error_response, 500)
 
         app.get('/goals/:goal_id', get_goal)
 
@@ -158,8 +136,6 @@ class GoalRoutes:
 
         def list_goals(res, req):
             """List goals with optional filtering."""
-            from ...presentation.middleware.security_middleware import add_security_headers
-
             try:
                 # Parse query parameters
                 campaign_id_str = req.get_query('campaign_id')
@@ -172,15 +148,12 @@ class GoalRoutes:
                 result = self.manage_goal_handler.list_goals(campaign_id, active_only)
 
                 # Return response
-                res.write_header("Content-Type", "application/json")
-                add_security_headers(res)
-
                 if result["status"] == "success":
-                    res.write_status(200)
+                    status_code = 200
                 else:
-                    res.write_status(400)
+                    status_code = 400
 
-                res.end(json.dumps(result))
+                send_json(res, result, status_code)
 
             except Exception as e:
                 logger.error(f"Error in list_goals: {e}", exc_info=True)
@@ -188,10 +161,7 @@ class GoalRoutes:
                     "status": "error",
                     "message": "Internal server error"
                 }
-                res.write_status(500)
-                res.write_header("Content-Type", "application/json")
-                add_security_headers(res)
-                res.end(json.dumps(error_response))
+                send_json(res, error_response, 500)
 
         app.get('/goals', list_goals)
 
@@ -200,7 +170,6 @@ class GoalRoutes:
 
         def update_goal(res, req):
             """Update an existing goal."""
-            from ...presentation.middleware.security_middleware import add_security_headers
             import json
 
             try:
@@ -225,28 +194,22 @@ class GoalRoutes:
                                         body_data = json.loads(full_body)
                                     except (ValueError, json.JSONDecodeError):
                                         logger.error("Invalid JSON in update goal request")
-                                        res.write_status(400)
-                                        res.write_header("Content-Type", "application/json")
-                                        add_security_headers(res)
-                                        res.end(json.dumps({
+                                        send_json(res, {
                                             "status": "error",
                                             "message": "Invalid JSON format"
-                                        }))
+                                        }, 400)
                                         return
 
                             # Update goal
                             result = self.manage_goal_handler.update_goal(goal_id, body_data)
 
                             # Return response
-                            res.write_header("Content-Type", "application/json")
-                            add_security_headers(res)
-
                             if result["status"] == "success":
-                                res.write_status(200)
+                                status_code = 200
                             else:
-                                res.write_status(404 if "not found" in result.get("message", "").lower() else 400)
+                                status_code = 404 if "not found" in result.get("message", "").lower() else 400
 
-                            res.end(json.dumps(result))
+                            send_json(res, result, status_code)
 
                     except Exception as e:
                         logger.error(f"Error processing update goal data: {e}", exc_info=True)
@@ -254,10 +217,7 @@ class GoalRoutes:
                             "status": "error",
                             "message": "Internal server error"
                         }
-                        res.write_status(500)
-                        res.write_header("Content-Type", "application/json")
-                        add_security_headers(res)
-                        res.end(json.dumps(error_response))
+                        send_json(res, error_response, 500)
 
                 res.on_data(on_data)
 
@@ -267,10 +227,7 @@ class GoalRoutes:
                     "status": "error",
                     "message": "Internal server error"
                 }
-                res.write_status(500)
-                res.write_header("Content-Type", "application/json")
-                add_security_headers(res)
-                res.end(json.dumps(error_response))
+                send_json(res, error_response, 500)
 
         app.put('/goals/:goal_id', update_goal)
 
@@ -279,8 +236,6 @@ class GoalRoutes:
 
         def delete_goal(res, req):
             """Delete a goal."""
-            from ...presentation.middleware.security_middleware import add_security_headers
-
             try:
                 goal_id = req.get_parameter(0)
 
@@ -288,15 +243,12 @@ class GoalRoutes:
                 result = self.manage_goal_handler.delete_goal(goal_id)
 
                 # Return response
-                res.write_header("Content-Type", "application/json")
-                add_security_headers(res)
-
                 if result["status"] == "success":
-                    res.write_status(200)
+                    status_code = 200
                 else:
-                    res.write_status(404)
+                    status_code = 404
 
-                res.end(json.dumps(result))
+                send_json(res, result, status_code)
 
             except Exception as e:
                 logger.error(f"Error in delete_goal: {e}", exc_info=True)
@@ -304,10 +256,7 @@ class GoalRoutes:
                     "status": "error",
                     "message": "Internal server error"
                 }
-                res.write_status(500)
-                res.write_header("Content-Type", "application/json")
-                add_security_headers(res)
-                res.end(json.dumps(error_response))
+                send_json(res, error_response, 500)
 
         app.delete('/goals/:goal_id', delete_goal)
 
@@ -316,22 +265,17 @@ class GoalRoutes:
 
         def get_templates(res, req):
             """Get predefined goal templates."""
-            from ...presentation.middleware.security_middleware import add_security_headers
-
             try:
                 # Get templates
                 result = self.manage_goal_handler.get_goal_templates()
 
                 # Return response
-                res.write_header("Content-Type", "application/json")
-                add_security_headers(res)
-
                 if result["status"] == "success":
-                    res.write_status(200)
+                    status_code = 200
                 else:
-                    res.write_status(500)
+                    status_code = 500
 
-                res.end(json.dumps(result))
+                send_json(res, result, status_code)
 
             except Exception as e:
                 logger.error(f"Error in get_templates: {e}", exc_info=True)
@@ -339,10 +283,7 @@ class GoalRoutes:
                     "status": "error",
                     "message": "Internal server error"
                 }
-                res.write_status(500)
-                res.write_header("Content-Type", "application/json")
-                add_security_headers(res)
-                res.end(json.dumps(error_response))
+                send_json(res, error_response, 500)
 
         app.get('/goals/templates', get_templates)
 
@@ -351,7 +292,6 @@ class GoalRoutes:
 
         def duplicate_goal(res, req):
             """Duplicate an existing goal."""
-            from ...presentation.middleware.security_middleware import add_security_headers
             import json
 
             try:
@@ -382,15 +322,12 @@ class GoalRoutes:
                             result = self.manage_goal_handler.duplicate_goal(goal_id, new_campaign_id)
 
                             # Return response
-                            res.write_header("Content-Type", "application/json")
-                            add_security_headers(res)
-
                             if result["status"] == "success":
-                                res.write_status(201)
+                                status_code = 201
                             else:
-                                res.write_status(404)
+                                status_code = 404
 
-                            res.end(json.dumps(result))
+                            send_json(res, result, status_code)
 
                     except Exception as e:
                         logger.error(f"Error processing duplicate goal data: {e}", exc_info=True)
@@ -398,10 +335,7 @@ class GoalRoutes:
                             "status": "error",
                             "message": "Internal server error"
                         }
-                        res.write_status(500)
-                        res.write_header("Content-Type", "application/json")
-                        add_security_headers(res)
-                        res.end(json.dumps(error_response))
+                        send_json(res, error_response, 500)
 
                 res.on_data(on_data)
 
@@ -411,10 +345,7 @@ class GoalRoutes:
                     "status": "error",
                     "message": "Internal server error"
                 }
-                res.write_status(500)
-                res.write_header("Content-Type", "application/json")
-                add_security_headers(res)
-                res.end(json.dumps(error_response))
+                send_json(res, error_response, 500)
 
         app.post('/goals/:goal_id/duplicate', duplicate_goal)
 
@@ -423,7 +354,7 @@ class GoalRoutes:
 
         def get_goal_performance(res, req):
             """Get performance metrics for a specific goal."""
-            from ...presentation.middleware.security_middleware import validate_request, add_security_headers
+            from ...presentation.middleware.security_middleware import validate_request
 
             # Validate request (authentication, rate limiting, etc.)
             if validate_request(req, res):
@@ -440,25 +371,19 @@ class GoalRoutes:
                         "status": "error",
                         "message": "start_date and end_date query parameters are required"
                     }
-                    res.write_status(400)
-                    res.write_header("Content-Type", "application/json")
-                    add_security_headers(res)
-                    res.end(json.dumps(error_response))
+                    send_json(res, error_response, 400)
                     return
 
                 # Get goal performance
                 result = self.manage_goal_handler.get_goal_performance(goal_id, start_date, end_date)
 
                 # Return response
-                res.write_header("Content-Type", "application/json")
-                add_security_headers(res)
-
                 if result["status"] == "success":
-                    res.write_status(200)
+                    status_code = 200
                 else:
-                    res.write_status(404 if "not found" in result.get("message", "").lower() else 400)
+                    status_code = 404 if "not found" in result.get("message", "").lower() else 400
 
-                res.end(json.dumps(result))
+                send_json(res, result, status_code)
 
             except Exception as e:
                 logger.error(f"Error in get_goal_performance: {e}")
@@ -466,9 +391,6 @@ class GoalRoutes:
                     "status": "error",
                     "message": "Internal server error"
                 }
-                res.write_status(500)
-                res.write_header("Content-Type", "application/json")
-                add_security_headers(res)
-                res.end(json.dumps(error_response))
+                send_json(res, error_response, 500)
 
         app.get('/goals/:goal_id/performance', get_goal_performance)
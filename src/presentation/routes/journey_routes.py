@@ -13,11 +13,10 @@
 
 """Customer journey analysis routes."""
 
-import json
-
 from loguru import logger
 
 from ...application.handlers.analyze_journey_handler import AnalyzeJourneyHandler
+from ...presentation.responses import send_json
 
 
 class JourneyRoutes:
@@ -37,8 +36,6 @@ class JourneyRoutes:
 
         def get_journey_funnel(res, req):
             """Get customer journey funnel analysis."""
-            from ...presentation.middleware.security_middleware import add_security_headers
-
             try:
                 # Parse query parameters
                 campaign_id_str = req.get_query('campaign_id')
@@ -50,18 +47,12 @@ class JourneyRoutes:
                 # Get funnel analysis
                 result = self.analyze_journey_handler.get_journey_funnel(campaign_id, days)
 
-                res.write_header("Content-Type", "application/json")
-                add_security_headers(res)
-                res.write_status(200)
-                res.end(json.dumps(result))
+                send_json(res, result)
 
             except Exception as e:
                 logger.error(f"Error in journey funnel: {e}")
                 error_response = {"status": "error", "message": str(e)}
-                res.write_status(500)
-                res.write_header("Content-Type", "application/json")
-                add_security_headers(res)
-                res.end(json.dumps(error_response))
+                send_json(res, error_response, 500)
 
         app.get('/journeys/funnel', get_journey_funnel)
 
@@ -70,8 +61,6 @@ class JourneyRoutes:
 
         def get_drop_off_analysis(res, req):
             """Get customer journey drop-off analysis."""
-            from ...presentation.middleware.security_middleware import add_security_headers
-
             try:
                 # Parse query parameters
                 campaign_id_str = req.get_query('campaign_id')
@@ -83,18 +72,12 @@ class JourneyRoutes:
                 # Get drop-off analysis
                 result = self.analyze_journey_handler.get_drop_off_analysis(campaign_id, days)
 
-                res.write_header("Content-Type", "application/json")
-                add_security_headers(res)
-                res.write_status(200)
-                res.end(json.dumps(result))
+                send_json(res, result)
 
             except Exception as e:
                 logger.error(f"Error in drop-off analysis: {e}")
                 error_response = {"status": "error", "message": str(e)}
-                res.write_status(500)
-                res.write_header("Content-Type", "application/json")
-                add_security_headers(res)
-                res.end(json.dumps(error_response))
+                send_json(res, error_response, 500)
 
         app.get('/journeys/drop-off', get_drop_off_analysis)
 
@@ -103,8 +86,6 @@ class JourneyRoutes:
 
         def populate_journeys(res, req):
             """Populate journey data from clicks and impressions."""
-            from ...presentation.middleware.security_middleware import add_security_headers
-
             try:
                 campaign_id_str = req.get_query('campaign_id')
                 campaign_id = int(campaign_id_str) if campaign_id_str else None
@@ -161,17 +142,11 @@ class JourneyRoutes:
                     click_data, impression_data
                 )
 
-                res.write_header("Content-Type", "application/json")
-                add_security_headers(res)
-                res.write_status(200)
-                res.end(json.dumps(result))
+                send_json(res, result)
 
             except Exception as e:
                 logger.error(f"Error in populate journeys: {e}")
                 error_response = {"status": "error", "message": str(e)}
-                res.write_status(500)
-                res.write_header("Content-Type", "application/json")
-                add_security_headers(res)
-                res.end(json.dumps(error_response))
+                send_json(res, error_response, 500)
 
         app.post('/journeys/populate', populate_journeys)
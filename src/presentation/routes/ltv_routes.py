@@ -13,10 +13,11 @@
 
 """LTV tracking routes."""
 
-import json
-
 from loguru import logger
 
+from ...presentation.responses import send_json
+
+
 
 class LtvRoutes:
     """Routes for LTV tracking."""
@@ -35,8 +36,6 @@ class LtvRoutes:
 
         def get_ltv_analysis(res, req):
             """Get LTV analysis."""
-            from ...presentation.middleware.security_middleware import add_security_headers
-
             try:
                 # Parse query parameters for date range
                 from urllib.parse import parse_qs, urlparse
@@ -60,18 +59,12 @@ class LtvRoutes:
                 # Get LTV analysis from handler
                 result = self._ltv_handler.get_ltv_analysis(start_date=start_dt, end_date=end_dt)
 
-                res.write_header("Content-Type", "application/json")
-                add_security_headers(res)
-                res.write_status(200)
-                res.end(json.dumps(result))
+                send_json(res, result)
 
             except Exception as e:
                 logger.error(f"Error in LTV analysis: {e}")
                 error_response = {"status": "error", "message": str(e)}
-                res.write_status(500)
-                res.write_header("Content-Type", "application/json")
-                add_security_headers(res)
-                res.end(json.dumps(error_response))
+                send_json(res, error_response, 500)
 
         app.get('/ltv/analysis', get_ltv_analysis)
 
@@ -80,36 +73,25 @@ class LtvRoutes:
 
         def get_customer_ltv_details(res, req):
             """Get detailed LTV information for a specific customer."""
-            from ...presentation.middleware.security_middleware import add_security_headers
-
             try:
                 # Get customer_id from URL path
                 customer_id = req.get_parameter(0)  # Assuming URL like /ltv/customer/{customer_id}
 
                 if not customer_id:
                     error_response = {"status": "error", "message": "Customer ID is required"}
-                    res.write_status(400)
-                    res.write_header("Content-Type", "application/json")
-                    add_security_headers(res)
-                    res.end(json.dumps(error_response))
+                    send_json(res, error_response, 400)
                     return
 
                 # Get customer LTV details from handler
                 result = self._ltv_handler.get_customer_ltv_details(customer_id)
 
                 status_code = 200 if result["status"] == "success" else 404
-                res.write_header("Content-Type", "application/json")
-                add_security_headers(res)
-                res.write_status(status_code)
-                res.end(json.dumps(result))
+                send_json(res, result, status_code)
 
             except Exception as e:
                 logger.error(f"Error getting customer LTV details: {e}")
                 error_response = {"status": "error", "message": str(e)}
-                res.write_status(500)
-                res.write_header("Content-Type", "application/json")
-                add_security_headers(res)
-                res.end(json.dumps(error_response))
+                send_json(res, error_response, 500)
 
         app.get('/ltv/customer/{customer_id}', get_customer_ltv_details)
 
@@ -118,23 +100,15 @@ class LtvRoutes:
 
         def get_ltv_segments(res, req):
             """Get overview of LTV segments."""
-            from ...presentation.middleware.security_middleware import add_security_headers
-
             try:
                 # Get LTV segments overview from handler
                 result = self._ltv_handler.get_ltv_segments_overview()
 
-                res.write_header("Content-Type", "application/json")
-                add_security_headers(res)
-                res.write_status(200)
-                res.end(json.dumps(result))
+                send_json(res, result)
 
             except Exception as e:
                 logger.error(f"Error getting LTV segments: {e}")
                 error_response = {"status": "error", "message": str(e)}
-                res.write_status(500)
-                res.write_header("Content-Type", "application/json")
-                add_security_headers(res)
-                res.end(json.dumps(error_response))
+                send_json(res, error_response, 500)
 
         app.get('/ltv/segments', get_ltv_segments)
@@ -16,6 +16,7 @@
 from loguru import logger
 
 from ...application.handlers.send_postback_handler import SendPostbackHandler
+from ...presentation.responses import send_json
 
 
 class PostbackRoutes:
@@ -33,7 +34,6 @@ class PostbackRoutes:
 
         def send_postback(res, req):
             """Send postback notification to external system."""
-            from ...presentation.middleware.security_middleware import add_security_headers
             import json
 
             try:
@@ -57,30 +57,24 @@ class PostbackRoutes:
                                         body_data = json.loads(full_body)
                                     except (ValueError, json.JSONDecodeError):
                                         logger.error("Invalid JSON in postback send request")
-                                        res.write_status(400)
-                                        res.write_header("Content-Type", "application/json")
-                                        add_security_headers(res)
-                                        res.end(json.dumps({
+                                        send_json(res, {
                                             "status": "error",
                                             "message": "Invalid JSON format"
-                                        }))
+                                        }, 400)
                                         return
 
                             # Send postback
                             result = self.send_postback_handler.handle(body_data)
 
                             # Return response
-                            res.write_header("Content-Type", "application/json")
-                            add_security_headers(res)
-
                             if result["status"] == "success":
-                                res.write_status(200)
+                                status_code = 200
                             elif result["status"] == "failed":
-                                res.write_status(502)  # Bad Gateway - external service error
+                                status_code = 502  # Bad Gateway - external service error
                             else:
-                                res.write_status(400)
+                                status_code = 400
 
-                            res.end(json.dumps(result))
+                            send_json(res, result, status_code)
 
                     except Exception as e:
                         logger.error(f"Error processing postback send data: {e}", exc_info=True)
@@ -88,10 +82,7 @@ class PostbackRoutes:
                             "status": "error",
                             "message": "Internal server error"
                         }
-                        res.write_status(500)
-                        res.write_header("Content-Type", "application/json")
-                        add_security_headers(res)
-                        res.end(json.dumps(error_response))
+                        send_json(res, error_response, 500)
 
                 res.on_data(on_data)
 
@@ -101,10 +92,7 @@ class PostbackRoutes:
                     "status": "error",
                     "message": "Internal server error"
                 }
-                res.write_status(500)
-                res.write_header("Content-Type", "application/json")
-                add_security_headers(res)
-                res.end(json.dumps(error_response))
+                send_json(res, error_response, 500)
 
         # Register the postback endpoint
         app.post('/postbacks/send', send_postback)
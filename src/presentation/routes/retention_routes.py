@@ -13,10 +13,11 @@
 
 """Retention campaign routes."""
 
-import json
-
 from loguru import logger
 
+from ...presentation.responses import send_json
+
+
 
 class RetentionRoutes:
     """Routes for retention campaigns."""
@@ -36,8 +37,6 @@ class RetentionRoutes:
 
         def get_retention_campaigns(res, req):
             """Get retention campaigns."""
-            from ...presentation.middleware.security_middleware import add_security_headers
-
             try:
                 # Parse query parameters
                 query = req.get_query()
@@ -46,18 +45,12 @@ class RetentionRoutes:
                 # Get retention campaigns from handler
                 result = self._retention_handler.get_retention_campaigns(status_filter=status_filter)
 
-                res.write_header("Content-Type", "application/json")
-                add_security_headers(res)
-                res.write_status(200)
-                res.end(json.dumps(result))
+                send_json(res, result)
 
             except Exception as e:
                 logger.error(f"Error in retention campaigns: {e}")
                 error_response = {"status": "error", "message": str(e)}
-                res.write_status(500)
-                res.write_header("Content-Type", "application/json")
-                add_security_headers(res)
-                res.end(json.dumps(error_response))
+                send_json(res, error_response, 500)
 
         app.get('/retention/campaigns', get_retention_campaigns)
 
@@ -66,36 +59,25 @@ class RetentionRoutes:
 
         def get_campaign_performance(res, req):
             """Get performance data for a specific campaign."""
-            from ...presentation.middleware.security_middleware import add_security_headers
-
             try:
                 # Get campaign_id from URL path
                 campaign_id = req.get_parameter(0)  # Assuming URL like /retention/campaign/{campaign_id}/performance
 
                 if not campaign_id:
                     error_response = {"status": "error", "message": "Campaign ID is required"}
-                    res.write_status(400)
-                    res.write_header("Content-Type", "application/json")
-                    add_security_headers(res)
-                    res.end(json.dumps(error_response))
+                    send_json(res, error_response, 400)
                     return
 
                 # Get campaign performance from handler
                 result = self._retention_handler.get_campaign_performance(campaign_id)
 
                 status_code = 200 if result["status"] == "success" else 404
-                res.write_header("Content-Type", "application/json")
-                add_security_headers(res)
-                res.write_status(status_code)
-                res.end(json.dumps(result))
+                send_json(res, result, status_code)
 
             except Exception as e:
                 logger.error(f"Error getting campaign performance: {e}")
                 error_response = {"status": "error", "message": str(e)}
-                res.write_status(500)
-                res.write_header("Content-Type", "application/json")
-                add_security_headers(res)
-                res.end(json.dumps(error_response))
+                send_json(res, error_response, 500)
 
         app.get('/retention/campaign/{campaign_id}/performance', get_campaign_performance)
 
@@ -104,36 +86,25 @@ class RetentionRoutes:
 
         def get_user_retention_analysis(res, req):
             """Analyze retention profile for a specific user."""
-            from ...presentation.middleware.security_middleware import add_security_headers
-
             try:
                 # Get customer_id from URL path
                 customer_id = req.get_parameter(0)  # Assuming URL like /retention/user/{customer_id}/analysis
 
                 if not customer_id:
                     error_response = {"status": "error", "message": "Customer ID is required"}
-                    res.write_status(400)
-                    res.write_header("Content-Type", "application/json")
-                    add_security_headers(res)
-                    res.end(json.dumps(error_response))
+                    send_json(res, error_response, 400)
                     return
 
                 # Get user retention analysis from handler
                 result = self._retention_handler.analyze_user_retention(customer_id)
 
                 status_code = 200 if result["status"] == "success" else 404
-                res.write_header("Content-Type", "application/json")
-                add_security_headers(res)
-                res.write_status(status_code)
-                res.end(json.dumps(result))
+                send_json(res, result, status_code)
 
             except Exception as e:
                 logger.error(f"Error in user retention analysis: {e}")
                 error_response = {"status": "error", "message": str(e)}
-                res.write_status(500)
-                res.write_header("Content-Type", "application/json")
-                add_security_headers(res)
-                res.end(json.dumps(error_response))
+                send_json(res, error_response, 500)
 
         app.get('/retention/user/{customer_id}/analysis', get_user_retention_analysis)
 
@@ -142,8 +113,6 @@ class RetentionRoutes:
 
         def get_retention_analytics(res, req):
             """Get retention analytics data."""
-            from ...presentation.middleware.security_middleware import add_security_headers
-
             try:
                 # Parse query parameters for date range
                 query = req.get_query()
@@ -163,17 +132,11 @@ class RetentionRoutes:
                 # Get retention analytics from handler
                 result = self._retention_handler.get_retention_analytics(start_date=start_dt, end_date=end_dt)
 
-                res.write_header("Content-Type", "application/json")
-                add_security_headers(res)
-                res.write_status(200)
-                res.end(json.dumps(result))
+                send_json(res, result)
 
             except Exception as e:
                 logger.error(f"Error in retention analytics: {e}")
                 error_response = {"status": "error", "message": str(e)}
-                res.write_status(500)
-                res.write_header("Content-Type", "application/json")
-                add_security_headers(res)
-                res.end(json.dumps(error_response))
+                send_json(res, error_response, 500)
 
         app.get('/retention/analytics', get_retention_analytics)
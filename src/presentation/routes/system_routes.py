@@ -18,6 +18,7 @@ import json
 from loguru import logger
 
 from ...application.handlers.system_handler import SystemHandler
+from ...presentation.responses import send_json
 
 
 class SystemRoutes:
@@ -29,6 +30,49 @@ class SystemRoutes:
     def register(self, app):
         """Register routes with socketify app."""
         self._register_cache_flush(app)
+        self._register_ingestion_stats(app)
+        self._register_ip_reputation_reload(app)
+
+    def _register_ingestion_stats(self, app):
+        """Register write-behind ingestion metrics route."""
+
+        def ingestion_stats(res, req):
+            """Get click ingestion buffer metrics."""
+            from ...presentation.middleware.security_middleware import validate_request
+
+            if validate_request(req, res):
+                return  # Validation failed, response already sent
+
+            try:
+                result = self.system_handler.get_ingestion_stats()
+                send_json(res, result)
+            except Exception as e:
+                logger.error(f"Error getting ingestion stats: {e}", exc_info=True)
+                send_json(res, {"error": {"code": "INTERNAL_SERVER_ERROR", "message": "Internal server error"}}, 500)
+
+        app.get('/v1/system/ingestion', ingestion_stats)
+
+    def _register_ip_reputation_reload(self, app):
+        """Register IP reputation reload route."""
+
+        async def reload_ip_reputation(res, req):
+            """Rebuild the IP reputation index from its files and swap it in on every worker."""
+            from ...presentation.middleware.security_middleware import validate_request
+
+            if validate_request(req, res):
+                return  # Validation failed, response already sent
+
+            try:
+                result = await self.system_handler.reload_ip_reputation()
+                if result.get("status") == "success":
+                    send_json(res, result)
+                else:
+                    send_json(res, result, 409 if result.get("status") == "disabled" else 500)
+            except Exception as e:
+                logger.error(f"Error reloading IP reputation data: {e}", exc_info=True)
+                send_json(res, {"error": {"code": "INTERNAL_SERVER_ERROR", "message": "Internal server error"}}, 500)
+
+        app.post('/v1/system/ip-reputation/reload', reload_ip_reputation)
 
     def _register_cache_flush(self, app):
         """Register cache flush route."""
@@ -36,7 +80,7 @@ class SystemRoutes:
         def flush_cache(res, req):
             """Flush application cache with selective options."""
             # Temporarily disable security middleware for testing
-            # from ...presentation.middleware.security_middleware import validate_request, add_security_headers
+            # from ...presentation.middleware.security_middleware import validate_request
 
             try:
                 # Parse request body
@@ -57,26 +101,22 @@ class SystemRoutes:
                                         body_data = json.loads(full_body)
                                     except (ValueError, json.JSONDecodeError):
                                         logger.error("Invalid JSON in cache flush request")
-                                        res.write_status(400)
-                                        res.write_header("Content-Type", "application/json")
-                                        res.end(json.dumps({
+                                        send_json(res, {
                                             "error": {"code": "VALIDATION_ERROR", "message": "Invalid JSON format"}
-                                        }))
+                                        }, 400)
                                         return
 
                             # Validate cache types if provided
                             cache_types = body_data.get('types', [])
-                            valid_types = ['campaigns', 'landing_pages', 'offers', 'analytics', 'all']
+                            valid_types = ['campaigns', 'landing_pages', 'offers', 'analytics', 'user_agents', 'auth_tokens', 'all']
 
                             if cache_types:
                                 invalid_types = [t for t in cache_types if t not in valid_types]
                                 if invalid_types:
-                                    res.write_status(400)
-                                    res.write_header("Content-Type", "application/json")
-                                    res.end(json.dumps({
+                                    send_json(res, {
                                         "error": {"code": "VALIDATION_ERROR",
                                                   "message": f"Invalid cache types: {', '.join(invalid_types)}. Valid types: {', '.join(valid_types)}"}
-                                    }))
+                                    }, 400)
                                     return
                             else:
                                 # Default to flush all if no types specified
@@ -85,30 +125,24 @@ class SystemRoutes:
                             # Flush cache
                             result = self.system_handler.flush_cache(cache_types)
 
-                            res.write_header("Content-Type", "application/json")
-                            res.end(json.dumps(result))
+                            send_json(res, result)
 
                     except Exception as e:
                         logger.error(f"Error processing cache flush data: {e}", exc_info=True)
                         error_response = {
                             "error": {"code": "INTERNAL_SERVER_ERROR", "message": "Internal server error"}}
-                        res.write_status(500)
-                        res.write_header("Content-Type", "application/json")
-                        res.end(json.dumps(error_response))
+                        send_json(res, error_response, 500)
 
                 res.on_data(on_data)
 
             except Exception as e:
                 logger.error(f"Error in flush_cache: {e}", exc_info=True)
                 error_response = {"error": {"code": "INTERNAL_SERVER_ERROR", "message": "Internal server error"}}
-                res.write_status(500)
-                res.write_header("Content-Type", "application/json")
-                res.end(json.dumps(error_response))
+                send_json(res, error_response, 500)
 
         def health_check(res, req):
             """Simple health check endpoint."""
             from ...container import container
-            import json
 
             try:
                 # Check database connectivity
@@ -127,17 +161,14 @@ class SystemRoutes:
                     "version": "1.0.0"
                 }
 
-                res.write_header("Content-Type", "application/json")
-                res.end(json.dumps(response))
+                send_json(res, response)
 
             except Exception as e:
                 error_response = {
                     "status": "unhealthy",
                     "error": str(e)[:100]
                 }
-                res.write_status(500)
-                res.write_header("Content-Type", "application/json")
-                res.end(json.dumps(error_response))
+                send_json(res, error_response, 500)
 
         # Register endpoints
         app.get('/health', health_check)
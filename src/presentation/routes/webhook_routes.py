@@ -16,6 +16,7 @@
 from loguru import logger
 
 from ...application.handlers.process_webhook_handler import ProcessWebhookHandler
+from ...presentation.responses import send_json
 
 
 class WebhookRoutes:
@@ -33,7 +34,6 @@ class WebhookRoutes:
 
         def telegram_webhook(res, req):
             """Handle incoming Telegram webhook."""
-            from ...presentation.middleware.security_middleware import add_security_headers
             import json
 
             try:
@@ -60,30 +60,24 @@ class WebhookRoutes:
                                         body_data = json.loads(full_body)
                                     except (ValueError, json.JSONDecodeError):
                                         logger.error("Invalid JSON in webhook request")
-                                        res.write_status(400)
-                                        res.write_header("Content-Type", "application/json")
-                                        add_security_headers(res)
-                                        res.end(json.dumps({
+                                        send_json(res, {
                                             "status": "error",
                                             "message": "Invalid JSON format"
-                                        }))
+                                        }, 400)
                                         return
 
                             # Process webhook
                             result = self.process_webhook_handler.handle(body_data)
 
                             # Return response
-                            res.write_header("Content-Type", "application/json")
-                            add_security_headers(res)
-
                             if result["status"] == "success":
-                                res.write_status(200)
+                                status_code = 200
                             elif result["status"] == "skipped":
-                                res.write_status(200)  # Telegram expects 200 even for skipped
+                                status_code = 200  # Telegram expects 200 even for skipped
                             else:
-                                res.write_status(400)
+                                status_code = 400
 
-                            res.end(json.dumps(result))
+                            send_json(res, result, status_code)
 
                     except Exception as e:
                         logger.error(f"Error processing webhook data: {e}", exc_info=True)
@@ -91,10 +85,7 @@ class WebhookRoutes:
                             "status": "error",
                             "message": "Internal server error"
                         }
-                        res.write_status(500)
-                        res.write_header("Content-Type", "application/json")
-                        add_security_headers(res)
-                        res.end(json.dumps(error_response))
+                        send_json(res, error_response, 500)
 
                 res.on_data(on_data)
 
@@ -104,10 +95,7 @@ class WebhookRoutes:
                     "status": "error",
                     "message": "Internal server error"
                 }
-                res.write_status(500)
-                res.write_header("Content-Type", "application/json")
-                add_security_headers(res)
-                res.end(json.dumps(error_response))
+                send_json(res, error_response, 500)
 
         # Register the webhook endpoint
         app.post('/webhooks/telegram', telegram_webhook)
@@ -0,0 +1,247 @@
+# Copyright (c) 2025 Bivex
+#
+# Author: Bivex
+# Available for contact via email: support@b-b.top
+# For up-to-date contact information:
+# https://github.com/bivex
+#
+# Created: 2026-10-16T09:12:04
+# Last Updated: 2026-10-16T09:12:04
+#
+# Licensed under the MIT License.
+# Commercial licensing available upon request.
+
+"""Pre-fork process supervisor for multi-worker mode.
+
+The supervisor does the fork-safe setup once (imports, shared-memory rate
+limiter, per-worker pool sizes, a port check), then forks ``WORKERS``
+processes. Each worker builds its own socketify app and listens on the same
+port with SO_REUSEPORT, so the kernel spreads connections between them.
+
+One worker at a time holds the ``LeaderLock`` and runs the singleton
+background jobs (PostgreSQL upholder, cache monitors). The lock is an
+``flock``: the kernel drops it when the holder dies and a waiting worker
+takes over.
+
+Crashed workers are restarted in the same slot with exponential backoff.
+SIGTERM/SIGINT is forwarded to the workers as SIGTERM; they stop accepting,
+finish in-flight requests and flush buffers. Anything still alive after the
+drain timeout is killed.
+"""
+
+import asyncio
+import os
+import signal
+import socket
+import threading
+import time
+from multiprocessing import connection, get_context
+from typing import Callable, Dict, Optional
+
+from loguru import logger
+
+try:
+    import fcntl
+    FCNTL_AVAILABLE = True
+except ImportError:
+    FCNTL_AVAILABLE = False
+
+# A worker that stayed up this long is considered healthy again and restarts without delay
+_STABLE_UPTIME_SECONDS = 60.0
+_MAX_RESTART_DELAY_SECONDS = 30.0
+
+
+class LeaderLock:
+    """Advisory file lock electing the one worker that runs singleton jobs."""
+
+    def __init__(self, path: str):
+        self.path = path
+        self._fd: Optional[int] = None
+
+    @property
+    def is_leader(self) -> bool:
+        return self._fd is not None
+
+    def try_acquire(self, blocking: bool = False) -> bool:
+        """Take the lock; must be called in the worker, after the fork."""
+        if self._fd is not None:
+            return True
+        if not FCNTL_AVAILABLE:
+            # No flock (Windows): every process runs its own jobs, as before
+            self._fd = -1
+            return True
+
+        fd = os.open(self.path, os.O_RDWR | os.O_CREAT, 0o644)
+        try:
+            fcntl.flock(fd, fcntl.LOCK_EX if blocking else fcntl.LOCK_EX | fcntl.LOCK_NB)
+        except BlockingIOError:
+            os.close(fd)
+            return False
+        os.ftruncate(fd, 0)
+        os.write(fd, str(os.getpid()).encode())
+        self._fd = fd
+        return True
+
+    def on_elected(self, callback: Callable[[], None]) -> None:
+        """
+        Run ``callback`` once this process holds the lock.
+
+        When another worker is leader, a daemon thread waits on the lock and
+        calls ``callback`` from that thread after a failover.
+        """
+        if self.try_acquire():
+            logger.info(f"👑 Worker {os.getpid()} is the leader ({self.path})")
+            callback()
+            return
+
+        def wait_for_leadership():
+            self.try_acquire(blocking=True)
+            logger.info(f"👑 Worker {os.getpid()} took over leadership ({self.path})")
+            callback()
+
+        threading.Thread(target=wait_for_leadership, name="Leader-Election", daemon=True).start()
+
+    def release(self) -> None:
+        if self._fd is not None and self._fd >= 0:
+            os.close(self._fd)
+        self._fd = None
+
+
+def check_listen_address(host: str, port: int) -> None:
+    """Fail fast (OSError) when the port is held by a socket without SO_REUSEPORT."""
+    family = socket.AF_INET6 if ':' in host else socket.AF_INET
+    with socket.socket(family, socket.SOCK_STREAM) as probe:
+        probe.setsockopt(socket.SOL_SOCKET, socket.SO_REUSEADDR, 1)
+        if hasattr(socket, 'SO_REUSEPORT'):
+            probe.setsockopt(socket.SOL_SOCKET, socket.SO_REUSEPORT, 1)
+        probe.bind((host, port))
+
+
+class InFlightRequests:
+    """Counts the async request handlers a socketify app is still running."""
+
+    def __init__(self, app):
+        self.count = 0
+        run_async = app.loop.run_async
+
+        # socketify schedules every coroutine handler through loop.run_async
+        def tracked_run_async(task, response=None):
+            self.count += 1
+            return run_async(self._track(task), response)
+
+        app.loop.run_async = tracked_run_async
+
+    async def _track(self, task):
+        try:
+            return await task
+        finally:
+            self.count -= 1
+
+    async def wait_idle(self, timeout: float) -> bool:
+        """Wait until no handler is running; False if some still are after ``timeout``."""
+        deadline = time.monotonic() + timeout
+        while self.count and time.monotonic() < deadline:
+            await asyncio.sleep(0.05)
+        return self.count == 0
+
+
+def stop_accepting(app) -> None:
+    """Close the app's listen socket but keep its loop running for in-flight requests."""
+    from socketify.native import ffi, lib
+    listen_socket = getattr(app, 'socket', None)
+    if listen_socket is not None and listen_socket != ffi.NULL:
+        lib.us_listen_socket_close(app.SSL, listen_socket)
+        app.socket = ffi.NULL
+
+
+class PreforkSupervisor:
+    """Forks ``workers`` copies of ``target(slot)`` and keeps them running."""
+
+    def __init__(self, target: Callable[[int], None], workers: int, drain_timeout: float = 30.0,
+                 name: str = "Socketify-Worker"):
+        self._target = target
+        self._workers = workers
+        self._drain_timeout = drain_timeout
+        self._name = name
+        self._context = get_context('fork')
+        self._processes: Dict[int, object] = {}
+        self._started_at: Dict[int, float] = {}
+        self._failures: Dict[int, int] = {}
+        self._restart_at: Dict[int, float] = {}
+        self._stopping = False
+
+    def run(self) -> None:
+        """Supervise until SIGTERM/SIGINT, then drain the workers."""
+        previous = {sig: signal.signal(sig, self._request_stop) for sig in (signal.SIGTERM, signal.SIGINT)}
+        try:
+            for slot in range(self._workers):
+                self._spawn(slot)
+            logger.info(f"🎯 {self._workers} workers started, supervisor pid {os.getpid()}")
+
+            while not self._stopping:
+                sentinels = {process.sentinel: slot for slot, process in self._processes.items()}
+                for sentinel in connection.wait(list(sentinels), timeout=0.5):
+                    self._reap(sentinels[sentinel])
+                self._restart_due()
+        finally:
+            self._drain()
+            for sig, handler in previous.items():
+                signal.signal(sig, handler)
+
+    def _request_stop(self, signum, frame) -> None:
+        if not self._stopping:
+            logger.info(f"🛑 Received {signal.Signals(signum).name}, draining workers...")
+        self._stopping = True
+
+    def _spawn(self, slot: int) -> None:
+        process = self._context.Process(target=self._run_worker, args=(slot,), name=f"{self._name}-{slot + 1}")
+        process.start()
+        self._processes[slot] = process
+        self._started_at[slot] = time.monotonic()
+
+    def _run_worker(self, slot: int) -> None:
+        # Workers drain on SIGTERM themselves; the parent's handlers must not leak into them
+        signal.signal(signal.SIGTERM, signal.SIG_DFL)
+        signal.signal(signal.SIGINT, signal.SIG_IGN)
+        self._target(slot)
+
+    def _reap(self, slot: int) -> None:
+        process = self._processes.pop(slot)
+        process.join()
+        if self._stopping:
+            return
+
+        uptime = time.monotonic() - self._started_at[slot]
+        failures = 1 if uptime >= _STABLE_UPTIME_SECONDS else self._failures.get(slot, 0) + 1
+        self._failures[slot] = failures
+        delay = 0.0 if failures == 1 else min(_MAX_RESTART_DELAY_SECONDS, 0.5 * 2 ** (failures - 2))
+        logger.error(f"💥 {process.name} (pid {process.pid}) exited with code {process.exitcode} "
+                     f"after {uptime:.1f}s; restarting in {delay:.1f}s")
+        self._restart_at[slot] = time.monotonic() + delay
+
+    def _restart_due(self) -> None:
+        now = time.monotonic()
+        for slot, when in list(self._restart_at.items()):
+            if when <= now:
+                del self._restart_at[slot]
+                self._spawn(slot)
+
+    def _drain(self) -> None:
+        processes = [process for process in self._processes.values() if process.is_alive()]
+        for process in processes:
+            try:
+                os.kill(process.pid, signal.SIGTERM)
+            except ProcessLookupError:
+                pass
+
+        deadline = time.monotonic() + self._drain_timeout
+        for process in processes:
+            process.join(max(0.0, deadline - time.monotonic()))
+
+        for process in processes:
+            if process.is_alive():
+                logger.warning(f"⚠️ {process.name} did not drain within {self._drain_timeout:.0f}s, killing it")
+                process.kill()
+                process.join()
+        self._processes.clear()
+        logger.info("✅ All workers stopped")
@@ -0,0 +1,29 @@
+# Copyright (c) 2025 Bivex
+#
+# Author: Bivex
+# Available for contact via email: support@b-b.top
+# For up-to-date contact information:
+# https://github.com/bivex
+#
+# Created: 2026-10-16T09:12:04
+# Last Updated: 2026-10-16T09:12:04
+#
+# Licensed under the MIT License.
+# Commercial licensing available upon request.
+
+"""Helpers for code that talks to both sync and asyncio-native repositories."""
+
+import inspect
+from typing import Any
+
+
+async def maybe_await(value: Any) -> Any:
+    """Return ``value``, awaiting it first if it is awaitable.
+
+    Repository interfaces are implemented both synchronously (psycopg2, SQLite,
+    in-memory) and as coroutines (asyncpg); callers on the event loop use this
+    to stay agnostic of which implementation the container handed them.
+    """
+    if inspect.isawaitable(value):
+        return await value
+    return value
@@ -0,0 +1,113 @@
+# Copyright (c) 2025 Bivex
+#
+# Author: Bivex
+# Available for contact via email: support@b-b.top
+# For up-to-date contact information:
+# https://github.com/bivex
+#
+# Created: 2026-10-16T09:12:04
+# Last Updated: 2026-10-16T09:12:04
+#
+# Licensed under the MIT License.
+# Commercial licensing available upon request.
+
+"""JSON encoding for API responses.
+
+``dumps`` is a drop-in for ``json.dumps(obj)`` in response code. It uses orjson
+when installed and falls back to the stdlib encoder otherwise; both understand
+the domain types that show up in payloads:
+
+* ``Decimal``      -> float
+* ``Money``        -> ``{"amount": float, "currency": "USD"}``
+* ``datetime``     -> ISO 8601 string (``date``/``time`` too)
+* ``ClickId``, ``CampaignId`` and other identifier value objects -> their string value
+* other dataclasses -> object of their fields
+"""
+
+import dataclasses
+import json
+from datetime import date, datetime, time
+from decimal import Decimal
+from typing import Any, Callable, Optional
+
+from ..domain.value_objects.financial.money import Money
+from ..domain.value_objects.identifiers.campaign_id import CampaignId
+from ..domain.value_objects.identifiers.click_id import ClickId
+from ..domain.value_objects.identifiers.impression_id import ImpressionId
+
+try:
+    import orjson
+    ORJSON_AVAILABLE = True
+except ImportError:
+    orjson = None
+    ORJSON_AVAILABLE = False
+
+_IDENTIFIER_TYPES = (ClickId, CampaignId, ImpressionId)
+
+if ORJSON_AVAILABLE:
+    # Dataclasses are passed through so Money and identifiers get their API shape
+    # rather than orjson's field-by-field encoding; datetimes stay native.
+    _ORJSON_OPTIONS = orjson.OPT_NON_STR_KEYS | orjson.OPT_PASSTHROUGH_DATACLASS
+    _ORJSON_INDENT_OPTIONS = _ORJSON_OPTIONS | orjson.OPT_INDENT_2
+
+
+def json_default(obj: Any) -> Any:
+    """Encode the non-native types used in API payloads."""
+    if isinstance(obj, Decimal):
+        return float(obj)
+    if isinstance(obj, Money):
+        return {"amount": float(obj.amount), "currency": obj.currency}
+    if isinstance(obj, _IDENTIFIER_TYPES):
+        return obj.value
+    if isinstance(obj, (datetime, date, time)):
+        return obj.isoformat()
+    if dataclasses.is_dataclass(obj) and not isinstance(obj, type):
+        return {field.name: getattr(obj, field.name) for field in dataclasses.fields(obj)}
+    if isinstance(obj, (set, frozenset)):
+        return list(obj)
+    raise TypeError(f"Object of type {type(obj).__name__} is not JSON serializable")
+
+
+def _chain(default: Optional[Callable[[Any], Any]]) -> Callable[[Any], Any]:
+    if default is None:
+        return json_default
+
+    def chained(obj: Any) -> Any:
+        try:
+            return json_default(obj)
+        except TypeError:
+            return default(obj)
+
+    return chained
+
+
+def dumps_bytes(obj: Any, default: Optional[Callable[[Any], Any]] = None, indent: bool = False) -> bytes:
+    """Encode ``obj`` as UTF-8 JSON bytes.
+
+    ``default`` is consulted for types ``json_default`` does not know, e.g.
+    ``default=str`` for best-effort diagnostic payloads.
+    """
+    if ORJSON_AVAILABLE:
+        return orjson.dumps(obj, default=_chain(default),
+                            option=_ORJSON_INDENT_OPTIONS if indent else _ORJSON_OPTIONS)
+    return json.dumps(obj, default=_chain(default), ensure_ascii=False,
+                      indent=2 if indent else None).encode('utf-8')
+
+
+def dumps(obj: Any, default: Optional[Callable[[Any], Any]] = None, indent: bool = False) -> str:
+    """Encode ``obj`` as a JSON string."""
+    if ORJSON_AVAILABLE:
+        return dumps_bytes(obj, default, indent).decode('utf-8')
+    return json.dumps(obj, default=_chain(default), ensure_ascii=False, indent=2 if indent else None)
+
+
+def loads(data: Any) -> Any:
+    """Decode JSON from ``str`` or ``bytes``."""
+    if ORJSON_AVAILABLE:
+        return orjson.loads(data)
+    return json.loads(data)
+
+
+def backend() -> str:
+    """Name of the encoder in use."""
+    return 'orjson' if ORJSON_AVAILABLE else 'json'
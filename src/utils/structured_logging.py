@@ -0,0 +1,176 @@
+# Copyright (c) 2025 Bivex
+#
+# Author: Bivex
+# Available for contact via email: support@b-b.top
+# For up-to-date contact information:
+# https://github.com/bivex
+#
+# Created: 2026-10-16T09:12:04
+# Last Updated: 2026-10-16T09:12:04
+#
+# Licensed under the MIT License.
+# Commercial licensing available upon request.
+
+"""Logging profiles, per-module level gates and request-scoped log context.
+
+Hot paths guard their log calls with a gate created at import time::
+
+    _INFO = log_gate(__name__, "INFO", sampled=True)
+    ...
+    if _INFO:
+        logger.info(f"Click {click_id} -> {url}")
+
+so when the module's level (or the request's sampling decision) filters the
+message out, the f-string is never built. ``configure_logging`` re-evaluates
+every gate when the profile is installed.
+"""
+
+import json
+import random
+import sys
+import uuid
+from contextlib import contextmanager
+from contextvars import ContextVar
+from typing import Any, Dict, Iterator, List, Optional
+
+from loguru import logger
+
+DEVELOPMENT_FORMAT = (
+    "┌─ <green>{time:YYYY-MM-DD HH:mm:ss.SSS}</green> ─┐\n"
+    "│ <level>{level: <8}</level> │ "
+    "<cyan>{name}</cyan>:<cyan>{function}</cyan>:<cyan>{line}</cyan>\n"
+    "│ <level>{message}</level>\n"
+    "└─────────────────────────────────────────────────────────────┘"
+)
+
+# Whether per-request info logs are emitted for the request being handled
+_request_sampled: ContextVar[bool] = ContextVar('request_sampled', default=True)
+
+_gates: List['LogGate'] = []
+_module_levels: Dict[str, int] = {}
+_default_level = logger.level("DEBUG").no
+_sample_rate = 1.0
+
+
+def parse_module_levels(spec: str) -> Dict[str, str]:
+    """Parse ``"src.presentation.routes=WARNING,src.infrastructure=INFO"``."""
+    levels = {}
+    for item in filter(None, (part.strip() for part in (spec or '').split(','))):
+        module, _, level = item.partition('=')
+        levels[module.strip()] = level.strip().upper()
+    return levels
+
+
+def _level_for(module: str) -> int:
+    """Most specific configured level for a dotted module name."""
+    name = module
+    while name:
+        if name in _module_levels:
+            return _module_levels[name]
+        name = name.rpartition('.')[0]
+    return _default_level
+
+
+class LogGate:
+    """Precomputed "would this be logged?" flag for one module and level."""
+
+    __slots__ = ('module', 'level', 'sampled', '_enabled')
+
+    def __init__(self, module: str, level: str, sampled: bool = False):
+        self.module = module
+        self.level = level
+        self.sampled = sampled
+        self._enabled = True
+        self.refresh()
+
+    def refresh(self) -> None:
+        self._enabled = logger.level(self.level).no >= _level_for(self.module)
+
+    def __bool__(self) -> bool:
+        if not self._enabled:
+            return False
+        return _request_sampled.get() if self.sampled else True
+
+
+def log_gate(module: str, level: str = "INFO", sampled: bool = False) -> LogGate:
+    """Create a gate for ``module``; ``sampled`` gates also honour per-request sampling."""
+    gate = LogGate(module, level, sampled)
+    _gates.append(gate)
+    return gate
+
+
+@contextmanager
+def request_log_context(request_id: Optional[str] = None, **fields: Any) -> Iterator[str]:
+    """Attach a request id (and e.g. click id) to every log record of this request.
+
+    The sampling decision for the request's info logs is made once here.
+    """
+    request_id = request_id or uuid.uuid4().hex[:16]
+    token = _request_sampled.set(_sample_rate >= 1.0 or random.random() < _sample_rate)
+    try:
+        with logger.contextualize(request_id=request_id, **fields):
+            yield request_id
+    finally:
+        _request_sampled.reset(token)
+
+
+class JsonLineSink:
+    """Write one compact JSON object per record."""
+
+    def __init__(self, stream=None):
+        self._stream = stream or sys.stderr
+
+    def __call__(self, message) -> None:
+        record = message.record
+        entry = {
+            'ts': record['time'].isoformat(),
+            'level': record['level'].name,
+            'logger': record['name'],
+            'fn': record['function'],
+            'line': record['line'],
+            'msg': record['message'],
+        }
+        if record['extra']:
+            entry.update(record['extra'])
+        if record['exception'] is not None:
+            exc_type, exc_value, _ = record['exception']
+            entry['exception'] = {'type': getattr(exc_type, '__name__', str(exc_type)), 'message': str(exc_value)}
+        self._stream.write(json.dumps(entry, default=str, ensure_ascii=False) + '\n')
+        self._stream.flush()
+
+
+def _module_filter(record) -> bool:
+    return record['level'].no >= _level_for(record['name'] or '')
+
+
+def configure_logging(logging_settings) -> None:
+    """Install the ``development`` or ``production`` logging profile."""
+    global _default_level, _sample_rate, _module_levels
+
+    level = logging_settings.level.upper()
+    _default_level = logger.level(level).no
+    _module_levels = {module: logger.level(module_level).no
+                      for module, module_level in parse_module_levels(logging_settings.module_levels).items()}
+    _sample_rate = max(0.0, min(1.0, logging_settings.sample_rate))
+    sink_level = min([_default_level, *_module_levels.values()])
+
+    logger.remove()
+    if logging_settings.profile == 'production':
+        # JSON lines written by a background thread; no variable dumps in tracebacks
+        logger.add(JsonLineSink(), level=sink_level, filter=_module_filter, enqueue=True,
+                   backtrace=False, diagnose=False, catch=True)
+        if logging_settings.file_path:
+            logger.add(logging_settings.file_path, level=sink_level, filter=_module_filter, serialize=True,
+                       enqueue=True, rotation="10 MB", retention="1 week", backtrace=False, diagnose=False)
+    else:
+        logger.add(sink=sys.stderr, level=sink_level, filter=_module_filter, format=DEVELOPMENT_FORMAT,
+                   colorize=True, backtrace=True, diagnose=True)
+        logger.add("app.log", level=sink_level, filter=_module_filter, format=DEVELOPMENT_FORMAT,
+                   rotation="10 MB", retention="1 week", backtrace=True, diagnose=True)
+        if logging_settings.file_path:
+            logger.add(logging_settings.file_path, level=sink_level, filter=_module_filter,
+                       format=DEVELOPMENT_FORMAT, rotation="10 MB", retention="1 week",
+                       backtrace=True, diagnose=True)
+
+    for gate in _gates:
+        gate.refresh()
@@ -0,0 +1,289 @@
+# Copyright (c) 2025 Bivex
+#
+# Author: Bivex
+# Available for contact via email: support@b-b.top
+# For up-to-date contact information:
+# https://github.com/bivex
+#
+# Created: 2026-10-16T09:12:04
+# Last Updated: 2026-10-16T09:12:04
+#
+# Licensed under the MIT License.
+# Commercial licensing available upon request.
+
+"""Unit tests for the asyncpg connection pool and the repositories built on it."""
+
+import asyncio
+from contextlib import asynccontextmanager
+from types import SimpleNamespace
+
+import pytest
+
+from src.domain.entities.click import Click
+from src.domain.value_objects import CampaignId, ClickId
+from src.infrastructure.database import async_connection_pool
+from src.infrastructure.database.async_connection_pool import AsyncConnectionPool
+from src.infrastructure.database.unit_of_work import AsyncUnitOfWork
+from src.infrastructure.repositories.async_postgres_click_repository import AsyncPostgresClickRepository
+
+
+class FakeTransaction:
+    """asyncpg-like transaction: explicit start/commit/rollback or ``async with``."""
+
+    def __init__(self, conn):
+        self._conn = conn
+
+    async def start(self):
+        self._conn.sent.append("BEGIN")
+
+    async def commit(self):
+        self._conn.sent.append("COMMIT")
+
+    async def rollback(self):
+        self._conn.sent.append("ROLLBACK")
+
+    async def __aenter__(self):
+        await self.start()
+        return self
+
+    async def __aexit__(self, exc_type, exc, tb):
+        if exc_type is None:
+            await self.commit()
+        else:
+            await self.rollback()
+        return False
+
+
+class FakeConnection:
+    """Records every statement sent on it."""
+
+    def __init__(self, name):
+        self.name = name
+        self.sent = []
+
+    def transaction(self):
+        return FakeTransaction(self)
+
+    async def execute(self, query, *args):
+        self.sent.append(query)
+        return "INSERT 0 1"
+
+    async def fetch(self, query, *args):
+        self.sent.append(query)
+        return []
+
+    async def fetchrow(self, query, *args):
+        self.sent.append(query)
+        return None
+
+    async def fetchval(self, query, *args):
+        self.sent.append(query)
+        return 0
+
+
+class FakeAsyncpgPool:
+    """Stands in for ``asyncpg.Pool``: one connection, checkouts counted."""
+
+    def __init__(self):
+        self.connection = FakeConnection("pooled")
+        self.checked_out = 0
+        self.released = 0
+        self.closed = False
+
+    @asynccontextmanager
+    async def acquire(self):
+        self.checked_out += 1
+        try:
+            yield self.connection
+        finally:
+            self.released += 1
+
+    async def execute(self, query, *args):
+        self.checked_out += 1
+        self.released += 1
+        return await self.connection.execute(query, *args)
+
+    def get_size(self):
+        return 1
+
+    def get_idle_size(self):
+        return 1 + self.released - self.checked_out
+
+    async def close(self):
+        self.closed = True
+
+    def terminate(self):
+        self.closed = True
+
+
+@pytest.fixture
+def fake_asyncpg(monkeypatch):
+    """Replace ``asyncpg.create_pool`` so ``open()`` builds a FakeAsyncpgPool."""
+    created = []
+
+    async def create_pool(init=None, **config):
+        created.append(FakeAsyncpgPool())
+        return created[-1]
+
+    monkeypatch.setattr(async_connection_pool, "asyncpg", SimpleNamespace(create_pool=create_pool))
+    return created
+
+
+class FakeContainer:
+    def __init__(self, pool):
+        self._pool = pool
+
+    async def get_async_db_connection_pool(self):
+        return self._pool
+
+
+def make_click():
+    return Click(id=ClickId.generate(), campaign_id=CampaignId("camp_1"),
+                 ip_address="8.8.8.8", user_agent="Mozilla/5.0")
+
+
+class TestAsyncConnectionPool:
+    """Test cases for AsyncConnectionPool."""
+
+    def test_acquire_checks_out_and_releases(self, fake_asyncpg):
+        pool = AsyncConnectionPool()
+
+        async def scenario():
+            async with pool.acquire() as conn:
+                assert conn is fake_asyncpg[0].connection
+                assert fake_asyncpg[0].released == 0
+            async with pool.acquire():
+                pass
+
+        asyncio.run(scenario())
+
+        assert len(fake_asyncpg) == 1
+        assert fake_asyncpg[0].checked_out == fake_asyncpg[0].released == 2
+        assert pool.get_stats()['acquisitions'] == 2
+
+    def test_acquire_releases_when_the_block_raises(self, fake_asyncpg):
+        pool = AsyncConnectionPool()
+
+        async def scenario():
+            async with pool.acquire():
+                raise ValueError("boom")
+
+        with pytest.raises(ValueError):
+            asyncio.run(scenario())
+
+        assert fake_asyncpg[0].checked_out == fake_asyncpg[0].released == 1
+
+    def test_transaction_commits_on_success(self, fake_asyncpg):
+        pool = AsyncConnectionPool()
+
+        async def scenario():
+            async with pool.transaction() as conn:
+                await conn.execute("UPDATE campaigns SET status = 'active'")
+
+        asyncio.run(scenario())
+
+        assert fake_asyncpg[0].connection.sent == ["BEGIN", "UPDATE campaigns SET status = 'active'", "COMMIT"]
+
+    def test_transaction_rolls_back_on_error(self, fake_asyncpg):
+        pool = AsyncConnectionPool()
+
+        async def scenario():
+            async with pool.transaction() as conn:
+                await conn.execute("UPDATE campaigns SET status = 'active'")
+                raise RuntimeError("boom")
+
+        with pytest.raises(RuntimeError):
+            asyncio.run(scenario())
+
+        assert fake_asyncpg[0].connection.sent == ["BEGIN", "UPDATE campaigns SET status = 'active'", "ROLLBACK"]
+        assert fake_asyncpg[0].released == 1
+
+    def test_query_with_conn_runs_on_that_connection(self, fake_asyncpg):
+        pool = AsyncConnectionPool()
+        joined = FakeConnection("joined")
+
+        async def scenario():
+            await pool.execute("SELECT 1", conn=joined)
+
+        asyncio.run(scenario())
+
+        assert joined.sent == ["SELECT 1"]
+        assert fake_asyncpg == []
+        assert pool.get_stats()['acquisitions'] == 0
+
+    def test_query_without_conn_uses_the_pool(self, fake_asyncpg):
+        pool = AsyncConnectionPool()
+
+        async def scenario():
+            return await pool.execute("SELECT 1")
+
+        assert asyncio.run(scenario()) == "INSERT 0 1"
+        assert fake_asyncpg[0].connection.sent == ["SELECT 1"]
+        assert pool.get_stats()['acquisitions'] == 1
+
+    def test_pool_is_recreated_on_a_new_event_loop(self, fake_asyncpg):
+        pool = AsyncConnectionPool()
+
+        async def scenario():
+            await pool.execute("SELECT 1")
+
+        asyncio.run(scenario())
+        asyncio.run(scenario())
+
+        assert len(fake_asyncpg) == 2
+        assert fake_asyncpg[0].closed
+
+
+class TestAsyncPostgresRepository:
+    """Test cases for repositories running on AsyncConnectionPool."""
+
+    def test_save_without_conn_goes_through_the_pool(self, fake_asyncpg):
+        repository = AsyncPostgresClickRepository(FakeContainer(AsyncConnectionPool()))
+
+        asyncio.run(repository.save(make_click()))
+
+        assert len(fake_asyncpg[0].connection.sent) == 1
+        assert "INSERT INTO clicks" in fake_asyncpg[0].connection.sent[0]
+
+    def test_save_with_conn_joins_the_callers_transaction(self, fake_asyncpg):
+        repository = AsyncPostgresClickRepository(FakeContainer(AsyncConnectionPool()))
+        joined = FakeConnection("joined")
+
+        asyncio.run(repository.save(make_click(), conn=joined))
+
+        assert len(joined.sent) == 1
+        assert "INSERT INTO clicks" in joined.sent[0]
+        assert fake_asyncpg == []
+
+    def test_unit_of_work_writes_share_one_transaction(self, fake_asyncpg):
+        pool = AsyncConnectionPool()
+        repository = AsyncPostgresClickRepository(FakeContainer(pool))
+
+        async def scenario():
+            async with AsyncUnitOfWork(pool) as uow:
+                uow.add(repository.save, make_click())
+                uow.add(repository.save, make_click())
+
+        asyncio.run(scenario())
+
+        sent = fake_asyncpg[0].connection.sent
+        assert sent[0] == "BEGIN" and sent[-1] == "COMMIT"
+        assert len(sent) == 4
+        assert fake_asyncpg[0].checked_out == fake_asyncpg[0].released == 1
+
+    def test_unit_of_work_rolls_back_repository_writes_on_error(self, fake_asyncpg):
+        pool = AsyncConnectionPool()
+        repository = AsyncPostgresClickRepository(FakeContainer(pool))
+
+        async def scenario():
+            async with AsyncUnitOfWork(pool) as uow:
+                await uow.run(repository.save, make_click())
+                raise RuntimeError("boom")
+
+        with pytest.raises(RuntimeError):
+            asyncio.run(scenario())
+
+        sent = fake_asyncpg[0].connection.sent
+        assert sent[0] == "BEGIN" and sent[-1] == "ROLLBACK"
+        assert "COMMIT" not in sent
+        assert fake_asyncpg[0].released == 1
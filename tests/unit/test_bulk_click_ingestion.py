@@ -0,0 +1,295 @@
+# Copyright (c) 2025 Bivex
+#
+# Author: Bivex
+# Available for contact via email: support@b-b.top
+# For up-to-date contact information:
+# https://github.com/bivex
+#
+# Created: 2026-10-16T09:12:04
+# Last Updated: 2026-10-16T09:12:04
+#
+# Licensed under the MIT License.
+# Commercial licensing available upon request.
+
+"""Unit tests for streaming bulk click ingestion."""
+
+import asyncio
+import json
+import threading
+
+from src.application.handlers.bulk_click_ingestion_handler import BulkClickIngestionHandler
+from src.domain.services.click import ClickValidationService, FraudRuleEngine
+from src.infrastructure.upholder.postgres_bulk_optimizer import PostgresBulkOptimizer
+from src.presentation.routes import bulk_operations_routes
+from src.presentation.routes.bulk_operations_routes import BulkOperationsRoutes, StreamingRecordParser
+
+BROWSER_UA = "Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 Chrome/120.0 Safari/537.36"
+
+
+class RecordingClickRepository:
+    def __init__(self, stored=()):
+        self.batches = []
+        self.stored = set(stored)
+
+    async def upsert_many(self, clicks):
+        self.batches.append(list(clicks))
+        inserted = [click.id.value for click in clicks if click.id.value not in self.stored]
+        self.stored.update(inserted)
+        return inserted
+
+
+class BlockedIngestionHandler:
+    """Ingestion handler whose batches wait until released."""
+
+    batch_size = 1
+
+    def __init__(self):
+        self.release = asyncio.Event()
+        self.batches = []
+
+    async def handle_batch(self, batch, records, malformed=()):
+        await self.release.wait()
+        self.batches.append(batch)
+        return {"batch": batch, "received": len(records), "accepted": len(records), "rejected": 0,
+                "fraudulent": 0, "errors": []}
+
+
+class FakeApp:
+    def __init__(self):
+        self.routes = {}
+
+    def post(self, pattern, handler):
+        self.routes[pattern] = handler
+
+    def get(self, pattern, handler):
+        self.routes[pattern] = handler
+
+
+class FakeRequest:
+    def __init__(self, headers=None):
+        self._headers = headers or {}
+
+    def get_header(self, name):
+        return self._headers.get(name)
+
+
+class StreamingResponse:
+    """Socketify response that keeps the body callback and records the reply."""
+
+    def __init__(self):
+        self.on_data_handler = None
+        self.status = 200
+        self.body = None
+        self.paused = []
+
+    def pause(self):
+        self.paused.append(True)
+
+    def resume(self):
+        self.paused.append(False)
+
+    def on_data(self, handler):
+        self.on_data_handler = handler
+
+    def write_status(self, status):
+        self.status = status
+
+    def write_header(self, name, value):
+        pass
+
+    def end(self, body):
+        self.body = json.loads(body)
+
+
+def ingestion_route(handler, monkeypatch):
+    monkeypatch.setattr(bulk_operations_routes, 'compile_route_validator',
+                        lambda spec: lambda req, res: {'format': 'ndjson', 'batchSize': None})
+    app = FakeApp()
+    BulkOperationsRoutes(None, None, handler).register(app)
+    return app.routes['/v1/clicks/bulk']
+
+
+class RecordingCampaignCounters:
+    def __init__(self):
+        self.increments = []
+
+    def increment(self, campaign_id, clicks=0):
+        self.increments.append((campaign_id, clicks))
+
+
+def click_record(click_id, **overrides):
+    record = {'click_id': click_id, 'campaign_id': 'camp_1', 'ip_address': '8.8.8.8', 'user_agent': BROWSER_UA}
+    record.update(overrides)
+    return record
+
+
+class TestBulkClickIngestion:
+    """Test cases for StreamingRecordParser and BulkClickIngestionHandler."""
+
+    def test_ndjson_lines_are_parsed_across_chunks(self):
+        parser = StreamingRecordParser('ndjson')
+
+        first = parser.feed(b'{"click_id": "a"}\n{"click_')
+        second = parser.feed(b'id": "b"}\n\nnot json\n[1]')
+        last = parser.close()
+
+        assert first == ([(1, {'click_id': 'a'})], [])
+        assert second[0] == [(2, {'click_id': 'b'})]
+        assert [line for line, _ in second[1]] == [4]
+        assert last == ([], [(5, "record must be a JSON object")])
+
+    def test_csv_uses_header_and_maps_empty_values_to_none(self):
+        parser = StreamingRecordParser('csv')
+
+        records, malformed = parser.feed(b'click_id,campaign_id,sub1\r\nabc,camp_1,\r\n"x,y",camp_2,tg\r\nshort\r\n')
+
+        assert records == [(2, {'click_id': 'abc', 'campaign_id': 'camp_1', 'sub1': None}),
+                           (3, {'click_id': 'x,y', 'campaign_id': 'camp_2', 'sub1': 'tg'})]
+        assert malformed == [(4, "expected 3 fields, got 1")]
+
+    def test_overlong_lines_are_dropped_without_buffering(self):
+        parser = StreamingRecordParser('ndjson', max_line_length=16)
+
+        assert parser.feed(b'{"click_id": "' + b'x' * 32) == ([], [])
+        records, malformed = parser.feed(b'x"}\n{"a": 1}\n')
+
+        assert records == [(2, {'a': 1})]
+        assert malformed == [(1, "line exceeds 16 bytes")]
+
+    def test_batch_is_screened_scored_and_saved_once(self):
+        repository = RecordingClickRepository()
+        counters = RecordingCampaignCounters()
+        handler = BulkClickIngestionHandler(repository, ClickValidationService(rule_engine=FraudRuleEngine()),
+                                            PostgresBulkOptimizer(connection_pool=None, max_workers=1),
+                                            campaign_counters=counters)
+        records = [
+            (1, click_record('click_000000001')),
+            (2, click_record('click_000000001')),
+            (3, click_record('click_000000002', referrer='ftp://example.com')),
+            (4, click_record('click_000000003', ip_address='not-an-ip')),
+            (5, click_record('click_000000004', user_agent='Googlebot/2.1 (+http://www.google.com/bot.html)',
+                             timestamp='2026-10-01T12:00:00Z')),
+        ]
+
+        result = asyncio.run(handler.handle_batch(1, records, malformed=[(6, "Expecting value")]))
+
+        assert result == {
+            "batch": 1, "received": 6, "accepted": 2, "rejected": 4, "fraudulent": 1,
+            "errors": [
+                {"line": 2, "reason": "duplicate click_id in batch"},
+                {"line": 3, "reason": "missing click_id/campaign_id or malformed timestamp/referrer"},
+                {"line": 4, "reason": "Invalid IP address format"},
+                {"line": 6, "reason": "Expecting value"},
+            ],
+        }
+        [saved] = repository.batches
+        assert [click.id.value for click in saved] == ['click_000000001', 'click_000000004']
+        assert not saved[1].is_valid and saved[1].created_at.isoformat() == '2026-10-01T12:00:00+00:00'
+        # Only the valid click counts towards the campaign's click total
+        assert counters.increments == [('camp_1', 1)]
+
+    def test_resubmitted_clicks_are_not_counted_again(self):
+        repository = RecordingClickRepository(stored={'click_000000001'})
+        counters = RecordingCampaignCounters()
+        handler = BulkClickIngestionHandler(repository, ClickValidationService(rule_engine=FraudRuleEngine()),
+                                            PostgresBulkOptimizer(connection_pool=None, max_workers=1),
+                                            campaign_counters=counters)
+        records = [(1, click_record('click_000000001')), (2, click_record('click_000000002'))]
+
+        result = asyncio.run(handler.handle_batch(1, records))
+
+        assert result["accepted"] == 2
+        assert counters.increments == [('camp_1', 1)]
+
+    def test_blocking_repository_writes_off_the_event_loop(self):
+        class BlockingClickRepository:
+            def __init__(self):
+                self.threads = []
+
+            def upsert_many(self, clicks):
+                self.threads.append(threading.get_ident())
+                return [click.id.value for click in clicks]
+
+        repository = BlockingClickRepository()
+        handler = BulkClickIngestionHandler(repository, ClickValidationService(rule_engine=FraudRuleEngine()),
+                                            PostgresBulkOptimizer(connection_pool=None, max_workers=1))
+
+        result = asyncio.run(handler.handle_batch(1, [(1, click_record('click_000000001'))]))
+
+        assert result["accepted"] == 1
+        assert repository.threads and repository.threads[0] != threading.get_ident()
+
+    def test_oversized_body_is_rejected_before_it_is_read(self, monkeypatch):
+        ingest = ingestion_route(BlockedIngestionHandler(), monkeypatch)
+        res = StreamingResponse()
+
+        ingest(res, FakeRequest({'content-length': str(bulk_operations_routes.MAX_BODY_BYTES + 1)}))
+
+        assert res.status == 413 and res.on_data_handler is None
+
+    def test_streamed_body_over_the_record_limit_is_rejected(self, monkeypatch):
+        monkeypatch.setattr(bulk_operations_routes, 'MAX_RECORDS', 2)
+        handler = BlockedIngestionHandler()
+        handler.batch_size = 10
+        ingest = ingestion_route(handler, monkeypatch)
+        res = StreamingResponse()
+
+        async def scenario():
+            ingest(res, FakeRequest())
+            res.on_data_handler(res, b'{"a": 1}\n{"a": 2}\n{"a": 3}\n', False)
+            res.on_data_handler(res, b'{"a": 4}\n', True)
+            handler.release.set()
+            for _ in range(5):
+                await asyncio.sleep(0)
+
+        asyncio.run(scenario())
+
+        assert res.status == 413 and res.body["message"] == "Request exceeds 2 records"
+        assert res.body["batches"] == [] and res.body["totals"]["accepted"] == 0
+
+    def test_limit_error_reports_batches_already_persisted(self, monkeypatch):
+        monkeypatch.setattr(bulk_operations_routes, 'MAX_RECORDS', 2)
+        handler = BlockedIngestionHandler()
+        handler.batch_size = 2
+        ingest = ingestion_route(handler, monkeypatch)
+        res = StreamingResponse()
+
+        async def scenario():
+            ingest(res, FakeRequest())
+            res.on_data_handler(res, b'{"a": 1}\n{"a": 2}\n', False)
+            res.on_data_handler(res, b'{"a": 3}\n', True)
+            handler.release.set()
+            for _ in range(5):
+                await asyncio.sleep(0)
+
+        asyncio.run(scenario())
+
+        assert res.status == 413
+        assert [batch["batch"] for batch in res.body["batches"]] == [1]
+        assert res.body["totals"]["accepted"] == 2
+
+    def test_upload_outrunning_persistence_is_paused(self, monkeypatch):
+        monkeypatch.setattr(bulk_operations_routes, 'MAX_PENDING_BATCHES', 2)
+        handler = BlockedIngestionHandler()
+        ingest = ingestion_route(handler, monkeypatch)
+        res = StreamingResponse()
+
+        async def scenario():
+            ingest(res, FakeRequest())
+            res.on_data_handler(res, b'{"a": 1}\n{"a": 2}\n{"a": 3}\n', False)
+            paused = list(res.paused)
+            handler.release.set()
+            for _ in range(5):
+                await asyncio.sleep(0)
+            res.on_data_handler(res, b'{"a": 4}\n', True)
+            for _ in range(5):
+                await asyncio.sleep(0)
+            return paused
+
+        paused = asyncio.run(scenario())
+
+        assert paused == [True]
+        assert res.paused == [True, False]
+        assert res.status == 200
+        assert handler.batches == [1, 2, 3, 4]
+        assert res.body["totals"]["accepted"] == 4
@@ -0,0 +1,185 @@
+# Copyright (c) 2025 Bivex
+#
+# Author: Bivex
+# Available for contact via email: support@b-b.top
+# For up-to-date contact information:
+# https://github.com/bivex
+#
+# Created: 2026-10-16T09:12:04
+# Last Updated: 2026-10-16T09:12:04
+#
+# Licensed under the MIT License.
+# Commercial licensing available upon request.
+
+"""Unit tests for the streaming COPY bulk loader."""
+
+import struct
+from datetime import datetime, timezone
+
+from src.domain.entities.click import Click
+from src.domain.value_objects import ClickId
+from src.infrastructure.repositories.postgres_bulk_loader import CopyStream, PostgresBulkLoader, encode_text_row
+from src.infrastructure.repositories.postgres_click_repository import PostgresClickRepository
+
+
+class FakeCursor:
+    """Cursor double that drains COPY sources chunk by chunk, like psycopg2."""
+
+    def __init__(self, connection):
+        self.connection = connection
+        self.rowcount = 0
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        return False
+
+    def execute(self, sql, params=None):
+        self.connection.executed.append(" ".join(sql.split()))
+        self.rowcount = self.connection.merged_rows
+
+    def fetchall(self):
+        return list(self.connection.column_types.items())
+
+    def copy_expert(self, sql, file, size=8192):
+        self.connection.copy_sql = sql
+        while True:
+            chunk = file.read(size)
+            if not chunk:
+                break
+            self.connection.chunks.append(chunk)
+
+    def executemany(self, sql, values):
+        self.connection.executed.append(" ".join(sql.split()))
+
+
+class FakeConnection:
+    def __init__(self, column_types=None, merged_rows=0):
+        self.column_types = column_types or {}
+        self.merged_rows = merged_rows
+        self.executed = []
+        self.chunks = []
+        self.copy_sql = None
+        self.commits = 0
+
+    def cursor(self):
+        return FakeCursor(self)
+
+    def commit(self):
+        self.commits += 1
+
+    def rollback(self):
+        pass
+
+
+class TransactionLogConnection(FakeConnection):
+    """Also logs COMMIT/ROLLBACK among the executed statements."""
+
+    def commit(self):
+        super().commit()
+        self.executed.append('COMMIT')
+
+    def rollback(self):
+        self.executed.append('ROLLBACK')
+
+
+class FakeContainer:
+    def __init__(self, connection):
+        self.connection = connection
+        self.released = 0
+
+    def get_db_connection(self):
+        return self.connection
+
+    def release_db_connection(self, conn):
+        self.released += 1
+
+
+class TestPostgresBulkLoader:
+    """Test cases for CopyStream and PostgresBulkLoader."""
+
+    def test_text_rows_escape_specials_and_send_null(self):
+        row = (None, '', 'a\tb\\c\nd', True, datetime(2026, 1, 2, 3, 4, 5), {'k': 1})
+
+        assert encode_text_row(row) == b'\\N\t\ta\\tb\\\\c\\nd\tt\t2026-01-02T03:04:05\t{"k": 1}\n'
+
+    def test_generator_is_streamed_in_bounded_chunks(self):
+        progress = []
+
+        def records():
+            for i in range(5000):
+                yield {'id': f"click_{i}", 'sub1': None if i % 2 else 'tg'}
+
+        conn = FakeConnection()
+        loader = PostgresBulkLoader(conn, batch_size_threshold=100, copy_chunk_size=1024)
+
+        result = loader.bulk_insert('clicks', records(), progress=progress.append)
+
+        assert result.success and result.method_used == 'copy'
+        assert result.records_loaded == 5000
+        assert conn.copy_sql == "COPY clicks (id, sub1) FROM STDIN WITH (FORMAT text)"
+        assert max(len(chunk) for chunk in conn.chunks) <= 1024
+        assert b''.join(conn.chunks).count(b'\\N') == 2500
+        assert progress[-1] == 5000 and len(progress) == len(conn.chunks)
+        assert conn.commits == 1
+
+    def test_upserts_copy_into_staging_and_merge_once(self):
+        conn = FakeConnection(merged_rows=3)
+        loader = PostgresBulkLoader(conn, batch_size_threshold=2)
+        records = [{'id': 'a', 'name': 'x'}, {'id': 'a', 'name': 'y'}, {'id': 'b', 'name': 'z'}, {'id': 'c'}]
+
+        result = loader.bulk_insert('campaigns', iter(records), conflict_resolution='update')
+
+        assert result.method_used == 'copy_merge' and result.records_loaded == 3
+        assert conn.copy_sql.startswith("COPY bulk_staging_campaigns (id, name) FROM STDIN")
+        assert conn.executed[-1] == (
+            "INSERT INTO campaigns (id, name) SELECT DISTINCT ON (id) id, name FROM bulk_staging_campaigns "
+            "ORDER BY id, ctid DESC ON CONFLICT (id) DO UPDATE SET name = EXCLUDED.name")
+
+    def test_binary_format_uses_column_types(self):
+        conn = FakeConnection(column_types={'id': 'int8', 'name': 'text', 'created_at': 'timestamptz'})
+        loader = PostgresBulkLoader(conn, batch_size_threshold=1)
+        created = datetime(2000, 1, 1, 0, 0, 1, tzinfo=timezone.utc)
+
+        loader.bulk_insert('events', [{'id': 7, 'name': None, 'created_at': created}], binary=True)
+
+        data = b''.join(conn.chunks)
+        assert conn.copy_sql.endswith("(FORMAT binary)")
+        assert data.startswith(b'PGCOPY\n\xff\r\n\x00')
+        assert data[19:] == (struct.pack('>h', 3) + struct.pack('>iq', 8, 7) + struct.pack('>i', -1)
+                             + struct.pack('>iq', 8, 1000000) + struct.pack('>h', -1))
+
+    def test_binary_falls_back_to_text_for_unsupported_types(self):
+        conn = FakeConnection(column_types={'id': 'int8', 'amount': 'numeric'})
+        loader = PostgresBulkLoader(conn, batch_size_threshold=1)
+
+        loader.bulk_insert('conversions', [{'id': 1, 'amount': '9.99'}], binary=True)
+
+        assert conn.copy_sql.endswith("(FORMAT text)")
+        assert CopyStream([(1, '9.99')]).read() == b''.join(conn.chunks)
+
+    def test_copy_records_leaves_the_transaction_to_the_caller(self):
+        conn = TransactionLogConnection()
+        loader = PostgresBulkLoader(conn)
+
+        copied = loader.copy_records('clicks_ingest', iter([{'id': 'a', 'sub1': None}, {'id': 'b'}]))
+
+        assert copied == 2
+        assert conn.copy_sql == "COPY clicks_ingest (id, sub1) FROM STDIN WITH (FORMAT text)"
+        assert b''.join(conn.chunks) == b'a\t\\N\nb\t\\N\n'
+        assert conn.commits == 0
+        assert 'ROLLBACK' not in conn.executed
+
+    def test_click_batch_stages_and_merges_in_one_transaction(self):
+        conn = TransactionLogConnection(merged_rows=2)
+        repository = PostgresClickRepository(FakeContainer(conn))
+        clicks = [Click(id=ClickId.generate(), ip_address="8.8.8.8") for _ in range(2)]
+
+        assert repository.save_many(clicks) == 2
+
+        assert conn.copy_sql.startswith("COPY clicks_ingest (id, campaign_id, click_id, ")
+        assert conn.executed[0].endswith("ON COMMIT DELETE ROWS")
+        assert conn.executed[1].startswith("INSERT INTO clicks (")
+        assert conn.executed[2:] == ['COMMIT']
+        assert not any(sql.startswith("TRUNCATE") for sql in conn.executed)
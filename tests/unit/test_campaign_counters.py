@@ -0,0 +1,133 @@
+# Copyright (c) 2025 Bivex
+#
+# Author: Bivex
+# Available for contact via email: support@b-b.top
+# For up-to-date contact information:
+# https://github.com/bivex
+#
+# Created: 2026-10-16T09:12:04
+# Last Updated: 2026-10-16T09:12:04
+#
+# Licensed under the MIT License.
+# Commercial licensing available upon request.
+
+"""Unit tests for the sharded campaign counter aggregator."""
+
+import asyncio
+from types import SimpleNamespace
+
+from src.application.handlers.track_conversion_handler import TrackConversionHandler
+from src.domain.value_objects import CampaignId
+from src.infrastructure.database.unit_of_work import DirectUnitOfWork
+from src.infrastructure.ingestion import CampaignCounterAggregator
+
+
+class TestCampaignCounterAggregator:
+    """Test cases for CampaignCounterAggregator."""
+
+    def test_flush_applies_summed_deltas(self):
+        """Increments for the same campaign collapse into one delta per flush."""
+        applied = []
+
+        async def sink(deltas):
+            applied.append(deltas)
+
+        async def scenario():
+            counters = CampaignCounterAggregator(sink, shard_count=4, flush_interval=60)
+            for _ in range(5):
+                counters.increment("camp_1", clicks=1)
+            counters.increment("camp_2", conversions=1)
+            assert counters.pending("camp_1").clicks == 5
+            await counters.close()
+            return counters.pending("camp_1")
+
+        remaining = asyncio.run(scenario())
+
+        assert len(applied) == 1
+        assert applied[0]["camp_1"].clicks == 5
+        assert applied[0]["camp_2"].conversions == 1
+        assert remaining.is_zero()
+
+    def test_failed_flush_keeps_deltas(self):
+        """Deltas survive a failed flush and are retried on the next one."""
+        applied = []
+        state = {'fail': True}
+
+        async def sink(deltas):
+            if state['fail']:
+                raise RuntimeError("database unavailable")
+            applied.append(deltas)
+
+        async def scenario():
+            counters = CampaignCounterAggregator(sink, flush_interval=60)
+            counters.increment("camp_1", clicks=3)
+            assert await counters.flush() == 0
+            counters.increment("camp_1", clicks=1)
+            state['fail'] = False
+            await counters.close()
+
+        asyncio.run(scenario())
+
+        assert applied[0]["camp_1"].clicks == 4
+
+
+class StubConversionService:
+    """Conversion service that accepts everything and flags fraud on request."""
+
+    def __init__(self, fraud_reason=None):
+        self.fraud_reason = fraud_reason
+
+    def validate_conversion_data(self, data):
+        return True, None
+
+    def enrich_conversion_data(self, data, click):
+        return dict(data)
+
+    def detect_duplicate_conversion(self, conversion):
+        return False
+
+    def calculate_attribution(self, conversion, click):
+        return {}
+
+    def validate_fraud_risk(self, conversion, click):
+        return self.fraud_reason
+
+    def should_trigger_postback(self, conversion):
+        return False
+
+
+class RecordingCounters:
+    def __init__(self):
+        self.increments = []
+
+    def increment(self, campaign_id, clicks=0, conversions=0):
+        self.increments.append((campaign_id, clicks, conversions))
+
+
+class TestConversionCounters:
+    """Conversions reach the campaign counters through the aggregator."""
+
+    def track(self, fraud_reason=None):
+        click = SimpleNamespace(campaign_id=CampaignId("camp_1"))
+        saved, counters = [], RecordingCounters()
+        handler = TrackConversionHandler(
+            conversion_repository=SimpleNamespace(save=saved.append),
+            click_repository=SimpleNamespace(find_by_id=lambda click_id: click),
+            conversion_service=StubConversionService(fraud_reason),
+            unit_of_work=DirectUnitOfWork,
+            campaign_counters=counters,
+        )
+        result = handler.handle({'click_id': 'click_000000001', 'conversion_type': 'lead'})
+        return result, saved, counters.increments
+
+    def test_conversion_is_added_as_a_counter_delta(self):
+        result, saved, increments = self.track()
+
+        assert result["status"] == "success" and len(saved) == 1
+        assert increments == [("camp_1", 0, 1)]
+
+    def test_fraudulent_conversion_is_not_counted(self):
+        result, saved, increments = self.track(fraud_reason="too fast")
+
+        assert result["fraud_detected"] and len(saved) == 1
+        assert increments == []
@@ -0,0 +1,208 @@
+# Copyright (c) 2025 Bivex
+#
+# Author: Bivex
+# Available for contact via email: support@b-b.top
+# For up-to-date contact information:
+# https://github.com/bivex
+#
+# Created: 2026-10-16T09:12:04
+# Last Updated: 2026-10-16T09:12:04
+#
+# Licensed under the MIT License.
+# Commercial licensing available upon request.
+
+"""Unit tests for the write-behind click buffer."""
+
+import asyncio
+
+from src.infrastructure.ingestion import ClickWriteBuffer
+
+
+class RecordingSink:
+    """Async sink that records batches and can be told to fail."""
+
+    def __init__(self, bad_rows=()):
+        self.batches = []
+        self.fail = False
+        self.bad_rows = set(bad_rows)
+
+    async def __call__(self, batch):
+        if self.fail:
+            raise ConnectionError("database unavailable")
+        if self.bad_rows.intersection(batch):
+            raise ValueError("invalid input for query argument")
+        self.batches.append(list(batch))
+
+
+class TestClickWriteBuffer:
+    """Test cases for ClickWriteBuffer."""
+
+    def test_size_trigger_flushes_full_batches(self):
+        """Reaching max_batch_size wakes the flusher without waiting for the interval."""
+        sink = RecordingSink()
+
+        async def scenario():
+            buffer = ClickWriteBuffer(sink.__call__, max_batch_size=3, flush_interval=60)
+            for i in range(6):
+                assert await buffer.add(i)
+            await asyncio.sleep(0.05)
+            await buffer.close()
+            return buffer.get_stats()
+
+        stats = asyncio.run(scenario())
+
+        assert sink.batches == [[0, 1, 2], [3, 4, 5]]
+        assert stats['flushed'] == 6
+        assert stats['pending'] == 0
+
+    def test_close_drains_pending_clicks(self):
+        """Clicks below the size trigger are written on close."""
+        sink = RecordingSink()
+
+        async def scenario():
+            buffer = ClickWriteBuffer(sink.__call__, max_batch_size=100, flush_interval=60)
+            await buffer.add("a")
+            await buffer.add("b")
+            await buffer.close()
+            return await buffer.add("c")
+
+        accepted_after_close = asyncio.run(scenario())
+
+        assert sink.batches == [["a", "b"]]
+        assert accepted_after_close is False
+
+    def test_backpressure_rejects_when_full(self):
+        """A full buffer whose sink is failing rejects new clicks instead of growing."""
+        sink = RecordingSink()
+        sink.fail = True
+
+        async def scenario():
+            buffer = ClickWriteBuffer(sink.__call__, max_batch_size=2, flush_interval=60,
+                                      max_pending=2, enqueue_timeout=0.01)
+            results = [await buffer.add(i) for i in range(3)]
+            stats = buffer.get_stats()
+            sink.fail = False
+            await buffer.close()
+            return results, stats
+
+        results, stats = asyncio.run(scenario())
+
+        assert results == [True, True, False]
+        assert stats['rejected'] == 1
+        assert stats['pending'] <= 2
+        assert sink.batches == [[0, 1]]
+
+    def test_close_waits_for_a_flush_in_progress(self):
+        """Shutting down mid-flush neither cancels nor loses the batch being written."""
+        sink = RecordingSink()
+        started = []
+
+        async def slow_sink(batch):
+            started.append(len(batch))
+            await asyncio.sleep(0.05)
+            await sink(batch)
+
+        async def scenario():
+            buffer = ClickWriteBuffer(slow_sink, max_batch_size=2, flush_interval=60)
+            for i in range(3):
+                await buffer.add(i)
+            while not started:
+                await asyncio.sleep(0)
+            await buffer.close()
+            return buffer.get_stats()
+
+        stats = asyncio.run(scenario())
+
+        assert sink.batches == [[0, 1], [2]]
+        assert stats['pending'] == 0
+
+    def test_cancelled_flush_requeues_its_batch(self):
+        async def hanging_sink(batch):
+            await asyncio.Event().wait()
+
+        async def scenario():
+            buffer = ClickWriteBuffer(hanging_sink, max_batch_size=10, flush_interval=60)
+            await buffer.add("a")
+            await buffer.add("b")
+            flush = asyncio.ensure_future(buffer.flush())
+            await asyncio.sleep(0.01)
+            flush.cancel()
+            await asyncio.gather(flush, return_exceptions=True)
+            return len(buffer)
+
+        assert asyncio.run(scenario()) == 2
+
+    def test_data_error_isolates_bad_rows_and_writes_the_rest(self):
+        """A bad row is bisected out of its batch instead of blocking it."""
+        sink = RecordingSink(bad_rows={"c"})
+        dead = []
+
+        async def scenario():
+            buffer = ClickWriteBuffer(sink.__call__, max_batch_size=4, flush_interval=60,
+                                      max_row_attempts=1,
+                                      dead_letter=lambda click, error: dead.append(click))
+            for click in "abcd":
+                await buffer.add(click)
+            await buffer.flush()
+            return buffer.get_stats()
+
+        stats = asyncio.run(scenario())
+
+        assert sorted(c for batch in sink.batches for c in batch) == ["a", "b", "d"]
+        assert dead == ["c"]
+        assert stats['flushed'] == 3
+        assert stats['dead_lettered'] == 1
+        assert stats['pending'] == 0
+
+    def test_bad_row_is_dead_lettered_after_max_attempts(self):
+        """Isolated rows are retried on later ticks, then dead-lettered; new clicks keep flowing."""
+        sink = RecordingSink(bad_rows={"bad"})
+        dead = []
+
+        async def scenario():
+            buffer = ClickWriteBuffer(sink.__call__, max_batch_size=2, flush_interval=0.01,
+                                      max_row_attempts=3,
+                                      dead_letter=lambda click, error: dead.append(click))
+            await buffer.add("bad")
+            await buffer.add("ok1")
+            await asyncio.sleep(0.01)
+            suspects_after_first_flush = buffer.get_stats()['suspect_rows']
+            await buffer.add("ok2")
+            await asyncio.sleep(0.1)
+            stats = buffer.get_stats()
+            await buffer.close()
+            return suspects_after_first_flush, stats
+
+        suspects, stats = asyncio.run(scenario())
+
+        assert suspects == 1
+        assert dead == ["bad"]
+        assert stats['data_errors'] == 3
+        assert stats['dead_lettered'] == 1
+        assert stats['suspect_rows'] == 0
+        assert ["ok1"] in sink.batches and ["ok2"] in sink.batches
+
+    def test_transient_error_requeues_without_dead_lettering(self):
+        """Connection failures keep the whole batch queued for a retry."""
+        sink = RecordingSink()
+        sink.fail = True
+        dead = []
+
+        async def scenario():
+            buffer = ClickWriteBuffer(sink.__call__, max_batch_size=10, flush_interval=60,
+                                      max_row_attempts=1,
+                                      dead_letter=lambda click, error: dead.append(click))
+            await buffer.add("a")
+            await buffer.add("b")
+            await buffer.flush()
+            pending = len(buffer)
+            sink.fail = False
+            await buffer.close()
+            return pending, buffer.get_stats()
+
+        pending, stats = asyncio.run(scenario())
+
+        assert pending == 2
+        assert dead == []
+        assert stats['failed_batches'] == 1
+        assert sink.batches == [["a", "b"]]
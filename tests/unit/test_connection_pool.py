@@ -0,0 +1,140 @@
+# Copyright (c) 2025 Bivex
+#
+# Author: Bivex
+# Available for contact via email: support@b-b.top
+# For up-to-date contact information:
+# https://github.com/bivex
+#
+# Created: 2026-10-16T09:12:04
+# Last Updated: 2026-10-16T09:12:04
+#
+# Licensed under the MIT License.
+# Commercial licensing available upon request.
+
+"""Unit tests for AdvancedConnectionPool checkout, fairness and reaping."""
+
+import threading
+import time
+
+import pytest
+from psycopg2 import extensions
+
+from src.infrastructure.database.advanced_connection_pool import AdvancedConnectionPool, PoolTimeoutError
+
+
+class FakeConnection:
+    """Just enough of a psycopg2 connection for the pool."""
+
+    def __init__(self):
+        self.closed = 0
+        self.queries = 0
+        self.rollbacks = 0
+        self.healthy = True
+        self.status = extensions.TRANSACTION_STATUS_IDLE
+
+    def get_transaction_status(self):
+        return self.status
+
+    def rollback(self):
+        self.rollbacks += 1
+        self.status = extensions.TRANSACTION_STATUS_IDLE
+
+    def close(self):
+        self.closed = 1
+
+    def cursor(self):
+        connection = self
+
+        class Cursor:
+            def execute(self, query, params=None):
+                connection.queries += 1
+                if not connection.healthy:
+                    raise OSError("server closed the connection")
+
+            def fetchone(self):
+                return (1,)
+
+            def close(self):
+                pass
+
+        return Cursor()
+
+
+class FakePool(AdvancedConnectionPool):
+    def _create_new_connection(self):
+        return FakeConnection()
+
+
+def make_pool(**kwargs):
+    kwargs.setdefault('reaper_interval', 3600)
+    return FakePool(**kwargs)
+
+
+class TestAdvancedConnectionPool:
+    """Test cases for the thread-safe pool."""
+
+    def test_checkout_does_not_query(self):
+        pool = make_pool(minconn=1, maxconn=2)
+        conn = pool.getconn()
+
+        assert conn.queries == 0
+        pool.putconn(conn)
+        assert pool.getconn() is conn
+        pool.closeall()
+
+    def test_open_transaction_is_rolled_back_on_return(self):
+        pool = make_pool(minconn=1, maxconn=1)
+        conn = pool.getconn()
+        conn.status = extensions.TRANSACTION_STATUS_INTRANS
+
+        pool.putconn(conn)
+
+        assert conn.rollbacks == 1
+        assert pool.get_stats()['available'] == 1
+        pool.closeall()
+
+    def test_waiters_are_served_in_order_and_time_out(self):
+        pool = make_pool(minconn=1, maxconn=1)
+        held = pool.getconn()
+        served = []
+
+        def wait_for_connection(name):
+            conn = pool.getconn(timeout=2)
+            served.append(name)
+            pool.putconn(conn)
+
+        threads = []
+        for name in ('first', 'second'):
+            thread = threading.Thread(target=wait_for_connection, args=(name,))
+            thread.start()
+            threads.append(thread)
+            time.sleep(0.05)
+
+        with pytest.raises(PoolTimeoutError):
+            pool.getconn(timeout=0.01)
+        pool.putconn(held)
+        for thread in threads:
+            thread.join()
+
+        stats = pool.get_stats()
+        assert served == ['first', 'second']
+        assert stats['checkout_timeouts'] == 1
+        assert stats['checkout_wait']['count'] == 3
+        assert stats['checkout_wait']['buckets']['le_0.001'] == 1
+        pool.closeall()
+
+    def test_reaper_replaces_unhealthy_and_expired_connections(self):
+        pool = make_pool(minconn=2, maxconn=4, health_check_interval=0, max_lifetime_seconds=3600)
+        broken, fine = pool.getconn(), pool.getconn()
+        broken.healthy = False
+        pool.putconn(broken)
+        pool.putconn(fine)
+
+        pool.reap()
+
+        stats = pool.get_stats()
+        assert broken.closed and not fine.closed
+        assert stats['available'] == 2
+        assert stats['health_checks'] == 2
+        assert stats['connections_discarded'] == 1
+        pool.closeall()
@@ -0,0 +1,95 @@
+# Copyright (c) 2025 Bivex
+#
+# Author: Bivex
+# Available for contact via email: support@b-b.top
+# For up-to-date contact information:
+# https://github.com/bivex
+#
+# Created: 2026-10-16T09:12:04
+# Last Updated: 2026-10-16T09:12:04
+#
+# Licensed under the MIT License.
+# Commercial licensing available upon request.
+
+"""Unit tests for persisted, cross-worker fraud rule management."""
+
+import asyncio
+import json
+
+from src.application.handlers.fraud_handler import FRAUD_RULES_NAMESPACE, FraudHandler
+from src.domain.entities.click import Click
+from src.domain.services.click import FraudRuleEngine
+from src.domain.value_objects import ClickId
+from src.infrastructure.cache import PostgresCacheInvalidator
+from src.infrastructure.repositories import SQLiteFraudRuleRepository
+
+BROWSER_UA = "Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 Chrome/120.0 Safari/537.36"
+
+RULE = {'name': 'Block probe', 'type': 'user_agent', 'action': 'block', 'patterns': ['acmeprobe'],
+        'campaignId': 'camp_1', 'priority': 5}
+
+
+class RecordingInvalidator:
+    """Invalidator that keeps subscriptions and published messages."""
+
+    def __init__(self):
+        self.subscribers = {}
+        self.published = []
+
+    def subscribe(self, namespace, callback):
+        self.subscribers.setdefault(namespace, []).append(callback)
+
+    def publish(self, namespace, key):
+        self.published.append((namespace, key))
+
+
+def probe_click():
+    return Click(id=ClickId.generate(), ip_address="8.8.8.8", user_agent=f"{BROWSER_UA} AcmeProbe/1.0")
+
+
+class TestFraudHandler:
+    """Test cases for FraudHandler rule persistence and reloads."""
+
+    def test_rules_survive_a_restart(self, tmp_path):
+        db_path = str(tmp_path / "rules.db")
+        created = FraudHandler(SQLiteFraudRuleRepository(db_path), FraudRuleEngine()).create_rule(RULE)
+
+        engine = FraudRuleEngine()
+        listed = FraudHandler(SQLiteFraudRuleRepository(db_path), engine).list_rules()
+
+        assert listed['rules'] == [created['rule']]
+        assert not engine.evaluate(probe_click(), campaign_id='camp_1').is_valid
+
+    def test_other_workers_reload_published_rules(self, tmp_path):
+        db_path = str(tmp_path / "rules.db")
+        invalidator = RecordingInvalidator()
+        writer = FraudHandler(SQLiteFraudRuleRepository(db_path), FraudRuleEngine(), invalidator=invalidator)
+        reader_engine = FraudRuleEngine()
+        reader_invalidator = RecordingInvalidator()
+        FraudHandler(SQLiteFraudRuleRepository(db_path), reader_engine, invalidator=reader_invalidator)
+
+        rule = writer.create_rule(RULE)['rule']
+        assert invalidator.published == [(FRAUD_RULES_NAMESPACE, rule['id'])]
+        assert reader_engine.evaluate(probe_click(), campaign_id='camp_1').is_valid
+
+        async def deliver():
+            [callback] = reader_invalidator.subscribers[FRAUD_RULES_NAMESPACE]
+            callback(rule['id'])
+            await asyncio.sleep(0.1)
+
+        asyncio.run(deliver())
+
+        assert not reader_engine.evaluate(probe_click(), campaign_id='camp_1').is_valid
+
+    def test_invalidator_dispatches_subscribed_namespaces(self):
+        invalidator = PostgresCacheInvalidator(cache=None, pool=None)
+        received = []
+        invalidator.subscribe(FRAUD_RULES_NAMESPACE, received.append)
+
+        invalidator._on_notify(None, 1, 'routing_cache_invalidation',
+                               json.dumps({'origin': 'other', 'namespace': FRAUD_RULES_NAMESPACE, 'key': 'rule_1'}))
+        invalidator._on_notify(None, 1, 'routing_cache_invalidation',
+                               json.dumps({'origin': invalidator._origin, 'namespace': FRAUD_RULES_NAMESPACE,
+                                           'key': 'rule_2'}))
+
+        assert received == ['rule_1']
@@ -0,0 +1,96 @@
+# Copyright (c) 2025 Bivex
+#
+# Author: Bivex
+# Available for contact via email: support@b-b.top
+# For up-to-date contact information:
+# https://github.com/bivex
+#
+# Created: 2026-10-16T09:12:04
+# Last Updated: 2026-10-16T09:12:04
+#
+# Licensed under the MIT License.
+# Commercial licensing available upon request.
+
+"""Unit tests for the compiled fraud rule engine."""
+
+import pytest
+
+from src.domain.entities.click import Click
+from src.domain.services.click import ClickValidationService, FraudRule, FraudRuleEngine
+from src.domain.value_objects import CampaignId, ClickId
+
+BROWSER_UA = "Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 Chrome/120.0 Safari/537.36"
+
+
+def make_click(**overrides):
+    data = dict(id=ClickId.generate(), ip_address="8.8.8.8", user_agent=BROWSER_UA,
+                referrer="https://news.site.org/article")
+    data.update(overrides)
+    return Click(**data)
+
+
+class TestFraudRuleEngine:
+    """Test cases for FraudRuleEngine."""
+
+    def test_clean_click_is_valid(self):
+        verdict = FraudRuleEngine().evaluate(make_click())
+
+        assert verdict.is_valid
+        assert verdict.score == 0.0
+        assert verdict.reason is None
+
+    def test_scores_accumulate_across_checks(self):
+        """Each failed check contributes its own weight to the breakdown."""
+        click = make_click(user_agent="Googlebot/2.1 (+http://www.google.com/bot.html)",
+                           ip_address="10.0.0.1", referrer="http://localhost/x")
+        verdict = FraudRuleEngine().evaluate(click)
+
+        assert not verdict.is_valid
+        assert verdict.score == 1.0
+        assert verdict.breakdown() == {'user_agent': 1.0, 'ip': 0.3, 'referrer': 0.2}
+        assert verdict.reason.startswith("bot_pattern_detected: ")
+
+    def test_campaign_rules_only_apply_to_their_campaign(self):
+        engine = FraudRuleEngine([
+            FraudRule(id="r1", name="block partner", type="referrer", action="block",
+                      patterns=(r"partner\.net",), campaign_id="camp_1"),
+        ])
+        click = make_click(referrer="https://www.partner.net/landing")
+
+        assert not engine.evaluate(click, campaign_id="camp_1").is_valid
+        assert engine.evaluate(click, campaign_id="camp_2").is_valid
+
+    def test_hot_reload_replaces_rules(self):
+        engine = FraudRuleEngine()
+        service = ClickValidationService(rule_engine=engine)
+        click = make_click(ip_address="45.33.32.156")
+        assert service.validate_click(click)[0]
+
+        engine.load_rules([FraudRule(id="r1", name="bad ip", type="ip", action="block",
+                                     patterns=("45.33.32.156",))])
+        is_valid, reason, score = service.validate_click(click)
+
+        assert not is_valid
+        assert reason == "rule_matched: bad ip"
+        assert engine.rule_count == 1
+
+    def test_invalid_rule_is_rejected(self):
+        with pytest.raises(ValueError):
+            FraudRule(id="r1", name="bad", type="cookie", action="block", patterns=("x",))
+
+    def test_batch_checks_each_distinct_value_once(self):
+        engine = FraudRuleEngine([
+            FraudRule(id="r1", name="block partner", type="referrer", action="block",
+                      patterns=(r"partner\.net",), campaign_id="camp_1"),
+        ])
+        checked = []
+        user_agent_signal = engine._user_agent_signal
+        engine._user_agent_signal = lambda value: checked.append(value) or user_agent_signal(value)
+        clicks = [make_click(campaign_id=CampaignId(campaign), referrer="https://www.partner.net/landing")
+                  for campaign in ("camp_1", "camp_2", "camp_1")]
+
+        verdicts = engine.evaluate_batch(clicks)
+
+        assert checked == [BROWSER_UA]
+        assert [verdict.is_valid for verdict in verdicts] == [False, True, False]
+        assert verdicts == [engine.evaluate(click, campaign_id=click.campaign_id.value) for click in clicks]
@@ -0,0 +1,148 @@
+# Copyright (c) 2025 Bivex
+#
+# Author: Bivex
+# Available for contact via email: support@b-b.top
+# For up-to-date contact information:
+# https://github.com/bivex
+#
+# Created: 2026-10-16T09:12:04
+# Last Updated: 2026-10-16T09:12:04
+#
+# Licensed under the MIT License.
+# Commercial licensing available upon request.
+
+"""Unit tests for the CIDR IP reputation index and offline geolocation."""
+
+import asyncio
+
+import pytest
+
+from src.application.handlers.system_handler import IP_REPUTATION_NAMESPACE, SystemHandler
+from src.domain.entities.click import Click
+from src.domain.services.click import FraudRule, FraudRuleEngine
+from src.domain.services.traffic import CidrIndex, IpReputationIndex, IpReputationService
+from src.domain.value_objects import ClickId
+from src.infrastructure.external import (
+    MmapIpGeolocationService, MockIpGeolocationService, compile_geo_database, load_ip_reputation_index
+)
+
+BROWSER_UA = "Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 Chrome/120.0 Safari/537.36"
+
+BLOCKS = [
+    ("45.0.0.0/8", "outer"),
+    ("45.33.0.0/16", "middle"),
+    ("45.33.32.156", "host"),
+    ("45.200.0.0/16", "sibling"),
+    ("2001:db8::/32", "v6"),
+]
+
+
+class TestCidrIndex:
+    """Test cases for CidrIndex."""
+
+    @pytest.mark.parametrize("backend", CidrIndex.BACKENDS)
+    def test_longest_prefix_match(self, backend):
+        index = CidrIndex(BLOCKS, backend=backend)
+
+        assert index.lookup("45.33.32.156") == "host"
+        assert index.lookup("45.33.32.157") == "middle"
+        assert index.lookup("45.34.0.1") == "outer"
+        assert index.lookup("45.200.1.1") == "sibling"
+        assert index.lookup("45.255.255.255") == "outer"
+        assert index.lookup("2001:db8::1") == "v6"
+        assert index.lookup("46.0.0.1") is None
+        assert index.lookup("not-an-ip") is None
+
+
+class RecordingInvalidator:
+    """Invalidator that keeps subscriptions and published messages."""
+
+    def __init__(self):
+        self.subscribers = {}
+        self.published = []
+
+    def subscribe(self, namespace, callback):
+        self.subscribers.setdefault(namespace, []).append(callback)
+
+    def publish(self, namespace, key):
+        self.published.append((namespace, key))
+
+
+class TestIpReputation:
+    """Test cases for IP reputation lookups in click validation and geolocation."""
+
+    def test_reload_swaps_index(self, tmp_path):
+        (tmp_path / "datacenter.txt").write_text("# cloud ranges\n45.33.0.0/16\nbogus\n")
+        (tmp_path / "locations.csv").write_text("cidr,country,region,city\n45.33.0.0/16,US,TX,Dallas\n")
+        service = IpReputationService(loader=lambda: load_ip_reputation_index(str(tmp_path)))
+        engine = FraudRuleEngine(ip_reputation=service)
+        click = Click(id=ClickId.generate(), ip_address="45.33.32.156", user_agent=BROWSER_UA)
+
+        assert engine.evaluate(click).breakdown() == {}
+        service.reload()
+
+        assert engine.evaluate(click).breakdown() == {'ip_reputation': 0.3}
+        assert MockIpGeolocationService(ip_reputation=service).get_location("45.33.32.156")["city"] == "Dallas"
+        assert service.get_stats()['blocklist_entries'] == 1
+
+    def test_reload_is_broadcast_to_other_workers(self, tmp_path):
+        (tmp_path / "datacenter.txt").write_text("45.33.0.0/16\n")
+        loader = lambda: load_ip_reputation_index(str(tmp_path))  # noqa: E731
+        writer, reader = IpReputationService(loader=loader), IpReputationService(loader=loader)
+        writer_invalidator, reader_invalidator = RecordingInvalidator(), RecordingInvalidator()
+        writer_handler = SystemHandler(ip_reputation=writer, invalidator=writer_invalidator)
+        SystemHandler(ip_reputation=reader, invalidator=reader_invalidator)
+
+        async def scenario():
+            result = await writer_handler.reload_ip_reputation()
+            [callback] = reader_invalidator.subscribers[IP_REPUTATION_NAMESPACE]
+            callback(None)
+            await asyncio.sleep(0.1)
+            return result
+
+        result = asyncio.run(scenario())
+
+        assert result["status"] == "success" and result["broadcast"]
+        assert writer_invalidator.published == [(IP_REPUTATION_NAMESPACE, None)]
+        assert reader.lookup("45.33.32.156") is not None
+
+    def test_campaign_blacklist_accepts_cidrs(self):
+        engine = FraudRuleEngine(ip_reputation=IpReputationService(IpReputationIndex()))
+        click = Click(id=ClickId.generate(), ip_address="45.33.32.156", user_agent=BROWSER_UA)
+
+        verdict = engine.evaluate(click, campaign_filters={'ip_blacklist': ["45.33.32.0/24", "junk"]})
+
+        assert verdict.reason == "ip_blacklisted"
+
+
+class TestMmapIpGeolocationService:
+    """Test cases for the offline geolocation database."""
+
+    def test_compiled_ranges_drive_geo_rules(self, tmp_path):
+        csv_path = tmp_path / "geo.csv"
+        csv_path.write_text("start_ip,end_ip,country,region,city\n"
+                            "45.33.0.0,45.33.255.255,US,TX,Dallas\n"
+                            "81.2.69.0/24,GB,ENG,London\n"
+                            "2a02:c7f::/32,GB,,\n")
+        db_path = tmp_path / "geo.bin"
+        assert compile_geo_database(str(csv_path), str(db_path))['ipv4_ranges'] == 2
+
+        geo = MmapIpGeolocationService(str(db_path), cache_size=16)
+        try:
+            assert geo.get_location("81.2.69.160") == {"country": "GB", "region": "ENG", "city": "London"}
+            assert geo.get_location("2a02:c7f::1")["country"] == "GB"
+            assert geo.get_location("45.34.0.1") is None
+            geo.get_location("81.2.69.160")
+            assert geo.get_stats()['cache_hits'] == 1
+
+            engine = FraudRuleEngine(geolocation=geo)
+            engine.load_rules([FraudRule(id="r1", name="no GB", type="country", action="flag",
+                                         patterns=("gb",), score=0.4)])
+            london = Click(id=ClickId.generate(), ip_address="81.2.69.160", user_agent=BROWSER_UA)
+            dallas = Click(id=ClickId.generate(), ip_address="45.33.32.156", user_agent=BROWSER_UA)
+
+            assert engine.evaluate(london).breakdown() == {'rule:country': 0.4}
+            assert engine.evaluate(dallas, campaign_filters={'allowed_countries': ["GB"]}).reason \
+                == "geo_not_targeted"
+        finally:
+            geo.close()
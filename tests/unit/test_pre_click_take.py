@@ -0,0 +1,180 @@
+# Copyright (c) 2025 Bivex
+#
+# Author: Bivex
+# Available for contact via email: support@b-b.top
+# For up-to-date contact information:
+# https://github.com/bivex
+#
+# Created: 2026-10-16T09:12:04
+# Last Updated: 2026-10-16T09:12:04
+#
+# Licensed under the MIT License.
+# Commercial licensing available upon request.
+
+"""Unit tests for consuming pre-click data with a single DELETE ... RETURNING."""
+
+import asyncio
+from datetime import datetime, timezone
+
+from src.domain.value_objects import ClickId
+from src.infrastructure.repositories.async_postgres_pre_click_data_repository import (
+    AsyncPostgresPreClickDataRepository,
+)
+from src.infrastructure.repositories.postgres_pre_click_data_repository import PostgresPreClickDataRepository
+
+
+def stored_row(click_id):
+    return {
+        'click_id': click_id,
+        'campaign_id': 'camp_1',
+        'timestamp': datetime(2026, 10, 16, tzinfo=timezone.utc),
+        'tracking_params': {'sub1': 'a'},
+        'metadata': {},
+    }
+
+
+class FakeTable:
+    """pre_click_data rows keyed by click_id; DELETE ... RETURNING pops one."""
+
+    def __init__(self, *click_ids):
+        self.rows = {click_id: stored_row(click_id) for click_id in click_ids}
+        self.sent = []
+
+    def delete_returning(self, sql, click_id):
+        self.sent.append(sql)
+        return self.rows.pop(click_id, None)
+
+
+class FakeConnection:
+    """psycopg2-like connection over a FakeTable."""
+
+    def __init__(self, table):
+        self.table = table
+        self.commits = 0
+
+    def cursor(self, cursor_factory=None):
+        connection = self
+
+        class Cursor:
+            def __init__(self):
+                self.connection = connection
+                self._row = None
+
+            def execute(self, sql, params=None):
+                self._row = connection.table.delete_returning(sql, params[0])
+
+            def fetchone(self):
+                return self._row
+
+        return Cursor()
+
+    def commit(self):
+        self.commits += 1
+
+    def rollback(self):
+        pass
+
+
+class FakeContainer:
+    def __init__(self, table):
+        self.connection = FakeConnection(table)
+        self.released = 0
+
+    async def get_db_connection_pool(self):
+        return self
+
+    def get_db_connection_pool_sync(self):
+        return self
+
+    def getconn(self):
+        return self.connection
+
+    def release_db_connection(self, conn):
+        self.released += 1
+
+
+class FakeAsyncPool:
+    """AsyncConnectionPool stand-in: ``fetchrow`` runs on ``conn`` when given."""
+
+    def __init__(self, table):
+        self.table = table
+        self.joined = []
+
+    async def fetchrow(self, query, *args, conn=None):
+        if conn is not None:
+            self.joined.append(conn)
+        return self.table.delete_returning(query, args[0])
+
+
+class FakeAsyncContainer:
+    def __init__(self, pool):
+        self._pool = pool
+
+    async def get_async_db_connection_pool(self):
+        return self._pool
+
+
+def ready(repository):
+    repository._db_initialized_event.set()
+    return repository
+
+
+class TestTakeByClickId:
+    """Test cases for PreClickDataRepository.take_by_click_id."""
+
+    def test_psycopg2_take_is_one_delete_returning(self):
+        click_id = ClickId.generate()
+        table = FakeTable(click_id.value)
+        container = FakeContainer(table)
+        repository = ready(PostgresPreClickDataRepository(container))
+
+        async def scenario():
+            return await repository.take_by_click_id(click_id), await repository.take_by_click_id(click_id)
+
+        first, second = asyncio.run(scenario())
+
+        assert first.click_id.value == click_id.value
+        assert first.tracking_params == {'sub1': 'a'}
+        assert second is None
+        assert len(table.sent) == 2
+        assert all(sql.startswith("DELETE FROM pre_click_data") and "RETURNING" in sql for sql in table.sent)
+        assert container.connection.commits == 2
+        assert container.released == 2
+
+    def test_psycopg2_take_on_a_unit_of_work_connection_leaves_commit_to_it(self):
+        click_id = ClickId.generate()
+        table = FakeTable(click_id.value)
+        container = FakeContainer(table)
+        joined = FakeConnection(table)
+        repository = ready(PostgresPreClickDataRepository(container))
+
+        taken = asyncio.run(repository.take_by_click_id(click_id, conn=joined))
+
+        assert taken.click_id.value == click_id.value
+        assert joined.commits == 0
+        assert container.released == 0
+
+    def test_async_take_is_one_delete_returning(self):
+        click_id = ClickId.generate()
+        table = FakeTable(click_id.value)
+        repository = ready(AsyncPostgresPreClickDataRepository(FakeAsyncContainer(FakeAsyncPool(table))))
+
+        async def scenario():
+            return await repository.take_by_click_id(click_id), await repository.take_by_click_id(click_id)
+
+        first, second = asyncio.run(scenario())
+
+        assert first.click_id.value == click_id.value
+        assert second is None
+        assert len(table.sent) == 2
+        assert all(sql.startswith("DELETE FROM pre_click_data") and "RETURNING" in sql for sql in table.sent)
+
+    def test_async_take_runs_on_the_given_connection(self):
+        click_id = ClickId.generate()
+        pool = FakeAsyncPool(FakeTable(click_id.value))
+        repository = ready(AsyncPostgresPreClickDataRepository(FakeAsyncContainer(pool)))
+        conn = object()
+
+        asyncio.run(repository.take_by_click_id(click_id, conn=conn))
+
+        assert pool.joined == [conn]
@@ -0,0 +1,71 @@
+# Copyright (c) 2025 Bivex
+#
+# Author: Bivex
+# Available for contact via email: support@b-b.top
+# For up-to-date contact information:
+# https://github.com/bivex
+#
+# Created: 2026-10-16T09:12:04
+# Last Updated: 2026-10-16T09:12:04
+#
+# Licensed under the MIT License.
+# Commercial licensing available upon request.
+
+"""Unit tests for the pre-fork supervisor helpers."""
+
+import time
+
+import pytest
+
+from src.infrastructure.database.pool_budget import PoolSizes, split_connection_budget
+from src.supervisor import FCNTL_AVAILABLE, LeaderLock
+
+
+class TestConnectionBudget:
+    """Test cases for splitting the connection budget between workers."""
+
+    def test_single_worker_keeps_the_defaults(self):
+        assert split_connection_budget(150, 1) == PoolSizes()
+
+    def test_budget_is_shared_between_workers(self):
+        sizes = split_connection_budget(150, 4)
+
+        assert (sizes.sync_max + sizes.async_max) * 4 <= 150
+        assert sizes == PoolSizes(sync_min=5, sync_max=24, async_min=5, async_max=13)
+
+    def test_tiny_budget_still_opens_one_connection_per_pool(self):
+        sizes = split_connection_budget(4, 8)
+
+        assert sizes == PoolSizes(sync_min=1, sync_max=1, async_min=1, async_max=1)
+
+
+@pytest.mark.skipif(not FCNTL_AVAILABLE, reason="flock is not available on this platform")
+class TestLeaderLock:
+    """Test cases for the flock-based leader election."""
+
+    def test_only_one_holder(self, tmp_path):
+        path = str(tmp_path / "api.leader")
+        first, second = LeaderLock(path), LeaderLock(path)
+
+        assert first.try_acquire()
+        assert not second.try_acquire()
+
+        first.release()
+        assert second.try_acquire()
+        second.release()
+
+    def test_waiting_worker_is_elected_after_release(self, tmp_path):
+        path = str(tmp_path / "api.leader")
+        leader, follower = LeaderLock(path), LeaderLock(path)
+        elected = []
+
+        leader.on_elected(lambda: elected.append('leader'))
+        follower.on_elected(lambda: elected.append('follower'))
+        assert elected == ['leader']
+
+        leader.release()
+        deadline = time.monotonic() + 2
+        while len(elected) < 2 and time.monotonic() < deadline:
+            time.sleep(0.01)
+        assert elected == ['leader', 'follower']
+        follower.release()
@@ -0,0 +1,94 @@
+# Copyright (c) 2025 Bivex
+#
+# Author: Bivex
+# Available for contact via email: support@b-b.top
+# For up-to-date contact information:
+# https://github.com/bivex
+#
+# Created: 2026-10-16T09:12:04
+# Last Updated: 2026-10-16T09:12:04
+#
+# Licensed under the MIT License.
+# Commercial licensing available upon request.
+
+"""Unit tests for the per-connection prepared statement cache."""
+
+import pytest
+
+from src.infrastructure.database.prepared_statements import (
+    PreparedStatementCache,
+    execute_prepared,
+    to_server_placeholders,
+)
+
+
+class RecordingCursor:
+    """Cursor double that records what would be sent to PostgreSQL."""
+
+    def __init__(self, statements=None, fail_with=None):
+        self.connection = type('Connection', (), {'statements': statements})()
+        self.executed = []
+        self.fail_with = fail_with
+
+    def execute(self, sql, params=None):
+        if self.fail_with and sql.startswith('EXECUTE'):
+            error, self.fail_with = self.fail_with, None
+            raise error
+        self.executed.append((sql, params))
+
+
+class StatementDropped(Exception):
+    pgcode = '26000'
+
+
+class TestPreparedStatementCache:
+    """Test cases for PreparedStatementCache and execute_prepared."""
+
+    def test_placeholders_are_numbered(self):
+        assert to_server_placeholders("SELECT %s, '100%%' WHERE a = %s") == ("SELECT $1, '100%' WHERE a = $2", 2)
+
+    def test_prepares_once_then_executes_with_bound_params(self):
+        cache = PreparedStatementCache()
+        cursor = RecordingCursor(cache)
+
+        execute_prepared(cursor, "SELECT * FROM campaigns WHERE id = %s", ("camp_1",))
+        execute_prepared(cursor, "SELECT * FROM campaigns WHERE id = %s", ("it's",))
+
+        assert cursor.executed == [
+            ("PREPARE ps_1 AS SELECT * FROM campaigns WHERE id = $1", None),
+            ("EXECUTE ps_1 (%s)", ("camp_1",)),
+            ("EXECUTE ps_1 (%s)", ("it's",)),
+        ]
+        assert cache.stats.get_summary()['hits'] == 1
+        assert cache.stats.get_summary()['misses'] == 1
+
+    def test_least_recently_used_statement_is_deallocated(self):
+        cache = PreparedStatementCache(capacity=2)
+        cursor = RecordingCursor(cache)
+
+        for sql in ("SELECT 1", "SELECT 2", "SELECT 1", "SELECT 3"):
+            execute_prepared(cursor, sql)
+
+        assert ("DEALLOCATE ps_2", None) in cursor.executed
+        assert len(cache) == 2
+        assert cache.stats.evictions == 1
+
+    def test_dropped_statement_is_prepared_again(self):
+        cache = PreparedStatementCache()
+        cursor = RecordingCursor(cache)
+        execute_prepared(cursor, "SELECT %s", (1,))
+
+        cursor.fail_with = StatementDropped()
+        with pytest.raises(StatementDropped):
+            execute_prepared(cursor, "SELECT %s", (2,))
+        execute_prepared(cursor, "SELECT %s", (3,))
+
+        assert cursor.executed[-2:] == [("PREPARE ps_2 AS SELECT $1", None), ("EXECUTE ps_2 (%s)", (3,))]
+        assert cache.stats.invalidations == 1
+
+    def test_connections_without_cache_execute_directly(self):
+        cursor = RecordingCursor()
+
+        execute_prepared(cursor, "SELECT %s", (1,))
+
+        assert cursor.executed == [("SELECT %s", (1,))]
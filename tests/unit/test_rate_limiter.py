@@ -0,0 +1,89 @@
+# Copyright (c) 2025 Bivex
+#
+# Author: Bivex
+# Available for contact via email: support@b-b.top
+# For up-to-date contact information:
+# https://github.com/bivex
+#
+# Created: 2026-10-16T09:12:04
+# Last Updated: 2026-10-16T09:12:04
+#
+# Licensed under the MIT License.
+# Commercial licensing available upon request.
+
+"""Unit tests for the sliding-window rate limiter."""
+
+import os
+
+import pytest
+
+from src.config.settings import settings
+from src.infrastructure.ratelimit import RateLimit, RateLimitPolicy, SlidingWindowRateLimiter, parse_rate_limit_groups
+from src.presentation.middleware.security_middleware import REVOKE_PATH, create_rate_limiter
+
+
+class TestSlidingWindowRateLimiter:
+    """Test cases for SlidingWindowRateLimiter."""
+
+    def test_route_groups_have_separate_budgets(self):
+        policy = RateLimitPolicy(RateLimit(100, 60), parse_rate_limit_groups("/v1/auth=2/60"))
+        limiter = SlidingWindowRateLimiter(policy, slots=64)
+
+        assert [limiter.check("1.2.3.4", "/v1/auth/token", now=0.0).allowed for _ in range(3)] == [True, True, False]
+        assert limiter.check("1.2.3.4", "/v1/campaigns", now=0.0).allowed
+        assert limiter.check("5.6.7.8", "/v1/auth/token", now=0.0).allowed
+
+    def test_self_revocation_has_its_own_tight_group(self):
+        group, limit = create_rate_limiter(shared=False).policy.resolve(REVOKE_PATH)
+
+        assert group == REVOKE_PATH
+        security = settings.security
+        assert limit == RateLimit(security.revoke_rate_limit_requests, security.revoke_rate_limit_window_seconds)
+
+    def test_window_slides(self):
+        limiter = SlidingWindowRateLimiter(RateLimitPolicy(RateLimit(10, 60)), slots=64)
+        for _ in range(10):
+            limiter.check("1.2.3.4", now=30.0)
+
+        blocked = limiter.check("1.2.3.4", now=59.0)
+        assert not blocked.allowed and blocked.retry_after == 1.0
+        # Half of the previous window still counts 30 seconds into the next one
+        assert limiter.check("1.2.3.4", now=90.0).remaining == 4
+        assert limiter.check("1.2.3.4", now=200.0).remaining == 9
+
+    def test_short_window_groups_do_not_reclaim_live_slots_of_long_windows(self):
+        policy = RateLimitPolicy(RateLimit(3, 60), parse_rate_limit_groups("/fast=100/1"))
+        # One set: every key competes for the same four ways
+        limiter = SlidingWindowRateLimiter(policy, slots=4, ways=4)
+
+        assert [limiter.check("1.2.3.4", now=10.0).allowed for _ in range(4)] == [True, True, True, False]
+        for client in ("10.0.0.1", "10.0.0.2", "10.0.0.3", "10.0.0.4"):
+            limiter.check(client, "/fast", now=10.5)
+
+        assert not limiter.check("1.2.3.4", now=11.0).allowed
+
+    def test_expired_long_window_slot_is_reclaimed(self):
+        policy = RateLimitPolicy(RateLimit(3, 60), parse_rate_limit_groups("/fast=100/1"))
+        limiter = SlidingWindowRateLimiter(policy, slots=4, ways=4)
+        for client in ("10.0.0.1", "10.0.0.2", "10.0.0.3"):
+            limiter.check(client, "/fast", now=0.0)
+        limiter.check("1.2.3.4", now=0.0)
+
+        limiter.check("10.0.0.4", "/fast", now=10.0)
+        limiter.check("10.0.0.5", "/fast", now=10.0)
+
+        # The /fast slots from t=0 had expired, so no live counter was evicted
+        assert limiter.get_stats()['evictions'] == 0
+        assert limiter.check("1.2.3.4", now=10.0).remaining == 1
+
+    @pytest.mark.skipif(not hasattr(os, 'fork'), reason="requires fork")
+    def test_shared_backend_counts_across_processes(self):
+        limiter = SlidingWindowRateLimiter(RateLimitPolicy(RateLimit(5, 60)), slots=64, shared=True)
+        pid = os.fork()
+        if pid == 0:
+            for _ in range(3):
+                limiter.check("1.2.3.4", now=0.0)
+            os._exit(0)
+        os.waitpid(pid, 0)
+
+        assert limiter.check("1.2.3.4", now=0.0).remaining == 1
@@ -0,0 +1,109 @@
+# Copyright (c) 2025 Bivex
+#
+# Author: Bivex
+# Available for contact via email: support@b-b.top
+# For up-to-date contact information:
+# https://github.com/bivex
+#
+# Created: 2026-10-16T09:12:04
+# Last Updated: 2026-10-16T09:12:04
+#
+# Licensed under the MIT License.
+# Commercial licensing available upon request.
+
+"""Unit tests for precompiled redirect decisions."""
+
+import asyncio
+from types import SimpleNamespace
+
+from src.application.handlers.track_click_handler import TrackClickHandler
+from src.domain.entities.campaign import Campaign
+from src.domain.entities.landing_page import LandingPage
+from src.domain.services.click import RedirectDecisionTable, RedirectTarget, FALLBACK_REDIRECT_URL
+from src.domain.value_objects import CampaignId, Url
+
+
+class TestRedirectDecisionTable:
+    """Test cases for RedirectDecisionTable."""
+
+    def test_test_mode_matches_with_query_params(self):
+        """The pre-split template yields the same URL as Url.with_query_params."""
+        url = Url("https://offer.example.com/path?a=1&click_id=old#top")
+        target = RedirectTarget.compile(url)
+
+        assert target.build("abc 123") == url.value
+        assert target.build("abc 123", test_mode=True) == url.with_query_params({'click_id': "abc 123"}).value
+
+    def test_priorities(self):
+        """Landing page, then offer page for valid clicks, safe page for invalid ones."""
+        campaign = Campaign(id=CampaignId("camp_1"), name="Test Campaign",
+                            offer_page_url=Url("https://offer.example.com"),
+                            safe_page_url=Url("https://safe.example.com"))
+        landing_pages = [
+            LandingPage(id="lp_1", campaign_id="camp_1", name="Active", url=Url("https://lp.example.com"),
+                        page_type="direct"),
+            LandingPage(id="lp_2", campaign_id="camp_1", name="Inactive", url=Url("https://old.example.com"),
+                        page_type="direct", is_active=False),
+        ]
+        table = RedirectDecisionTable.compile(campaign, landing_pages)
+
+        assert table.decide(False, landing_page_id="lp_1").url == "https://lp.example.com"
+        assert table.decide(True, landing_page_id="lp_2").url == "https://offer.example.com"
+        assert table.decide(False).url == "https://safe.example.com"
+
+    def test_unconfigured_campaign_uses_fallback(self):
+        """A campaign without offer/safe URLs routes every click to the fallback page."""
+        table = RedirectDecisionTable.compile(Campaign(id=CampaignId("camp_1"), name="Test Campaign"))
+
+        assert table.decide(True).url == FALLBACK_REDIRECT_URL
+        assert table.decide(False).url == FALLBACK_REDIRECT_URL
+
+
+class FakeRoutingCache:
+    """Routing cache holding landing pages of other campaigns; records lookups."""
+
+    def __init__(self, landing_pages=()):
+        self.landing_pages = {lp.id: lp for lp in landing_pages}
+        self.lookups = []
+
+    async def get_landing_page(self, landing_page_id):
+        self.lookups.append(landing_page_id)
+        return self.landing_pages.get(landing_page_id)
+
+    async def get_offer(self, offer_id):
+        self.lookups.append(offer_id)
+        return None
+
+
+class TestTrackClickRedirect:
+    """Test cases for TrackClickHandler redirect resolution."""
+
+    def redirect(self, routing_cache, landing_page_id=None, is_valid=True):
+        campaign = Campaign(id=CampaignId("camp_1"), name="Test Campaign",
+                            offer_page_url=Url("https://offer.example.com"))
+        own_page = LandingPage(id="lp_1", campaign_id="camp_1", name="Own", url=Url("https://lp.example.com"),
+                               page_type="direct")
+        snapshot = SimpleNamespace(redirects=RedirectDecisionTable.compile(campaign, [own_page]))
+        handler = TrackClickHandler(None, None, None, None, None, None, None, routing_cache=routing_cache)
+        command = SimpleNamespace(landing_page_id=landing_page_id, campaign_offer_id=None)
+        return asyncio.run(handler._determine_redirect_url(snapshot, is_valid, False, "click_1", command))
+
+    def test_table_hit_needs_no_lookup(self):
+        cache = FakeRoutingCache()
+
+        assert self.redirect(cache, landing_page_id="lp_1") == "https://lp.example.com"
+        assert cache.lookups == []
+
+    def test_table_miss_looks_up_the_landing_page(self):
+        other = LandingPage(id="lp_9", campaign_id="camp_2", name="Other", url=Url("https://other.example.com"),
+                            page_type="direct")
+        cache = FakeRoutingCache([other])
+
+        assert self.redirect(cache, landing_page_id="lp_9") == "https://other.example.com"
+        assert cache.lookups == ["lp_9"]
+
+    def test_unknown_landing_page_falls_back_to_the_campaign(self):
+        cache = FakeRoutingCache()
+
+        assert self.redirect(cache, landing_page_id="lp_404") == "https://offer.example.com"
+        assert cache.lookups == ["lp_404"]
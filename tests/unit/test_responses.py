@@ -0,0 +1,81 @@
+# Copyright (c) 2025 Bivex
+#
+# Author: Bivex
+# Available for contact via email: support@b-b.top
+# For up-to-date contact information:
+# https://github.com/bivex
+#
+# Created: 2026-10-16T09:12:04
+# Last Updated: 2026-10-16T09:12:04
+#
+# Licensed under the MIT License.
+# Commercial licensing available upon request.
+
+"""Unit tests for the socketify response helpers."""
+
+import json
+from decimal import Decimal
+
+from src.presentation.responses import (
+    ADMIN_HEADERS, build_header_bundles, send_json, send_redirect,
+)
+
+
+class RecordingResponse:
+    """Collects what a handler writes to a socketify response."""
+
+    def __init__(self):
+        self.status = None
+        self.headers = []
+        self.body = None
+
+    def write_status(self, status):
+        assert not self.headers, "status must be written before headers"
+        self.status = status
+
+    def write_header(self, name, value):
+        self.headers.append((name, value))
+
+    def end(self, body):
+        self.body = body
+
+
+class TestResponses:
+    """Test cases for send_json and the precomputed header bundles."""
+
+    def test_send_json_writes_status_headers_and_body(self):
+        res = RecordingResponse()
+
+        send_json(res, {"amount": Decimal("1.50")}, 201, headers=ADMIN_HEADERS)
+
+        assert res.status == 201
+        assert res.headers == list(ADMIN_HEADERS)
+        assert (b'Content-Type', b'application/json') in res.headers
+        assert (b'Cache-Control', b'no-store') in res.headers
+        assert json.loads(res.body) == {"amount": 1.5}
+
+    def test_default_status_is_not_written(self):
+        res = RecordingResponse()
+
+        send_json(res, [])
+
+        assert res.status is None
+        assert res.body == b'[]'
+
+    def test_cors_bundles_follow_configured_origins(self):
+        wildcard = dict(build_header_bundles(['*'])['api'])
+        single = dict(build_header_bundles(['https://app.example.com'])['api'])
+        several = dict(build_header_bundles(['https://a.example.com', 'https://b.example.com'])['api'])
+
+        assert wildcard[b'Access-Control-Allow-Origin'] == b'*'
+        assert single[b'Access-Control-Allow-Origin'] == b'https://app.example.com'
+        assert b'Access-Control-Allow-Origin' not in several
+        assert several[b'Vary'] == b'Origin'
+
+    def test_redirect(self):
+        res = RecordingResponse()
+
+        send_redirect(res, 'https://offer.example.com/?a=1')
+
+        assert res.status == 302
+        assert (b'Location', 'https://offer.example.com/?a=1') in res.headers
@@ -0,0 +1,145 @@
+# Copyright (c) 2025 Bivex
+#
+# Author: Bivex
+# Available for contact via email: support@b-b.top
+# For up-to-date contact information:
+# https://github.com/bivex
+#
+# Created: 2026-10-16T09:12:04
+# Last Updated: 2026-10-16T09:12:04
+#
+# Licensed under the MIT License.
+# Commercial licensing available upon request.
+
+"""Unit tests for compiled route spec validators."""
+
+import json
+from datetime import datetime
+from urllib.parse import parse_qsl
+
+import pytest
+
+from src.infrastructure.ratelimit import RateLimit, build_rate_limiter
+from src.presentation.middleware import security_middleware
+from src.presentation.middleware.route_spec import (
+    PAGINATION_PARAMS, QueryParam, RouteSpec, compile_route_validator, route,
+)
+
+
+class FakeRequest:
+    """Minimal socketify request: a URL, a query string and headers."""
+
+    def __init__(self, url, headers=None, method='GET'):
+        self._url = url
+        self._query = dict(parse_qsl(url.partition('?')[2], keep_blank_values=True))
+        self._headers = headers or {}
+        self._method = method
+
+    def get_url(self):
+        return self._url.partition('?')[0]
+
+    def get_full_url(self):
+        return self._url
+
+    def get_query(self, name):
+        return self._query.get(name)
+
+    def get_method(self):
+        return self._method
+
+    def get_header(self, name):
+        return self._headers.get(name)
+
+    def get_remote_address(self):
+        return '10.0.0.1'
+
+
+class RecordingResponse:
+    """Collects what the validator writes to a socketify response."""
+
+    def __init__(self):
+        self.status = None
+        self.headers = []
+        self.body = None
+
+    def write_status(self, status):
+        self.status = status
+
+    def write_header(self, name, value):
+        self.headers.append((name, value))
+
+    def end(self, body):
+        self.body = body
+
+
+@pytest.fixture(autouse=True)
+def rate_limiter():
+    previous = security_middleware._rate_limiter
+    security_middleware.configure_rate_limiter(build_rate_limiter(RateLimit(2, 60)))
+    yield
+    security_middleware.configure_rate_limiter(previous)
+
+
+API_KEY = {'x-api-key': 'test-key'}
+
+
+class TestRouteSpec:
+    """Test cases for RouteSpec, QueryParam and compile_route_validator."""
+
+    def test_parses_declared_params_with_defaults(self):
+        validate = compile_route_validator(RouteSpec('/v1/campaigns', query=PAGINATION_PARAMS))
+
+        params = validate(FakeRequest('/v1/campaigns?pageSize=50', API_KEY), RecordingResponse())
+
+        assert params == {'page': 1, 'pageSize': 50}
+
+    def test_out_of_range_param_sends_400(self):
+        validate = compile_route_validator(RouteSpec('/v1/campaigns', query=PAGINATION_PARAMS))
+        res = RecordingResponse()
+
+        assert validate(FakeRequest('/v1/campaigns?pageSize=500', API_KEY), res) is None
+        assert res.status == 400
+        assert json.loads(res.body)['error']['message'] == 'pageSize must be between 1 and 100'
+
+    def test_strict_query_rejects_unknown_params(self):
+        validate = compile_route_validator(
+            RouteSpec('/v1/campaigns', query=PAGINATION_PARAMS, strict_query=True))
+        res = RecordingResponse()
+
+        assert validate(FakeRequest('/v1/campaigns?page=1&x-unknown=1', API_KEY), res) is None
+        assert json.loads(res.body)['error']['message'] == 'Unknown query parameter'
+
+    def test_missing_credentials_send_401(self):
+        validate = compile_route_validator(RouteSpec('/v1/campaigns'))
+        res = RecordingResponse()
+
+        assert validate(FakeRequest('/v1/campaigns'), res) is None
+        assert res.status == 401
+
+    def test_rate_limit_is_keyed_by_pattern_prefix(self):
+        spec = RouteSpec('/v1/campaigns/:campaign_id', auth=False)
+        validate = compile_route_validator(spec)
+
+        assert spec.static_prefix == '/v1/campaigns'
+        assert validate(FakeRequest('/v1/campaigns/1'), RecordingResponse()) == {}
+        assert validate(FakeRequest('/v1/campaigns/2'), RecordingResponse()) == {}
+        res = RecordingResponse()
+        assert validate(FakeRequest('/v1/campaigns/3'), res) is None
+        assert res.status == 429
+
+    def test_query_param_types(self):
+        assert QueryParam('since', datetime).parse('2024-01-02') == datetime(2024, 1, 2)
+        assert QueryParam('flag', bool).parse('yes') is True
+        with pytest.raises(ValueError, match='must be one of: 0, 1'):
+            QueryParam('is_valid', int, choices=(0, 1)).parse('2')
+
+    def test_route_registers_each_method(self):
+        registered = []
+
+        class App:
+            def post(self, pattern, handler):
+                registered.append(('POST', pattern, handler))
+
+        route(App(), RouteSpec('/v1/campaigns', methods=frozenset({'POST'})), print)
+
+        assert registered == [('POST', '/v1/campaigns', print)]
@@ -0,0 +1,154 @@
+# Copyright (c) 2025 Bivex
+#
+# Author: Bivex
+# Available for contact via email: support@b-b.top
+# For up-to-date contact information:
+# https://github.com/bivex
+#
+# Created: 2026-10-16T09:12:04
+# Last Updated: 2026-10-16T09:12:04
+#
+# Licensed under the MIT License.
+# Commercial licensing available upon request.
+
+"""Unit tests for the read-through routing cache."""
+
+import asyncio
+
+from src.application.commands.create_campaign_command import CreateCampaignCommand
+from src.application.handlers.create_campaign_handler import CreateCampaignHandler
+from src.domain.entities.campaign import Campaign
+from src.domain.value_objects import CampaignId, CampaignStatus, Url
+from src.infrastructure.cache import RoutingCache, CampaignRoutingSnapshot
+
+
+class CountingCampaignRepository:
+    """Async campaign source that counts lookups."""
+
+    def __init__(self, *campaigns):
+        self.campaigns = {c.id.value: c for c in campaigns}
+        self.lookups = 0
+
+    async def find_by_id(self, campaign_id):
+        self.lookups += 1
+        await asyncio.sleep(0.01)
+        return self.campaigns.get(campaign_id.value)
+
+    def save(self, campaign):
+        self.campaigns[campaign.id.value] = campaign
+
+
+def make_campaign(campaign_id="camp_1", status=CampaignStatus.ACTIVE):
+    return Campaign(id=CampaignId(campaign_id), name="Test Campaign", status=status,
+                    offer_page_url=Url("https://offer.example.com"),
+                    safe_page_url=Url("https://safe.example.com"))
+
+
+class TestRoutingCache:
+    """Test cases for RoutingCache."""
+
+    def test_hits_are_served_from_memory(self):
+        """Repeated and concurrent lookups load each campaign once."""
+        repository = CountingCampaignRepository(make_campaign())
+        cache = RoutingCache(repository)
+
+        async def scenario():
+            first = await asyncio.gather(*(cache.get_campaign("camp_1") for _ in range(10)))
+            second = await cache.get_campaign(CampaignId("camp_1"))
+            return first, second
+
+        first, second = asyncio.run(scenario())
+
+        assert repository.lookups == 1
+        assert isinstance(second, CampaignRoutingSnapshot)
+        assert second.is_active
+        assert all(snapshot is second for snapshot in first)
+        assert cache.get_stats()['namespaces']['campaigns']['hits'] == 1
+
+    def test_invalidation_and_flush_force_reload(self):
+        """Invalidated entries are reloaded and reflect the latest status."""
+        campaign = make_campaign()
+        repository = CountingCampaignRepository(campaign)
+        cache = RoutingCache(repository)
+
+        async def scenario():
+            await cache.get_campaign("camp_1")
+            campaign.status = CampaignStatus.PAUSED
+            stale = await cache.get_campaign("camp_1")
+            cache.invalidate_campaign(CampaignId("camp_1"))
+            fresh = await cache.get_campaign("camp_1")
+            flushed = cache.flush()
+            await cache.get_campaign("camp_1")
+            return stale, fresh, flushed
+
+        stale, fresh, flushed = asyncio.run(scenario())
+
+        assert stale.status == CampaignStatus.ACTIVE
+        assert fresh.status == CampaignStatus.PAUSED
+        assert flushed == {'campaigns': 1, 'landing_pages': 0, 'offers': 0}
+        assert repository.lookups == 3
+
+    def test_invalidation_during_load_is_not_overwritten(self):
+        """A load that read the row before an invalidation does not cache its result."""
+        campaign = make_campaign()
+        repository = CountingCampaignRepository(campaign)
+        read_before_update = repository.find_by_id
+
+        async def find_by_id(campaign_id):
+            loaded = make_campaign(status=campaign.status)
+            await read_before_update(campaign_id)
+            return loaded
+
+        repository.find_by_id = find_by_id
+        cache = RoutingCache(repository)
+
+        async def scenario():
+            load = asyncio.ensure_future(cache.get_campaign("camp_1"))
+            await asyncio.sleep(0)
+            campaign.status = CampaignStatus.PAUSED
+            cache.invalidate_campaign("camp_1")
+            stale = await load
+            fresh = await cache.get_campaign("camp_1")
+            return stale, fresh
+
+        stale, fresh = asyncio.run(scenario())
+
+        assert stale.status == CampaignStatus.ACTIVE
+        assert fresh.status == CampaignStatus.PAUSED
+        assert repository.lookups == 2
+
+    def test_lru_eviction_and_negative_caching(self):
+        """The least recently used entry is evicted, and unknown ids are cached as misses."""
+        repository = CountingCampaignRepository(make_campaign("camp_1"), make_campaign("camp_2"))
+        cache = RoutingCache(repository, max_entries=1)
+
+        async def scenario():
+            await cache.get_campaign("camp_1")
+            await cache.get_campaign("camp_2")
+            await cache.get_campaign("camp_1")
+            missing = [await cache.get_campaign("camp_missing") for _ in range(2)]
+            return missing
+
+        missing = asyncio.run(scenario())
+
+        assert missing == [None, None]
+        assert cache.get_stats()['namespaces']['campaigns']['evictions'] >= 2
+        assert repository.lookups == 4
+
+    def test_created_campaign_replaces_a_cached_miss(self, monkeypatch):
+        """Creating a campaign drops the miss cached by a click that arrived first."""
+        monkeypatch.setattr(CampaignId, 'generate', classmethod(lambda cls: cls("camp_new")))
+        repository = CountingCampaignRepository()
+        cache = RoutingCache(repository)
+        handler = CreateCampaignHandler(repository, routing_cache=cache)
+
+        async def scenario():
+            early = await cache.get_campaign("camp_new")
+            handler.handle(CreateCampaignCommand(name="New Campaign", black_url="https://offer.example.com"))
+            return early, await cache.get_campaign("camp_new")
+
+        early, created = asyncio.run(scenario())
+
+        assert early is None
+        assert created.id.value == "camp_new"
+        assert repository.lookups == 2
@@ -0,0 +1,58 @@
+# Copyright (c) 2025 Bivex
+#
+# Author: Bivex
+# Available for contact via email: support@b-b.top
+# For up-to-date contact information:
+# https://github.com/bivex
+#
+# Created: 2026-10-16T09:12:04
+# Last Updated: 2026-10-16T09:12:04
+#
+# Licensed under the MIT License.
+# Commercial licensing available upon request.
+
+"""Unit tests for response JSON serialization."""
+
+import json
+from datetime import datetime, timezone
+from decimal import Decimal
+
+import pytest
+
+from src.domain.value_objects.financial.money import Money
+from src.domain.value_objects.identifiers.campaign_id import CampaignId
+from src.domain.value_objects.identifiers.click_id import ClickId
+from src.utils import serialization
+
+
+class TestSerialization:
+    """Test cases for the response encoder."""
+
+    def test_domain_types_are_encoded(self):
+        click_id = ClickId.generate()
+        payload = {
+            "campaign": CampaignId("camp_123"),
+            "click": click_id,
+            "revenue": Money(Decimal("12.50"), "usd"),
+            "rate": Decimal("0.25"),
+            "at": datetime(2026, 1, 2, 3, 4, 5, tzinfo=timezone.utc),
+            1: "non-string key",
+        }
+
+        decoded = json.loads(serialization.dumps_bytes(payload))
+
+        assert decoded == {
+            "campaign": "camp_123",
+            "click": click_id.value,
+            "revenue": {"amount": 12.5, "currency": "USD"},
+            "rate": 0.25,
+            "at": "2026-01-02T03:04:05+00:00",
+            "1": "non-string key",
+        }
+        assert json.loads(serialization.dumps(payload)) == decoded
+
+    def test_unknown_types_use_fallback_default(self):
+        with pytest.raises(TypeError):
+            serialization.dumps({"obj": object()})
+
+        assert json.loads(serialization.dumps({"obj": Ellipsis}, default=str)) == {"obj": "Ellipsis"}
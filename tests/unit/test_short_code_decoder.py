@@ -0,0 +1,63 @@
+# Copyright (c) 2025 Bivex
+#
+# Author: Bivex
+# Available for contact via email: support@b-b.top
+# For up-to-date contact information:
+# https://github.com/bivex
+#
+# Created: 2026-10-16T09:12:04
+# Last Updated: 2026-10-16T09:12:04
+#
+# Licensed under the MIT License.
+# Commercial licensing available upon request.
+
+"""Unit tests for the process-wide short code decoder."""
+
+from shared_url_shortener import ShortCodeDecoder, TrackingURLHandler, URLParams, URLShortener
+
+
+class TestShortCodeDecoder:
+    """Test cases for ShortCodeDecoder caching and recovery."""
+
+    def _decoder(self, tmp_path, **kwargs):
+        return ShortCodeDecoder(URLShortener(str(tmp_path / "storage.json")), **kwargs)
+
+    def test_decoded_codes_are_served_from_the_lru(self, tmp_path):
+        decoder = self._decoder(tmp_path, lru_size=2)
+        codes = [decoder.shortener.encode(URLParams(cid=str(i))) for i in range(3)]
+
+        for code in codes + codes[-1:]:
+            decoder.decode(code)
+
+        assert decoder.get_stats()["decoded_cached"] == 2
+        assert (decoder.hits, decoder.misses) == (1, 3)
+
+    def test_unknown_codes_hit_the_negative_cache(self, tmp_path):
+        decoder = self._decoder(tmp_path)
+
+        assert decoder.decode("sNOTAKEY1") is None
+        assert decoder.decode("sNOTAKEY1") is None
+
+        assert (decoder.negative_hits, decoder.misses) == (1, 1)
+
+    def test_negative_entries_expire(self, tmp_path):
+        decoder = self._decoder(tmp_path, negative_ttl=0.0)
+        assert decoder.decode("sLATEKEY1") is None
+
+        decoder.shortener.key_to_params["LATEKEY1"] = URLParams(cid="42")
+
+        assert decoder.decode("sLATEKEY1") == URLParams(cid="42")
+
+    def test_recovers_plain_compressed_params(self, tmp_path):
+        decoder = self._decoder(tmp_path)
+
+        assert decoder.decode("c51:tg|k:abc") == URLParams(cid="5", sub1="tg", click_id="abc")
+
+    def test_tracking_handler_uses_the_shared_decoder(self, tmp_path):
+        decoder = self._decoder(tmp_path)
+        code = decoder.shortener.encode(URLParams(cid="9061", sub1="telegram"))
+
+        params = TrackingURLHandler(decoder).handle_tracking_redirect(code)
+
+        assert params == {"campaign_id": "9061", "sub1": "telegram"}
+        assert decoder.misses == 1
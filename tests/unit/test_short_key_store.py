@@ -0,0 +1,134 @@
+# Copyright (c) 2025 Bivex
+#
+# Author: Bivex
+# Available for contact via email: support@b-b.top
+# For up-to-date contact information:
+# https://github.com/bivex
+#
+# Created: 2026-10-16T09:12:04
+# Last Updated: 2026-10-16T09:12:04
+#
+# Licensed under the MIT License.
+# Commercial licensing available upon request.
+
+"""Unit tests for the append-only short key storage of the URL shortener."""
+
+import json
+import threading
+
+from shared_url_shortener import ShortKeyStore, URLParams, URLShortener
+
+
+class TestShortKeyStore:
+    """Test cases for ShortKeyStore and URLShortener short-key encoding."""
+
+    def test_keys_survive_reopen(self, tmp_path):
+        path = str(tmp_path / "keys.log")
+        store = ShortKeyStore(path)
+        store["abc12345"] = URLParams(cid="9061", sub1="telegram", extra={"utm": "x"})
+        store.close()
+
+        reopened = ShortKeyStore(path)
+
+        assert len(reopened) == 1
+        assert reopened["abc12345"] == URLParams(cid="9061", sub1="telegram", extra={"utm": "x"})
+
+    def test_encode_many_appends_one_batch(self, tmp_path):
+        shortener = URLShortener(str(tmp_path / "storage.json"))
+
+        codes = shortener.encode_many([URLParams(cid=str(i % 50)) for i in range(100)])
+
+        assert len(set(codes)) == 50
+        assert codes[7] == codes[57]
+        with open(tmp_path / "storage.log", encoding="utf-8") as f:
+            assert len(f.readlines()) == 50
+        assert URLShortener(str(tmp_path / "storage.json")).decode(codes[7]).cid == "7"
+
+    def test_sees_keys_appended_by_another_process(self, tmp_path):
+        path = str(tmp_path / "keys.log")
+        reader, writer = ShortKeyStore(path), ShortKeyStore(path)
+
+        writer["late0001"] = URLParams(cid="42")
+
+        assert reader.get("late0001") == URLParams(cid="42")
+
+    def test_compaction_drops_superseded_records(self, tmp_path):
+        path = str(tmp_path / "keys.log")
+        store = ShortKeyStore(path)
+        store.COMPACT_MIN_RECORDS = 10
+        store["keep0001"] = URLParams(cid="1")
+
+        for i in range(20):
+            store["hot00001"] = URLParams(cid=str(i))
+
+        with open(path, encoding="utf-8") as f:
+            lines = f.readlines()
+        assert len(lines) < 10
+        assert store["hot00001"].cid == "19"
+        assert ShortKeyStore(path)["keep0001"].cid == "1"
+
+    def test_reads_stay_consistent_during_compaction(self, tmp_path):
+        path = str(tmp_path / "keys.log")
+        store = ShortKeyStore(path)
+        store.put_many((f"key{i:05d}", URLParams(cid=str(i))) for i in range(200))
+        stop = threading.Event()
+
+        def compact_repeatedly():
+            while not stop.is_set():
+                store.compact()
+
+        compactor = threading.Thread(target=compact_repeatedly)
+        compactor.start()
+        try:
+            for _ in range(20):
+                store._cache.clear()
+                assert [store.get(f"key{i:05d}").cid for i in range(200)] == [str(i) for i in range(200)]
+        finally:
+            stop.set()
+            compactor.join()
+
+    def test_migrates_legacy_json_once(self, tmp_path):
+        legacy = tmp_path / "storage.json"
+        legacy.write_text(json.dumps({"key_to_params": {"Ot3i8qUG": {"cid": "9061", "sub1": "bot"}}}))
+
+        shortener = URLShortener(str(legacy))
+
+        assert shortener.decode("sOt3i8qUG") == URLParams(cid="9061", sub1="bot")
+        assert (tmp_path / "storage.log").exists()
+
+    def test_identical_params_share_one_key(self, tmp_path):
+        shortener = URLShortener(str(tmp_path / "storage.json"))
+
+        first = shortener.encode(URLParams(cid="9061", sub1="telegram", extra={"a": "1", "b": "2"}))
+        second = shortener.encode(URLParams(cid="9061", sub1="telegram", extra={"b": "2", "a": "1"}))
+
+        assert first == second
+        assert len(shortener.key_to_params) == 1
+
+    def test_unique_mode_issues_a_new_key(self, tmp_path):
+        shortener = URLShortener(str(tmp_path / "storage.json"))
+        params = URLParams(cid="9061", click_id="c1")
+
+        codes = {shortener.encode(params, unique=True) for _ in range(3)}
+
+        assert len(codes) == 3
+        assert shortener.encode(params) not in codes
+
+    def test_collapse_duplicates_keeps_old_codes_working(self, tmp_path):
+        legacy = tmp_path / "storage.json"
+        legacy.write_text(json.dumps({"key_to_params": {
+            "dup00001": {"cid": "9061", "sub1": "bot"},
+            "dup00002": {"sub1": "bot", "cid": "9061"},
+            "solo0001": {"cid": "7"},
+        }}))
+        shortener = URLShortener(str(legacy))
+
+        stats = shortener.collapse_duplicates()
+
+        assert stats == {"keys": 3, "distinct": 2, "aliased": 3}
+        reopened = URLShortener(str(legacy))
+        code = reopened.encode(URLParams(cid="9061", sub1="bot"))
+        assert reopened.decode("sdup00001") == reopened.decode("sdup00002") == reopened.decode(code)
+        assert reopened.decode("ssolo0001") == URLParams(cid="7")
+        with open(tmp_path / "storage.log", encoding="utf-8") as f:
+            assert sum(1 for line in f if "\t{" in line) == 2
@@ -0,0 +1,59 @@
+# Copyright (c) 2025 Bivex
+#
+# Author: Bivex
+# Available for contact via email: support@b-b.top
+# For up-to-date contact information:
+# https://github.com/bivex
+#
+# Created: 2026-10-16T09:12:04
+# Last Updated: 2026-10-16T09:12:04
+#
+# Licensed under the MIT License.
+# Commercial licensing available upon request.
+
+"""Unit tests for logging gates, request context and the JSON sink."""
+
+import io
+import json
+import sys
+
+from loguru import logger
+
+from src.config.settings import LoggingSettings
+from src.utils import structured_logging
+from src.utils.structured_logging import JsonLineSink, configure_logging, log_gate, request_log_context
+
+
+class TestStructuredLogging:
+    """Test cases for the production logging profile."""
+
+    def teardown_method(self):
+        configure_logging(LoggingSettings(level="DEBUG", profile="production"))
+        logger.remove()
+        logger.add(sys.stderr)
+
+    def test_module_levels_and_sampling_gate_messages(self):
+        hot = log_gate("src.presentation.routes.click_routes", "INFO", sampled=True)
+        other = log_gate("src.application.handlers.system_handler", "INFO")
+
+        configure_logging(LoggingSettings(level="INFO", profile="production",
+                                          module_levels="src.presentation.routes=WARNING"))
+        assert not hot and other
+
+        configure_logging(LoggingSettings(level="INFO", profile="production", sample_rate=0.0))
+        with request_log_context("req-1"):
+            assert not hot and other
+        assert hot
+
+    def test_json_sink_includes_request_context(self):
+        stream = io.StringIO()
+        logger.remove()
+        logger.add(JsonLineSink(stream), format="{message}")
+
+        with request_log_context("req-42", click_id="c-1"):
+            logger.info("click processed")
+        logger.complete()
+
+        entry = json.loads(stream.getvalue())
+        assert (entry['msg'], entry['request_id'], entry['click_id']) == ("click processed", "req-42", "c-1")
+        assert structured_logging._request_sampled.get()
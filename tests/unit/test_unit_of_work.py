@@ -0,0 +1,244 @@
+# Copyright (c) 2025 Bivex
+#
+# Author: Bivex
+# Available for contact via email: support@b-b.top
+# For up-to-date contact information:
+# https://github.com/bivex
+#
+# Created: 2026-10-16T09:12:04
+# Last Updated: 2026-10-16T09:12:04
+#
+# Licensed under the MIT License.
+# Commercial licensing available upon request.
+
+"""Unit tests for the psycopg2 and asyncpg units of work."""
+
+import asyncio
+from contextlib import asynccontextmanager
+from types import SimpleNamespace
+
+import pytest
+
+from src.application.handlers.gaming_webhook_handler import GamingWebhookHandler
+from src.infrastructure.database.unit_of_work import AsyncUnitOfWork, DirectUnitOfWork, UnitOfWork
+
+
+class FakeConnection:
+    """psycopg2-like connection that records every round trip."""
+
+    def __init__(self):
+        self.sent = []
+
+    def commit(self):
+        self.sent.append('COMMIT')
+
+    def rollback(self):
+        self.sent.append('ROLLBACK')
+
+    def cursor(self):
+        connection = self
+
+        class Cursor:
+            def mogrify(self, sql, params=None):
+                return (sql % tuple(repr(p) for p in params) if params else sql).encode()
+
+            def execute(self, sql, params=None):
+                connection.sent.append(sql)
+
+            def fetchone(self):
+                return ('click_1',)
+
+            def close(self):
+                pass
+
+        return Cursor()
+
+
+class FakePool:
+    def __init__(self):
+        self.connection = FakeConnection()
+        self.checkouts = 0
+        self.returned = []
+
+    def getconn(self):
+        self.checkouts += 1
+        return self.connection
+
+    def putconn(self, conn, close=False):
+        self.returned.append(close)
+
+
+def find(click_id, conn):
+    cursor = conn.cursor()
+    cursor.execute("SELECT * FROM clicks WHERE id = %s", (click_id,))
+    return cursor.fetchone()
+
+
+def insert(table, value, conn):
+    conn.cursor().execute(f"INSERT INTO {table} VALUES (%s)", (value,))
+
+
+async def executor_take(click_id, conn):
+    # Executor-based psycopg2 repository: blocking calls run off the loop
+    await asyncio.get_running_loop().run_in_executor(
+        None, conn.cursor().execute, "DELETE FROM pre_click_data WHERE click_id = %s RETURNING *", (click_id,))
+    return 'pre_click'
+
+
+class FakeAsyncConnection:
+    def __init__(self):
+        self.sent = []
+
+    def transaction(self):
+        connection = self
+
+        class Transaction:
+            async def start(self):
+                connection.sent.append('BEGIN')
+
+            async def commit(self):
+                connection.sent.append('COMMIT')
+
+            async def rollback(self):
+                connection.sent.append('ROLLBACK')
+
+        return Transaction()
+
+
+class FakeAsyncPool:
+    def __init__(self):
+        self.connection = FakeAsyncConnection()
+        self.checkouts = 0
+
+    @asynccontextmanager
+    async def acquire(self):
+        self.checkouts += 1
+        yield self.connection
+
+
+async def async_insert(table, conn):
+    conn.sent.append(f"INSERT INTO {table}")
+
+
+async def async_take(table, conn):
+    conn.sent.append(f"DELETE FROM {table} RETURNING *")
+    return 'pre_click'
+
+
+async def async_fail(conn):
+    raise RuntimeError("insert failed")
+
+
+class TestUnitOfWork:
+    """Test cases for the units of work."""
+
+    def test_reads_and_batched_writes_share_one_connection(self):
+        pool = FakePool()
+
+        with UnitOfWork(pool) as uow:
+            assert uow.run(find, 'click_1') == ('click_1',)
+            uow.add(insert, 'conversions', 'conv_1')
+            uow.add(insert, 'customer_ltv', 'user_1')
+
+        assert pool.checkouts == 1
+        assert pool.connection.sent == [
+            "SELECT * FROM clicks WHERE id = %s",
+            b"INSERT INTO conversions VALUES ('conv_1');\nINSERT INTO customer_ltv VALUES ('user_1')",
+            'COMMIT',
+            'ROLLBACK',
+        ]
+        assert pool.returned == [False]
+
+    def test_reads_roll_back_with_the_block(self):
+        pool = FakePool()
+
+        with pytest.raises(ValueError):
+            with UnitOfWork(pool) as uow:
+                uow.run(find, 'click_1')
+                uow.add(insert, 'conversions', 'conv_1')
+                raise ValueError("invalid conversion")
+
+        assert pool.connection.sent == ["SELECT * FROM clicks WHERE id = %s", 'ROLLBACK']
+        assert pool.returned == [False]
+
+    def test_writes_are_dropped_when_the_block_fails(self):
+        pool = FakePool()
+
+        with pytest.raises(ValueError):
+            with UnitOfWork(pool) as uow:
+                uow.add(insert, 'conversions', 'conv_1')
+                raise ValueError("invalid conversion")
+
+        assert pool.checkouts == 0
+        assert pool.connection.sent == []
+
+    def test_psycopg2_unit_works_on_the_async_click_path(self):
+        pool = FakePool()
+
+        async def scenario():
+            async with UnitOfWork(pool) as uow:
+                assert await uow.run(executor_take, 'click_1') == 'pre_click'
+                uow.add(insert, 'clicks', 'click_1')
+
+        asyncio.run(scenario())
+
+        assert pool.checkouts == 1
+        assert pool.connection.sent == ["DELETE FROM pre_click_data WHERE click_id = %s RETURNING *",
+                                        b"INSERT INTO clicks VALUES ('click_1')", 'COMMIT', 'ROLLBACK']
+        assert pool.returned == [False]
+
+    def test_async_writes_share_one_transaction(self):
+        pool = FakeAsyncPool()
+
+        async def scenario():
+            async with AsyncUnitOfWork(pool) as uow:
+                uow.add(async_insert, 'clicks')
+                uow.add(async_insert, 'campaigns')
+            async with AsyncUnitOfWork(pool) as uow:
+                uow.add(async_insert, 'clicks')
+
+        asyncio.run(scenario())
+
+        assert pool.checkouts == 2
+        assert pool.connection.sent == ['BEGIN', 'INSERT INTO clicks', 'INSERT INTO campaigns', 'COMMIT',
+                                        'BEGIN', 'INSERT INTO clicks', 'COMMIT']
+
+    def test_async_take_rolls_back_when_a_write_fails(self):
+        pool = FakeAsyncPool()
+
+        async def scenario():
+            async with AsyncUnitOfWork(pool) as uow:
+                assert await uow.run(async_take, 'pre_click_data') == 'pre_click'
+                uow.add(async_fail)
+
+        with pytest.raises(RuntimeError):
+            asyncio.run(scenario())
+
+        assert pool.connection.sent == ['BEGIN', 'DELETE FROM pre_click_data RETURNING *', 'ROLLBACK']
+
+    def test_direct_unit_defers_writes_to_commit(self):
+        written = []
+
+        with DirectUnitOfWork() as uow:
+            uow.add(written.append, 'conv_1')
+            assert written == []
+
+        assert written == ['conv_1']
+
+    def test_webhook_conversion_is_saved_in_a_unit_of_work(self):
+        pool = FakePool()
+        click = SimpleNamespace(id='click_1', campaign_id='camp_1', created_at=None,
+                                sub1=None, sub2=None, sub3=None, sub4=None, sub5=None)
+        service = SimpleNamespace(validate_deposit_data=lambda data: (True, None),
+                                  find_click_by_user_identifier=lambda data: click,
+                                  is_duplicate_deposit=lambda data, click_id: False)
+        conversions = SimpleNamespace(save=lambda conversion, conn: insert('conversions', conversion.order_id, conn))
+        conversion_service = SimpleNamespace(should_trigger_postback=lambda conversion: False)
+        handler = GamingWebhookHandler(conversions, None, None, conversion_service, service,
+                                       unit_of_work=lambda: UnitOfWork(pool))
+
+        result = handler.handle_deposit({'transaction_id': 'tx_1', 'user_id': 'user_1', 'amount': 50})
+
+        assert result['status'] == 'success'
+        assert pool.checkouts == 1
+        assert pool.connection.sent == [b"INSERT INTO conversions VALUES ('tx_1')", 'COMMIT', 'ROLLBACK']
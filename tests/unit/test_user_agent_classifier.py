@@ -0,0 +1,45 @@
+# Copyright (c) 2025 Bivex
+#
+# Author: Bivex
+# Available for contact via email: support@b-b.top
+# For up-to-date contact information:
+# https://github.com/bivex
+#
+# Created: 2026-10-16T09:12:04
+# Last Updated: 2026-10-16T09:12:04
+#
+# Licensed under the MIT License.
+# Commercial licensing available upon request.
+
+"""Unit tests for the cached user-agent classifier."""
+
+from src.domain.services.traffic import UserAgentClassifier
+
+IPHONE_UA = ("Mozilla/5.0 (iPhone; CPU iPhone OS 17_0 like Mac OS X) AppleWebKit/605.1.15 "
+             "(KHTML, like Gecko) Version/17.0 Mobile/15E148 Safari/604.1")
+
+
+class TestUserAgentClassifier:
+    """Test cases for UserAgentClassifier."""
+
+    def test_classifies_bots_and_families(self):
+        classifier = UserAgentClassifier()
+
+        bot = classifier.classify("Googlebot/2.1 (+http://www.google.com/bot.html)")
+        phone = classifier.classify(IPHONE_UA)
+
+        assert bot.is_bot and bot.reason.startswith("bot_pattern_detected: ")
+        assert not phone.is_bot
+        assert (phone.device_family, phone.browser_family) == ('mobile', 'safari')
+        assert classifier.classify(None).reason == "missing_user_agent"
+
+    def test_lru_hits_and_evictions(self):
+        classifier = UserAgentClassifier(max_entries=2)
+        classifier.classify(IPHONE_UA)
+        classifier.classify(IPHONE_UA)
+        classifier.classify("curl/8.0.1")
+        classifier.classify("Wget/1.21")
+
+        stats = classifier.get_stats()
+        assert (stats['hits'], stats['misses'], stats['evictions'], stats['keys']) == (1, 3, 1, 2)
+        assert classifier.clear() == 2
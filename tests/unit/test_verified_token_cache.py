@@ -0,0 +1,91 @@
+# Copyright (c) 2025 Bivex
+#
+# Author: Bivex
+# Available for contact via email: support@b-b.top
+# For up-to-date contact information:
+# https://github.com/bivex
+#
+# Created: 2026-10-16T09:12:04
+# Last Updated: 2026-10-16T09:12:04
+#
+# Licensed under the MIT License.
+# Commercial licensing available upon request.
+
+"""Unit tests for the verified JWT claims cache."""
+
+import os
+import time
+
+import pytest
+
+from src.infrastructure.auth import RevocationList, VerifiedTokenCache
+
+
+class TestVerifiedTokenCache:
+    """Test cases for VerifiedTokenCache."""
+
+    def test_entries_expire_with_the_token(self):
+        cache = VerifiedTokenCache()
+        cache.put("token-a", {"sub": "admin", "exp": 1000}, now=100)
+        cache.put("token-b", {"sub": "admin"}, now=100)  # No exp: never cached
+
+        assert cache.get("token-a", now=999) == {"sub": "admin", "exp": 1000}
+        assert cache.get("token-a", now=1000) is None
+        assert cache.get("token-b", now=100) is None
+        stats = cache.get_stats()
+        assert (stats['hits'], stats['misses'], stats['expired'], stats['keys']) == (1, 2, 1, 0)
+
+    def test_revocation_evicts_and_rejects_until_expiry(self):
+        cache = VerifiedTokenCache()
+        claims = {"sub": "admin", "exp": 1000, "jti": "j1"}
+        cache.put("token-a", claims, now=100)
+
+        cache.revoke(token="token-a", expires_at=1000)
+
+        assert cache.get("token-a", now=200) is None
+        assert cache.is_revoked("token-a", claims, now=200)
+        assert not cache.is_revoked("token-a", claims, now=1000)
+
+        cache.revoke(jti="j1")
+        assert cache.is_revoked("token-c", {"jti": "j1"}, now=200)
+
+    @pytest.mark.skipif(not hasattr(os, 'fork'), reason="requires fork")
+    def test_shared_revocation_reaches_other_workers_caches(self):
+        cache = VerifiedTokenCache(revocations=RevocationList(slots=64, shared=True))
+        exp = time.time() + 3600
+        cache.put("token-a", {"sub": "admin", "exp": exp})
+        cache.put("token-b", {"sub": "admin", "exp": exp, "jti": "j2"})
+
+        pid = os.fork()
+        if pid == 0:
+            # Another worker revokes; this process's copy of the cache is separate
+            cache.revoke(token="token-a", expires_at=exp)
+            cache.revoke(jti="j2")
+            os._exit(0)
+        os.waitpid(pid, 0)
+
+        assert cache.get("token-a") is None
+        assert cache.get("token-b") is None
+        assert cache.is_revoked("token-a", {"sub": "admin"})
+        assert cache.is_revoked("token-c", {"jti": "j2"})
+
+    def test_full_revocation_set_keeps_earlier_revocations(self):
+        revocations = RevocationList(slots=2, ways=2)
+        results = [revocations.add(key, until, now=0) for key, until in ((2, 300.0), (4, 100.0), (6, 200.0))]
+
+        assert results == [True, True, False]
+        assert revocations.live_keys(now=50) == {2, 4}
+        assert revocations.get_stats()['overflows'] == 1
+        # Once a revocation lapses its slot is reused
+        assert revocations.add(6, 200.0, now=150)
+        assert revocations.live_keys(now=160) == {2, 6}
+
+    def test_flooding_revocations_cannot_unrevoke_a_token(self):
+        cache = VerifiedTokenCache(revocations=RevocationList(slots=4, ways=4))
+        exp = time.time() + 3600
+        assert cache.revoke(token="stolen-token", expires_at=exp)
+
+        stored = [cache.revoke(token=f"throwaway-{i}", expires_at=exp) for i in range(10)]
+
+        assert stored.count(False) == 7
+        assert cache.is_revoked("stolen-token", {"sub": "admin", "exp": exp})